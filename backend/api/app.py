@@ -20,6 +20,10 @@ from config.validation_config import ValidationConfigs
 # Import core components
 from core.messaging.broker import MessageBroker
 from core.control.cpm import ControlPointManager
+from core.monitoring.health_probes import database_check, get_health_registry, shutdown_health_registry
+from core.services.auth.password_hasher import shutdown_password_hasher
+from core.services.auth.token_revocation import shutdown_revocation_store
+from db.repository.write_behind import shutdown_write_behind
 from core.messaging.event_types import (
     MessageType, ProcessingStage, ProcessingStatus, MessageMetadata,
     ComponentType, ModuleIdentifier
@@ -169,11 +173,23 @@ class ApplicationFactory:
                 "health_check": "/api/v1/health"
             }
 
+        # Repeated hits share one cached, time-bounded database ping. It is
+        # registered apart from HealthChecker's 'database' probe, which has
+        # a longer timeout.
+        probes = get_health_registry()
+        probes.register(
+            'api.database',
+            database_check(lambda: self.db_config.engine if self.db_config else None),
+            timeout=5,
+            ttl=15
+        )
+
         @self.app.get("/api/v1/health", tags=["Health"])
         async def health_check():
             try:
-                async with self.components['db_session']() as session:
-                    await session.execute("SELECT 1")
+                database = await probes.run('api.database')
+                if not database.healthy:
+                    raise RuntimeError(database.error or database.details.get('reason', 'database unavailable'))
 
                 return {
                     'status': 'healthy',
@@ -183,7 +199,8 @@ class ApplicationFactory:
                         name: 'healthy'
                         for name, component in self.components.items()
                         if hasattr(component, 'is_healthy') and component.is_healthy()
-                    }
+                    },
+                    'dependencies': probes.circuit_states()
                 }
             except Exception as e:
                 self.logger.error(f"Health check failed: {e}")
@@ -233,6 +250,14 @@ class ApplicationFactory:
             yield
         finally:
             await self._cleanup_async_resources()
+            await shutdown_health_registry()
+            shutdown_password_hasher()
+            await shutdown_revocation_store()
+            # Persist buffered logs and history before the engine goes away
+            try:
+                await shutdown_write_behind()
+            except Exception as e:
+                logger.error(f"Write-behind flush on shutdown failed: {str(e)}")
             if self.db_config:
                 await self.db_config.cleanup()
 
@@ -488,6 +513,14 @@ class ApplicationFactory:
             yield
         finally:
             await self._cleanup_async_resources()
+            await shutdown_health_registry()
+            shutdown_password_hasher()
+            await shutdown_revocation_store()
+            # Persist buffered logs and history before the engine goes away
+            try:
+                await shutdown_write_behind()
+            except Exception as e:
+                logger.error(f"Write-behind flush on shutdown failed: {str(e)}")
             if self.db_config:
                 await self.db_config.cleanup()
 
@@ -12,6 +12,8 @@ from fastapi.responses import JSONResponse
 from functools import wraps
 
 import logging
+import uuid
+from core.services.auth.token_revocation import TokenRevocationStore, get_revocation_store
 from ..utils.route_registry import APIRoutes
 
 logger = logging.getLogger(__name__)
@@ -24,12 +26,14 @@ class JWTTokenManager:
             self,
             secret_key: str,
             access_token_expires: int = 3600,
-            refresh_token_expires: int = 86400
+            refresh_token_expires: int = 86400,
+            revocation_store: Optional[TokenRevocationStore] = None
     ):
         self.secret_key = secret_key
         self.access_token_expires = access_token_expires
         self.refresh_token_expires = refresh_token_expires
-        self.blacklisted_tokens = set()  # Simple in-memory blacklist
+        # Shared with every worker through the revoked_tokens table
+        self._revocation_store = revocation_store
         self._default_permissions = [
             'profile:read',
             'profile:update',
@@ -43,6 +47,12 @@ class JWTTokenManager:
             'data_sources:read'
         ]
 
+    @property
+    def revocation_store(self) -> TokenRevocationStore:
+        if self._revocation_store is None:
+            self._revocation_store = get_revocation_store()
+        return self._revocation_store
+
     def _get_default_permissions(self) -> List[str]:
         """Retrieve the list of default permissions assigned to all users."""
         return self._default_permissions.copy()
@@ -58,6 +68,7 @@ class JWTTokenManager:
             # Prepare claims for access token
             access_token_payload = {
                 'sub': str(user['id']),
+                'jti': uuid.uuid4().hex,
                 'roles': user.get('roles', []),
                 'permissions': combined_permissions,
                 'email': user.get('email'),
@@ -69,6 +80,7 @@ class JWTTokenManager:
             # Prepare claims for refresh token
             refresh_token_payload = {
                 'sub': str(user['id']),
+                'jti': uuid.uuid4().hex,
                 'type': 'refresh',
                 'iat': datetime.utcnow(),
                 'exp': datetime.utcnow() + timedelta(seconds=self.refresh_token_expires)
@@ -87,15 +99,29 @@ class JWTTokenManager:
             logger.error(f"Token creation error: {str(e)}")
             raise
 
-    def blacklist_token(self, jti: str) -> None:
-        """Add token to blacklist."""
-        self.blacklisted_tokens.add(jti)
+    async def blacklist_token(
+            self,
+            jti: str,
+            expires_at: Optional[Any] = None,
+            user_id: Optional[str] = None
+    ) -> None:
+        """
+        Revoke a token for every worker until it expires.
+
+        Without ``expires_at`` the token is held for the longest lifetime
+        this manager issues.
+        """
+        if expires_at is None:
+            expires_at = datetime.utcnow() + timedelta(
+                seconds=max(self.access_token_expires, self.refresh_token_expires)
+            )
+        await self.revocation_store.revoke(jti, expires_at, user_id, 'blacklisted')
 
-    def verify_permission(self, token: str, required_permission: str) -> bool:
+    async def verify_permission(self, token: str, required_permission: str) -> bool:
         """Verify if token has required permission."""
         try:
             # Decode the token
-            decoded_token = self.validate_token(token)
+            decoded_token = await self.validate_token(token)
 
             # Check permissions
             user_permissions = decoded_token.get('permissions', [])
@@ -122,7 +148,7 @@ class JWTTokenManager:
 
                 try:
                     # Validate token and check permissions
-                    decoded_token = self.validate_token(token)
+                    decoded_token = await self.validate_token(token)
                     user_permissions = decoded_token.get('permissions', [])
 
                     if permission not in user_permissions:
@@ -170,7 +196,7 @@ class JWTTokenManager:
 
                 try:
                     # Validate token and check roles
-                    decoded_token = self.validate_token(token)
+                    decoded_token = await self.validate_token(token)
                     user_roles = decoded_token.get('roles', [])
 
                     if not set(roles).intersection(set(user_roles)):
@@ -200,7 +226,7 @@ class JWTTokenManager:
 
         return decorator
 
-    def validate_token(self, token: str) -> Dict[str, Any]:
+    async def validate_token(self, token: str) -> Dict[str, Any]:
         """Validate and decode token."""
         try:
             # Decode the token
@@ -211,7 +237,8 @@ class JWTTokenManager:
             )
 
             # Check if token is blacklisted
-            if decoded_token.get('jti') in self.blacklisted_tokens:
+            jti = decoded_token.get('jti')
+            if jti and await self.revocation_store.is_revoked(jti):
                 raise ValueError("Token has been blacklisted")
 
             return decoded_token
@@ -240,7 +267,7 @@ class JWTTokenManager:
             return auth_header.split(' ')[1]
         return None
 
-    def refresh_tokens(self, refresh_token: str) -> Dict[str, str]:
+    async def refresh_tokens(self, refresh_token: str) -> Dict[str, str]:
         """
         Refresh access token using a valid refresh token.
 
@@ -252,7 +279,7 @@ class JWTTokenManager:
         """
         try:
             # Validate the refresh token
-            decoded_refresh_token = self.validate_token(refresh_token)
+            decoded_refresh_token = await self.validate_token(refresh_token)
 
             # Ensure this is a refresh token
             if decoded_refresh_token.get('type') != 'refresh':
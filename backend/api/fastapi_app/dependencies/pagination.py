@@ -0,0 +1,45 @@
+# api/fastapi_app/dependencies/pagination.py
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from fastapi import HTTPException, Query
+
+from db.repository.pagination import COUNT_EXACT, InvalidCursorError, Page
+
+
+@dataclass(frozen=True)
+class PaginationParams:
+    """Cursor pagination query parameters shared by list endpoints"""
+    cursor: Optional[str]
+    per_page: int
+    count: str
+
+    def response(self, page: Page, items_key: str) -> Dict[str, Any]:
+        """Uniform list payload: items, next_cursor and count metadata"""
+        return {
+            items_key: page.items,
+            'next_cursor': page.next_cursor,
+            'total_count': page.total_count,
+            'count_estimated': page.count_estimated,
+            'per_page': self.per_page
+        }
+
+
+async def get_pagination(
+    cursor: Optional[str] = Query(
+        None,
+        description="Continuation token from the previous page's next_cursor"
+    ),
+    per_page: int = Query(10, gt=0, le=100),
+    count: str = Query(
+        COUNT_EXACT,
+        pattern="^(exact|estimate|none)$",
+        description="exact (cached), estimate (planner statistics) or none"
+    )
+) -> PaginationParams:
+    return PaginationParams(cursor=cursor, per_page=per_page, count=count)
+
+
+def invalid_cursor(error: InvalidCursorError) -> HTTPException:
+    return HTTPException(status_code=400, detail=str(error))
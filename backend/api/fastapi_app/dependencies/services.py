@@ -11,6 +11,7 @@ from core.services.reports import ReportService
 from core.services.recommendation import RecommendationService
 from config.database import get_db_session
 from core.services.pipeline.pipeline_service import PipelineService
+from core.services.staging.staging_service import StagingService
 from core.managers.staging_manager import StagingManager
 
 
@@ -44,9 +45,9 @@ async def get_quality_service(
 
 async def get_staging_service(
     db: AsyncSession = Depends(get_db_session)
-) -> StagingManager:
+) -> StagingService:
     if 'staging' not in _service_instances:
-        _service_instances['staging'] = StagingManager(db)
+        _service_instances['staging'] = StagingService(db)
     return _service_instances['staging']
 
 async def get_report_service(
@@ -11,8 +11,10 @@ from jose import JWTError, jwt
 from pydantic_settings import BaseSettings
 from functools import lru_cache, wraps
 from core.services.auth.auth_service import AuthService
+from core.services.auth.principal_cache import token_key
+from core.services.auth.token_revocation import get_revocation_store
 from config.database import get_db_session
-from ..utils.route_registry import APIRoutes, RouteDefinition
+from ..utils.route_registry import RouteDefinition, RouteMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +53,7 @@ class AuthMiddleware:
             self.settings = get_auth_settings()
             self.secret_key = self.settings.JWT_SECRET_KEY
             self.algorithm = self.settings.JWT_ALGORITHM
+            self.route_matcher = route_matcher
             logger.info("Auth middleware initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize auth middleware: {e}")
@@ -108,18 +111,10 @@ class AuthMiddleware:
                     detail="Invalid token type"
                 )
 
-            # Get user from database
-            auth_service = AuthService(db)
-            user = await auth_service.get_user_by_id(user_id)
-
-            if not user:
-                raise HTTPException(
-                    status_code=401,
-                    detail="User not found"
-                )
-
-            return user
+            return await self.resolve_principal(payload, token, db)
 
+        except HTTPException:
+            raise
         except JWTError:
             raise HTTPException(
                 status_code=401,
@@ -209,13 +204,7 @@ class AuthMiddleware:
                     detail="Invalid token type"
                 )
 
-            # Get user from database or extract from token
-            user_data = {
-                'id': user_id,
-                'email': payload.get('email'),
-                'roles': payload.get('roles', []),
-                'permissions': payload.get('permissions', [])
-            }
+            user_data = await self.resolve_principal(payload, token, db)
 
             # Store user in request state
             request.state.user = user_data
@@ -230,6 +219,28 @@ class AuthMiddleware:
                 detail="Authentication failed"
             )
 
+    async def resolve_principal(
+            self,
+            payload: Dict[str, Any],
+            token: str,
+            db: AsyncSession
+    ) -> Dict[str, Any]:
+        """Cached principal for a validated access token"""
+        if await get_revocation_store().is_revoked(token_key(payload, token)):
+            raise HTTPException(
+                status_code=401,
+                detail="Token has been revoked"
+            )
+
+        principal = await AuthService(db).get_principal(payload, token)
+        if not principal:
+            raise HTTPException(
+                status_code=401,
+                detail="User not found"
+            )
+        return principal
+
+
 def normalize_route(path: str) -> str:
     """Normalize route by removing trailing slashes"""
     return path.rstrip('/')
@@ -246,13 +257,6 @@ def get_route_from_request(request_path: str, request_method: str) -> Optional[R
     if normalized_path.endswith('/') and len(normalized_path) > 1:
         normalized_path = normalized_path[:-1]
 
-    path_parts = normalized_path.split('/')
-    logger.debug(f"Matching route: {normalized_path} [{request_method}]")
-
-    # DEBUG: Log all available routes for comparison
-    for route in APIRoutes:
-        logger.debug(f"Available route: {route.value.path} [{','.join(route.value.methods)}]")
-
     # Special case for pipeline routes - TEMPORARY FIX
     if normalized_path == '/pipeline' or normalized_path == '/pipeline/':
         # Create a fake RouteDefinition for testing
@@ -264,33 +268,11 @@ def get_route_from_request(request_path: str, request_method: str) -> Optional[R
             required_permissions=[]
         )
 
-    # Loop through routes for matching
-    for route in APIRoutes:
-        route_def = route.value
-        route_parts = route_def.path.split('/')
-
-        # Simple full path matching
-        if normalized_path == route_def.path and request_method in route_def.methods:
-            logger.debug(f"Direct match found: {route_def.path}")
-            return route_def
-
-        # Check for path pattern matching (with parameters)
-        if len(path_parts) != len(route_parts):
-            continue
-
-        matches = True
-        for req_part, route_part in zip(path_parts, route_parts):
-            if route_part.startswith('{') and route_part.endswith('}'):
-                continue  # Parameter part matches anything
-            if req_part != route_part:
-                matches = False
-                break
-
-        if matches and request_method in route_def.methods:
-            logger.debug(f"Pattern match found: {route_def.path}")
-            return route_def
+    route_def = route_matcher.match(normalized_path, request_method)
+    if route_def is not None:
+        return route_def
 
-    logger.debug("No matching route found")
+    logger.debug(f"No matching route found: {normalized_path} [{request_method}]")
 
     # TEMPORARY WORKAROUND: Allow all authenticated requests
     if request_path.startswith('/api/v1'):
@@ -304,7 +286,8 @@ def get_route_from_request(request_path: str, request_method: str) -> Optional[R
 
     return None
 
-# Create singleton instances
+# Create singleton instances; the route table is compiled once at startup
+route_matcher = RouteMatcher.from_registry()
 auth_settings = get_auth_settings()
 auth_middleware = AuthMiddleware()
 
@@ -316,8 +299,7 @@ async def get_current_user(
         db: AsyncSession = Depends(get_db_session)
 ) -> Dict[str, Any]:
     """Dependency to get current authenticated user"""
-    middleware = AuthMiddleware()
-    user = await middleware(request, credentials, db)
+    user = await auth_middleware(request, credentials, db)
 
     if not user:
         raise HTTPException(
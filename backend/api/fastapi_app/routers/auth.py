@@ -3,6 +3,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Response, Request, FastAPI
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
+from typing import Optional
 from fastapi.responses import JSONResponse
 from datetime import datetime, timedelta
 from jose import jwt
@@ -10,6 +11,8 @@ from config.database import get_db_session
 from api.fastapi_app.middleware.auth_middleware import get_current_user, get_optional_user
 from api.fastapi_app.middleware.auth_middleware import auth_middleware
 from core.services.auth.auth_service import AuthService
+from core.services.auth.password_hasher import HashingLimitExceeded
+from core.services.auth.token_revocation import get_revocation_store
 from api.fastapi_app.schemas.auth import (
     LoginRequestSchema,
     LoginResponseSchema,
@@ -39,6 +42,19 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _client_ip(request: Request) -> Optional[str]:
+    return request.client.host if request.client else None
+
+
+def _too_many_requests(error: HashingLimitExceeded) -> HTTPException:
+    """429 for a login/password request refused by the hashing pool"""
+    return HTTPException(
+        status_code=429,
+        detail=str(error),
+        headers={'Retry-After': str(error.retry_after)}
+    )
+
+
 @router.post("/login", response_model=LoginResponseSchema)
 async def login(
         request: Request,
@@ -50,7 +66,8 @@ async def login(
         auth_service = AuthService(db)
         user = await auth_service.authenticate_user(
             email=credentials.email,
-            password=credentials.password
+            password=credentials.password,
+            client_ip=_client_ip(request)
         )
 
         if not user:
@@ -127,6 +144,8 @@ async def login(
             permitted_actions=user_data.get('permissions', [])
         )
 
+    except HashingLimitExceeded as e:
+        raise _too_many_requests(e)
     except Exception as e:
         logger.error(f"Login error: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail="Authentication failed")
@@ -216,6 +235,7 @@ async def update_profile(
 
 @router.post("/register", response_model=RegistrationResponseSchema)
 async def register(
+        request: Request,
         registration_data: RegistrationRequestSchema,
         response: Response,
         db: AsyncSession = Depends(get_db_session)
@@ -229,7 +249,7 @@ async def register(
         if existing_user:
             raise HTTPException(status_code=409, detail="Email already registered")
 
-        user = await auth_service.register_user(registration_data.dict())
+        user = await auth_service.register_user(registration_data.dict(), client_ip=_client_ip(request))
 
         # Create tokens
         user_data = {
@@ -264,6 +284,8 @@ async def register(
 
     except HTTPException:
         raise
+    except HashingLimitExceeded as e:
+        raise _too_many_requests(e)
     except Exception as e:
         logger.error(f"Registration error: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail="Registration failed")
@@ -340,6 +362,8 @@ async def reset_password(
             request.new_password
         )
         return reset_result
+    except HashingLimitExceeded as e:
+        raise _too_many_requests(e)
     except Exception as e:
         logger.error(f"Password reset error: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail="Password reset failed")
@@ -360,6 +384,8 @@ async def change_password(
             request.new_password
         )
         return change_result
+    except HashingLimitExceeded as e:
+        raise _too_many_requests(e)
     except Exception as e:
         logger.error(f"Password change error: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail="Password change failed")
@@ -532,6 +558,15 @@ async def logout(
 ):
     """Logout user"""
     try:
+        # Refuse this token on every worker until it expires
+        if current_user.get('jti') and current_user.get('exp'):
+            await get_revocation_store().revoke(
+                current_user['jti'],
+                current_user['exp'],
+                user_id=current_user.get('id'),
+                reason='logout'
+            )
+
         # Clear cookies
         response.delete_cookie('access_token')
         response.delete_cookie('refresh_token', path='/api/v1/auth/refresh')
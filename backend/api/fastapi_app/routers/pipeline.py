@@ -1,6 +1,6 @@
 # api/fastapi_app/routers/pipeline.py
 
-from fastapi import APIRouter, Depends, HTTPException, Security, Query
+from fastapi import APIRouter, Depends, HTTPException, Security
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict, Any, Optional, List
 from uuid import UUID
@@ -10,6 +10,8 @@ from datetime import datetime
 from config.database import get_db_session
 from api.fastapi_app.middleware.auth_middleware import get_current_user, require_permission
 from api.fastapi_app.dependencies.services import get_pipeline_service, get_staging_manager
+from api.fastapi_app.dependencies.pagination import PaginationParams, get_pagination, invalid_cursor
+from db.repository.pagination import InvalidCursorError
 from core.services.pipeline.pipeline_service import PipelineService
 from core.managers.staging_manager import StagingManager
 from api.fastapi_app.schemas.staging import (
@@ -52,36 +54,34 @@ async def validate_pipeline_exists(
 
 @router.get("/", response_model=PipelineListResponse)
 async def list_pipelines(
-    page: int = Query(1, gt=0),
-    per_page: int = Query(10, gt=0, le=100),
+    pagination: PaginationParams = Depends(get_pagination),
     filters: Optional[Dict[str, Any]] = None,
     current_user: dict = Security(require_permission("pipeline:list")),
     pipeline_service: PipelineService = Depends(get_pipeline_service),
-    pipeline_manager: Any = Depends(get_pipeline_service)
+    db: AsyncSession = Depends(get_db_session)
 ):
-    """List pipelines with filtering and pagination"""
+    """List pipelines with filtering and cursor pagination"""
     try:
-        # Get pipelines with runtime status
-        pipelines = await pipeline_service.list_pipelines(
+        page = await pipeline_service.list_pipelines(
+            db,
             filters=filters or {},
-            page=page,
-            per_page=per_page
+            page_size=pagination.per_page,
+            cursor=pagination.cursor,
+            count_mode=pagination.count
         )
 
-        # Enrich with runtime status
-        for pipeline in pipelines['pipelines']:
-            runtime_status = await pipeline_manager.get_pipeline_status(
-                str(pipeline['id'])
-            )
+        # Enrich the whole page with runtime status in one lookup
+        runtime_statuses = pipeline_service.get_pipeline_statuses(
+            [str(pipeline['id']) for pipeline in page.items]
+        )
+        for pipeline in page.items:
+            runtime_status = runtime_statuses.get(str(pipeline['id']))
             if runtime_status:
                 pipeline['runtime_status'] = runtime_status
 
-        return {
-            'pipelines': pipelines['pipelines'],
-            'total_count': pipelines['total_count'],
-            'page': page,
-            'per_page': per_page
-        }
+        return pagination.response(page, 'pipelines')
+    except InvalidCursorError as e:
+        raise invalid_cursor(e)
     except Exception as e:
         logger.error(f"Error retrieving pipelines: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail="Error retrieving pipelines")
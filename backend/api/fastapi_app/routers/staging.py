@@ -29,6 +29,12 @@ from api.fastapi_app.dependencies.services import (
     get_recommendation_service,
     get_staging_manager
 )
+from api.fastapi_app.dependencies.pagination import (
+    PaginationParams,
+    get_pagination,
+    invalid_cursor
+)
+from db.repository.pagination import InvalidCursorError
 
 # Services
 from core.services.quality import QualityService
@@ -106,12 +112,12 @@ router = APIRouter()
 # ====================== Base Staging Routes ======================
 @router.get("/outputs", response_model=Dict[str, Any])
 async def list_outputs(
-    page: int = Query(1, gt=0),
-    per_page: int = Query(10, gt=0, le=100),
+    pagination: PaginationParams = Depends(get_pagination),
     component_type: Optional[ComponentType] = None,
     filters: Optional[Dict[str, Any]] = None,
     current_user: dict = Security(require_permission("staging:outputs:list")),
-    staging_service: StagingService = Depends(get_staging_service)
+    staging_service: StagingService = Depends(get_staging_service),
+    db: AsyncSession = Depends(get_db_session)
 ):
     """List staged outputs with comprehensive filtering"""
     try:
@@ -120,25 +126,25 @@ async def list_outputs(
         if component_type:
             filter_dict['component_type'] = component_type
 
-        outputs = await staging_service.list_outputs(
+        page = await staging_service.list_outputs(
+            db,
             filters=filter_dict,
-            page=page,
-            per_page=per_page
+            page_size=pagination.per_page,
+            cursor=pagination.cursor,
+            count_mode=pagination.count
         )
 
         # Process output schemas
         response_data = []
-        for output in outputs['items']:
+        for output in page.items:
             schema = StagedOutputSchemas.get_schema(output.component_type, 'response')
             response_data.append(schema().dump(output))
+        page.items = response_data
 
-        return {
-            'outputs': response_data,
-            'total': outputs['total'],
-            'page': page,
-            'per_page': per_page
-        }
+        return pagination.response(page, 'outputs')
 
+    except InvalidCursorError as e:
+        raise invalid_cursor(e)
     except Exception as e:
         logger.error(f"Failed to list staged outputs: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to list staged outputs")
@@ -1153,34 +1159,33 @@ def get_services(db: AsyncSession = Depends(get_db_session)):
 
 @router.get("/", response_model=DecisionListResponse)
 async def list_decisions(
-    page: int = Query(1, gt=0),
-    per_page: int = Query(10, gt=0, le=100),
+    pagination: PaginationParams = Depends(get_pagination),
     filters: Optional[Dict[str, Any]] = None,
     current_user: dict = Depends(get_current_user),
-    services: Dict[str, Any] = Depends(get_services)
+    services: Dict[str, Any] = Depends(get_services),
+    db: AsyncSession = Depends(get_db_session)
 ):
-    """List decisions with filtering and pagination"""
+    """List decisions with filtering and cursor pagination"""
     try:
-        decisions = await services['decision_service'].list_decisions(
+        page = await services['decision_service'].list_decisions(
+            db,
             filters=filters or {},
-            page=page,
-            per_page=per_page
+            page_size=pagination.per_page,
+            cursor=pagination.cursor,
+            count_mode=pagination.count
         )
 
         # Enrich with staging status
-        for decision in decisions['items']:
+        for decision in page.items:
             if decision.get('staging_reference'):
                 staging_status = await services['staging_manager'].get_status(
                     decision['staging_reference']
                 )
                 decision['staging_status'] = staging_status
 
-        return {
-            'decisions': decisions['items'],
-            'total': decisions['total'],
-            'page': page,
-            'per_page': per_page
-        }
+        return pagination.response(page, 'decisions')
+    except InvalidCursorError as e:
+        raise invalid_cursor(e)
     except Exception as e:
         logger.error(f"Failed to list decisions: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to list decisions")
@@ -1379,36 +1384,35 @@ async def generate_recommendations(
 
 @router.get("/list", response_model=RecommendationListResponse)
 async def list_recommendations(
-    page: int = Query(1, gt=0),
-    per_page: int = Query(10, gt=0, le=100),
+    pagination: PaginationParams = Depends(get_pagination),
     filters: Optional[Dict[str, Any]] = None,
     current_user: dict = Security(require_permission("recommendations:list")),
     recommendation_service: RecommendationService = Depends(get_recommendation_service),
-    staging_manager: StagingManager = Depends(get_staging_manager)
+    staging_manager: StagingManager = Depends(get_staging_manager),
+    db: AsyncSession = Depends(get_db_session)
 ):
     """List recommendations with filtering and priority sorting"""
     try:
-        recommendations = await recommendation_service.list_recommendations(
+        page = await recommendation_service.list_recommendations(
+            db,
             filters=filters or {},
-            page=page,
-            per_page=per_page
+            page_size=pagination.per_page,
+            cursor=pagination.cursor,
+            count_mode=pagination.count
         )
 
         # Enrich with impact analysis
-        for recommendation in recommendations['items']:
+        for recommendation in page.items:
             if recommendation.get('staging_reference'):
                 impact_data = await staging_manager.get_impact_analysis(
                     recommendation['staging_reference']
                 )
                 recommendation['impact_analysis'] = impact_data
 
-        return {
-            'recommendations': recommendations['items'],
-            'total': recommendations['total'],
-            'page': page,
-            'per_page': per_page
-        }
+        return pagination.response(page, 'recommendations')
 
+    except InvalidCursorError as e:
+        raise invalid_cursor(e)
     except Exception as e:
         logger.error(f"Failed to list recommendations: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to list recommendations")
@@ -157,6 +157,16 @@ class AuditMixin(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class CursorPageMixin(BaseModel):
+    """Mixin to add keyset pagination fields to list responses"""
+    next_cursor: Optional[str] = None
+    total_count: Optional[int] = Field(default=None, ge=0)
+    count_estimated: bool = False
+    per_page: int = Field(default=10, ge=1, le=100)
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class MetadataMixin(BaseModel):
     """Mixin to add metadata fields to any schema"""
     metadata: Dict[str, Any] = Field(default_factory=dict)
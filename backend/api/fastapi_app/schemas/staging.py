@@ -5,7 +5,7 @@ from typing import Optional, List, Dict, Any, Union
 from uuid import UUID
 from pydantic import BaseModel, Field, validator, model_validator, constr, confloat, ConfigDict
 from enum import Enum
-from .base import BaseStagingSchema, ProcessingStatus, ComponentType
+from .base import BaseStagingSchema, CursorPageMixin, ProcessingStatus, ComponentType
 
 class ReportStatus(str, Enum):
     """Enum for report generation status"""
@@ -424,12 +424,9 @@ class PipelineMetricsResponse(BaseStagingSchema):
     resource_usage: Dict[str, float]
     performance_metrics: Dict[str, Any]
 
-class PipelineListResponse(BaseStagingSchema):
+class PipelineListResponse(CursorPageMixin, BaseStagingSchema):
     """Response schema for pipeline listing"""
     pipelines: List[PipelineResponse]
-    total_count: int
-    page: int
-    page_size: int
 
 
 class DecisionMessageType(str, Enum):
@@ -485,28 +482,12 @@ class DecisionStagingResponse(BaseStagingSchema):
     rationale: Dict[str, Any]
 
 
-class DecisionListResponse(BaseStagingSchema):
+class DecisionListResponse(CursorPageMixin, BaseStagingSchema):
     """Schema for listing decisions with pagination"""
     decisions: List[Dict[str, Any]] = Field(
         default_factory=list,
         description="List of decision objects"
     )
-    total_count: int = Field(
-        default=0,
-        description="Total number of decisions",
-        ge=0
-    )
-    page: int = Field(
-        default=1,
-        description="Current page number",
-        ge=1
-    )
-    page_size: int = Field(
-        default=10,
-        description="Number of items per page",
-        ge=1,
-        le=100
-    )
 
 class DecisionHistoryResponse(BaseStagingSchema):
     """Schema for decision history responses"""
@@ -727,17 +708,12 @@ class RecommendationDismissRequest(BaseStagingSchema):
     )
 
 
-class RecommendationListResponse(BaseStagingSchema):
+class RecommendationListResponse(CursorPageMixin, BaseStagingSchema):
     """Schema for listing recommendations"""
     recommendations: List[Dict[str, Any]] = Field(
         ...,
         description="List of recommendation objects"
     )
-    total_count: int = Field(
-        default=0,
-        ge=0,
-        description="Total number of recommendations"
-    )
     filter_summary: Dict[str, Any] = Field(
         default_factory=dict,
         description="Summary of applied filters"
@@ -1,6 +1,6 @@
 from enum import Enum
-from dataclasses import dataclass
-from typing import List, Optional, TypedDict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, TypedDict
 
 @dataclass
 class RouteDefinition:
@@ -10,6 +10,7 @@ class RouteDefinition:
     requires_auth: bool = True
     rate_limit: Optional[int] = None
     cache_ttl: Optional[int] = None
+    required_permissions: List[str] = field(default_factory=list)
 
 class RouteParams(TypedDict, total=False):
     source_id: str
@@ -190,4 +191,61 @@ class APIRoutes(Enum):
 
 def normalize_route(route: str) -> str:
     """Normalize route format by removing trailing slashes"""
-    return route.rstrip('/')
\ No newline at end of file
+    return route.rstrip('/')
+
+
+class _RouteNode:
+    __slots__ = ('static', 'param', 'methods')
+
+    def __init__(self):
+        self.static: Dict[str, '_RouteNode'] = {}
+        self.param: Optional['_RouteNode'] = None
+        self.methods: Dict[str, RouteDefinition] = {}
+
+
+class RouteMatcher:
+    """
+    Method + path matcher compiled once from the route registry
+
+    Routes are stored in a segment trie, so matching walks the request path
+    once instead of testing every registered route. Literal segments take
+    precedence over ``{param}`` segments; the first registered definition
+    wins for a given path shape and method.
+    """
+
+    def __init__(self, routes: Iterable[RouteDefinition]):
+        self._root = _RouteNode()
+        for route_def in routes:
+            node = self._root
+            for part in self._split(route_def.path):
+                if part.startswith('{') and part.endswith('}'):
+                    node.param = node.param or _RouteNode()
+                    node = node.param
+                else:
+                    node = node.static.setdefault(part, _RouteNode())
+            for method in route_def.methods:
+                node.methods.setdefault(method.upper(), route_def)
+
+    @classmethod
+    def from_registry(cls, registry=APIRoutes) -> 'RouteMatcher':
+        return cls(route.value for route in registry)
+
+    @staticmethod
+    def _split(path: str) -> List[str]:
+        return [part for part in path.split('/') if part]
+
+    def match(self, path: str, method: str) -> Optional[RouteDefinition]:
+        """Definition for ``method`` on ``path`` (without the API prefix)"""
+        return self._match(self._root, self._split(path), 0, method.upper())
+
+    def _match(self, node: _RouteNode, parts: List[str], index: int, method: str) -> Optional[RouteDefinition]:
+        if index == len(parts):
+            return node.methods.get(method)
+        child = node.static.get(parts[index])
+        if child is not None:
+            found = self._match(child, parts, index + 1, method)
+            if found is not None:
+                return found
+        if node.param is not None:
+            return self._match(node.param, parts, index + 1, method)
+        return None
@@ -176,7 +176,8 @@ class Config:
             'LOG_FOLDER': 'logs',
             'STAGING_FOLDER': 'staging',
             'TEMP_FOLDER': 'temp',
-            'CACHE_FOLDER': 'cache'
+            'CACHE_FOLDER': 'cache',
+            'STATE_FOLDER': 'state'
         }
 
         for attr, folder_name in folders.items():
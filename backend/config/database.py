@@ -7,7 +7,7 @@ and session management.
 
 Features:
     - Async database configuration
-    - Connection pooling
+    - Connection pooling with separate write/read/analytics pools
     - Session management
     - Performance metrics
     - Health monitoring
@@ -30,18 +30,18 @@ import asyncio
 
 from fastapi import FastAPI, Depends
 from sqlalchemy.ext.asyncio import (
-    create_async_engine,
     AsyncSession,
     async_sessionmaker,
     AsyncEngine
 )
 from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.engine.url import make_url, URL
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import SQLAlchemyError, TimeoutError as PoolTimeoutError
 from sqlalchemy import text
 from pydantic import PostgresDsn, Field, field_validator
 from pydantic_settings import BaseSettings
 
+from db.routing import DatabaseRouter, ROLE_DEFAULTS, ROLE_WRITE
 from .app_config import app_config, Config
 
 # Configure logging
@@ -183,6 +183,7 @@ class DatabaseConfig:
         """Configure database with settings."""
         self.settings = settings
         self.engine: Optional[AsyncEngine] = None
+        self.router: Optional[DatabaseRouter] = None
         self._session_factory: Optional[async_sessionmaker[AsyncSession]] = None
         self._active_sessions: Set[AsyncSession] = set()
         self.metrics = DatabaseMetrics()
@@ -209,6 +210,8 @@ class DatabaseConfig:
             self.pool_timeout = getattr(settings, 'SQLALCHEMY_POOL_TIMEOUT', 30)
             self.echo = getattr(settings, 'SQLALCHEMY_ECHO', False)
             self.isolation_level = getattr(settings, 'SQLALCHEMY_ISOLATION_LEVEL', 'READ_COMMITTED')
+            self.pool_pre_ping = getattr(settings, 'SQLALCHEMY_POOL_PRE_PING', True)
+            self.pool_use_lifo = getattr(settings, 'SQLALCHEMY_POOL_USE_LIFO', True)
 
             logger.info(f"Database configuration initialized with URI: {self.uri.split('@')[1] if '@' in self.uri else 'unknown'}")
 
@@ -220,6 +223,7 @@ class DatabaseConfig:
         """Initialize database configuration."""
         self.settings = None
         self.engine = None
+        self.router = None
         self._session_factory = None
         self._active_sessions = set()
         self.metrics = DatabaseMetrics()
@@ -230,6 +234,8 @@ class DatabaseConfig:
         self.pool_timeout = 30
         self.echo = False
         self.isolation_level = "READ_COMMITTED"
+        self.pool_pre_ping = True
+        self.pool_use_lifo = True
 
     async def init_db(self) -> None:
         """Initialize database with engine and session factory."""
@@ -238,32 +244,28 @@ class DatabaseConfig:
             return
 
         try:
-            # Create async engine with settings from config
-            if not self.engine:
-                self.engine = create_async_engine(
+            # One pool per role (write/read/analytics); roles without their
+            # own URL share the primary, SQLite roles alias the write engine
+            if not self.router:
+                self.router = DatabaseRouter.from_env(
                     self.uri,
-                    # Remove poolclass as it's automatically handled for async engines
-                    pool_size=self.pool_size,
-                    max_overflow=self.max_overflow,
-                    pool_timeout=self.pool_timeout,
-                    pool_pre_ping=getattr(self.settings, 'SQLALCHEMY_POOL_PRE_PING', True),
-                    pool_use_lifo=getattr(self.settings, 'SQLALCHEMY_POOL_USE_LIFO', True),
+                    write_defaults=(
+                        self.pool_size,
+                        self.max_overflow,
+                        self.pool_timeout,
+                        ROLE_DEFAULTS[ROLE_WRITE][3]
+                    ),
+                    write_overrides={
+                        'pool_pre_ping': self.pool_pre_ping,
+                        'pool_use_lifo': self.pool_use_lifo
+                    },
                     echo=self.echo,
-                    isolation_level=self.isolation_level,
-                    # Remove json_serializer as it's not needed for async engine
-                    connect_args={
-                        "server_settings": {
-                            "application_name": "fastapi_app",
-                            "client_encoding": "utf8",
-                            "timezone": "UTC"
-                        }
-                    }
-                )
-
-            # Initialize session factory
-            self._session_factory = async_sessionmaker(
-                bind=self.engine,
-                class_=AsyncSession,
+                    isolation_level=self.isolation_level
+                ).start()
+                self.engine = self.router.engine(ROLE_WRITE)
+
+            # Sessions route reads per role and writes to the write pool
+            self._session_factory = self.router.session_factory(
                 expire_on_commit=False,
                 autoflush=False
             )
@@ -319,6 +321,8 @@ class DatabaseConfig:
             yield session
         except SQLAlchemyError as e:
             logger.error(f"Database session error: {e}")
+            if isinstance(e, PoolTimeoutError) and self.router:
+                self.router.record_timeout(e)
             if session:
                 await session.rollback()
             raise
@@ -338,9 +342,13 @@ class DatabaseConfig:
                     await session.close()
                 self._active_sessions.clear()
 
-                # Dispose engine
-                if self.engine:
+                # Dispose every role's engine
+                if self.router:
+                    await self.router.dispose()
+                    self.router = None
+                elif self.engine:
                     await self.engine.dispose()
+                self.engine = None
 
                 self._session_factory = None
                 logger.info("Database resources cleaned up successfully")
@@ -359,6 +367,7 @@ class DatabaseConfig:
             'engine_initialized': engine_status,
             'active_sessions': len(self._active_sessions),
             'metrics': metrics,
+            'pools': self.router.pool_metrics() if self.router else {},
             'pool_size': self.settings.SQLALCHEMY_POOL_SIZE,
             'max_overflow': self.settings.SQLALCHEMY_MAX_OVERFLOW,
             'isolation_level': self.settings.SQLALCHEMY_ISOLATION_LEVEL
@@ -392,6 +401,13 @@ def setup_database(app: FastAPI, settings: Optional[DatabaseSettings] = None) ->
         @app.on_event("shutdown")
         async def shutdown_db():
             """Cleanup database resources on application shutdown."""
+            from db.repository.write_behind import shutdown_write_behind
+
+            # Persist buffered logs and history before the engine goes away
+            try:
+                await shutdown_write_behind()
+            except Exception as e:
+                logger.error(f"Write-behind flush on shutdown failed: {str(e)}")
             await db_config.cleanup()
 
     except Exception as e:
@@ -339,7 +339,7 @@ class S3ValidationConfig(BaseValidationConfig):
     )
     allowed_operations: Set[str] = field(
         default_factory=lambda: {
-            'get', 'put', 'delete', 'list', 'head'
+            'get', 'put', 'delete', 'list', 'head', 'batch'
         }
     )
 
@@ -1,6 +1,7 @@
 # backend/core/control/cpm.py
 
 import asyncio
+import heapq
 import logging
 from typing import Dict, List, Any, Optional, Set, Tuple
 from datetime import datetime
@@ -18,6 +19,10 @@ from ..messaging.event_types import (
     PipelineContext
 )
 from ..registry.component_registry import ComponentRegistry
+from .deadline_scheduler import DeadlineScheduler
+from .task_queue import TaskPriorityQueue
+from ..monitoring.system_sampler import get_system_sampler
+from .status_index import pipeline_status_index
 
 logger = logging.getLogger(__name__)
 
@@ -135,6 +140,9 @@ class ControlPointManager:
         self.control_point_history: Dict[str, List[ControlPoint]] = {}
         self.department_chains: Dict[str, Dict[str, ModuleIdentifier]] = {}
         self.active_pipelines: Dict[str, PipelineContext] = {}
+
+        # Control point timeout deadlines
+        self.timeout_scheduler = DeadlineScheduler()
         
         # Frontend communication tracking
         self.frontend_sessions: Dict[str, FrontendCPMContext] = {}
@@ -143,6 +151,8 @@ class ControlPointManager:
         # Processor tracking
         self.registered_processors: Dict[str, ProcessorContext] = {}
         self.processor_capabilities: Dict[str, Set[str]] = {}
+        self.processor_queues: Dict[str, TaskPriorityQueue] = {}
+        self.max_processor_queue_size = 2000
 
         # Process flow configuration
         self.stage_transitions = self._setup_stage_transitions()
@@ -179,6 +189,9 @@ class ControlPointManager:
                 callback=self._handle_control_message
             )
 
+            # Lifecycle events published by the services update the status index
+            await pipeline_status_index.attach(self.message_broker)
+
             # Register processing chains
             await self._register_department_chains()
 
@@ -198,23 +211,35 @@ class ControlPointManager:
             raise
 
     async def _monitor_process_timeouts(self):
-        """Monitor processes for timeouts"""
+        """Fire control point timeouts as their deadlines expire"""
         while True:
             try:
-                # Check active control points for timeouts
-                current_time = datetime.now()
-                for cp in list(self.active_control_points.values()):
-                    elapsed_minutes = (current_time - cp.created_at).total_seconds() / 60
-                    if elapsed_minutes > cp.timeout_minutes:
-                        await self._handle_process_timeout(cp)
-
-                await asyncio.sleep(60)  # Check every minute
+                await self.timeout_scheduler.run(self._on_control_point_deadline)
+                break
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Process timeout monitoring failed: {str(e)}")
-                await asyncio.sleep(60)  # Retry after error
+                await asyncio.sleep(1)  # Retry after error
+
+    async def _on_control_point_deadline(self, control_point_id: str) -> None:
+        """Handle an expired control point deadline"""
+        control_point = self.active_control_points.get(control_point_id)
+        if control_point:
+            await self._handle_process_timeout(control_point)
+
+    def extend_control_point_timeout(self, control_point_id: str, additional_minutes: float) -> bool:
+        """Push back the timeout of an active control point, unless it already fired"""
+        control_point = self.active_control_points.get(control_point_id)
+        if not control_point:
+            return False
+
+        if self.timeout_scheduler.extend(control_point_id, additional_minutes * 60) is None:
+            return False
+        control_point.timeout_minutes += additional_minutes
+        control_point.updated_at = datetime.now()
+        return True
 
     async def _monitor_resource_usage(self):
         """Monitor system resource usage"""
@@ -250,10 +275,11 @@ class ControlPointManager:
         Monitor system resource usage and publish alerts if thresholds are exceeded.
         """
         try:
-            # Collect system resource metrics
-            cpu_usage = psutil.cpu_percent()
-            memory_usage = psutil.virtual_memory().percent
-            disk_usage = psutil.disk_usage('/').percent
+            # Read the shared sample rather than measuring inline
+            snapshot = get_system_sampler().latest()
+            cpu_usage = snapshot.cpu_percent
+            memory_usage = snapshot.memory_percent
+            disk_usage = snapshot.disk_percent
 
             # Create metrics object
             metrics = {
@@ -850,6 +876,7 @@ class ControlPointManager:
                 await self._cleanup_pipeline(pipeline_id)
 
             # Clear state
+            self.timeout_scheduler.clear()
             self.active_control_points.clear()
             self.control_point_history.clear()
             self.active_pipelines.clear()
@@ -1241,6 +1268,9 @@ class ControlPointManager:
     ) -> None:
         """Send notification to frontend"""
         try:
+            # Status listings read the index rather than each pipeline's context
+            pipeline_status_index.apply_notification(pipeline_id, notification_type, data)
+
             # Get pipeline status
             status = self.get_pipeline_status(pipeline_id)
             if not status:
@@ -1274,8 +1304,19 @@ class ControlPointManager:
             pipeline_id: str,
             initial_metadata: Dict[str, Any]
     ) -> str:
-        """Create new processing pipeline"""
+        """
+        Create new processing pipeline
+
+        Re-runs of the same pipeline execute incrementally: departments
+        recompute only staged chunks whose fingerprints changed. Set
+        ``force_full_rebuild`` in the metadata to recompute everything.
+        """
         try:
+            initial_metadata = {
+                **initial_metadata,
+                'execution_mode': 'full' if initial_metadata.get('force_full_rebuild') else 'incremental'
+            }
+
             # Create pipeline context
             context = PipelineContext(
                 pipeline_id=pipeline_id,
@@ -1291,6 +1332,11 @@ class ControlPointManager:
             )
 
             self.active_pipelines[pipeline_id] = context
+            pipeline_status_index.set(pipeline_id, {
+                'state': ProcessingStatus.PENDING.value,
+                'current_stage': ProcessingStage.RECEPTION.value,
+                'progress': 0.0
+            })
 
             # Create initial control point
             await self.create_control_point(
@@ -1306,6 +1352,17 @@ class ControlPointManager:
             logger.error(f"Pipeline creation failed: {str(e)}")
             raise
 
+    async def rebuild_pipeline(
+            self,
+            pipeline_id: str,
+            metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Re-run a pipeline from scratch, discarding stored chunk results"""
+        return await self.create_pipeline(
+            pipeline_id,
+            {**(metadata or {}), 'force_full_rebuild': True}
+        )
+
     def _setup_stage_transitions(self) -> Dict[ProcessingStage, List[ProcessingStage]]:
         """
         Define the possible stage transitions in the data processing pipeline.
@@ -1412,6 +1469,7 @@ class ControlPointManager:
                     'pipeline_id': control_point.pipeline_id,
                     'stage': control_point.stage.value,
                     'staging_reference': control_point.staging_reference,
+                    'execution_mode': control_point.metadata.get('execution_mode', 'incremental'),
                     'metadata': control_point.metadata
                 },
                 source_identifier=self.module_identifier,
@@ -1771,6 +1829,7 @@ class ControlPointManager:
             # Remove from active
             if control_point.id in self.active_control_points:
                 del self.active_control_points[control_point.id]
+            self.timeout_scheduler.cancel(control_point.id)
 
             # Update pipeline
             pipeline = self.active_pipelines.get(control_point.pipeline_id)
@@ -1849,6 +1908,8 @@ class ControlPointManager:
                 await self._archive_control_point(cp)
 
             # Clear from active pipelines
+            pipeline_status_index.discard(pipeline_id)
+            get_system_sampler().evict_pipeline(pipeline_id)
             if pipeline_id in self.active_pipelines:
                 pipeline = self.active_pipelines.pop(pipeline_id)
 
@@ -1963,6 +2024,7 @@ class ControlPointManager:
 
             # Add to active control points
             self.active_control_points[control_point.id] = control_point
+            self.timeout_scheduler.schedule(control_point.id, control_point.timeout_minutes * 60)
 
             # Start stage processing
             await self._start_stage_processing(control_point)
@@ -2709,11 +2771,18 @@ class ControlPointManager:
                 await self._handle_pipeline_rejection(control_point)
 
             elif action_type == 'restart':
-                # Restart the entire pipeline
-                await self.create_pipeline(
-                    pipeline_id=control_point.pipeline_id,
-                    initial_metadata=control_point.metadata
-                )
+                # Restart the entire pipeline; unchanged chunks are reused
+                # unless the decision asks for a full rebuild
+                if action.get('metadata', {}).get('force_full_rebuild'):
+                    await self.rebuild_pipeline(
+                        control_point.pipeline_id,
+                        control_point.metadata
+                    )
+                else:
+                    await self.create_pipeline(
+                        pipeline_id=control_point.pipeline_id,
+                        initial_metadata=control_point.metadata
+                    )
 
         except Exception as e:
             logger.error(f"Decision action execution failed: {str(e)}")
@@ -3565,6 +3634,58 @@ class ControlPointManager:
         except Exception as e:
             logger.error(f"Backpressure escalation failed: {str(e)}")
 
+    def _get_processor_queue(self, processor_id: str) -> TaskPriorityQueue:
+        """Get (or create) the priority queue for a processor"""
+        queue = self.processor_queues.get(processor_id)
+        if queue is None:
+            queue = TaskPriorityQueue(max_size=self.max_processor_queue_size)
+            self.processor_queues[processor_id] = queue
+        return queue
+
+    def _sync_queue_size(self, processor_id: str) -> None:
+        context = self.registered_processors.get(processor_id)
+        if context:
+            context.message_queue_size = len(self._get_processor_queue(processor_id))
+
+    async def enqueue_processor_task(self, processor_id: str, task: ProcessingMessage) -> bool:
+        """
+        Queue a task for a processor, subject to backpressure admission
+
+        Returns False when the task is rejected; the caller owns the retry.
+        """
+        try:
+            queue = self._get_processor_queue(processor_id)
+            context = self.registered_processors.get(processor_id)
+
+            base_priority = getattr(task.metadata.priority, 'value', task.metadata.priority)
+            level = self._calculate_backpressure_level(context) if context else 'low'
+            if not queue.admits(base_priority, level):
+                logger.warning(
+                    f"Task {task.id} rejected by processor {processor_id} "
+                    f"(backpressure: {level}, queued: {len(queue)})"
+                )
+                return False
+
+            queue.push(task.id, task, self._calculate_task_priority(task, context))
+            self._sync_queue_size(processor_id)
+            return True
+
+        except Exception as e:
+            logger.error(f"Task enqueue failed: {str(e)}")
+            raise
+
+    def dequeue_processor_task(self, processor_id: str) -> Optional[ProcessingMessage]:
+        """Pop the highest-priority (aged) task for a processor"""
+        entry = self._get_processor_queue(processor_id).pop()
+        self._sync_queue_size(processor_id)
+        return entry.item if entry else None
+
+    def cancel_processor_task(self, processor_id: str, task_id: str) -> bool:
+        """Remove a queued task by id"""
+        entry = self._get_processor_queue(processor_id).remove(task_id)
+        self._sync_queue_size(processor_id)
+        return entry is not None
+
     async def _redistribute_tasks(self, processor_id: str) -> None:
         """Redistribute tasks from overloaded processor"""
         try:
@@ -3588,107 +3709,91 @@ class ControlPointManager:
                 context.active_tasks // 2
             )
             
-            # Redistribute tasks
+            # Each task goes to the currently least-loaded target
+            targets = [
+                (self.registered_processors[pid].message_queue_size, pid)
+                for pid in available_processors
+            ]
+            heapq.heapify(targets)
+            moved = 0
             for _ in range(redistribution_amount):
-                target_processor = available_processors[0]  # Simple round-robin
-                await self._move_task(processor_id, target_processor)
+                size, target_processor = heapq.heappop(targets)
+                if not await self._move_task(processor_id, target_processor):
+                    break
+                moved += 1
+                heapq.heappush(targets, (size + 1, target_processor))
                 
             logger.info(
-                f"Redistributed {redistribution_amount} tasks from processor {processor_id}"
+                f"Redistributed {moved} tasks from processor {processor_id}"
             )
             
         except Exception as e:
             logger.error(f"Task redistribution failed: {str(e)}")
 
-    async def _move_task(self, source_processor: str, target_processor: str) -> None:
-        """Move a task from one processor to another"""
+    async def _move_task(
+            self,
+            source_processor: str,
+            target_processor: str,
+            task_id: Optional[str] = None
+    ) -> bool:
+        """Move a task (the head, or ``task_id``) between processor queues, keeping its age"""
         try:
-            # Get task from source processor
-            task = await self.message_broker.get_next_task(source_processor)
-            if not task:
-                return
-                
-            # Forward task to target processor
-            await self.message_broker.forward_task(
-                task,
-                target_processor,
-                metadata=MessageMetadata(
-                    priority=MessagePriority.HIGH,
-                    source_processor=source_processor
-                )
-            )
-            
+            source_queue = self._get_processor_queue(source_processor)
+            entry = source_queue.remove(task_id) if task_id else source_queue.pop()
+            if not entry:
+                return False
+
+            self._get_processor_queue(target_processor).push_entry(entry)
+
             # Update processor contexts
-            self.registered_processors[source_processor].message_queue_size -= 1
-            self.registered_processors[target_processor].message_queue_size += 1
+            self._sync_queue_size(source_processor)
+            self._sync_queue_size(target_processor)
+            return True
             
         except Exception as e:
             logger.error(f"Task movement failed: {str(e)}")
+            return False
 
     async def _adjust_task_prioritization(self, processor_id: str) -> None:
-        """Adjust task prioritization for processor using advanced algorithms"""
+        """
+        Refresh time-dependent priorities for a processor's queue
+
+        Aging is built into the queue ordering, so only tasks with a
+        deadline (whose urgency changes over time) are rescored.
+        """
         try:
-            # Get current queue and processor context
-            queue = await self.message_broker.get_processor_queue(processor_id)
+            queue = self._get_processor_queue(processor_id)
             context = self.registered_processors[processor_id]
             
-            # Calculate priority scores for each task
-            prioritized_tasks = await self._calculate_task_priorities(queue, context)
-            
-            # Apply priority-based sorting with additional factors
-            sorted_tasks = self._sort_tasks_by_priority(prioritized_tasks)
-            
-            # Apply fairness adjustments
-            adjusted_tasks = self._apply_fairness_adjustments(sorted_tasks, context)
-            
-            # Requeue tasks in priority order
-            await self.message_broker.reorder_processor_queue(
-                processor_id,
-                adjusted_tasks
-            )
+            for entry in queue:
+                if getattr(entry.item.metadata, 'deadline', None):
+                    queue.update_priority(
+                        entry.task_id,
+                        self._calculate_task_priority(entry.item, context)
+                    )
             
             # Update processor metrics
-            await self._update_processor_metrics(processor_id, adjusted_tasks)
+            await self._update_processor_metrics(processor_id, queue.items())
             
         except Exception as e:
             logger.error(f"Task prioritization adjustment failed: {str(e)}")
 
-    async def _calculate_task_priorities(self, queue: List[ProcessingMessage], context: ProcessorContext) -> List[Tuple[ProcessingMessage, float]]:
-        """Calculate priority scores for tasks using multiple factors"""
-        prioritized_tasks = []
+    def _calculate_task_priority(self, task: ProcessingMessage, context: Optional[ProcessorContext]) -> float:
+        """Calculate a task's priority score at enqueue time"""
+        base_priority = getattr(task.metadata.priority, 'value', task.metadata.priority)
+        resource_score = self._calculate_resource_impact(task, context) if context else 0.0
         
-        for task in queue:
-            # Base priority from message metadata
-            base_priority = task.metadata.priority.value
-            
-            # Calculate urgency score
-            urgency_score = self._calculate_urgency_score(task)
-            
-            # Calculate resource impact score
-            resource_score = self._calculate_resource_impact(task, context)
-            
-            # Calculate dependency score
-            dependency_score = self._calculate_dependency_score(task)
-            
-            # Calculate fairness score
-            fairness_score = self._calculate_fairness_score(task, context)
-            
-            # Weighted combination of scores
-            total_score = (
-                0.3 * base_priority +
-                0.25 * urgency_score +
-                0.2 * resource_score +
-                0.15 * dependency_score +
-                0.1 * fairness_score
-            )
-            
-            prioritized_tasks.append((task, total_score))
-            
-        return prioritized_tasks
+        # Waiting-time fairness comes from queue aging rather than a score term
+        return (
+            0.35 * base_priority +
+            0.3 * self._calculate_urgency_score(task) +
+            0.2 * resource_score +
+            0.15 * self._calculate_dependency_score(task)
+        )
 
     def _calculate_urgency_score(self, task: ProcessingMessage) -> float:
         """Calculate urgency score based on deadlines and dependencies"""
-        deadline = task.metadata.deadline
+        deadline = getattr(task.metadata, 'deadline', None)
         if not deadline:
             return 0.5
             
@@ -3706,19 +3811,19 @@ class ControlPointManager:
     def _calculate_resource_impact(self, task: ProcessingMessage, context: ProcessorContext) -> float:
         """Calculate resource impact score based on task requirements"""
         # Get task resource requirements
-        requirements = task.metadata.resource_requirements or {}
+        requirements = getattr(task.metadata, 'resource_requirements', None) or {}
         
         # Calculate resource utilization impact
-        cpu_impact = requirements.get('cpu', 0) / context.max_cpu
-        memory_impact = requirements.get('memory', 0) / context.max_memory
-        io_impact = requirements.get('io_operations', 0) / context.max_io_ops
+        cpu_impact = requirements.get('cpu', 0) / getattr(context, 'max_cpu', 1)
+        memory_impact = requirements.get('memory', 0) / getattr(context, 'max_memory', 1)
+        io_impact = requirements.get('io_operations', 0) / getattr(context, 'max_io_ops', 1)
         
         # Weighted average of resource impacts
         return (0.4 * cpu_impact + 0.3 * memory_impact + 0.3 * io_impact)
 
     def _calculate_dependency_score(self, task: ProcessingMessage) -> float:
         """Calculate dependency score based on task dependencies"""
-        dependencies = task.metadata.dependencies or []
+        dependencies = getattr(task.metadata, 'dependencies', None) or []
         if not dependencies:
             return 0.5
             
@@ -3728,125 +3833,6 @@ class ControlPointManager:
         # Normalize score
         return min(1.0, blocked_count / len(dependencies))
 
-    def _calculate_fairness_score(self, task: ProcessingMessage, context: ProcessorContext) -> float:
-        """Calculate fairness score to prevent starvation"""
-        # Get task source and age
-        source = task.metadata.source_component
-        age = (datetime.utcnow() - task.metadata.created_at).total_seconds()
-        
-        # Calculate waiting time ratio
-        wait_ratio = min(1.0, age / context.max_wait_time)
-        
-        # Get source-specific waiting time
-        source_wait_time = context.source_wait_times.get(source, 0)
-        source_ratio = min(1.0, source_wait_time / context.max_source_wait_time)
-        
-        # Combine factors
-        return 0.6 * wait_ratio + 0.4 * source_ratio
-
-    def _sort_tasks_by_priority(self, prioritized_tasks: List[Tuple[ProcessingMessage, float]]) -> List[ProcessingMessage]:
-        """Sort tasks by priority score with tie-breaking"""
-        # Sort by priority score
-        sorted_tasks = sorted(prioritized_tasks, key=lambda x: x[1], reverse=True)
-        
-        # Apply tie-breaking rules
-        final_order = []
-        current_score = None
-        current_group = []
-        
-        for task, score in sorted_tasks:
-            if current_score is None:
-                current_score = score
-                current_group.append(task)
-            elif abs(score - current_score) < 0.01:  # Consider scores equal if difference is small
-                current_group.append(task)
-            else:
-                # Sort current group by tie-breaking rules
-                final_order.extend(self._apply_tie_breaking(current_group))
-                current_score = score
-                current_group = [task]
-                
-        # Handle last group
-        if current_group:
-            final_order.extend(self._apply_tie_breaking(current_group))
-            
-        return final_order
-
-    def _apply_tie_breaking(self, tasks: List[ProcessingMessage]) -> List[ProcessingMessage]:
-        """Apply tie-breaking rules to tasks with equal priority scores"""
-        # Sort by multiple criteria in order of importance
-        return sorted(
-            tasks,
-            key=lambda t: (
-                t.metadata.priority.value,  # Message priority
-                t.metadata.deadline or datetime.max,  # Deadline
-                t.metadata.created_at,  # Creation time
-                t.metadata.source_component  # Source component
-            )
-        )
-
-    def _apply_fairness_adjustments(self, tasks: List[ProcessingMessage], context: ProcessorContext) -> List[ProcessingMessage]:
-        """Apply fairness adjustments to prevent starvation"""
-        # Group tasks by source
-        source_groups = {}
-        for task in tasks:
-            source = task.metadata.source_component
-            if source not in source_groups:
-                source_groups[source] = []
-            source_groups[source].append(task)
-            
-        # Calculate fair distribution
-        fair_distribution = self._calculate_fair_distribution(tasks, source_groups)
-        
-        # Apply distribution while maintaining priority order within groups
-        adjusted_tasks = []
-        for source, count in fair_distribution.items():
-            source_tasks = source_groups.get(source, [])
-            adjusted_tasks.extend(source_tasks[:count])
-            
-        return adjusted_tasks
-
-    def _calculate_fair_distribution(self, tasks: List[ProcessingMessage], source_groups: Dict[str, List[ProcessingMessage]]) -> Dict[str, int]:
-        """Calculate fair distribution of tasks across sources"""
-        total_tasks = len(tasks)
-        num_sources = len(source_groups)
-        
-        # Calculate base fair share
-        base_share = total_tasks // num_sources
-        remainder = total_tasks % num_sources
-        
-        # Initialize distribution
-        distribution = {}
-        for source in source_groups:
-            distribution[source] = base_share
-            
-        # Distribute remainder based on source priority
-        if remainder > 0:
-            # Sort sources by priority (can be customized based on business rules)
-            priority_sources = sorted(
-                source_groups.keys(),
-                key=lambda s: self._get_source_priority(s)
-            )
-            
-            # Distribute remainder to highest priority sources
-            for source in priority_sources[:remainder]:
-                distribution[source] += 1
-                
-        return distribution
-
-    def _get_source_priority(self, source: str) -> int:
-        """Get priority for a source component"""
-        # Define source priorities (can be customized)
-        source_priorities = {
-            'data_import': 1,
-            'data_transform': 2,
-            'data_validate': 3,
-            'data_export': 4,
-            'quality_check': 5,
-            'analytics': 6
-        }
-        return source_priorities.get(source, 0)
-
     async def _update_processor_metrics(self, processor_id: str, tasks: List[ProcessingMessage]) -> None:
         """Update processor metrics with detailed performance analytics"""
         try:
@@ -0,0 +1,179 @@
+# backend/core/control/deadline_scheduler.py
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(order=True)
+class _DeadlineEntry:
+    deadline: float
+    sequence: int
+    key: str = field(compare=False)
+    active: bool = field(default=True, compare=False)
+
+
+@dataclass
+class SchedulerStats:
+    """Precision and cost counters for the deadline scheduler"""
+    scheduled: int = 0
+    cancelled: int = 0
+    fired: int = 0
+    entries_examined: int = 0
+    max_lateness: float = 0.0
+    total_lateness: float = 0.0
+
+    @property
+    def mean_lateness(self) -> float:
+        return self.total_lateness / self.fired if self.fired else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'scheduled': self.scheduled,
+            'cancelled': self.cancelled,
+            'fired': self.fired,
+            'entries_examined': self.entries_examined,
+            'max_lateness_seconds': self.max_lateness,
+            'mean_lateness_seconds': self.mean_lateness
+        }
+
+
+class DeadlineScheduler:
+    """
+    Min-heap of keyed deadlines
+
+    Scheduling and rescheduling push an entry in O(log n); cancellation
+    marks the indexed entry inactive and stale entries are discarded when
+    they reach the top (or by a rebuild once they outnumber live ones).
+    ``run`` sleeps exactly until the earliest live deadline and is woken
+    early when a sooner deadline is scheduled.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self.stats = SchedulerStats()
+        self._heap: List[_DeadlineEntry] = []
+        self._entries: Dict[str, _DeadlineEntry] = {}
+        self._sequence = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._running = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def schedule(self, key: str, delay_seconds: float) -> float:
+        """Set (or replace) the deadline for ``key``; returns the absolute deadline"""
+        self._deactivate(key)
+        entry = _DeadlineEntry(self.clock() + delay_seconds, next(self._sequence), key)
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+        self.stats.scheduled += 1
+
+        if self._wakeup is not None and self._heap[0] is entry:
+            self._wakeup.set()
+        return entry.deadline
+
+    def reschedule(self, key: str, delay_seconds: float) -> Optional[float]:
+        """Move an existing deadline; no-op for unknown keys"""
+        if key not in self._entries:
+            return None
+        return self.schedule(key, delay_seconds)
+
+    def extend(self, key: str, extra_seconds: float) -> Optional[float]:
+        """
+        Push an existing deadline back by ``extra_seconds``
+
+        Returns None for unknown keys and for deadlines that have already
+        passed, whether or not their callback has run yet.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.deadline <= self.clock():
+            return None
+        return self.schedule(key, entry.deadline + extra_seconds - self.clock())
+
+    def cancel(self, key: str) -> bool:
+        if not self._deactivate(key):
+            return False
+        self.stats.cancelled += 1
+        return True
+
+    def deadline_of(self, key: str) -> Optional[float]:
+        entry = self._entries.get(key)
+        return entry.deadline if entry else None
+
+    def next_deadline(self) -> Optional[float]:
+        self._discard_stale_head()
+        return self._heap[0].deadline if self._heap else None
+
+    def pop_expired(self, now: Optional[float] = None) -> List[str]:
+        """Remove and return keys whose deadline has passed, earliest first"""
+        now = self.clock() if now is None else now
+        expired = []
+        while self._heap and self._heap[0].deadline <= now:
+            entry = heapq.heappop(self._heap)
+            self.stats.entries_examined += 1
+            if not entry.active:
+                continue
+            del self._entries[entry.key]
+            lateness = now - entry.deadline
+            self.stats.fired += 1
+            self.stats.total_lateness += lateness
+            self.stats.max_lateness = max(self.stats.max_lateness, lateness)
+            expired.append(entry.key)
+        return expired
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._entries.clear()
+
+    async def run(self, callback: Callable[[str], Awaitable[None]]) -> None:
+        """Invoke ``callback(key)`` as each deadline expires, until stopped"""
+        self._wakeup = asyncio.Event()
+        self._running = True
+        try:
+            while self._running:
+                next_deadline = self.next_deadline()
+                timeout = None if next_deadline is None else max(next_deadline - self.clock(), 0.0)
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+
+                for key in self.pop_expired():
+                    try:
+                        await callback(key)
+                    except Exception as e:
+                        logger.error(f"Deadline callback failed for {key}: {str(e)}")
+        finally:
+            self._running = False
+            self._wakeup = None
+
+    def stop(self) -> None:
+        self._running = False
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _deactivate(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        entry.active = False
+        # Rebuild once stale entries dominate, keeping the heap O(live)
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._entries):
+            self._heap = [e for e in self._heap if e.active]
+            heapq.heapify(self._heap)
+        return True
+
+    def _discard_stale_head(self) -> None:
+        while self._heap and not self._heap[0].active:
+            heapq.heappop(self._heap)
@@ -0,0 +1,206 @@
+# backend/core/control/status_index.py
+
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Lifecycle events (MessageType values) and the runtime state each one implies
+STATE_EVENTS = {
+    'pipeline.start.complete': 'running',
+    'pipeline.resume.complete': 'running',
+    'pipeline.pause.complete': 'paused',
+    'pipeline.cancel.complete': 'cancelled'
+}
+STAGE_EVENTS = ('pipeline.stage.status.update', 'pipeline.stage.complete.notify')
+ERROR_EVENTS = ('pipeline.error.notify', 'pipeline.stage.error')
+# Only these open an entry; other events for unknown pipelines are ignored
+CREATE_EVENTS = ('pipeline.start.complete',)
+CLEANUP_EVENT = 'pipeline.cleanup.complete'
+
+# CPM frontend notification types and the runtime state each one implies
+NOTIFICATION_STATES = {
+    'stage_started': 'running',
+    'pipeline_completed': 'completed',
+    'pipeline_rejected': 'rejected'
+}
+ERROR_NOTIFICATIONS = ('stage_error', 'error', 'stage_timeout')
+
+# Every runtime status has exactly these fields, whichever source it came from
+STATUS_FIELDS = (
+    'pipeline_id', 'state', 'current_stage', 'last_completed_stage', 'progress',
+    'error_count', 'last_error', 'pending_decision', 'completed_at', 'updated_at'
+)
+
+
+def status_view(status: Dict[str, Any]) -> Dict[str, Any]:
+    """A status dict reduced to ``STATUS_FIELDS``, with progress as a single fraction"""
+    view = {field: status.get(field) for field in STATUS_FIELDS}
+    if isinstance(view['progress'], dict):
+        view['progress'] = view['progress'].get('overall')
+    view['error_count'] = view['error_count'] or 0
+    view['pending_decision'] = bool(view['pending_decision'])
+    return view
+
+
+class PipelineStatusIndex:
+    """
+    In-memory runtime status of every live pipeline, keyed by pipeline id
+
+    The index is written as pipelines move, by CPM notifications and by
+    the pipeline lifecycle events on the message broker, so reading the
+    status of a whole page of pipelines is a single dictionary pass with
+    no per-pipeline awaits. Entries are opened by ``set`` or a start event
+    and leave the index when the pipeline is cleaned up; later events for
+    a pipeline that is not indexed are ignored, so a late message cannot
+    bring a discarded pipeline back. ``max_entries`` bounds the index if
+    cleanup events are lost.
+    """
+
+    def __init__(self, max_entries: int = 50000):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._brokers = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, pipeline_id: str) -> bool:
+        return str(pipeline_id) in self._entries
+
+    def get(self, pipeline_id: str) -> Optional[Dict[str, Any]]:
+        return self.get_many([pipeline_id]).get(str(pipeline_id))
+
+    def get_many(self, pipeline_ids: Iterable[Any]) -> Dict[str, Dict[str, Any]]:
+        """Status of each indexed pipeline among ``pipeline_ids``, in one call"""
+        statuses = {}
+        with self._lock:
+            for pipeline_id in pipeline_ids:
+                entry = self._entries.get(str(pipeline_id))
+                if entry is not None:
+                    statuses[str(pipeline_id)] = status_view(entry)
+        return statuses
+
+    def set(self, pipeline_id: str, status: Dict[str, Any]) -> None:
+        """Replace the status of a pipeline"""
+        pipeline_id = str(pipeline_id)
+        with self._lock:
+            self._entries[pipeline_id] = {
+                'pipeline_id': pipeline_id,
+                'error_count': 0,
+                **status,
+                'updated_at': status.get('updated_at') or datetime.utcnow().isoformat()
+            }
+            self._touch(pipeline_id)
+
+    def update(self, pipeline_id: str, create: bool = False, **fields: Any) -> None:
+        """Merge ``fields`` into the status of an indexed pipeline (or open it with ``create``)"""
+        pipeline_id = str(pipeline_id)
+        with self._lock:
+            entry = self._entries.get(pipeline_id)
+            if entry is None:
+                if not create:
+                    return
+                entry = self._entries[pipeline_id] = {'pipeline_id': pipeline_id, 'error_count': 0}
+            entry.update({key: value for key, value in fields.items() if value is not None})
+            entry['updated_at'] = datetime.utcnow().isoformat()
+            self._touch(pipeline_id)
+
+    def discard(self, pipeline_id: str) -> None:
+        with self._lock:
+            self._entries.pop(str(pipeline_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def record_error(self, pipeline_id: str, error: Optional[str] = None) -> None:
+        """Count an error against an indexed pipeline"""
+        pipeline_id = str(pipeline_id)
+        with self._lock:
+            entry = self._entries.get(pipeline_id)
+            if entry is None:
+                return
+            entry['error_count'] = entry.get('error_count', 0) + 1
+            if error:
+                entry['last_error'] = error
+            entry['updated_at'] = datetime.utcnow().isoformat()
+            self._touch(pipeline_id)
+
+    def apply_notification(self, pipeline_id: str, notification_type: str, data: Dict[str, Any]) -> None:
+        """Fold a CPM frontend notification into the index"""
+        if notification_type in ERROR_NOTIFICATIONS:
+            self.record_error(pipeline_id, data.get('error'))
+            return
+
+        fields: Dict[str, Any] = {'state': NOTIFICATION_STATES.get(notification_type)}
+        if notification_type == 'stage_started':
+            fields['current_stage'] = data.get('stage')
+        elif notification_type == 'stage_completed':
+            fields['last_completed_stage'] = data.get('stage')
+            fields['current_stage'] = data.get('next_stage')
+            if data.get('requires_decision'):
+                fields['pending_decision'] = True
+        elif notification_type == 'progress_update':
+            fields['progress'] = data.get('overall_progress')
+        elif notification_type == 'pipeline_completed':
+            fields['completed_at'] = datetime.utcnow().isoformat()
+        self.update(pipeline_id, **fields)
+
+    def apply_event(self, event_type: str, content: Dict[str, Any]) -> None:
+        """Fold a pipeline lifecycle event from the message broker into the index"""
+        pipeline_id = content.get('pipeline_id')
+        if not pipeline_id:
+            return
+
+        if event_type == CLEANUP_EVENT:
+            self.discard(pipeline_id)
+        elif event_type in ERROR_EVENTS:
+            self.record_error(pipeline_id, content.get('error'))
+        elif event_type in STATE_EVENTS:
+            self.update(pipeline_id, create=event_type in CREATE_EVENTS, state=STATE_EVENTS[event_type])
+        elif event_type in STAGE_EVENTS:
+            progress = content.get('progress')
+            if isinstance(progress, dict):
+                progress = progress.get('overall')
+            self.update(
+                pipeline_id,
+                current_stage=content.get('next_stage', content.get('stage')),
+                last_completed_stage=content.get('stage') if 'next_stage' in content else None,
+                progress=progress
+            )
+
+    async def handle_message(self, message: Any) -> None:
+        """Broker callback for the lifecycle events in ``subscribed_events``"""
+        try:
+            event_type = getattr(message.message_type, 'value', message.message_type)
+            self.apply_event(event_type, message.content or {})
+        except Exception as e:
+            logger.error(f"Failed to index pipeline status: {str(e)}")
+
+    async def attach(self, message_broker: Any, module_identifier: Union[str, Any] = 'pipeline_status_index') -> None:
+        """Keep the index current from ``message_broker``; repeated calls are no-ops"""
+        if id(message_broker) in self._brokers:
+            return
+        self._brokers.add(id(message_broker))
+        await message_broker.subscribe(
+            module_identifier=module_identifier,
+            message_patterns=subscribed_events(),
+            callback=self.handle_message
+        )
+
+    def _touch(self, pipeline_id: str) -> None:
+        self._entries.move_to_end(pipeline_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+def subscribed_events():
+    return [*STATE_EVENTS, *STAGE_EVENTS, *ERROR_EVENTS, CLEANUP_EVENT]
+
+
+pipeline_status_index = PipelineStatusIndex()
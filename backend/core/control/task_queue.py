@@ -0,0 +1,169 @@
+# backend/core/control/task_queue.py
+
+import itertools
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Minimum task priority admitted at each backpressure level
+ADMISSION_MIN_PRIORITY = {
+    'low': 0,     # MessagePriority.LOW
+    'medium': 1,  # MessagePriority.NORMAL
+    'high': 2     # MessagePriority.HIGH
+}
+
+
+@dataclass
+class QueuedTask:
+    """Heap entry; ``key`` already folds in the task's aging credit"""
+    task_id: str
+    item: Any
+    priority: float
+    enqueued_at: float
+    key: float
+    sequence: int
+
+
+class TaskPriorityQueue:
+    """
+    Indexed max-priority heap of tasks keyed by task id
+
+    Insert, pop, priority change and removal by id are O(log n). Fairness
+    aging is applied through virtual time: a task's effective priority is
+    ``priority + aging_rate * (now - enqueued_at)``. Since ``now`` is
+    common to every task, ordering by ``priority - aging_rate * enqueued_at``
+    is equivalent and never needs rescoring as time passes.
+    """
+
+    def __init__(
+            self,
+            aging_rate: float = 1.0 / 600,
+            max_size: Optional[int] = None,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        self.aging_rate = aging_rate
+        self.max_size = max_size
+        self.clock = clock
+        self._heap: List[QueuedTask] = []
+        self._positions: Dict[str, int] = {}
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._positions
+
+    def __iter__(self) -> Iterator[QueuedTask]:
+        """Entries in heap (not priority) order"""
+        return iter(list(self._heap))
+
+    def push(self, task_id: str, item: Any, priority: float) -> QueuedTask:
+        if task_id in self._positions:
+            raise ValueError(f"Task already queued: {task_id}")
+        now = self.clock()
+        return self._insert(QueuedTask(
+            task_id, item, priority, now,
+            self._key(priority, now), next(self._sequence)
+        ))
+
+    def push_entry(self, entry: QueuedTask) -> QueuedTask:
+        """Insert an entry removed from another queue, keeping its age"""
+        if entry.task_id in self._positions:
+            raise ValueError(f"Task already queued: {entry.task_id}")
+        entry.key = self._key(entry.priority, entry.enqueued_at)
+        entry.sequence = next(self._sequence)
+        return self._insert(entry)
+
+    def peek(self) -> Optional[QueuedTask]:
+        return self._heap[0] if self._heap else None
+
+    def pop(self) -> Optional[QueuedTask]:
+        if not self._heap:
+            return None
+        return self._remove_at(0)
+
+    def remove(self, task_id: str) -> Optional[QueuedTask]:
+        position = self._positions.get(task_id)
+        if position is None:
+            return None
+        return self._remove_at(position)
+
+    def update_priority(self, task_id: str, priority: float) -> bool:
+        position = self._positions.get(task_id)
+        if position is None:
+            return False
+        entry = self._heap[position]
+        entry.priority = priority
+        entry.key = self._key(priority, entry.enqueued_at)
+        self._sift_up(position)
+        self._sift_down(self._positions[task_id])
+        return True
+
+    def effective_priority(self, task_id: str) -> Optional[float]:
+        """Priority including aging credit accrued so far"""
+        position = self._positions.get(task_id)
+        if position is None:
+            return None
+        entry = self._heap[position]
+        return entry.priority + self.aging_rate * (self.clock() - entry.enqueued_at)
+
+    def admits(self, priority: float, backpressure_level: str = 'low') -> bool:
+        """Admission check combining queue capacity and backpressure level"""
+        if self.max_size is not None and len(self._heap) >= self.max_size:
+            return False
+        return priority >= ADMISSION_MIN_PRIORITY.get(backpressure_level, 0)
+
+    def items(self) -> List[Any]:
+        return [entry.item for entry in self._heap]
+
+    def _key(self, priority: float, enqueued_at: float) -> float:
+        return priority - self.aging_rate * enqueued_at
+
+    def _before(self, a: QueuedTask, b: QueuedTask) -> bool:
+        # Higher key first; FIFO among equal keys
+        return (a.key, -a.sequence) > (b.key, -b.sequence)
+
+    def _insert(self, entry: QueuedTask) -> QueuedTask:
+        self._heap.append(entry)
+        self._positions[entry.task_id] = len(self._heap) - 1
+        self._sift_up(len(self._heap) - 1)
+        return entry
+
+    def _remove_at(self, position: int) -> QueuedTask:
+        entry = self._heap[position]
+        last = self._heap.pop()
+        del self._positions[entry.task_id]
+        if position < len(self._heap):
+            self._heap[position] = last
+            self._positions[last.task_id] = position
+            self._sift_up(position)
+            self._sift_down(self._positions[last.task_id])
+        return entry
+
+    def _swap(self, i: int, j: int) -> None:
+        heap = self._heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self._positions[heap[i].task_id] = i
+        self._positions[heap[j].task_id] = j
+
+    def _sift_up(self, position: int) -> None:
+        while position > 0:
+            parent = (position - 1) // 2
+            if not self._before(self._heap[position], self._heap[parent]):
+                break
+            self._swap(position, parent)
+            position = parent
+
+    def _sift_down(self, position: int) -> None:
+        size = len(self._heap)
+        while True:
+            best = position
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < size and self._before(self._heap[child], self._heap[best]):
+                    best = child
+            if best == position:
+                return
+            self._swap(position, best)
+            position = best
+
@@ -0,0 +1,163 @@
+# backend/core/control/work_queue.py
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+from uuid import UUID
+
+import psutil
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.repository.work_queue import (
+    DEFAULT_MAX_ATTEMPTS,
+    ClaimedItem,
+    ItemResult,
+    WorkQueueRepository,
+    retry_delay
+)
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[ClaimedItem], Awaitable[Any]]
+
+
+@dataclass
+class WorkQueueStats:
+    """Throughput counters for one DurableWorkQueue"""
+    claims: int = 0
+    claimed: int = 0
+    completed: int = 0
+    failed: int = 0
+    reclaimed: int = 0
+    claim_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'claims': self.claims,
+            'claimed': self.claimed,
+            'completed': self.completed,
+            'failed': self.failed,
+            'reclaimed': self.reclaimed,
+            'mean_claim_seconds': self.claim_seconds / self.claims if self.claims else 0.0
+        }
+
+
+class DurableWorkQueue:
+    """
+    Worker engine over the ``event_queue`` table
+
+    Each worker loop claims up to ``batch_size`` due items in one statement,
+    runs the handler on them concurrently, and records every outcome
+    (execution time, memory delta, retry schedule) in one batched ack.
+    Expired leases are reclaimed at most every ``reclaim_interval`` seconds
+    by whichever worker gets there first, so a crashed worker's items become
+    visible again without a separate sweeper.
+
+    Handlers are cut off after ``handler_timeout`` (half the visibility
+    timeout by default), which leaves the rest of the lease for the batched
+    ack; a slow handler fails its item instead of letting the lease lapse
+    and the item run twice.
+    """
+
+    def __init__(
+            self,
+            session_factory: Callable[[], AsyncSession],
+            handler: Handler,
+            batch_size: int = 100,
+            visibility_timeout: float = 60.0,
+            handler_timeout: Optional[float] = None,
+            max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+            backoff: Callable[[int], float] = retry_delay,
+            poll_interval: float = 0.5,
+            reclaim_interval: float = 10.0,
+            processor_id: Optional[UUID] = None,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        self.session_factory = session_factory
+        self.handler = handler
+        self.batch_size = batch_size
+        self.visibility_timeout = visibility_timeout
+        self.handler_timeout = handler_timeout if handler_timeout is not None else visibility_timeout / 2
+        if not 0 < self.handler_timeout < visibility_timeout:
+            raise ValueError("handler_timeout must be positive and below visibility_timeout")
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.poll_interval = poll_interval
+        self.reclaim_interval = reclaim_interval
+        self.processor_id = processor_id
+        self.clock = clock
+        self.stats = WorkQueueStats()
+        self._process = psutil.Process()
+        self._last_reclaim: Optional[float] = None
+        self._workers: List[asyncio.Task] = []
+        self._stopping = asyncio.Event()
+
+    async def enqueue(self, items: Iterable[Dict[str, Any]]) -> int:
+        async with self.session_factory() as session:
+            return await WorkQueueRepository(session).enqueue_many(items, self.processor_id)
+
+    async def run_once(self) -> int:
+        """Claim and process one batch; returns the number of items claimed"""
+        async with self.session_factory() as session:
+            repository = WorkQueueRepository(session)
+
+            now = self.clock()
+            if self._last_reclaim is None or now - self._last_reclaim >= self.reclaim_interval:
+                self._last_reclaim = now
+                self.stats.reclaimed += await repository.reclaim_expired(self.max_attempts)
+
+            started = time.perf_counter()
+            items = await repository.claim(self.batch_size, self.visibility_timeout, self.processor_id)
+            self.stats.claims += 1
+            self.stats.claim_seconds += time.perf_counter() - started
+            if not items:
+                return 0
+            self.stats.claimed += len(items)
+
+            results = await asyncio.gather(*(self._execute(item) for item in items))
+            await repository.acknowledge(list(results), self.max_attempts, self.backoff)
+
+        failures = sum(1 for result in results if result.error is not None)
+        self.stats.failed += failures
+        self.stats.completed += len(results) - failures
+        return len(items)
+
+    async def _execute(self, item: ClaimedItem) -> ItemResult:
+        rss_before = self._process.memory_info().rss
+        started = time.perf_counter()
+        error = None
+        try:
+            await asyncio.wait_for(self.handler(item), timeout=self.handler_timeout)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            logger.warning(f"Queue item {item.id} failed on attempt {item.attempt_count}: {error}")
+        elapsed = time.perf_counter() - started
+        # Process-wide RSS delta in MB; approximate when handlers overlap
+        memory = max(self._process.memory_info().rss - rss_before, 0) / (1024 * 1024)
+        return ItemResult(item, elapsed, memory, error)
+
+    async def _worker(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                claimed = await self.run_once()
+            except Exception as e:
+                logger.error(f"Work queue iteration failed: {str(e)}")
+                claimed = 0
+            if claimed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def start(self, workers: int = 1) -> None:
+        """Start ``workers`` concurrent claim loops"""
+        self._stopping.clear()
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(workers)]
+
+    async def stop(self) -> None:
+        """Finish in-flight batches and stop the claim loops"""
+        self._stopping.set()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
@@ -27,6 +27,9 @@ from ..messaging.event_types import (
     ManagerState
 )
 from .base.base_manager import BaseManager
+from data.processing.advanced_analytics.modules.model_evaluation.drift_detector import (
+    SlidingWindowDriftMonitor
+)
 
 logger = logging.getLogger(__name__)
 
@@ -370,6 +373,9 @@ class AnalyticsManager(BaseManager):
             "maximum_memory_usage": 0.85
         }
 
+        # Per-pipeline input drift monitors built from training-time sketches
+        self.drift_monitors: Dict[str, SlidingWindowDriftMonitor] = {}
+
     async def start(self) -> None:
         """Initialize and start analytics manager"""
         try:
@@ -410,9 +416,15 @@ class AnalyticsManager(BaseManager):
                 await self._cleanup_model_resources(context)
                 # Release compute resources
                 await self._release_compute_resources(context)
+            self.drift_monitors.clear()
         except Exception as e:
             self.logger.error(f"Analytics specific cleanup failed: {str(e)}")
 
+    async def _cleanup_process(self, process_id: str) -> None:
+        """Clean up a process along with its input drift monitor"""
+        self.drift_monitors.pop(process_id, None)
+        await super()._cleanup_process(process_id)
+
 
     async def _setup_domain_handlers(self) -> None:
         """Setup analytics-specific message handlers"""
@@ -432,6 +444,7 @@ class AnalyticsManager(BaseManager):
             # Model Management
             MessageType.ANALYTICS_MODEL_SELECT_REQUEST: self._handle_model_select_request,
             MessageType.ANALYTICS_MODEL_TRAIN_REQUEST: self._handle_model_train_request,
+            MessageType.ANALYTICS_MODEL_TRAIN_COMPLETE: self._handle_model_train_complete,
             MessageType.ANALYTICS_MODEL_EVALUATE_REQUEST: self._handle_model_evaluate_request,
             MessageType.ANALYTICS_MODEL_TUNE_REQUEST: self._handle_model_tune_request,
             MessageType.ANALYTICS_MODEL_DEPLOY: self._handle_model_deploy,
@@ -1095,6 +1108,10 @@ class AnalyticsManager(BaseManager):
             return
 
         try:
+            scoring_batch = message.content.get('scoring_data')
+            if scoring_batch is not None:
+                self._update_input_drift(pipeline_id, context, scoring_batch)
+
             drift_results = await self._analyze_model_drift(context)
 
             if drift_results.get('drift_detected', False):
@@ -1104,8 +1121,30 @@ class AnalyticsManager(BaseManager):
             logger.error(f"Drift detection failed: {str(e)}")
             await self._handle_error(pipeline_id, str(e))
 
+    def _update_input_drift(
+            self,
+            pipeline_id: str,
+            context: AnalyticsContext,
+            scoring_batch: Any
+    ) -> None:
+        """Feed a scoring batch into the pipeline's sliding-window drift monitor"""
+        monitor = self.drift_monitors.get(pipeline_id)
+        if monitor is None:
+            sketches = context.model_metadata.get('reference_sketches')
+            if not sketches:
+                return
+            monitor = SlidingWindowDriftMonitor(
+                sketches,
+                **context.model_metadata.get('drift_config', {})
+            )
+            self.drift_monitors[pipeline_id] = monitor
+
+        if not isinstance(scoring_batch, pd.DataFrame):
+            scoring_batch = pd.DataFrame(scoring_batch)
+        monitor.update(scoring_batch)
+
     async def _analyze_model_drift(self, context: AnalyticsContext) -> Dict[str, Any]:
-        """Analyze model drift using current metrics"""
+        """Analyze model drift from input distributions and current metrics"""
         try:
             current_metrics = context.performance_metrics
             baseline_metrics = context.model_metadata.get('baseline_metrics', {})
@@ -1115,6 +1154,13 @@ class AnalyticsManager(BaseManager):
                 'metric_changes': {}
             }
 
+            # Input drift is visible before accuracy degrades
+            monitor = self.drift_monitors.get(context.pipeline_id)
+            if monitor is not None:
+                input_drift = monitor.compute()
+                drift_analysis['input_drift'] = input_drift
+                drift_analysis['drift_detected'] = input_drift['drift_detected']
+
             # Compare current metrics with baseline
             for metric, current_value in current_metrics.items():
                 if metric in baseline_metrics:
@@ -1485,6 +1531,30 @@ class AnalyticsManager(BaseManager):
             logger.error(f"Model training request failed: {str(e)}")
             await self._handle_error(pipeline_id, str(e))
 
+    async def _handle_model_train_complete(self, message: ProcessingMessage) -> None:
+        """Record training output needed after the model is deployed"""
+        pipeline_id = message.content.get('pipeline_id')
+        training_results = message.content.get('training_results', {})
+        context = self.active_processes.get(pipeline_id)
+
+        if not context:
+            return
+
+        try:
+            # Reference sketches describe the training inputs; a new model
+            # replaces them, so any monitor built on the old ones is dropped
+            sketches = training_results.get('reference_sketches')
+            if sketches:
+                context.model_metadata['reference_sketches'] = sketches
+                self.drift_monitors.pop(pipeline_id, None)
+            if training_results.get('metrics'):
+                context.model_metadata['baseline_metrics'] = training_results['metrics']
+            context.updated_at = datetime.now()
+
+        except Exception as e:
+            logger.error(f"Model training completion failed: {str(e)}")
+            await self._handle_error(pipeline_id, str(e))
+
     async def _handle_model_evaluate_request(self, message: ProcessingMessage) -> None:
         """Handle model evaluation request"""
         pipeline_id = message.content.get('pipeline_id')
@@ -6,7 +6,6 @@ from typing import Dict, Any, Optional, Callable, Coroutine, List, Set
 from datetime import datetime
 import uuid
 from pathlib import Path
-import psutil
 
 from ...messaging.broker import MessageBroker
 from ...messaging.event_types import (
@@ -20,6 +19,7 @@ from ...messaging.event_types import (
     ProcessingStatus
 )
 from .manager_types import ChannelManager
+from ...monitoring.system_sampler import get_system_sampler
 
 
 class BaseManager:
@@ -191,12 +191,12 @@ class BaseManager:
     async def _collect_resource_metrics(self) -> Dict[str, float]:
         """Collect current resource metrics"""
         try:
-            process = psutil.Process()
+            process = get_system_sampler().latest().process
             return {
-                'cpu_percent': process.cpu_percent(),
-                'memory_percent': process.memory_percent(),
-                'num_threads': process.num_threads(),
-                'open_files': len(process.open_files())
+                'cpu_percent': process.cpu_percent,
+                'memory_percent': process.memory_percent,
+                'num_threads': process.num_threads,
+                'open_files': process.open_files
             }
         except Exception as e:
             self.logger.error(f"Resource metrics collection failed: {str(e)}")
@@ -257,7 +257,12 @@ class BaseManager:
                 raise ValueError(f"No handler for message type: {message.message_type}")
 
             self.context.state = ManagerState.PROCESSING
-            await handler(message)
+
+            # Attribute handler time to the pipeline and message type
+            pipeline_id = message.content.get('pipeline_id') if isinstance(message.content, dict) else None
+            label = f"{pipeline_id or self.context.component_name}:{message.message_type.value}"
+            with get_system_sampler().track(label):
+                await handler(message)
 
         except Exception as e:
             self.logger.error(f"Message handling failed: {str(e)}")
@@ -328,6 +333,8 @@ class BaseManager:
         """Clean up a specific process"""
         try:
             process = self.active_processes.pop(process_id, None)
+            # Handler usage is labelled "<pipeline_id>:<message_type>"
+            get_system_sampler().evict_pipeline(process_id)
             if process:
                 self.process_timeouts.pop(process_id, None)
                 if hasattr(process, 'cleanup'):
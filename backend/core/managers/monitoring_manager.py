@@ -21,6 +21,7 @@ from ..messaging.event_types import (
     MonitoringMetrics
 )
 from .base.base_manager import BaseManager
+from ..monitoring.system_sampler import get_system_sampler
 
 logger = logging.getLogger(__name__)
 
@@ -170,7 +171,7 @@ class MonitoringManager(BaseManager):
         """Collect system metrics"""
         try:
             metrics = {
-                "cpu_percent": psutil.cpu_percent(interval=1),
+                "cpu_percent": get_system_sampler().latest().cpu_percent,
                 "memory_percent": psutil.virtual_memory().percent,
                 "disk_usage": psutil.disk_usage('/').percent,
                 "network_io": {
@@ -534,7 +535,7 @@ class MonitoringManager(BaseManager):
         """Collect specific metric value"""
         try:
             if metric == "cpu_percent":
-                return psutil.cpu_percent(interval=1)
+                return get_system_sampler().latest().cpu_percent
             elif metric == "memory_percent":
                 return psutil.virtual_memory().percent
             elif metric == "disk_usage":
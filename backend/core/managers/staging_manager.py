@@ -1,5 +1,6 @@
 import logging
 import asyncio
+import time
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -60,7 +61,9 @@ class StagingManager(BaseManager):
             "max_retention_hours": 24,
             "cleanup_interval_minutes": 30,
             "max_concurrent_operations": 10,
-            "backpressure_threshold": 0.8  # 80% of max storage
+            "backpressure_threshold": 0.8,  # 80% of max storage
+            "cleanup_batch_size": 1000,
+            "cleanup_file_concurrency": 16
         }
 
         # Resource tracking
@@ -590,7 +593,7 @@ class StagingManager(BaseManager):
         """Store data in staging area"""
         try:
             # Validate storage limits
-            await self._validate_storage_limits(data)
+            await self._validate_storage_limits(data, metadata.get('size_bytes'))
 
             # Determine appropriate output type
             type_mapping = {
@@ -666,11 +669,12 @@ class StagingManager(BaseManager):
             logger.error(f"Data storage failed: {str(e)}")
             raise
 
-    async def _validate_storage_limits(self, data: Any) -> None:
+    async def _validate_storage_limits(self, data: Any, size_bytes: Optional[int] = None) -> None:
         """Validate storage limits before storing data"""
         try:
-            # Check file size
-            data_size_mb = len(data) / (1024 * 1024)
+            # Check file size; data already written to the store reports its size
+            data_size = len(data) if data is not None else (size_bytes or 0)
+            data_size_mb = data_size / (1024 * 1024)
             if data_size_mb > self.staging_limits['max_file_size_mb']:
                 raise ValueError(f"File size exceeds limit of {self.staging_limits['max_file_size_mb']}MB")
 
@@ -759,21 +763,51 @@ class StagingManager(BaseManager):
             logger.error(f"Access validation failed: {str(e)}")
             return False
 
-    async def _cleanup_expired_resources(self) -> None:
+    async def _cleanup_expired_resources(self) -> Dict[str, Any]:
         """Clean up expired resources"""
+        stats = {'rows_deleted': 0, 'files_deleted': 0, 'rows_per_second': 0.0}
         try:
             retention_hours = self.staging_limits['max_retention_hours']
             expiry_time = datetime.now() - timedelta(hours=retention_hours)
+            started = time.perf_counter()
+
+            # Rows are deleted set-based in batches; files go concurrently
+            async for batch in self.repository.delete_expired_outputs(
+                    expiry_time,
+                    batch_size=self.staging_limits['cleanup_batch_size']
+            ):
+                stats['rows_deleted'] += len(batch)
+                stats['files_deleted'] += await self._delete_files(
+                    [path for _, path in batch if path]
+                )
 
-            # Get expired resources
-            expired_ids = await self.repository.get_expired_resources(expiry_time)
-
-            # Clean up each expired resource
-            for resource_id in expired_ids:
-                await self._delete_resource(resource_id)
+            elapsed = time.perf_counter() - started
+            if stats['rows_deleted']:
+                stats['rows_per_second'] = stats['rows_deleted'] / elapsed if elapsed else 0.0
+                self.logger.info(
+                    f"Expired {stats['rows_deleted']} resources, removed "
+                    f"{stats['files_deleted']} files ({stats['rows_per_second']:.0f} rows/s)"
+                )
 
         except Exception as e:
             logger.error(f"Resource cleanup failed: {str(e)}")
+        return stats
+
+    async def _delete_files(self, paths: List[str]) -> int:
+        """Remove stored files with bounded concurrency"""
+        semaphore = asyncio.Semaphore(self.staging_limits['cleanup_file_concurrency'])
+
+        async def remove(path: str) -> bool:
+            async with semaphore:
+                try:
+                    await asyncio.to_thread(Path(path).unlink, missing_ok=True)
+                    return True
+                except OSError as e:
+                    logger.error(f"Failed to remove staged file {path}: {str(e)}")
+                    return False
+
+        results = await asyncio.gather(*(remove(path) for path in paths))
+        return sum(results)
 
     async def _delete_resource(self, resource_id: str) -> None:
         """Delete a resource and its file"""
@@ -10,6 +10,8 @@ from collections import defaultdict
 import psutil
 import json
 
+from .timeseries import TimeSeriesStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,8 +26,9 @@ class MetricPoint:
 class MetricsCollector:
     """Centralized metrics collection for all data sources"""
 
-    def __init__(self):
-        self.metrics: Dict[str, List[MetricPoint]] = defaultdict(list)
+    def __init__(self, store: Optional[TimeSeriesStore] = None):
+        # Bounded ring-buffer storage; memory does not grow with uptime
+        self.store = store or TimeSeriesStore()
         self._start_time = time.time()
 
     async def record_metric(
@@ -42,37 +45,60 @@ class MetricsCollector:
             'source_id': source_id
         })
 
-        self.metrics[name].append(MetricPoint(
-            value=value,
-            labels=labels
-        ))
+        self.store.record(name, value, labels)
 
     async def get_metrics(
             self,
-            source_type: Optional[str] = None
+            source_type: Optional[str] = None,
+            start: Optional[datetime] = None,
+            end: Optional[datetime] = None
     ) -> Dict[str, List[Dict[str, Any]]]:
-        """Get metrics, optionally filtered by source type"""
-        if source_type:
-            return {
-                name: [
-                    {
-                        'value': point.value,
-                        'timestamp': point.timestamp.isoformat(),
-                        'labels': point.labels
-                    }
-                    for point in points
-                    if point.labels.get('source_type') == source_type
-                ]
-                for name, points in self.metrics.items()
-            }
-        return {
-            name: [
+        """Get metrics, optionally filtered by source type and time range"""
+        filters = {'source_type': source_type} if source_type else {}
+        results: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for series in self.store.query(
+                start=start.timestamp() if start else None,
+                end=end.timestamp() if end else None,
+                **filters
+        ):
+            results[series.name].extend(
+                {
+                    'value': float(value),
+                    'timestamp': datetime.fromtimestamp(timestamp).isoformat(),
+                    'labels': series.labels
+                }
+                for timestamp, value in zip(series.timestamps, series.values)
+            )
+        return dict(results)
+
+    async def get_rollup(
+            self,
+            name: str,
+            resolution: int = 60,
+            start: Optional[datetime] = None,
+            end: Optional[datetime] = None,
+            **labels
+    ) -> List[Dict[str, Any]]:
+        """Min/max/mean/count buckets for a metric at 1m or 1h resolution"""
+        buckets = []
+        for series in self.store.query(
+                name,
+                start=start.timestamp() if start else None,
+                end=end.timestamp() if end else None,
+                resolution=resolution,
+                **labels
+        ):
+            buckets.extend(
                 {
-                    'value': point.value,
-                    'timestamp': point.timestamp.isoformat(),
-                    'labels': point.labels
+                    'timestamp': datetime.fromtimestamp(bucket).isoformat(),
+                    'min': float(low),
+                    'max': float(high),
+                    'mean': float(mean),
+                    'count': int(count),
+                    'labels': series.labels
                 }
-                for point in points
-            ]
-            for name, points in self.metrics.items()
-        }
\ No newline at end of file
+                for bucket, low, high, mean, count in zip(
+                    series.timestamps, series.minimum, series.maximum, series.values, series.count
+                )
+            )
+        return buckets
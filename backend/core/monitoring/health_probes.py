@@ -0,0 +1,254 @@
+# backend/core/monitoring/health_probes.py
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Union
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+ProbeCheck = Callable[[], Awaitable[Union[bool, Dict[str, Any]]]]
+
+
+class CircuitState(Enum):
+    """Circuit state of a probed dependency"""
+    CLOSED = "closed"        # probing normally
+    OPEN = "open"            # failing; probes skipped until recovery timeout
+    HALF_OPEN = "half_open"  # one trial probe allowed
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    """Outcome of one probe run"""
+    name: str
+    healthy: bool
+    checked_at: float
+    latency_ms: float = 0.0
+    error: Optional[str] = None
+    details: Dict[str, Any] = field(default_factory=dict)
+    circuit: CircuitState = CircuitState.CLOSED
+    consecutive_failures: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'healthy': self.healthy,
+            'status': 'healthy' if self.healthy else 'unhealthy',
+            'checked_at': self.checked_at,
+            'latency_ms': round(self.latency_ms, 3),
+            'error': self.error,
+            'details': self.details,
+            'circuit': self.circuit.value,
+            'consecutive_failures': self.consecutive_failures
+        }
+
+
+@dataclass
+class Probe:
+    """A registered dependency check and its cache/circuit state"""
+    name: str
+    check: ProbeCheck
+    timeout: float = 5.0
+    ttl: float = 15.0
+    failure_threshold: int = 3
+    recovery_timeout: float = 30.0
+    circuit: CircuitState = CircuitState.CLOSED
+    consecutive_failures: int = 0
+    opened_at: float = 0.0
+    last_result: Optional[ProbeResult] = None
+    in_flight: Optional[asyncio.Future] = None
+
+
+class HealthProbeRegistry:
+    """
+    Concurrent, cached dependency probes with circuit breaking
+
+    Every probe runs under its own timeout, and ``run_all`` fans them out
+    together, so a round costs the slowest probe rather than the sum.
+    Results are cached for ``ttl`` seconds and concurrent callers join
+    the probe already in flight, so health endpoints and per-pipeline
+    loops share a single round. After ``failure_threshold`` consecutive
+    failures a dependency's circuit opens and it is not probed again
+    until ``recovery_timeout`` has passed.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic, connection_limit: int = 20):
+        self.clock = clock
+        self.connection_limit = connection_limit
+        self.probes: Dict[str, Probe] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def register(
+            self,
+            name: str,
+            check: ProbeCheck,
+            timeout: float = 5.0,
+            ttl: float = 15.0,
+            failure_threshold: int = 3,
+            recovery_timeout: float = 30.0
+    ) -> Probe:
+        """Register (or replace) a probe, keeping any circuit state"""
+        existing = self.probes.get(name)
+        probe = Probe(name, check, timeout, ttl, failure_threshold, recovery_timeout)
+        if existing is not None:
+            probe.circuit = existing.circuit
+            probe.consecutive_failures = existing.consecutive_failures
+            probe.opened_at = existing.opened_at
+        self.probes[name] = probe
+        return probe
+
+    def unregister(self, name: str) -> None:
+        self.probes.pop(name, None)
+
+    async def run(self, name: str, force: bool = False) -> ProbeResult:
+        """Result for one probe, from cache when fresh"""
+        probe = self.probes.get(name)
+        if probe is None:
+            raise KeyError(f"Unknown health probe: {name}")
+
+        now = self.clock()
+        cached = probe.last_result
+        if not force and cached is not None and now - cached.checked_at < probe.ttl:
+            return cached
+
+        if probe.circuit == CircuitState.OPEN:
+            if now - probe.opened_at < probe.recovery_timeout:
+                return self._circuit_open_result(probe, now)
+            probe.circuit = CircuitState.HALF_OPEN
+
+        # Single flight: concurrent callers share the running probe
+        if probe.in_flight is None:
+            probe.in_flight = asyncio.ensure_future(self._execute(probe))
+            probe.in_flight.add_done_callback(lambda _: setattr(probe, 'in_flight', None))
+        return await asyncio.shield(probe.in_flight)
+
+    async def run_all(self, names: Optional[Iterable[str]] = None, force: bool = False) -> Dict[str, ProbeResult]:
+        """Run probes concurrently"""
+        names = list(self.probes) if names is None else list(names)
+        results = await asyncio.gather(*(self.run(name, force) for name in names))
+        return dict(zip(names, results))
+
+    def circuit_states(self) -> Dict[str, Dict[str, Any]]:
+        """Per-dependency circuit state"""
+        return {
+            name: {
+                'state': probe.circuit.value,
+                'consecutive_failures': probe.consecutive_failures,
+                'last_checked': probe.last_result.checked_at if probe.last_result else None
+            }
+            for name, probe in self.probes.items()
+        }
+
+    async def _execute(self, probe: Probe) -> ProbeResult:
+        started = self.clock()
+        error = None
+        details: Dict[str, Any] = {}
+        try:
+            outcome = await asyncio.wait_for(probe.check(), probe.timeout)
+            if isinstance(outcome, dict):
+                details = outcome
+                healthy = bool(outcome.get('healthy', True))
+            else:
+                healthy = bool(outcome)
+        except asyncio.TimeoutError:
+            healthy, error = False, f"timed out after {probe.timeout}s"
+        except Exception as e:
+            healthy, error = False, str(e)
+
+        finished = self.clock()
+        if healthy:
+            probe.consecutive_failures = 0
+            probe.circuit = CircuitState.CLOSED
+        else:
+            probe.consecutive_failures += 1
+            if probe.circuit == CircuitState.HALF_OPEN or probe.consecutive_failures >= probe.failure_threshold:
+                if probe.circuit != CircuitState.OPEN:
+                    logger.warning(f"Health circuit opened for {probe.name}: {error or 'unhealthy'}")
+                probe.circuit = CircuitState.OPEN
+                probe.opened_at = finished
+
+        result = ProbeResult(
+            name=probe.name,
+            healthy=healthy,
+            checked_at=finished,
+            latency_ms=(finished - started) * 1000,
+            error=error,
+            details=details,
+            circuit=probe.circuit,
+            consecutive_failures=probe.consecutive_failures
+        )
+        probe.last_result = result
+        return result
+
+    def _circuit_open_result(self, probe: Probe, now: float) -> ProbeResult:
+        last = probe.last_result
+        return ProbeResult(
+            name=probe.name,
+            healthy=False,
+            checked_at=last.checked_at if last else now,
+            error=last.error if last and last.error else 'circuit open',
+            circuit=CircuitState.OPEN,
+            consecutive_failures=probe.consecutive_failures
+        )
+
+    def http_session(self) -> aiohttp.ClientSession:
+        """Pooled client shared by all HTTP probes"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.connection_limit, keepalive_timeout=30)
+            )
+        return self._session
+
+    def http_check(self, url: str, expected_status: int = 200) -> ProbeCheck:
+        """Check that ``url`` answers with ``expected_status`` over the pooled client"""
+        async def check() -> Dict[str, Any]:
+            async with self.http_session().get(url) as response:
+                return {'healthy': response.status == expected_status, 'status_code': response.status}
+        return check
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+def database_check(engine_provider: Callable[[], Any]) -> ProbeCheck:
+    """``SELECT 1`` over a pooled connection of the async engine"""
+    async def check() -> Dict[str, Any]:
+        from sqlalchemy import text
+
+        engine = engine_provider()
+        if engine is None:
+            return {'healthy': False, 'reason': 'database engine not initialized'}
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+        pool = engine.pool
+        return {
+            'healthy': True,
+            'pool': {
+                'size': pool.size() if hasattr(pool, 'size') else None,
+                'checked_out': pool.checkedout() if hasattr(pool, 'checkedout') else None
+            }
+        }
+    return check
+
+
+_registry: Optional[HealthProbeRegistry] = None
+
+
+def get_health_registry() -> HealthProbeRegistry:
+    """Process-wide probe registry"""
+    global _registry
+    if _registry is None:
+        _registry = HealthProbeRegistry()
+    return _registry
+
+
+async def shutdown_health_registry() -> None:
+    global _registry
+    if _registry is not None:
+        await _registry.close()
+        _registry = None
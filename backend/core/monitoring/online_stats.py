@@ -0,0 +1,302 @@
+# backend/core/monitoring/online_stats.py
+
+import math
+from typing import Any, Dict, List, Optional, Sequence
+
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+# Floors for the EWMA deviation so a perfectly flat series still scores finitely
+STD_FLOOR_RELATIVE = 1e-3
+STD_FLOOR_ABSOLUTE = 1e-9
+
+
+class Welford:
+    """Running count, mean, variance, min and max in O(1) per update"""
+
+    __slots__ = ('count', 'mean', 'm2', 'minimum', 'maximum')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def update(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance"""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std_dev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def merge(self, other: 'Welford') -> None:
+        """Combine with another accumulator (Chan et al.)"""
+        if not other.count:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'm2': self.m2,
+            'min': self.minimum if self.count else None,
+            'max': self.maximum if self.count else None
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Welford':
+        stats = cls()
+        stats.count = data['count']
+        stats.mean = data['mean']
+        stats.m2 = data['m2']
+        stats.minimum = data['min'] if data.get('min') is not None else math.inf
+        stats.maximum = data['max'] if data.get('max') is not None else -math.inf
+        return stats
+
+
+class EWMA:
+    """Exponentially weighted mean and variance"""
+
+    __slots__ = ('alpha', 'mean', 'variance', 'count')
+
+    def __init__(self, alpha: float = 0.1):
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = alpha
+        self.mean: Optional[float] = None
+        self.variance = 0.0
+        self.count = 0
+
+    def update(self, value: float) -> None:
+        self.count += 1
+        if self.mean is None:
+            self.mean = value
+            return
+        delta = value - self.mean
+        increment = self.alpha * delta
+        self.mean += increment
+        self.variance = (1 - self.alpha) * (self.variance + delta * increment)
+
+    @property
+    def std_dev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'alpha': self.alpha, 'mean': self.mean, 'variance': self.variance, 'count': self.count}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'EWMA':
+        ewma = cls(data['alpha'])
+        ewma.mean = data['mean']
+        ewma.variance = data['variance']
+        ewma.count = data['count']
+        return ewma
+
+
+class P2Quantile:
+    """
+    Streaming quantile estimate with the P² algorithm (Jain & Chlamtac)
+
+    Five markers track the minimum, the target quantile, the maximum and
+    two midpoints; their heights are adjusted with a piecewise-parabolic
+    fit, so memory and update cost are constant.
+    """
+
+    __slots__ = ('p', 'count', 'heights', 'positions', 'desired', 'increments')
+
+    def __init__(self, p: float):
+        if not 0 < p < 1:
+            raise ValueError("quantile must be in (0, 1)")
+        self.p = p
+        self.count = 0
+        self.heights: List[float] = []
+        self.positions = [0, 1, 2, 3, 4]
+        self.desired = [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0]
+        self.increments = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+    def update(self, value: float) -> None:
+        self.count += 1
+        heights = self.heights
+        if self.count <= 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            k = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            k = 3
+        else:
+            k = 0
+            while k < 3 and value >= heights[k + 1]:
+                k += 1
+
+        positions = self.positions
+        for i in range(k + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        for i in (1, 2, 3):
+            drift = self.desired[i] - positions[i]
+            if (drift >= 1 and positions[i + 1] - positions[i] > 1) or \
+                    (drift <= -1 and positions[i - 1] - positions[i] < -1):
+                step = 1 if drift > 0 else -1
+                candidate = self._parabolic(i, step)
+                if heights[i - 1] < candidate < heights[i + 1]:
+                    heights[i] = candidate
+                else:
+                    heights[i] += step * (heights[i + step] - heights[i]) / (positions[i + step] - positions[i])
+                positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        q, n = self.heights, self.positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    @property
+    def value(self) -> Optional[float]:
+        if not self.count:
+            return None
+        if self.count > 5:
+            return self.heights[2]
+        # Exact (linearly interpolated) quantile while warming up
+        ordered = self.heights
+        rank = self.p * (len(ordered) - 1)
+        lower = int(math.floor(rank))
+        upper = min(lower + 1, len(ordered) - 1)
+        return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'p': self.p,
+            'count': self.count,
+            'heights': list(self.heights),
+            'positions': list(self.positions),
+            'desired': list(self.desired)
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'P2Quantile':
+        quantile = cls(data['p'])
+        quantile.count = data['count']
+        quantile.heights = list(data['heights'])
+        quantile.positions = list(data['positions'])
+        quantile.desired = list(data['desired'])
+        return quantile
+
+
+class MetricSketch:
+    """
+    Constant-size summary of one metric stream
+
+    Combines Welford moments, P² quantiles and an EWMA. Each update also
+    scores the value against the EWMA mean and deviation seen so far,
+    giving a windowed anomaly score (effective window ~ ``2 / alpha``).
+    The sketch serializes to a plain dict for persistence.
+    """
+
+    def __init__(
+            self,
+            quantiles: Sequence[float] = DEFAULT_QUANTILES,
+            alpha: float = 0.1,
+            warmup: int = 10
+    ):
+        self.moments = Welford()
+        self.ewma = EWMA(alpha)
+        self.quantiles = {q: P2Quantile(q) for q in quantiles}
+        self.warmup = warmup
+        self.last_value: Optional[float] = None
+        self.last_score = 0.0
+
+    @property
+    def count(self) -> int:
+        return self.moments.count
+
+    def update(self, value: float) -> float:
+        """Add a value; returns its anomaly score (EWMA z-score)"""
+        value = float(value)
+        self.last_score = self.score(value)
+        self.last_value = value
+        self.moments.update(value)
+        self.ewma.update(value)
+        for quantile in self.quantiles.values():
+            quantile.update(value)
+        return self.last_score
+
+    def score(self, value: float) -> float:
+        """How many EWMA deviations ``value`` lies from the EWMA mean"""
+        if self.ewma.count < self.warmup or self.ewma.mean is None:
+            return 0.0
+        mean = self.ewma.mean
+        if value == mean:
+            return 0.0
+        std_dev = max(self.ewma.std_dev, STD_FLOOR_RELATIVE * abs(mean), STD_FLOOR_ABSOLUTE)
+        return (value - mean) / std_dev
+
+    def quantile(self, q: float) -> Optional[float]:
+        estimator = self.quantiles.get(q)
+        return estimator.value if estimator else None
+
+    def reset_period(self) -> None:
+        """Start new moments and quantiles; the EWMA carries on"""
+        self.moments = Welford()
+        self.quantiles = {q: P2Quantile(q) for q in self.quantiles}
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'count': self.moments.count,
+            'mean': self.moments.mean,
+            'median': self.quantile(0.5),
+            'std_dev': self.moments.std_dev,
+            'min': self.moments.minimum if self.moments.count else None,
+            'max': self.moments.maximum if self.moments.count else None,
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+            'ewma': self.ewma.mean,
+            'ewma_std_dev': self.ewma.std_dev,
+            'anomaly_score': self.last_score
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'moments': self.moments.to_dict(),
+            'ewma': self.ewma.to_dict(),
+            'quantiles': [q.to_dict() for q in self.quantiles.values()],
+            'warmup': self.warmup,
+            'last_value': self.last_value,
+            'last_score': self.last_score
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'MetricSketch':
+        sketch = cls(quantiles=(), alpha=data['ewma']['alpha'], warmup=data.get('warmup', 10))
+        sketch.moments = Welford.from_dict(data['moments'])
+        sketch.ewma = EWMA.from_dict(data['ewma'])
+        sketch.quantiles = {q['p']: P2Quantile.from_dict(q) for q in data['quantiles']}
+        sketch.last_value = data.get('last_value')
+        sketch.last_score = data.get('last_score', 0.0)
+        return sketch
+
+    def copy(self) -> 'MetricSketch':
+        return MetricSketch.from_dict(self.to_dict())
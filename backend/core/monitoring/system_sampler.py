@@ -0,0 +1,266 @@
+# backend/core/monitoring/system_sampler.py
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Optional, Tuple
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = float(os.getenv('SYSTEM_SAMPLER_INTERVAL', '1.0'))
+
+
+@dataclass(frozen=True)
+class ProcessSnapshot:
+    """Resource usage of this process"""
+    pid: int
+    cpu_percent: float
+    memory_percent: float
+    memory_rss: int
+    memory_vms: int
+    num_threads: int
+    open_files: int
+
+
+@dataclass(frozen=True)
+class TaskUsage:
+    """Accumulated usage attributed to one label (e.g. a pipeline task)"""
+    cpu_seconds: float = 0.0
+    wall_seconds: float = 0.0
+    runs: int = 0
+    active: int = 0
+
+
+@dataclass
+class _UsageCounter:
+    """Mutable accumulator behind a label; copied into TaskUsage when sampled"""
+    cpu_seconds: float = 0.0
+    wall_seconds: float = 0.0
+    runs: int = 0
+    active: int = 0
+
+
+@dataclass(frozen=True)
+class SystemSnapshot:
+    """One immutable system sample; readers never see a partial update"""
+    timestamp: float
+    cpu_percent: float
+    per_cpu_percent: Tuple[float, ...]
+    cpu_count: int
+    memory_percent: float
+    memory_total: int
+    memory_available: int
+    memory_used: int
+    swap_percent: float
+    disk_percent: float
+    disk_total: int
+    disk_used: int
+    disk_free: int
+    net_bytes_sent: int
+    net_bytes_recv: int
+    process: ProcessSnapshot
+    tasks: Dict[str, TaskUsage] = field(default_factory=dict)
+
+    @property
+    def age_seconds(self) -> float:
+        return time.time() - self.timestamp
+
+
+class SystemSampler:
+    """
+    Process-wide system metrics sampler
+
+    A daemon thread samples psutil every ``interval`` seconds and swaps in
+    a new immutable ``SystemSnapshot``. Reading ``latest()`` is a single
+    attribute load, so monitors on the event loop never block and all of
+    them see the same sample instead of each taking its own.
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL, disk_path: str = '/'):
+        self.interval = interval
+        self.disk_path = disk_path
+        self._process = psutil.Process()
+        self._snapshot: Optional[SystemSnapshot] = None
+        self._usage: Dict[str, _UsageCounter] = {}
+        self._usage_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        # Prime the cpu_percent counters so the first real sample has a baseline
+        psutil.cpu_percent(interval=None, percpu=True)
+        self._process.cpu_percent(interval=None)
+        self._snapshot = self._sample()
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='system-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return bool(self._thread and self._thread.is_alive())
+
+    def latest(self) -> SystemSnapshot:
+        """Most recent snapshot (never blocks on sampling)"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            self.start()
+            snapshot = self._snapshot
+        return snapshot
+
+    @contextmanager
+    def track(self, label: str) -> Iterator[None]:
+        """
+        Attribute CPU and wall time spent inside the block to ``label``
+
+        CPU time is thread CPU time, so it is exact for work run in worker
+        threads (``asyncio.to_thread``) and an upper bound for coroutines
+        that await inside the block.
+        """
+        cpu_start = time.thread_time()
+        wall_start = time.perf_counter()
+        self._record(label, active=1)
+        try:
+            yield
+        finally:
+            # A label evicted while the block ran stays evicted
+            self._record(
+                label,
+                cpu=time.thread_time() - cpu_start,
+                wall=time.perf_counter() - wall_start,
+                runs=1,
+                active=-1,
+                create=False
+            )
+
+    def reset_usage(self, label: Optional[str] = None) -> None:
+        with self._usage_lock:
+            if label is None:
+                self._usage.clear()
+            else:
+                self._usage.pop(label, None)
+
+    def evict_pipeline(self, pipeline_id: str) -> int:
+        """Drop every ``"<pipeline_id>:<message_type>"`` label; returns how many"""
+        prefix = f"{pipeline_id}:"
+        with self._usage_lock:
+            labels = [label for label in self._usage if label.startswith(prefix)]
+            for label in labels:
+                del self._usage[label]
+        return len(labels)
+
+    def usage(self) -> Dict[str, TaskUsage]:
+        """Point-in-time copy of the per-label usage"""
+        with self._usage_lock:
+            return {
+                label: TaskUsage(c.cpu_seconds, c.wall_seconds, c.runs, c.active)
+                for label, c in self._usage.items()
+            }
+
+    def _record(
+            self,
+            label: str,
+            cpu: float = 0.0,
+            wall: float = 0.0,
+            runs: int = 0,
+            active: int = 0,
+            create: bool = True
+    ) -> None:
+        with self._usage_lock:
+            counter = self._usage.get(label)
+            if counter is None:
+                if not create:
+                    return
+                counter = self._usage[label] = _UsageCounter()
+            counter.cpu_seconds += cpu
+            counter.wall_seconds += wall
+            counter.runs += runs
+            counter.active += active
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self._snapshot = self._sample()
+            except Exception as e:
+                logger.error(f"System sampling failed: {str(e)}")
+
+    def _sample(self) -> SystemSnapshot:
+        per_cpu = tuple(psutil.cpu_percent(interval=None, percpu=True))
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage(self.disk_path)
+        net = psutil.net_io_counters()
+
+        process = self._process
+        with process.oneshot():
+            memory_info = process.memory_info()
+            try:
+                open_files = len(process.open_files())
+            except psutil.Error:
+                open_files = 0
+            process_snapshot = ProcessSnapshot(
+                pid=process.pid,
+                cpu_percent=process.cpu_percent(interval=None),
+                memory_percent=process.memory_percent(),
+                memory_rss=memory_info.rss,
+                memory_vms=memory_info.vms,
+                num_threads=process.num_threads(),
+                open_files=open_files
+            )
+
+        return SystemSnapshot(
+            timestamp=time.time(),
+            cpu_percent=sum(per_cpu) / len(per_cpu) if per_cpu else 0.0,
+            per_cpu_percent=per_cpu,
+            cpu_count=psutil.cpu_count() or len(per_cpu),
+            memory_percent=memory.percent,
+            memory_total=memory.total,
+            memory_available=memory.available,
+            memory_used=memory.used,
+            swap_percent=psutil.swap_memory().percent,
+            disk_percent=disk.percent,
+            disk_total=disk.total,
+            disk_used=disk.used,
+            disk_free=disk.free,
+            net_bytes_sent=net.bytes_sent if net else 0,
+            net_bytes_recv=net.bytes_recv if net else 0,
+            process=process_snapshot,
+            # Copied once per sample rather than on every tracked call
+            tasks=self.usage()
+        )
+
+
+_sampler: Optional[SystemSampler] = None
+_sampler_lock = threading.Lock()
+
+
+def get_system_sampler() -> SystemSampler:
+    """Shared sampler, started on first use"""
+    global _sampler
+    if _sampler is None:
+        with _sampler_lock:
+            if _sampler is None:
+                sampler = SystemSampler()
+                sampler.start()
+                _sampler = sampler
+    return _sampler
+
+
+def shutdown_system_sampler() -> None:
+    global _sampler
+    with _sampler_lock:
+        if _sampler is not None:
+            _sampler.stop()
+            _sampler = None
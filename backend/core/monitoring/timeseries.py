@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SeriesKey = Tuple[str, FrozenSet[Tuple[str, str]]]
+
+# Rollup resolution (seconds) -> number of buckets retained. There is no
+# 1s rollup: at typical sample rates it would repeat the raw ring.
+DEFAULT_ROLLUPS: Dict[int, int] = {
+    60: 1440,      # 1m buckets for the last day
+    3600: 24 * 30  # 1h buckets for the last 30 days
+}
+
+
+class _Ring:
+    """
+    Fixed-capacity ring of equally shaped NumPy columns
+
+    Rows are appended in timestamp order, so the logical sequence is two
+    sorted segments of the underlying arrays and range lookups are two
+    binary searches. Arrays start small and double until they reach
+    ``capacity``; they never grow past it.
+    """
+
+    INITIAL_SIZE = 64
+
+    def __init__(self, capacity: int, columns: Tuple[str, ...]):
+        self.capacity = capacity
+        initial = min(capacity, self.INITIAL_SIZE)
+        self.columns = {name: np.zeros(initial, dtype=np.float64) for name in columns}
+        self.head = 0  # next write position
+        self.size = 0
+
+    def append(self, row: Dict[str, float]) -> None:
+        if self.size < self.capacity and self.head == len(self.columns[next(iter(self.columns))]):
+            grown = min(self.head * 2, self.capacity)
+            self.columns = {name: np.resize(column, grown) for name, column in self.columns.items()}
+        for name, column in self.columns.items():
+            column[self.head] = row[name]
+        self.head = (self.head + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def last_index(self) -> Optional[int]:
+        return (self.head - 1) % self.capacity if self.size else None
+
+    def _segments(self) -> List[Tuple[int, int]]:
+        if self.size < self.capacity:
+            return [(0, self.size)]
+        return [(self.head, self.capacity), (0, self.head)]
+
+    def slice(self, key: str, start: float, end: float) -> Dict[str, np.ndarray]:
+        """Rows with ``start <= key < end``, oldest first"""
+        keys = self.columns[key]
+        parts: Dict[str, List[np.ndarray]] = {name: [] for name in self.columns}
+        for lo, hi in self._segments():
+            left = lo + int(np.searchsorted(keys[lo:hi], start, side='left'))
+            right = lo + int(np.searchsorted(keys[lo:hi], end, side='left'))
+            if right > left:
+                for name, column in self.columns.items():
+                    parts[name].append(column[left:right])
+        return {
+            name: np.concatenate(chunks) if chunks else np.empty(0, dtype=np.float64)
+            for name, chunks in parts.items()
+        }
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self.columns.values())
+
+
+class _Rollup:
+    """Fixed-capacity min/max/sum/count buckets at one resolution"""
+
+    COLUMNS = ('start', 'min', 'max', 'sum', 'count')
+
+    def __init__(self, resolution: int, capacity: int):
+        self.resolution = resolution
+        self.ring = _Ring(capacity, self.COLUMNS)
+
+    def add(self, timestamp: float, value: float) -> None:
+        bucket = timestamp - (timestamp % self.resolution)
+        index = self.ring.last_index()
+        columns = self.ring.columns
+        if index is not None and columns['start'][index] == bucket:
+            columns['min'][index] = min(columns['min'][index], value)
+            columns['max'][index] = max(columns['max'][index], value)
+            columns['sum'][index] += value
+            columns['count'][index] += 1
+        else:
+            self.ring.append({'start': bucket, 'min': value, 'max': value, 'sum': value, 'count': 1})
+
+
+@dataclass
+class SeriesRange:
+    """Result of a range query on one series"""
+    name: str
+    labels: Dict[str, str]
+    timestamps: np.ndarray
+    values: np.ndarray
+    resolution: Optional[int] = None
+    minimum: Optional[np.ndarray] = None
+    maximum: Optional[np.ndarray] = None
+    count: Optional[np.ndarray] = None
+
+
+class TimeSeries:
+    """Raw ring buffer of points plus cascading rollups"""
+
+    def __init__(self, capacity: int, rollups: Dict[int, int]):
+        self.raw = _Ring(capacity, ('timestamp', 'value'))
+        self.rollups = {resolution: _Rollup(resolution, size) for resolution, size in rollups.items()}
+        self.last_timestamp = float('-inf')
+
+    def add(self, timestamp: float, value: float) -> None:
+        # Keep the ring sorted; late points are stamped at the latest time
+        timestamp = max(timestamp, self.last_timestamp)
+        self.last_timestamp = timestamp
+        self.raw.append({'timestamp': timestamp, 'value': value})
+        for rollup in self.rollups.values():
+            rollup.add(timestamp, value)
+
+    def __len__(self) -> int:
+        return self.raw.size
+
+    def range(self, start: float, end: float, resolution: Optional[int] = None) -> Dict[str, np.ndarray]:
+        if resolution is None:
+            return self.raw.slice('timestamp', start, end)
+        rollup = self.rollups.get(resolution)
+        if rollup is None:
+            raise ValueError(f"No rollup at {resolution}s resolution")
+        # Include the bucket containing ``start``; an open start stays -inf
+        if math.isfinite(start):
+            start -= start % resolution
+        return rollup.ring.slice('start', start, end)
+
+    @property
+    def nbytes(self) -> int:
+        return self.raw.nbytes + sum(r.ring.nbytes for r in self.rollups.values())
+
+
+class TimeSeriesStore:
+    """
+    Embedded, constant-memory time-series store
+
+    Each (name, labels) series keeps a fixed-capacity raw ring and fixed
+    rollup rings, so memory is bounded by ``max_series`` regardless of
+    uptime; once full, the least recently written series makes room for a
+    new one. Series are found through an inverted label index and time
+    ranges are resolved by binary search.
+    """
+
+    def __init__(
+            self,
+            raw_capacity: int = 4096,
+            rollups: Optional[Dict[int, int]] = None,
+            max_series: int = 5000
+    ):
+        self.raw_capacity = raw_capacity
+        self.rollup_config = dict(DEFAULT_ROLLUPS if rollups is None else rollups)
+        self.max_series = max_series
+        # Ordered by last write, oldest first
+        self._series: OrderedDict[SeriesKey, TimeSeries] = OrderedDict()
+        self.evicted = 0
+        self._by_name: Dict[str, Set[SeriesKey]] = {}
+        self._by_label: Dict[Tuple[str, str], Set[SeriesKey]] = {}
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    def __getitem__(self, key: SeriesKey) -> TimeSeries:
+        return self._series[key]
+
+    @staticmethod
+    def series_key(name: str, labels: Optional[Dict[str, str]] = None) -> SeriesKey:
+        return name, frozenset((str(k), str(v)) for k, v in (labels or {}).items())
+
+    def record(
+            self,
+            name: str,
+            value: float,
+            labels: Optional[Dict[str, str]] = None,
+            timestamp: Optional[float] = None
+    ) -> None:
+        """Append a point, evicting the least recently written series if full"""
+        key = self.series_key(name, labels)
+        series = self._series.get(key)
+        if series is None:
+            if len(self._series) >= self.max_series:
+                oldest = next(iter(self._series))
+                self._remove(oldest)
+                self.evicted += 1
+                logger.debug(f"Time-series limit reached, evicted {oldest[0]}")
+            series = TimeSeries(self.raw_capacity, self.rollup_config)
+            self._series[key] = series
+            self._by_name.setdefault(name, set()).add(key)
+            for label in key[1]:
+                self._by_label.setdefault(label, set()).add(key)
+        else:
+            self._series.move_to_end(key)
+
+        series.add(time.time() if timestamp is None else timestamp, float(value))
+
+    def select(self, name: Optional[str] = None, **labels: str) -> List[SeriesKey]:
+        """Series keys matching a name and/or all given label values"""
+        candidates: List[Set[SeriesKey]] = []
+        if name is not None:
+            candidates.append(self._by_name.get(name, set()))
+        for label in labels.items():
+            candidates.append(self._by_label.get((label[0], str(label[1])), set()))
+        if not candidates:
+            return list(self._series)
+        candidates.sort(key=len)
+        return list(candidates[0].intersection(*candidates[1:]))
+
+    def query(
+            self,
+            name: Optional[str] = None,
+            start: Optional[float] = None,
+            end: Optional[float] = None,
+            resolution: Optional[int] = None,
+            **labels: str
+    ) -> List[SeriesRange]:
+        """
+        Points (or rollup buckets) in ``[start, end)`` for matching series
+
+        With a ``resolution``, ``values`` holds bucket means and min/max/count
+        are filled in.
+        """
+        start = float('-inf') if start is None else start
+        end = float('inf') if end is None else end
+        results = []
+        for key in self.select(name, **labels):
+            data = self._series[key].range(start, end, resolution)
+            series_labels = dict(key[1])
+            if resolution is None:
+                results.append(SeriesRange(key[0], series_labels, data['timestamp'], data['value']))
+            else:
+                results.append(SeriesRange(
+                    key[0], series_labels, data['start'],
+                    data['sum'] / np.maximum(data['count'], 1),
+                    resolution=resolution,
+                    minimum=data['min'],
+                    maximum=data['max'],
+                    count=data['count']
+                ))
+        return results
+
+    def series(self, name: str, labels: Optional[Dict[str, str]] = None) -> Optional[TimeSeries]:
+        return self._series.get(self.series_key(name, labels))
+
+    def drop(self, **labels: str) -> int:
+        """Remove all series matching the labels"""
+        keys = self.select(**labels) if labels else list(self._series)
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def _remove(self, key: SeriesKey) -> None:
+        del self._series[key]
+        self._discard(self._by_name, key[0], key)
+        for label in key[1]:
+            self._discard(self._by_label, label, key)
+
+    @staticmethod
+    def _discard(index: Dict[Any, Set[SeriesKey]], entry: Any, key: SeriesKey) -> None:
+        keys = index.get(entry)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del index[entry]
+
+    def label_values(self, label: str) -> Set[str]:
+        return {value for name, value in self._by_label if name == label}
+
+    @property
+    def nbytes(self) -> int:
+        return sum(series.nbytes for series in self._series.values())
+
+    def iter_series(self) -> Iterable[Tuple[SeriesKey, TimeSeries]]:
+        return self._series.items()
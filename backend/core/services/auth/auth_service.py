@@ -4,30 +4,49 @@ import logging
 import os
 from jose import jwt
 import secrets
-from typing import Dict, Any, Optional
+import uuid
+from typing import Dict, Any, Iterable, Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import update
+from sqlalchemy import event, inspect, update
 from datetime import datetime, timedelta
-from passlib.context import CryptContext
 
 from db.models.auth import User, UserSession, PasswordResetToken
-
-# Configure password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from .password_hasher import PasswordHasher, get_password_hasher
+from .principal_cache import principal_cache, token_key
 
 logger = logging.getLogger(__name__)
 
+# User attributes that change what a cached principal may do
+PRINCIPAL_ATTRIBUTES = ('role', 'status', 'is_active', 'password_hash')
+
+
+@event.listens_for(User, 'after_update')
+def _invalidate_principals(mapper, connection, target: User) -> None:
+    """Drop cached principals when a user's role, status or password changes"""
+    state = inspect(target)
+    if any(state.attrs[name].history.has_changes() for name in PRINCIPAL_ATTRIBUTES):
+        principal_cache.invalidate_user(target.id)
+
 
 class AuthService:
-    def __init__(self, db_session: AsyncSession):
+    def __init__(self, db_session: AsyncSession, hasher: Optional[PasswordHasher] = None):
         self.db_session = db_session
+        self.hasher = hasher or get_password_hasher()
         self.logger = logging.getLogger(__name__)
 
-    def _hash_password(self, password: str) -> str:
-        """Hash a password using passlib."""
-        return pwd_context.hash(password)
+    @staticmethod
+    def _limit_keys(email: str, client_ip: Optional[str] = None) -> Iterable[str]:
+        """Concurrency-limit keys for a hashing job, keyed on the normalized email"""
+        keys = [f"account:{email.strip().lower()}"]
+        if client_ip:
+            keys.append(f"ip:{client_ip}")
+        return keys
+
+    async def _hash_password(self, password: str, keys: Iterable[str] = ()) -> str:
+        """Hash a password on the hashing pool."""
+        return await self.hasher.hash(password, keys)
 
     async def create_tokens(self, user_data):
         """Create access and refresh tokens for a user"""
@@ -45,6 +64,7 @@ class AuthService:
             # Create access token
             access_token_payload = {
                 "sub": user_data["id"],
+                "jti": uuid.uuid4().hex,
                 "exp": access_token_expires,
                 "type": "access",
                 "roles": user_data.get("roles", []),
@@ -54,6 +74,7 @@ class AuthService:
             # Create refresh token
             refresh_token_payload = {
                 "sub": user_data["id"],
+                "jti": uuid.uuid4().hex,
                 "exp": refresh_token_expires,
                 "type": "refresh"
             }
@@ -82,11 +103,16 @@ class AuthService:
             self.logger.error(f"Error creating tokens: {str(e)}")
             raise
 
-    def _verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        """Verify a password against its hash using passlib."""
-        return pwd_context.verify(plain_password, hashed_password)
+    async def _verify_password(
+            self,
+            plain_password: str,
+            hashed_password: str,
+            keys: Iterable[str] = ()
+    ) -> bool:
+        """Verify a password against its hash on the hashing pool."""
+        return await self.hasher.verify(plain_password, hashed_password, keys)
 
-    async def register_user(self, data: Dict[str, Any]) -> User:
+    async def register_user(self, data: Dict[str, Any], client_ip: Optional[str] = None) -> User:
         """Register a new user."""
         try:
             # Check if user exists
@@ -94,7 +120,9 @@ class AuthService:
             if existing_user:
                 raise ValueError("Email already registered")
 
-            password_hash = self._hash_password(data['password'])
+            password_hash = await self._hash_password(
+                data['password'], self._limit_keys(data['email'], client_ip)
+            )
 
             # Create user with required fields
             user = User(
@@ -127,8 +155,22 @@ class AuthService:
             self.logger.error(f"User registration error: {str(e)}")
             raise
 
-    async def authenticate_user(self, email: str, password: str) -> Optional[User]:
-        """Authenticate a user."""
+    async def authenticate_user(
+            self,
+            email: str,
+            password: str,
+            client_ip: Optional[str] = None
+    ) -> Optional[User]:
+        """
+        Authenticate a user.
+
+        Verification runs on the hashing pool, limited per account and per
+        client IP. A hash made with an outdated bcrypt cost is replaced on
+        successful login.
+
+        Raises:
+            HashingLimitExceeded: If the account, IP or pool is at its limit
+        """
         try:
             user = await self.get_user_by_email(email)
             if not user:
@@ -140,13 +182,20 @@ class AuthService:
             if user.failed_login_attempts >= 5 and user.locked_until and user.locked_until > datetime.utcnow():
                 raise ValueError("Account is locked. Please try again later")
 
-            if not self._verify_password(password, user.password_hash):
+            valid, new_hash = await self.hasher.verify_and_update(
+                password, user.password_hash, self._limit_keys(email, client_ip)
+            )
+            if not valid:
                 user.failed_login_attempts += 1
                 if user.failed_login_attempts >= 5:
                     user.locked_until = datetime.utcnow() + timedelta(minutes=30)
                 await self.db_session.commit()
                 return None
 
+            if new_hash:
+                # Stored hash used a different cost; upgrade it transparently
+                user.password_hash = new_hash
+
             # Reset failed attempts on successful login
             user.failed_login_attempts = 0
             user.locked_until = None
@@ -169,11 +218,12 @@ class AuthService:
             if not user:
                 raise ValueError("User not found")
 
-            if not self._verify_password(current_password, user.password_hash):
+            keys = self._limit_keys(user.email)
+            if not await self._verify_password(current_password, user.password_hash, keys):
                 raise ValueError("Invalid current password")
 
             # Update password
-            user.password_hash = self._hash_password(new_password)
+            user.password_hash = await self._hash_password(new_password, keys)
             await self.db_session.commit()
 
         except Exception as e:
@@ -202,7 +252,7 @@ class AuthService:
                 raise ValueError("User not found")
 
             # Update password
-            user.password_hash = self._hash_password(new_password)
+            user.password_hash = await self._hash_password(new_password, self._limit_keys(user.email))
 
             # Delete the used reset token
             await self.db_session.delete(reset_record)
@@ -289,6 +339,45 @@ class AuthService:
             self.logger.error(f"Error fetching user by id: {str(e)}")
             raise
 
+    async def get_principal(self, payload: Dict[str, Any], token: str) -> Optional[Dict[str, Any]]:
+        """
+        Resolve the principal (user, roles, permissions) behind a decoded
+        access token.
+
+        Served from the principal cache when possible, so repeated requests
+        with the same token make no database round trip. On a miss the user
+        is loaded once and cached until the cache TTL or the token's expiry.
+        Roles and permissions come from the stored user, never from the
+        token's claims. Invalidation is per process, so other workers may
+        serve a changed user's old principal for up to the cache TTL.
+
+        Args:
+            payload: Verified access token claims
+            token: The encoded token, used as cache key when it has no jti
+
+        Returns:
+            Principal dict, or None if the user is missing or inactive
+        """
+        key = token_key(payload, token)
+        principal = principal_cache.get(key)
+        if principal is not None:
+            return principal
+
+        user = await self.get_user_by_id(payload['sub'])
+        if not user or not user.is_active:
+            return None
+
+        principal = {
+            'id': str(user.id),
+            'email': user.email,
+            'roles': [user.role] if user.role else [],
+            'permissions': sorted(set(self.get_user_permissions(user))),
+            'jti': key,
+            'exp': payload.get('exp')
+        }
+        principal_cache.set(key, principal, expires_at=payload.get('exp'))
+        return principal
+
     async def get_user_by_email(self, email: str) -> Optional[User]:
         """Get user by their email address."""
         try:
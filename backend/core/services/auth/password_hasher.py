@@ -0,0 +1,198 @@
+# backend/core/services/auth/password_hasher.py
+
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from passlib.context import CryptContext
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BCRYPT_ROUNDS = 12
+
+
+class HashingLimitExceeded(Exception):
+    """Raised when a client or the whole hashing pool is over its concurrency limit"""
+
+    def __init__(self, message: str, retry_after: int = 1):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass
+class HasherStats:
+    """Counters for the password hashing pool"""
+    hashed: int = 0
+    verified: int = 0
+    rehashed: int = 0
+    rejected: int = 0
+    peak_pending: int = 0
+    work_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        jobs = self.hashed + self.verified
+        return {
+            'hashed': self.hashed,
+            'verified': self.verified,
+            'rehashed': self.rehashed,
+            'rejected': self.rejected,
+            'peak_pending': self.peak_pending,
+            'mean_work_seconds': self.work_seconds / jobs if jobs else 0.0
+        }
+
+
+def crypt_context(rounds: int = DEFAULT_BCRYPT_ROUNDS) -> CryptContext:
+    """
+    bcrypt context pinned to ``rounds``
+
+    Hashes made with any other cost report ``needs_update``, so changing
+    the cost rehashes each account on its next successful login.
+    """
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds
+    )
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt off the event loop on a dedicated, bounded thread pool
+
+    bcrypt releases the GIL, so ``workers`` hashes run in parallel while
+    the loop keeps serving other requests. Admission is bounded twice:
+    at most ``max_pending`` jobs may be queued or running in total, and at
+    most ``per_key_limit`` at once for any one key (client IP, account).
+    Jobs over either limit are rejected with ``HashingLimitExceeded``
+    instead of queueing, so a flood of logins cannot build an unbounded
+    backlog of 100+ ms hashes.
+    """
+
+    def __init__(
+            self,
+            rounds: int = DEFAULT_BCRYPT_ROUNDS,
+            workers: Optional[int] = None,
+            max_pending: int = 64,
+            per_key_limit: int = 2
+    ):
+        self.rounds = rounds
+        self.context = crypt_context(rounds)
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.max_pending = max_pending
+        self.per_key_limit = per_key_limit
+        self.stats = HasherStats()
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='password-hash')
+        self._pending = 0
+        self._per_key: Dict[str, int] = {}
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def hash(self, password: str, keys: Iterable[str] = ()) -> str:
+        hashed = await self._run(self.context.hash, keys, password)
+        self.stats.hashed += 1
+        return hashed
+
+    async def verify(self, password: str, hashed: str, keys: Iterable[str] = ()) -> bool:
+        valid = await self._run(self.context.verify, keys, password, hashed)
+        self.stats.verified += 1
+        return valid
+
+    async def verify_and_update(
+            self,
+            password: str,
+            hashed: str,
+            keys: Iterable[str] = ()
+    ) -> Tuple[bool, Optional[str]]:
+        """Verify, returning a replacement hash when the stored cost is outdated"""
+        valid, new_hash = await self._run(self.context.verify_and_update, keys, password, hashed)
+        self.stats.verified += 1
+        if new_hash:
+            self.stats.rehashed += 1
+        return valid, new_hash
+
+    async def _run(self, fn: Callable, keys: Iterable[str], *args: Any) -> Any:
+        keys = tuple(key for key in keys if key)
+        loop = asyncio.get_running_loop()
+        self._admit(keys)
+        try:
+            job = self._executor.submit(self._timed, fn, *args)
+        except Exception:
+            self._release(keys)
+            raise
+        # Release when the worker finishes, not when the caller stops
+        # waiting, so cancelled requests cannot overfill the pool
+        job.add_done_callback(lambda _: self._release_from_worker(loop, keys))
+        result, elapsed = await asyncio.wrap_future(job)
+        self.stats.work_seconds += elapsed
+        return result
+
+    @staticmethod
+    def _timed(fn: Callable, *args: Any) -> Tuple[Any, float]:
+        started = time.perf_counter()
+        result = fn(*args)
+        return result, time.perf_counter() - started
+
+    def _admit(self, keys: Tuple[str, ...]) -> None:
+        if self._pending >= self.max_pending:
+            self.stats.rejected += 1
+            raise HashingLimitExceeded("Too many authentication requests, try again shortly")
+        for key in keys:
+            if self._per_key.get(key, 0) >= self.per_key_limit:
+                self.stats.rejected += 1
+                logger.warning(f"Password hashing limit reached for {key}")
+                raise HashingLimitExceeded("Too many concurrent attempts, try again shortly")
+        self._pending += 1
+        self.stats.peak_pending = max(self.stats.peak_pending, self._pending)
+        for key in keys:
+            self._per_key[key] = self._per_key.get(key, 0) + 1
+
+    def _release_from_worker(self, loop: asyncio.AbstractEventLoop, keys: Tuple[str, ...]) -> None:
+        try:
+            loop.call_soon_threadsafe(self._release, keys)
+        except RuntimeError:
+            # Loop already closed; nothing is waiting on the counters
+            pass
+
+    def _release(self, keys: Tuple[str, ...]) -> None:
+        self._pending -= 1
+        for key in keys:
+            remaining = self._per_key.get(key, 1) - 1
+            if remaining > 0:
+                self._per_key[key] = remaining
+            else:
+                self._per_key.pop(key, None)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+_hasher: Optional[PasswordHasher] = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Process-wide password hasher, sized from the environment"""
+    global _hasher
+    if _hasher is None:
+        workers = os.getenv('AUTH_HASH_WORKERS')
+        _hasher = PasswordHasher(
+            rounds=int(os.getenv('AUTH_BCRYPT_ROUNDS', str(DEFAULT_BCRYPT_ROUNDS))),
+            workers=int(workers) if workers else None,
+            max_pending=int(os.getenv('AUTH_HASH_MAX_PENDING', '64')),
+            per_key_limit=int(os.getenv('AUTH_HASH_PER_KEY_LIMIT', '2'))
+        )
+    return _hasher
+
+
+def shutdown_password_hasher() -> None:
+    global _hasher
+    if _hasher is not None:
+        _hasher.shutdown()
+        _hasher = None
@@ -0,0 +1,119 @@
+# backend/core/services/auth/principal_cache.py
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+
+
+def token_key(payload: Dict[str, Any], token: str) -> str:
+    """Cache key for a token: its ``jti``, else a digest of the token itself"""
+    jti = payload.get('jti')
+    if jti:
+        return str(jti)
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class PrincipalCache:
+    """
+    Bounded TTL/LRU cache of resolved principals keyed by token id
+
+    A hit lets an authenticated request skip the user lookup entirely.
+    Entries live for ``ttl`` seconds or until the token expires, whichever
+    is sooner, and are dropped when the token is revoked
+    (``invalidate_token``) and when the user's role or status changes
+    (``invalidate_user``). Revocation itself is enforced by the token
+    revocation store, which is checked before this cache.
+
+    The cache and its invalidation are per process: a role or status change
+    made through one worker is not seen by the others until their entries
+    expire, so AUTH_PRINCIPAL_CACHE_TTL bounds how long they stay stale.
+    """
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 10000, clock=time.time):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries: 'OrderedDict[str, Tuple[Dict[str, Any], float]]' = OrderedDict()
+        self._by_user: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """A copy of the cached principal, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= self.clock():
+                if entry is not None:
+                    self._drop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            principal = entry[0]
+        # Callers decorate the returned dict; keep the cached one pristine
+        return {
+            **principal,
+            'roles': list(principal.get('roles', ())),
+            'permissions': list(principal.get('permissions', ()))
+        }
+
+    def set(self, key: str, principal: Dict[str, Any], expires_at: Optional[float] = None) -> None:
+        if self.ttl <= 0:
+            return
+        deadline = self.clock() + self.ttl
+        if expires_at is not None:
+            deadline = min(deadline, expires_at)
+        stored = {
+            **principal,
+            'roles': tuple(principal.get('roles', ())),
+            'permissions': tuple(principal.get('permissions', ()))
+        }
+        user_id = str(principal['id'])
+        with self._lock:
+            self._entries[key] = (stored, deadline)
+            self._entries.move_to_end(key)
+            self._by_user.setdefault(user_id, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                oldest, (evicted, _) = self._entries.popitem(last=False)
+                self._unindex(oldest, evicted)
+
+    def invalidate_token(self, key: str) -> None:
+        with self._lock:
+            self._drop(key)
+
+    def invalidate_user(self, user_id: Any) -> None:
+        """Drop every cached principal of a user, e.g. after a role change"""
+        with self._lock:
+            for key in list(self._by_user.get(str(user_id), ())):
+                self._drop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_user.clear()
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._unindex(key, entry[0])
+
+    def _unindex(self, key: str, principal: Dict[str, Any]) -> None:
+        user_id = str(principal['id'])
+        keys = self._by_user.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_user[user_id]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+principal_cache = PrincipalCache(
+    ttl=float(os.getenv('AUTH_PRINCIPAL_CACHE_TTL', '60')),
+    max_entries=int(os.getenv('AUTH_PRINCIPAL_CACHE_SIZE', '10000'))
+)
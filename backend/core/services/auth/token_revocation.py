@@ -0,0 +1,301 @@
+# backend/core/services/auth/token_revocation.py
+
+import asyncio
+import hashlib
+import logging
+import math
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional, Union
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.repository.revocation import TokenRevocationRepository
+from .principal_cache import principal_cache
+
+logger = logging.getLogger(__name__)
+
+Expiry = Union[datetime, int, float]
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings
+
+    Membership tests never miss an added item; they report a false
+    positive at roughly ``error_rate`` once ``capacity`` items are added.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = max(capacity, 1)
+        self.error_rate = error_rate
+        self.size = max(8, int(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        # Kirsch-Mitzenmacher double hashing
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+@dataclass
+class RevocationStats:
+    """Counters for the token revocation store"""
+    checks: int = 0
+    bloom_negatives: int = 0
+    lookups: int = 0
+    false_positives: int = 0
+    revoked: int = 0
+    synced: int = 0
+    purged: int = 0
+    rebuilds: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'checks': self.checks,
+            'bloom_negatives': self.bloom_negatives,
+            'lookups': self.lookups,
+            'false_positives': self.false_positives,
+            'revoked': self.revoked,
+            'synced': self.synced,
+            'purged': self.purged,
+            'rebuilds': self.rebuilds
+        }
+
+
+def _expiry_datetime(expires_at: Expiry) -> datetime:
+    if isinstance(expires_at, datetime):
+        return expires_at
+    return datetime.utcfromtimestamp(expires_at)
+
+
+class TokenRevocationStore:
+    """
+    Revoked token ids shared by every worker through ``revoked_tokens``
+
+    Each worker keeps a Bloom filter of all unexpired revocations. A token
+    that is not in the filter, which is nearly every token, is known
+    not revoked without any I/O. Filter hits are confirmed against the
+    table and memoised until the token expires.
+
+    Revocations made by other processes reach the filter through a sync
+    that polls the ``revoked_at`` index every ``sync_interval`` seconds
+    (overlapping by ``clock_skew`` to tolerate clock differences between
+    hosts). Expired rows are purged, and the filter rebuilt from the
+    remaining rows, every ``purge_interval`` seconds.
+    """
+
+    def __init__(
+            self,
+            session_factory: Callable[[], AsyncSession],
+            capacity: int = 100000,
+            error_rate: float = 0.001,
+            sync_interval: float = 1.0,
+            purge_interval: float = 300.0,
+            clock_skew: float = 5.0,
+            memo_size: int = 10000
+    ):
+        self.session_factory = session_factory
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_interval = sync_interval
+        self.purge_interval = purge_interval
+        self.clock_skew = timedelta(seconds=clock_skew)
+        self.memo_size = memo_size
+        self.stats = RevocationStats()
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._next_bloom: Optional[BloomFilter] = None
+        # jti -> (revoked, memo expiry as epoch seconds)
+        self._memo: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._watermark: Optional[datetime] = None
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._last_purge = time.monotonic()
+
+    def might_be_revoked(self, jti: str) -> bool:
+        """O(1) and I/O-free; False means definitely not revoked"""
+        return jti in self._bloom
+
+    async def is_revoked(self, jti: str) -> bool:
+        await self.load()
+        self.stats.checks += 1
+        if jti not in self._bloom:
+            self.stats.bloom_negatives += 1
+            return False
+
+        memo = self._memo.get(jti)
+        if memo is not None and memo[1] > time.time():
+            self._memo.move_to_end(jti)
+            return memo[0]
+
+        self.stats.lookups += 1
+        async with self.session_factory() as session:
+            revoked = await TokenRevocationRepository(session).is_revoked(jti)
+        if not revoked:
+            self.stats.false_positives += 1
+        # Negative answers are re-checked after a sync interval, in case the
+        # revocation lands between this lookup and the next sync
+        self._remember(jti, revoked, time.time() + (self.purge_interval if revoked else self.sync_interval))
+        return revoked
+
+    async def revoke(
+            self,
+            jti: str,
+            expires_at: Expiry,
+            user_id: Any = None,
+            reason: Optional[str] = None
+    ) -> None:
+        """Revoke a token until ``expires_at`` (its ``exp`` claim)"""
+        expiry = _expiry_datetime(expires_at)
+        if user_id is not None and not isinstance(user_id, UUID):
+            user_id = UUID(str(user_id))
+        async with self.session_factory() as session:
+            await TokenRevocationRepository(session).revoke(jti, expiry, user_id, reason)
+        self._add(jti)
+        self._remember(jti, True, (expiry - datetime.utcnow()).total_seconds() + time.time())
+        principal_cache.invalidate_token(jti)
+        self.stats.revoked += 1
+
+    async def load(self) -> None:
+        """Build the filter from the table once, before the first check"""
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            self._watermark = datetime.utcnow() - self.clock_skew
+            await self._rebuild()
+            self._loaded = True
+
+    async def sync(self) -> int:
+        """Pull revocations recorded by other processes since the last sync"""
+        await self.load()
+        since = self._watermark
+        async with self.session_factory() as session:
+            rows = await TokenRevocationRepository(session).revoked_since(since)
+        for jti, revoked_at in rows:
+            if jti not in self._bloom:
+                self.stats.synced += 1
+            self._add(jti)
+            self._memo.pop(jti, None)
+            principal_cache.invalidate_token(jti)
+            since = max(since, revoked_at - self.clock_skew)
+        self._watermark = since
+        return len(rows)
+
+    async def purge(self) -> int:
+        """Delete expired revocations and rebuild the filter without them"""
+        await self.load()
+        async with self.session_factory() as session:
+            deleted = await TokenRevocationRepository(session).purge_expired()
+        self.stats.purged += deleted
+        if deleted or self._bloom.count > self.capacity:
+            await self._rebuild()
+        now = time.time()
+        for jti in [jti for jti, (_, until) in self._memo.items() if until <= now]:
+            del self._memo[jti]
+        return deleted
+
+    async def _rebuild(self) -> None:
+        fresh = BloomFilter(self.capacity, self.error_rate)
+        # Revocations arriving while the table is scanned go into both
+        self._next_bloom = fresh
+        try:
+            async with self.session_factory() as session:
+                async for batch in TokenRevocationRepository(session).active_jtis():
+                    for jti in batch:
+                        fresh.add(jti)
+            if fresh.count > self.capacity:
+                logger.warning(
+                    f"{fresh.count} active revocations exceed the filter capacity of "
+                    f"{self.capacity}; false positives will rise"
+                )
+            self._bloom = fresh
+            self.stats.rebuilds += 1
+        finally:
+            self._next_bloom = None
+
+    def _add(self, jti: str) -> None:
+        self._bloom.add(jti)
+        if self._next_bloom is not None:
+            self._next_bloom.add(jti)
+
+    def _remember(self, jti: str, revoked: bool, until: float) -> None:
+        self._memo[jti] = (revoked, until)
+        self._memo.move_to_end(jti)
+        while len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.sync_interval)
+            try:
+                await self.sync()
+                if time.monotonic() - self._last_purge >= self.purge_interval:
+                    self._last_purge = time.monotonic()
+                    await self.purge()
+            except Exception as e:
+                logger.error(f"Token revocation sync failed: {str(e)}")
+
+    def start(self) -> None:
+        """Start the background sync and purge loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+_store: Optional[TokenRevocationStore] = None
+
+
+def _default_session_factory() -> AsyncSession:
+    from config.database import db_config
+    return db_config.session_factory()()
+
+
+def get_revocation_store() -> TokenRevocationStore:
+    """Process-wide revocation store, sized from the environment"""
+    global _store
+    if _store is None:
+        _store = TokenRevocationStore(
+            _default_session_factory,
+            capacity=int(os.getenv('TOKEN_REVOCATION_CAPACITY', '100000')),
+            error_rate=float(os.getenv('TOKEN_REVOCATION_ERROR_RATE', '0.001')),
+            sync_interval=float(os.getenv('TOKEN_REVOCATION_SYNC_INTERVAL', '1.0')),
+            purge_interval=float(os.getenv('TOKEN_REVOCATION_PURGE_INTERVAL', '300'))
+        )
+    if _store._task is None:
+        try:
+            _store.start()
+        except RuntimeError:
+            # No running loop yet; the first call from inside one starts it
+            pass
+    return _store
+
+
+async def shutdown_revocation_store() -> None:
+    global _store
+    if _store is not None:
+        await _store.close()
+        _store = None
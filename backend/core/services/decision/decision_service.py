@@ -6,6 +6,8 @@ import asyncio
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from ..base.base_service import BaseService
 from ...messaging.broker import MessageBroker
 from ...messaging.event_types import (
@@ -22,6 +24,9 @@ from ...messaging.event_types import (
     DecisionImpact,
     DecisionMetrics
 )
+from db.models.staging.processing import StagedDecisionOutput
+from db.repository.base import BaseRepository
+from db.repository.pagination import COUNT_EXACT, Page
 
 logger = logging.getLogger(__name__)
 
@@ -488,6 +493,25 @@ class DecisionService(BaseService):
                 )
             )
 
+    async def list_decisions(
+            self,
+            db_session: AsyncSession,
+            filters: Optional[Dict[str, Any]] = None,
+            page_size: int = 50,
+            cursor: Optional[str] = None,
+            count_mode: str = COUNT_EXACT
+    ) -> Page:
+        """One keyset page of staged decisions, newest first; items are dicts"""
+        page = await BaseRepository(db_session).list_all(
+            StagedDecisionOutput,
+            filters=filters,
+            page_size=page_size,
+            cursor=cursor,
+            count_mode=count_mode
+        )
+        page.items = [BaseRepository.to_dict(item) for item in page.items]
+        return page
+
     async def cleanup(self) -> None:
         """
         Clean up active decision processes and unsubscribe from message broker
@@ -0,0 +1,435 @@
+import logging
+import math
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Deque, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+LabelSet = FrozenSet[Tuple[str, str]]
+Scope = Tuple[str, str, LabelSet]  # (rule type, metric/component key, series labels)
+
+WINDOW_AGGREGATIONS = ('avg', 'sum', 'min', 'max', 'count', 'rate')
+NUMERIC_OPERATORS = ('>', '>=', '<', '<=', '==', '!=')
+
+
+def _field(obj: Any, name: str, default: Any = None) -> Any:
+    """Read a field from a dataclass/pydantic object or a plain dict"""
+    if isinstance(obj, dict):
+        return obj.get(name, default)
+    return getattr(obj, name, default)
+
+
+def _type_value(rule_type: Any) -> str:
+    return rule_type.value if isinstance(rule_type, Enum) else str(rule_type)
+
+
+def _label_set(labels: Optional[Dict[str, Any]]) -> LabelSet:
+    return frozenset((str(k), str(v)) for k, v in (labels or {}).items())
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+
+@dataclass
+class RuleMatch:
+    """A rule that fired for one series"""
+    rule_id: str
+    rule_type: str
+    key: str
+    value: Any
+    labels: Dict[str, str]
+
+    @property
+    def fingerprint(self) -> Tuple[str, LabelSet]:
+        return self.rule_id, _label_set(self.labels)
+
+
+@dataclass
+class EngineStats:
+    """Evaluation cost counters"""
+    evaluations: int = 0
+    samples: int = 0
+    groups_examined: int = 0
+    matches: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            'evaluations': self.evaluations,
+            'samples': self.samples,
+            'groups_examined': self.groups_examined,
+            'matches': self.matches
+        }
+
+
+class WindowAggregate:
+    """
+    Sliding-window aggregates over one series, maintained incrementally
+
+    Sum and count are running totals; min and max use monotonic deques, so
+    each point is added and evicted once and reads are O(1).
+    """
+
+    def __init__(self, window: float):
+        self.window = window
+        self._points: Deque[Tuple[int, float, float]] = deque()
+        self._min: Deque[Tuple[int, float]] = deque()
+        self._max: Deque[Tuple[int, float]] = deque()
+        self._sum = 0.0
+        self._sequence = 0
+
+    def add(self, timestamp: float, value: float) -> None:
+        sequence = self._sequence
+        self._sequence += 1
+        self._points.append((sequence, timestamp, value))
+        self._sum += value
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((sequence, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((sequence, value))
+        self._evict(timestamp - self.window)
+
+    def _evict(self, cutoff: float) -> None:
+        while self._points and self._points[0][1] < cutoff:
+            sequence, _, value = self._points.popleft()
+            self._sum -= value
+            if self._min and self._min[0][0] == sequence:
+                self._min.popleft()
+            if self._max and self._max[0][0] == sequence:
+                self._max.popleft()
+
+    def value(self, aggregation: str) -> Optional[float]:
+        if not self._points:
+            return None
+        if aggregation == 'avg':
+            return self._sum / len(self._points)
+        if aggregation == 'sum':
+            return self._sum
+        if aggregation == 'count':
+            return float(len(self._points))
+        if aggregation == 'min':
+            return self._min[0][1]
+        if aggregation == 'max':
+            return self._max[0][1]
+        if aggregation == 'rate':
+            _, first_ts, first_value = self._points[0]
+            _, last_ts, last_value = self._points[-1]
+            elapsed = last_ts - first_ts
+            return (last_value - first_value) / elapsed if elapsed > 0 else None
+        raise ValueError(f"Unsupported window aggregation: {aggregation}")
+
+
+class _ThresholdGroup:
+    """
+    Rules sharing a key, label matchers and aggregation
+
+    Numeric thresholds are compiled per operator into sorted arrays, so the
+    rules matched by a value are a contiguous slice found by binary search.
+    Non-numeric thresholds (e.g. status strings) are matched by hashing.
+    """
+
+    def __init__(self, matchers: LabelSet, aggregation: Optional[str], window: Optional[float]):
+        self.matchers = matchers
+        self.aggregation = aggregation
+        self.window = window
+        self.rules: Dict[str, Tuple[str, Any]] = {}  # rule_id -> (operator, threshold)
+        self._compiled: Optional[Dict[str, Tuple[np.ndarray, np.ndarray]]] = None
+        self._equals: Dict[Any, List[str]] = {}
+        self._not_equals: List[Tuple[Any, str]] = []
+
+    def add(self, rule_id: str, operator: str, threshold: Any) -> None:
+        self.rules[rule_id] = (operator, threshold)
+        self._compiled = None
+
+    def remove(self, rule_id: str) -> None:
+        if self.rules.pop(rule_id, None) is not None:
+            self._compiled = None
+
+    def _compile(self) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        grouped: Dict[str, List[Tuple[float, str]]] = {}
+        self._equals = {}
+        self._not_equals = []
+        for rule_id, (operator, threshold) in self.rules.items():
+            if _is_number(threshold):
+                grouped.setdefault(operator, []).append((float(threshold), rule_id))
+            elif operator == '==':
+                self._equals.setdefault(threshold, []).append(rule_id)
+            elif operator == '!=':
+                self._not_equals.append((threshold, rule_id))
+
+        compiled = {}
+        for operator, entries in grouped.items():
+            entries.sort(key=lambda entry: entry[0])
+            compiled[operator] = (
+                np.fromiter((t for t, _ in entries), dtype=np.float64, count=len(entries)),
+                np.array([rule_id for _, rule_id in entries], dtype=object)
+            )
+        self._compiled = compiled
+        return compiled
+
+    def match(self, value: Any) -> List[str]:
+        compiled = self._compiled if self._compiled is not None else self._compile()
+        fired: List[str] = []
+
+        if _is_number(value):
+            for operator, (thresholds, rule_ids) in compiled.items():
+                left = int(np.searchsorted(thresholds, value, side='left'))
+                right = int(np.searchsorted(thresholds, value, side='right'))
+                if operator == '>':      # threshold < value
+                    fired.extend(rule_ids[:left])
+                elif operator == '>=':   # threshold <= value
+                    fired.extend(rule_ids[:right])
+                elif operator == '<':    # threshold > value
+                    fired.extend(rule_ids[right:])
+                elif operator == '<=':   # threshold >= value
+                    fired.extend(rule_ids[left:])
+                elif operator == '==':
+                    fired.extend(rule_ids[left:right])
+                elif operator == '!=':
+                    fired.extend(rule_ids[:left])
+                    fired.extend(rule_ids[right:])
+        else:
+            try:
+                fired.extend(self._equals.get(value, ()))
+            except TypeError:
+                pass  # unhashable value
+            fired.extend(rule_id for threshold, rule_id in self._not_equals if value != threshold)
+        return fired
+
+
+class AlertRuleEngine:
+    """
+    Alert rules indexed by rule type, metric name and label matchers
+
+    An update only touches the groups registered for the metrics it
+    carries, and each group resolves its firing rules by binary search
+    over compiled thresholds. Windowed rules share one incremental
+    aggregate per series and window, so evaluation cost follows the size
+    of the update rather than the number of configured rules.
+    """
+
+    def __init__(self, max_window_series: int = 10000, clock=time.time):
+        self.max_window_series = max_window_series
+        self.clock = clock
+        self.stats = EngineStats()
+        # (rule type, key) -> group key -> group
+        self._index: Dict[Tuple[str, str], Dict[Tuple, _ThresholdGroup]] = {}
+        self._rule_locations: Dict[str, Tuple[Tuple[str, str], Tuple]] = {}
+        # Least recently updated first, so the stalest series is dropped when full
+        self._windows: OrderedDict[Tuple[str, LabelSet, float], WindowAggregate] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._rule_locations)
+
+    def __contains__(self, rule_id: str) -> bool:
+        return rule_id in self._rule_locations
+
+    @staticmethod
+    def rule_key(rule_type: str, condition: Any) -> Optional[str]:
+        """Metric (or component) a rule is indexed under"""
+        if rule_type == 'status_change':
+            return _field(condition, 'component_id')
+        return _field(condition, 'metric_name')
+
+    def add_rule(self, rule: Any) -> bool:
+        """Index a rule; returns False for rules that cannot be indexed"""
+        rule_id = _field(rule, 'rule_id')
+        rule_type = _type_value(_field(rule, 'rule_type'))
+        condition = _field(rule, 'condition')
+
+        key = self.rule_key(rule_type, condition)
+        operator = _field(condition, 'operator')
+        indexable = key is not None and operator in NUMERIC_OPERATORS
+        aggregation = _field(condition, 'aggregation')
+        window = _field(condition, 'window')
+        # Validate before touching the index so a rejected rule leaves the old one in place
+        if indexable and (aggregation is None) != (window is None):
+            raise ValueError(f"Alert rule {rule_id} needs both aggregation and window")
+        if indexable and aggregation is not None and aggregation not in WINDOW_AGGREGATIONS:
+            raise ValueError(f"Unsupported window aggregation: {aggregation}")
+
+        self.remove_rule(rule_id)
+        if not indexable:
+            logger.debug(f"Alert rule {rule_id} is not indexable, skipping")
+            return False
+
+        matchers = _label_set(_field(condition, 'labels'))
+        group_key = (matchers, aggregation, float(window) if window is not None else None)
+        groups = self._index.setdefault((rule_type, key), {})
+        group = groups.get(group_key)
+        if group is None:
+            group = groups[group_key] = _ThresholdGroup(*group_key)
+
+        group.add(rule_id, operator, _field(condition, 'threshold'))
+        self._rule_locations[rule_id] = ((rule_type, key), group_key)
+        return True
+
+    def remove_rule(self, rule_id: str) -> bool:
+        location = self._rule_locations.pop(rule_id, None)
+        if location is None:
+            return False
+        index_key, group_key = location
+        groups = self._index[index_key]
+        group = groups[group_key]
+        group.remove(rule_id)
+        if not group.rules:
+            del groups[group_key]
+            if not groups:
+                del self._index[index_key]
+        return True
+
+    def clear(self) -> None:
+        self._index.clear()
+        self._rule_locations.clear()
+        self._windows.clear()
+
+    def evaluate(
+            self,
+            rule_type: Any,
+            samples: Iterable[Tuple[str, Any, Dict[str, str]]],
+            timestamp: Optional[float] = None
+    ) -> Tuple[List[RuleMatch], Set[Scope]]:
+        """
+        Evaluate ``(key, value, labels)`` samples
+
+        Returns the firing rules and the scopes that were evaluated, so
+        callers can resolve alerts that stopped firing in those scopes.
+        """
+        rule_type = _type_value(rule_type)
+        timestamp = self.clock() if timestamp is None else timestamp
+        matches: List[RuleMatch] = []
+        scopes: Set[Scope] = set()
+        self.stats.evaluations += 1
+
+        for key, value, labels in samples:
+            self.stats.samples += 1
+            groups = self._index.get((rule_type, key))
+            if not groups:
+                continue
+            labels = {str(k): str(v) for k, v in (labels or {}).items()}
+            series_labels = _label_set(labels)
+            scopes.add((rule_type, key, series_labels))
+
+            windows: Dict[float, WindowAggregate] = {}
+            for group in groups.values():
+                self.stats.groups_examined += 1
+                if not group.matchers <= series_labels:
+                    continue
+                observed = value
+                if group.window is not None:
+                    if not _is_number(value):
+                        continue
+                    # Groups sharing a window see the sample added once
+                    aggregate = windows.get(group.window)
+                    if aggregate is None:
+                        aggregate = windows[group.window] = self._window(key, series_labels, group.window)
+                        aggregate.add(timestamp, float(value))
+                    observed = aggregate.value(group.aggregation)
+                    if observed is None:
+                        continue
+                for rule_id in group.match(observed):
+                    matches.append(RuleMatch(rule_id, rule_type, key, observed, labels))
+
+        self.stats.matches += len(matches)
+        return matches, scopes
+
+    def _window(self, key: str, labels: LabelSet, window: float) -> WindowAggregate:
+        state_key = (key, labels, window)
+        aggregate = self._windows.get(state_key)
+        if aggregate is None:
+            if len(self._windows) >= self.max_window_series:
+                # Drop the least recently updated series rather than grow without bound
+                self._windows.popitem(last=False)
+            aggregate = self._windows[state_key] = WindowAggregate(window)
+        else:
+            self._windows.move_to_end(state_key)
+        return aggregate
+
+
+@dataclass
+class ActiveAlert:
+    """A firing alert, deduplicated by rule and series labels"""
+    rule_id: str
+    labels: Dict[str, str]
+    value: Any
+    first_seen: float
+    last_seen: float
+    occurrences: int = 1
+    scope: Optional[Scope] = None
+
+
+@dataclass
+class AlertTransitions:
+    """Alerts that started or stopped firing in one evaluation"""
+    fired: List[ActiveAlert] = field(default_factory=list)
+    resolved: List[ActiveAlert] = field(default_factory=list)
+
+
+class AlertDeduplicator:
+    """
+    Tracks firing alerts so each one is reported once until it resolves
+
+    Active alerts are indexed by scope, so resolving only looks at the
+    series present in the current update.
+    """
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self.active: Dict[Tuple[str, LabelSet], ActiveAlert] = {}
+        self._by_scope: Dict[Scope, Set[Tuple[str, LabelSet]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.active)
+
+    def update(self, matches: List[RuleMatch], scopes: Set[Scope]) -> AlertTransitions:
+        now = self.clock()
+        transitions = AlertTransitions()
+        firing: Set[Tuple[str, LabelSet]] = set()
+
+        for match in matches:
+            fingerprint = match.fingerprint
+            firing.add(fingerprint)
+            alert = self.active.get(fingerprint)
+            if alert is not None:
+                alert.value = match.value
+                alert.last_seen = now
+                alert.occurrences += 1
+                continue
+            scope = (match.rule_type, match.key, fingerprint[1])
+            alert = ActiveAlert(match.rule_id, match.labels, match.value, now, now, scope=scope)
+            self.active[fingerprint] = alert
+            self._by_scope.setdefault(scope, set()).add(fingerprint)
+            transitions.fired.append(alert)
+
+        for scope in scopes:
+            for fingerprint in list(self._by_scope.get(scope, ())):
+                if fingerprint not in firing:
+                    transitions.resolved.append(self._forget(fingerprint))
+        return transitions
+
+    def discard_rule(self, rule_id: str) -> List[ActiveAlert]:
+        return [self._forget(fp) for fp in [fp for fp in self.active if fp[0] == rule_id]]
+
+    def _forget(self, fingerprint: Tuple[str, LabelSet]) -> ActiveAlert:
+        alert = self.active.pop(fingerprint)
+        members = self._by_scope.get(alert.scope)
+        if members is not None:
+            members.discard(fingerprint)
+            if not members:
+                del self._by_scope[alert.scope]
+        return alert
+
+
+def group_alerts(alerts: List[ActiveAlert]) -> Dict[str, List[ActiveAlert]]:
+    """Group newly firing alerts by rule, one notification per rule"""
+    groups: Dict[str, List[ActiveAlert]] = {}
+    for alert in alerts:
+        groups.setdefault(alert.rule_id, []).append(alert)
+    return groups
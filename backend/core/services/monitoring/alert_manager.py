@@ -1,6 +1,7 @@
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+import uuid
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 import json
@@ -18,6 +19,7 @@ from ...messaging.event_types import (
     AlertNotification,
     AlertHistory
 )
+from .alert_engine import ActiveAlert, AlertDeduplicator, AlertRuleEngine, group_alerts
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +30,52 @@ class AlertRuleType(Enum):
     ANOMALY_DETECTION = "anomaly_detection"
     CUSTOM = "custom"
 
+class _IndexedRules(dict):
+    """
+    Rule mapping that keeps the alert engine's index in sync
+
+    Every mutator goes through ``__setitem__``/``__delitem__``. A rule the
+    engine rejects raises ValueError before anything is stored.
+    """
+
+    def __init__(self, engine: AlertRuleEngine):
+        super().__init__()
+        self.engine = engine
+
+    def __setitem__(self, rule_id: str, rule: AlertRule) -> None:
+        self.engine.add_rule(rule)
+        super().__setitem__(rule_id, rule)
+
+    def __delitem__(self, rule_id: str) -> None:
+        super().__delitem__(rule_id)
+        self.engine.remove_rule(rule_id)
+
+    def pop(self, rule_id: str, *default):
+        self.engine.remove_rule(rule_id)
+        return super().pop(rule_id, *default)
+
+    def popitem(self) -> Tuple[str, AlertRule]:
+        rule_id, rule = super().popitem()
+        self.engine.remove_rule(rule_id)
+        return rule_id, rule
+
+    def update(self, *args, **kwargs) -> None:
+        for rule_id, rule in dict(*args, **kwargs).items():
+            self[rule_id] = rule
+
+    def setdefault(self, rule_id: str, rule: Optional[AlertRule] = None) -> AlertRule:
+        if rule_id not in self:
+            self[rule_id] = rule
+        return self[rule_id]
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self.engine.clear()
+
 class AlertManager(BaseService):
     """
     Service for managing alert rules, conditions, and notifications.
@@ -47,7 +95,9 @@ class AlertManager(BaseService):
 
         # Alert configuration
         self.alert_history: List[AlertHistory] = []
-        self.alert_rules: Dict[str, AlertRule] = {}
+        self.alert_engine = AlertRuleEngine()
+        self.active_alerts = AlertDeduplicator()
+        self.alert_rules: Dict[str, AlertRule] = _IndexedRules(self.alert_engine)
         self.notification_channels: Dict[str, Any] = {}
         self.alert_cooldown: Dict[str, datetime] = {}
         self.cooldown_period = 300  # 5 minutes
@@ -114,8 +164,9 @@ class AlertManager(BaseService):
             if rule_id not in self.alert_rules:
                 raise ValueError(f"Alert rule {rule_id} not found")
 
-            # Update alert rule
+            # Update alert rule; its firing state restarts under the new condition
             self.alert_rules[rule_id] = AlertRule(**rule_data)
+            self.active_alerts.discard_rule(rule_id)
 
             # Publish rule update notification
             await self.message_broker.publish(
@@ -145,6 +196,7 @@ class AlertManager(BaseService):
 
             # Delete alert rule
             del self.alert_rules[rule_id]
+            self.active_alerts.discard_rule(rule_id)
 
             # Publish rule deletion notification
             await self.message_broker.publish(
@@ -258,10 +310,12 @@ class AlertManager(BaseService):
             if not metrics:
                 return
 
-            # Evaluate metric-based alert rules
-            for rule in self.alert_rules.values():
-                if rule.rule_type == AlertRuleType.METRIC_THRESHOLD:
-                    await self._evaluate_metric_rule(rule, metrics)
+            # Only rules indexed under the updated metrics are evaluated
+            await self._evaluate_indexed_rules(
+                AlertRuleType.METRIC_THRESHOLD,
+                self._metric_samples(metrics, message.content.get('labels')),
+                message.content.get('timestamp')
+            )
 
         except Exception as e:
             logger.error(f"Failed to handle metrics update: {str(e)}")
@@ -274,10 +328,12 @@ class AlertManager(BaseService):
             if not health_result:
                 return
 
-            # Evaluate status-based alert rules
-            for rule in self.alert_rules.values():
-                if rule.rule_type == AlertRuleType.STATUS_CHANGE:
-                    await self._evaluate_status_rule(rule, health_result)
+            # Evaluate status-based alert rules for the reported components
+            samples = [
+                (component_id, component.get('status'), {})
+                for component_id, component in health_result.get('components', {}).items()
+            ]
+            await self._evaluate_indexed_rules(AlertRuleType.STATUS_CHANGE, samples)
 
         except Exception as e:
             logger.error(f"Failed to handle health result: {str(e)}")
@@ -291,55 +347,76 @@ class AlertManager(BaseService):
                 return
 
             # Evaluate anomaly-based alert rules
-            for rule in self.alert_rules.values():
-                if rule.rule_type == AlertRuleType.ANOMALY_DETECTION:
-                    await self._evaluate_anomaly_rule(rule, anomaly_data)
+            await self._evaluate_indexed_rules(
+                AlertRuleType.ANOMALY_DETECTION,
+                self._metric_samples(anomaly_data, message.content.get('labels'))
+            )
 
         except Exception as e:
             logger.error(f"Failed to handle anomaly detection: {str(e)}")
             await self._handle_error(message, str(e))
 
-    async def _evaluate_metric_rule(self, rule: AlertRule, metrics: Dict[str, Any]) -> None:
-        """Evaluate metric-based alert rule"""
+    @staticmethod
+    def _metric_samples(
+            metrics: Dict[str, Any],
+            labels: Optional[Dict[str, str]] = None
+    ) -> List[Tuple[str, Any, Dict[str, str]]]:
+        """
+        Flatten a metrics payload into (name, value, labels) samples
+
+        Values may be scalars, ``{'value': ..., 'labels': {...}}`` or a list
+        of those for metrics reported per series.
+        """
+        samples = []
+        for name, reported in metrics.items():
+            for point in reported if isinstance(reported, list) else [reported]:
+                if isinstance(point, dict) and 'value' in point:
+                    samples.append((name, point['value'], {**(labels or {}), **point.get('labels', {})}))
+                else:
+                    samples.append((name, point, dict(labels or {})))
+        return samples
+
+    async def _evaluate_indexed_rules(
+            self,
+            rule_type: AlertRuleType,
+            samples: List[Tuple[str, Any, Dict[str, str]]],
+            timestamp: Optional[float] = None
+    ) -> None:
+        """Evaluate samples through the rule index, alerting on state changes"""
+        matches, scopes = self.alert_engine.evaluate(rule_type, samples, timestamp)
+        transitions = self.active_alerts.update(matches, scopes)
+
+        # One notification per rule, however many series started firing
+        for rule_id, alerts in group_alerts(transitions.fired).items():
+            rule = self.alert_rules.get(rule_id)
+            if rule is not None:
+                await self._generate_alert(rule, alerts[0].value, alerts)
+
+        for alert in transitions.resolved:
+            await self._publish_resolved(alert)
+
+    async def _publish_resolved(self, alert: ActiveAlert) -> None:
+        """Publish that a firing alert has cleared"""
         try:
-            metric_name = rule.condition.metric_name
-            if metric_name not in metrics:
-                return
-
-            metric_value = metrics[metric_name]
-            if self._check_condition(rule.condition, metric_value):
-                await self._generate_alert(rule, metric_value)
-
-        except Exception as e:
-            logger.error(f"Failed to evaluate metric rule: {str(e)}")
-
-    async def _evaluate_status_rule(self, rule: AlertRule, health_result: Dict[str, Any]) -> None:
-        """Evaluate status-based alert rule"""
-        try:
-            component_id = rule.condition.component_id
-            if component_id not in health_result.get('components', {}):
-                return
-
-            component_status = health_result['components'][component_id]['status']
-            if self._check_condition(rule.condition, component_status):
-                await self._generate_alert(rule, component_status)
-
-        except Exception as e:
-            logger.error(f"Failed to evaluate status rule: {str(e)}")
-
-    async def _evaluate_anomaly_rule(self, rule: AlertRule, anomaly_data: Dict[str, Any]) -> None:
-        """Evaluate anomaly-based alert rule"""
-        try:
-            metric_name = rule.condition.metric_name
-            if metric_name not in anomaly_data:
-                return
-
-            anomaly_value = anomaly_data[metric_name]
-            if self._check_condition(rule.condition, anomaly_value):
-                await self._generate_alert(rule, anomaly_value)
-
+            await self.message_broker.publish(
+                ProcessingMessage(
+                    message_type=MessageType.MONITORING_ALERT_RESOLVE,
+                    content={
+                        'rule_id': alert.rule_id,
+                        'labels': alert.labels,
+                        'value': alert.value,
+                        'first_seen': alert.first_seen,
+                        'last_seen': alert.last_seen,
+                        'occurrences': alert.occurrences
+                    },
+                    metadata=MessageMetadata(
+                        correlation_id=str(uuid.uuid4()),
+                        source_component=self.module_identifier.component_name
+                    )
+                )
+            )
         except Exception as e:
-            logger.error(f"Failed to evaluate anomaly rule: {str(e)}")
+            logger.error(f"Failed to publish alert resolution: {str(e)}")
 
     def _check_condition(self, condition: AlertCondition, value: Any) -> bool:
         """Check if a condition is met"""
@@ -363,14 +440,26 @@ class AlertManager(BaseService):
             logger.error(f"Failed to check condition: {str(e)}")
             return False
 
-    async def _generate_alert(self, rule: AlertRule, value: Any) -> None:
-        """Generate and send alert"""
+    async def _generate_alert(
+            self,
+            rule: AlertRule,
+            value: Any,
+            alerts: Optional[List[ActiveAlert]] = None
+    ) -> None:
+        """Generate and send alert, grouping the series that triggered it"""
         try:
             # Check alert cooldown
             if rule.rule_id in self.alert_cooldown:
                 if datetime.now() - self.alert_cooldown[rule.rule_id] < timedelta(seconds=self.cooldown_period):
                     return
 
+            details = rule.details
+            if alerts and (len(alerts) > 1 or alerts[0].labels):
+                details = {
+                    **(rule.details or {}),
+                    'series': [{'labels': a.labels, 'value': a.value} for a in alerts]
+                }
+
             # Create alert notification
             notification = AlertNotification(
                 alert_id=str(uuid.uuid4()),
@@ -379,7 +468,7 @@ class AlertManager(BaseService):
                 message=rule.message,
                 timestamp=datetime.now(),
                 value=value,
-                details=rule.details
+                details=details
             )
 
             # Send notifications to all configured channels
@@ -398,7 +487,7 @@ class AlertManager(BaseService):
                 message=rule.message,
                 timestamp=notification.timestamp,
                 value=value,
-                details=rule.details
+                details=details
             ))
 
             # Clean up old alerts
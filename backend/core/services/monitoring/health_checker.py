@@ -1,12 +1,13 @@
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+import uuid
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime, timedelta
-import psutil
-import aiohttp
 from enum import Enum
 
 from ..base.base_service import BaseService
+from ...monitoring.health_probes import database_check, get_health_registry
+from ...monitoring.system_sampler import get_system_sampler
 from ...messaging.broker import MessageBroker
 from ...messaging.event_types import (
     MessageType,
@@ -35,7 +36,11 @@ class HealthChecker(BaseService):
     Handles component status monitoring, service availability, and system health reporting.
     """
 
-    def __init__(self, message_broker: MessageBroker):
+    def __init__(
+            self,
+            message_broker: MessageBroker,
+            db_engine_provider: Optional[Callable[[], Any]] = None
+    ):
         super().__init__(message_broker)
         
         # Service identifier
@@ -51,6 +56,16 @@ class HealthChecker(BaseService):
         self.timeout = 10  # seconds
         self.retry_count = 3
         self.retry_delay = 5  # seconds
+        self.result_ttl = 15  # seconds a probe result is reused
+        self.api_url = 'http://localhost:8000/health'
+        # The API itself is covered by the 'api' probe
+        self.network_endpoints = {
+            'database': 'http://localhost:5432/health'
+        }
+
+        # Probes are shared process-wide so concurrent callers share one round
+        self.probes = get_health_registry()
+        self._register_probes(db_engine_provider or self._default_engine)
         
         # Health check state
         self.component_status: Dict[str, ComponentStatus] = {}
@@ -60,6 +75,33 @@ class HealthChecker(BaseService):
         # Setup message handlers
         self._setup_message_handlers()
 
+    def _register_probes(self, db_engine_provider: Callable[[], Any]) -> None:
+        """Register dependency probes with per-probe timeouts and TTLs"""
+        self.probes.register(
+            'database', database_check(db_engine_provider),
+            timeout=self.timeout, ttl=self.result_ttl
+        )
+        self.probes.register(
+            'api', self.probes.http_check(self.api_url),
+            timeout=self.timeout, ttl=self.result_ttl
+        )
+        for name, url in self.network_endpoints.items():
+            self.probes.register(
+                f'network.{name}', self.probes.http_check(url),
+                timeout=self.timeout, ttl=self.result_ttl
+            )
+
+    @staticmethod
+    def _default_engine() -> Any:
+        """Engine of the initialized database configuration, if any"""
+        from config.database import DatabaseConfig
+        instance = DatabaseConfig.__dict__.get('_instance')
+        return getattr(instance, 'engine', None)
+
+    def get_dependency_states(self) -> Dict[str, Dict[str, Any]]:
+        """Circuit state per probed dependency"""
+        return self.probes.circuit_states()
+
     async def _setup_message_handlers(self) -> None:
         """Setup handlers for health check messages"""
         handlers = {
@@ -251,21 +293,21 @@ class HealthChecker(BaseService):
     async def _check_system_health(self, pipeline_id: str) -> HealthCheckResult:
         """Check overall system health"""
         try:
-            # Check system resources
-            system_status = await self._check_system_resources()
-            
-            # Check component statuses
-            component_status = await self._check_component_status()
-            
-            # Check service availability
-            service_status = await self._check_service_availability()
-            
-            # Check database connectivity
-            database_status = await self._check_database_connectivity()
-            
-            # Check network connectivity
-            network_status = await self._check_network_connectivity()
-            
+            # Checks run concurrently; probes are cached and time-bounded
+            (
+                system_status,
+                component_status,
+                service_status,
+                database_status,
+                network_status
+            ) = await asyncio.gather(
+                self._check_system_resources(),
+                self._check_component_status(),
+                self._check_service_availability(),
+                self._check_database_status(),
+                self._check_network_connectivity()
+            )
+
             # Determine overall health status
             overall_status = self._determine_overall_status([
                 system_status,
@@ -285,7 +327,8 @@ class HealthChecker(BaseService):
                     'components': component_status,
                     'services': service_status,
                     'database': database_status,
-                    'network': network_status
+                    'network': network_status,
+                    'dependencies': self.get_dependency_states()
                 }
             )
             
@@ -303,22 +346,24 @@ class HealthChecker(BaseService):
     async def _check_system_resources(self) -> Dict[str, Any]:
         """Check system resource usage"""
         try:
+            snapshot = get_system_sampler().latest()
             return {
                 'cpu': {
-                    'usage': psutil.cpu_percent(interval=1),
-                    'count': psutil.cpu_count(),
+                    'usage': snapshot.cpu_percent,
+                    'count': snapshot.cpu_count,
                     'status': 'healthy'
                 },
                 'memory': {
-                    'usage': psutil.virtual_memory().percent,
-                    'available': psutil.virtual_memory().available,
+                    'usage': snapshot.memory_percent,
+                    'available': snapshot.memory_available,
                     'status': 'healthy'
                 },
                 'disk': {
-                    'usage': psutil.disk_usage('/').percent,
-                    'free': psutil.disk_usage('/').free,
+                    'usage': snapshot.disk_percent,
+                    'free': snapshot.disk_free,
                     'status': 'healthy'
-                }
+                },
+                'sampled_at': datetime.fromtimestamp(snapshot.timestamp).isoformat()
             }
         except Exception as e:
             logger.error(f"Failed to check system resources: {str(e)}")
@@ -342,10 +387,14 @@ class HealthChecker(BaseService):
     async def _check_service_availability(self) -> Dict[str, Any]:
         """Check availability of critical services"""
         try:
+            database, api = await asyncio.gather(
+                self._check_database_connectivity(),
+                self._check_api_availability()
+            )
             services = {
                 'message_broker': self.message_broker.is_connected(),
-                'database': await self._check_database_connectivity(),
-                'api': await self._check_api_availability()
+                'database': database,
+                'api': api
             }
             
             return {
@@ -359,35 +408,40 @@ class HealthChecker(BaseService):
     async def _check_database_connectivity(self) -> bool:
         """Check database connectivity"""
         try:
-            # Implement database connectivity check
-            # This is a placeholder - implement actual database check
-            return True
+            return (await self.probes.run('database')).healthy
         except Exception as e:
             logger.error(f"Failed to check database connectivity: {str(e)}")
             return False
 
+    async def _check_database_status(self) -> Dict[str, Any]:
+        """Database ping result with latency and circuit state"""
+        try:
+            result = await self.probes.run('database')
+            status = result.to_dict()
+            status['status'] = 'healthy' if result.healthy else 'error'
+            return status
+        except Exception as e:
+            logger.error(f"Failed to check database status: {str(e)}")
+            return {'error': str(e), 'status': 'error'}
+
     async def _check_network_connectivity(self) -> Dict[str, Any]:
         """Check network connectivity"""
         try:
-            async with aiohttp.ClientSession() as session:
-                # Check connectivity to critical endpoints
-                endpoints = {
-                    'api': 'http://localhost:8000/health',
-                    'database': 'http://localhost:5432/health'
-                }
-                
-                results = {}
-                for name, url in endpoints.items():
-                    try:
-                        async with session.get(url, timeout=self.timeout) as response:
-                            results[name] = response.status == 200
-                    except Exception as e:
-                        results[name] = False
-                
-                return {
-                    'endpoints': results,
-                    'status': 'healthy' if all(results.values()) else 'degraded'
-                }
+            # Probe all endpoints concurrently over the pooled client
+            results = await self.probes.run_all(f'network.{name}' for name in self.network_endpoints)
+            endpoints = {
+                name: results[f'network.{name}'].healthy
+                for name in self.network_endpoints
+            }
+
+            return {
+                'endpoints': endpoints,
+                'latency_ms': {
+                    name: results[f'network.{name}'].latency_ms
+                    for name in self.network_endpoints
+                },
+                'status': 'healthy' if all(endpoints.values()) else 'degraded'
+            }
         except Exception as e:
             logger.error(f"Failed to check network connectivity: {str(e)}")
             return {'error': str(e), 'status': 'error'}
@@ -395,9 +449,7 @@ class HealthChecker(BaseService):
     async def _check_api_availability(self) -> bool:
         """Check API availability"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get('http://localhost:8000/health', timeout=self.timeout) as response:
-                    return response.status == 200
+            return (await self.probes.run('api')).healthy
         except Exception as e:
             logger.error(f"Failed to check API availability: {str(e)}")
             return False
@@ -6,6 +6,7 @@ from datetime import datetime
 import uuid
 
 from ..base.base_service import BaseService
+from ...monitoring.system_sampler import get_system_sampler
 from ...messaging.broker import MessageBroker
 from ...messaging.event_types import (
     MessageType,
@@ -148,7 +149,7 @@ class MetricsCollector(BaseService):
         # System metrics
         if MetricType.SYSTEM in context.metric_types:
             metrics['metrics']['system'] = {
-                'cpu_percent': psutil.cpu_percent(interval=1),
+                'cpu_percent': get_system_sampler().latest().cpu_percent,
                 'memory_percent': psutil.virtual_memory().percent,
                 'disk_usage': psutil.disk_usage('/').percent,
                 'network_io': {
@@ -1,11 +1,14 @@
 import asyncio
+import json
 import logging
+import os
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
-import statistics
-import numpy as np
+import uuid
 
 from ..base.base_service import BaseService
+from ...monitoring.online_stats import MetricSketch
+from ...monitoring.timeseries import TimeSeriesStore
 from ...messaging.broker import MessageBroker
 from ...messaging.event_types import (
     MessageType,
@@ -24,9 +27,12 @@ class PerformanceTracker(BaseService):
     """
     Service for tracking and analyzing system performance.
     Handles performance metrics analysis, baseline creation, and anomaly detection.
+
+    Statistics are maintained online per metric in constant-size sketches,
+    so an update costs O(1) regardless of history length.
     """
 
-    def __init__(self, message_broker: MessageBroker):
+    def __init__(self, message_broker: MessageBroker, baseline_path: Optional[str] = None):
         super().__init__(message_broker)
         
         # Service identifier
@@ -41,10 +47,18 @@ class PerformanceTracker(BaseService):
         self.baseline_window = timedelta(hours=24)  # Default baseline window
         self.anomaly_threshold = 2.0  # Standard deviations for anomaly detection
         self.min_samples = 100  # Minimum samples for baseline calculation
+        self.ewma_alpha = 0.1  # Weight of the newest sample in the EWMA
         
-        # Performance data storage
-        self.performance_history: Dict[str, List[Dict[str, Any]]] = {}
-        self.performance_baselines: Dict[str, Dict[str, Any]] = {}
+        # Performance data storage: one bounded series per pipeline metric,
+        # named "<category>.<metric>" and labelled with the pipeline id
+        self.performance_store = TimeSeriesStore()
+
+        # Online statistics per pipeline -> category -> metric, covering the
+        # period since the last baseline; baselines are frozen sketches
+        self.metric_stats: Dict[str, Dict[str, Dict[str, MetricSketch]]] = {}
+        self.performance_baselines: Dict[str, Dict[str, Dict[str, MetricSketch]]] = {}
+        self.baseline_path = baseline_path or os.getenv('PERFORMANCE_BASELINE_PATH')
+        self._load_baselines()
         
         # Setup message handlers
         self._setup_message_handlers()
@@ -54,7 +68,8 @@ class PerformanceTracker(BaseService):
         handlers = {
             MessageType.MONITORING_METRICS_UPDATE: self._handle_metrics_update,
             MessageType.MONITORING_PERFORMANCE_ANALYZE: self._handle_performance_analysis,
-            MessageType.MONITORING_BASELINE_UPDATE: self._handle_baseline_update
+            MessageType.MONITORING_BASELINE_UPDATE: self._handle_baseline_update,
+            MessageType.PIPELINE_CLEANUP_REQUEST: self._handle_pipeline_cleanup
         }
 
         for message_type, handler in handlers.items():
@@ -75,55 +90,52 @@ class PerformanceTracker(BaseService):
             if not metrics:
                 return
 
-            # Store metrics in history
-            if pipeline_id not in self.performance_history:
-                self.performance_history[pipeline_id] = []
-            
-            self.performance_history[pipeline_id].append({
-                'timestamp': datetime.now(),
-                'metrics': metrics
-            })
-
-            # Clean up old metrics
-            self._cleanup_old_metrics(pipeline_id)
+            # Store metrics; ring buffers evict old points on their own
+            timestamp = datetime.now().timestamp()
+            for category, values in metrics.items():
+                for key, value in values.items():
+                    if isinstance(value, (int, float)):
+                        self.performance_store.record(
+                            f"{category}.{key}", value, {'pipeline_id': pipeline_id}, timestamp
+                        )
+                        self._update_stats(pipeline_id, category, key, value)
 
             # Analyze performance if we have enough data
-            if len(self.performance_history[pipeline_id]) >= self.min_samples:
+            if self._sample_count(pipeline_id) >= self.min_samples:
                 await self._analyze_performance(pipeline_id)
 
         except Exception as e:
             logger.error(f"Failed to handle metrics update: {str(e)}")
             await self._handle_error(message, str(e))
 
-    def _cleanup_old_metrics(self, pipeline_id: str) -> None:
-        """Remove metrics older than the baseline window"""
-        if pipeline_id not in self.performance_history:
-            return
-
-        cutoff_time = datetime.now() - self.baseline_window
-        self.performance_history[pipeline_id] = [
-            entry for entry in self.performance_history[pipeline_id]
-            if entry['timestamp'] > cutoff_time
-        ]
+    def _update_stats(self, pipeline_id: str, category: str, key: str, value: float) -> float:
+        """Fold one sample into the metric's sketch; returns its anomaly score"""
+        categories = self.metric_stats.setdefault(pipeline_id, {})
+        sketch = categories.setdefault(category, {}).get(key)
+        if sketch is None:
+            sketch = categories[category][key] = MetricSketch(alpha=self.ewma_alpha)
+        return sketch.update(value)
+
+    def _sample_count(self, pipeline_id: str) -> int:
+        """Number of samples for the pipeline's busiest metric"""
+        return max(
+            (sketch.count
+             for metrics in self.metric_stats.get(pipeline_id, {}).values()
+             for sketch in metrics.values()),
+            default=0
+        )
 
     async def _analyze_performance(self, pipeline_id: str) -> None:
         """Analyze performance metrics and detect anomalies"""
         try:
-            if pipeline_id not in self.performance_history:
-                return
-
-            history = self.performance_history[pipeline_id]
-            if len(history) < self.min_samples:
+            if self._sample_count(pipeline_id) < self.min_samples:
                 return
 
-            # Extract metrics for analysis
-            metrics_data = self._extract_metrics_data(history)
-            
-            # Calculate performance metrics
-            performance_metrics = self._calculate_performance_metrics(metrics_data)
+            # Summaries come straight from the online sketches
+            performance_metrics = self._calculate_performance_metrics(pipeline_id)
             
             # Detect anomalies
-            anomalies = self._detect_anomalies(metrics_data, performance_metrics)
+            anomalies = self._detect_anomalies(pipeline_id)
             
             # Create performance metrics object
             performance_result = PerformanceMetrics(
@@ -159,72 +171,36 @@ class PerformanceTracker(BaseService):
                 str(e)
             )
 
-    def _extract_metrics_data(self, history: List[Dict[str, Any]]) -> Dict[str, List[float]]:
-        """Extract numeric metrics from history for analysis"""
-        metrics_data = {}
-        
-        for entry in history:
-            metrics = entry['metrics']
-            for category, values in metrics.items():
-                if category not in metrics_data:
-                    metrics_data[category] = {}
-                
-                for key, value in values.items():
-                    if isinstance(value, (int, float)):
-                        if key not in metrics_data[category]:
-                            metrics_data[category][key] = []
-                        metrics_data[category][key].append(value)
-        
-        return metrics_data
-
-    def _calculate_performance_metrics(self, metrics_data: Dict[str, Dict[str, List[float]]]) -> Dict[str, Any]:
-        """Calculate performance metrics from raw data"""
-        performance_metrics = {}
-        
-        for category, metrics in metrics_data.items():
-            performance_metrics[category] = {}
-            
-            for key, values in metrics.items():
-                if len(values) > 0:
-                    performance_metrics[category][key] = {
-                        'mean': statistics.mean(values),
-                        'median': statistics.median(values),
-                        'std_dev': statistics.stdev(values) if len(values) > 1 else 0,
-                        'min': min(values),
-                        'max': max(values),
-                        'p95': np.percentile(values, 95),
-                        'p99': np.percentile(values, 99)
-                    }
-        
-        return performance_metrics
+    def _calculate_performance_metrics(self, pipeline_id: str) -> Dict[str, Any]:
+        """Summarize each metric's sketch"""
+        return {
+            category: {key: sketch.summary() for key, sketch in metrics.items()}
+            for category, metrics in self.metric_stats.get(pipeline_id, {}).items()
+        }
 
-    def _detect_anomalies(self, metrics_data: Dict[str, Dict[str, List[float]]], 
-                         performance_metrics: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
-        """Detect anomalies in performance metrics"""
+    def _detect_anomalies(self, pipeline_id: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Flag metrics whose latest sample scored beyond the anomaly threshold"""
         anomalies = {}
         
-        for category, metrics in metrics_data.items():
+        for category, metrics in self.metric_stats.get(pipeline_id, {}).items():
             anomalies[category] = []
             
-            for key, values in metrics.items():
-                if len(values) > 0:
-                    current_value = values[-1]
-                    stats = performance_metrics[category][key]
-                    
-                    # Check if current value is outside normal range
-                    if abs(current_value - stats['mean']) > (self.anomaly_threshold * stats['std_dev']):
-                        anomalies[category].append({
-                            'metric': key,
-                            'value': current_value,
-                            'threshold': stats['mean'] + (self.anomaly_threshold * stats['std_dev']),
-                            'severity': 'high' if abs(current_value - stats['mean']) > (3 * stats['std_dev']) else 'medium'
-                        })
+            for key, sketch in metrics.items():
+                score = sketch.last_score
+                if abs(score) > self.anomaly_threshold:
+                    anomalies[category].append({
+                        'metric': key,
+                        'value': sketch.last_value,
+                        'score': score,
+                        'threshold': sketch.ewma.mean + (self.anomaly_threshold * sketch.ewma.std_dev),
+                        'severity': 'high' if abs(score) > 3 else 'medium'
+                    })
         
         return anomalies
 
     def _compare_with_baseline(self, pipeline_id: str, 
                              performance_metrics: Dict[str, Any]) -> Dict[str, Any]:
-        """Compare current performance with baseline"""
+        """Compare current performance with the baseline sketches"""
         if pipeline_id not in self.performance_baselines:
             return {'status': 'no_baseline'}
         
@@ -236,18 +212,31 @@ class PerformanceTracker(BaseService):
             
             for key, stats in metrics.items():
                 if category in baseline and key in baseline[category]:
-                    baseline_value = baseline[category][key]
+                    baseline_sketch = baseline[category][key]
+                    baseline_value = baseline_sketch.moments.mean
                     current_value = stats['mean']
                     
                     comparison['metrics'][category][key] = {
                         'current': current_value,
                         'baseline': baseline_value,
                         'difference': current_value - baseline_value,
-                        'percent_change': ((current_value - baseline_value) / baseline_value) * 100
+                        'percent_change': (
+                            ((current_value - baseline_value) / baseline_value) * 100
+                            if baseline_value else None
+                        ),
+                        'baseline_p95': baseline_sketch.quantile(0.95),
+                        'current_p95': stats.get('p95')
                     }
         
         return comparison
 
+    async def _handle_pipeline_cleanup(self, message: ProcessingMessage) -> None:
+        """Release a finished pipeline's series and metric sketches"""
+        pipeline_id = message.content.get('pipeline_id')
+        if pipeline_id:
+            self.performance_store.drop(pipeline_id=pipeline_id)
+            self.metric_stats.pop(pipeline_id, None)
+
     async def _handle_performance_analysis(self, message: ProcessingMessage) -> None:
         """Handle performance analysis request"""
         try:
@@ -269,13 +258,12 @@ class PerformanceTracker(BaseService):
             if not pipeline_id:
                 raise ValueError("Pipeline ID is required")
 
-            if pipeline_id not in self.performance_history:
+            if not self._sample_count(pipeline_id):
                 raise ValueError("No performance history available")
 
-            # Calculate new baseline
-            history = self.performance_history[pipeline_id]
-            metrics_data = self._extract_metrics_data(history)
-            performance_metrics = self._calculate_performance_metrics(metrics_data)
+            # Freeze the current sketches as the baseline
+            performance_metrics = self._calculate_performance_metrics(pipeline_id)
+            sketches = self.metric_stats[pipeline_id]
 
             # Create baseline
             baseline = PerformanceBaseline(
@@ -285,8 +273,15 @@ class PerformanceTracker(BaseService):
                 window_size=self.baseline_window
             )
 
-            # Store baseline
-            self.performance_baselines[pipeline_id] = performance_metrics
+            # Store baseline and start a new comparison period
+            self.performance_baselines[pipeline_id] = {
+                category: {key: sketch.copy() for key, sketch in metrics.items()}
+                for category, metrics in sketches.items()
+            }
+            for metrics in sketches.values():
+                for sketch in metrics.values():
+                    sketch.reset_period()
+            self._save_baselines()
 
             # Publish baseline update notification
             await self.message_broker.publish(
@@ -305,4 +300,40 @@ class PerformanceTracker(BaseService):
 
         except Exception as e:
             logger.error(f"Failed to update baseline: {str(e)}")
-            await self._handle_error(message, str(e)) 
\ No newline at end of file
+            await self._handle_error(message, str(e)) 
+
+    def _load_baselines(self) -> None:
+        """Restore persisted baseline sketches"""
+        if not self.baseline_path or not os.path.exists(self.baseline_path):
+            return
+        try:
+            with open(self.baseline_path) as f:
+                data = json.load(f)
+            self.performance_baselines = {
+                pipeline_id: {
+                    category: {key: MetricSketch.from_dict(sketch) for key, sketch in metrics.items()}
+                    for category, metrics in categories.items()
+                }
+                for pipeline_id, categories in data.items()
+            }
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Failed to load performance baselines: {str(e)}")
+
+    def _save_baselines(self) -> None:
+        """Persist baseline sketches atomically"""
+        if not self.baseline_path:
+            return
+        data = {
+            pipeline_id: {
+                category: {key: sketch.to_dict() for key, sketch in metrics.items()}
+                for category, metrics in categories.items()
+            }
+            for pipeline_id, categories in self.performance_baselines.items()
+        }
+        tmp_path = f"{self.baseline_path}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.baseline_path)
+        except OSError as e:
+            logger.error(f"Failed to persist performance baselines: {str(e)}")
@@ -6,6 +6,7 @@ import psutil
 import numpy as np
 
 from ..base.base_service import BaseService
+from ...monitoring.system_sampler import get_system_sampler
 from ...messaging.broker import MessageBroker
 from ...messaging.event_types import (
     MessageType,
@@ -227,7 +228,7 @@ class ResourceMonitor(BaseService):
         """Collect system resource metrics"""
         metrics = {
             'cpu': {
-                'percent': psutil.cpu_percent(interval=1),
+                'percent': get_system_sampler().latest().cpu_percent,
                 'count': psutil.cpu_count(),
                 'freq': psutil.cpu_freq()._asdict() if psutil.cpu_freq() else {},
                 'times': psutil.cpu_times()._asdict()
@@ -4,6 +4,8 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 import uuid
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from ..base.base_service import BaseService
 from ...messaging.broker import MessageBroker
 from ...messaging.event_types import (
@@ -18,6 +20,9 @@ from ...messaging.event_types import (
     ModuleIdentifier,
     MetricType
 )
+from ...control.status_index import pipeline_status_index, status_view
+from db.repository.auth import PipelineRepository
+from db.repository.pagination import COUNT_EXACT, Page
 
 logger = logging.getLogger(__name__)
 
@@ -83,6 +88,9 @@ class PipelineService(BaseService):
                 handler
             )
 
+        # Lifecycle events from every component keep the shared status index current
+        await pipeline_status_index.attach(self.message_broker)
+
     async def _handle_pipeline_create(self, message: ProcessingMessage) -> None:
         """Handle pipeline creation request"""
         try:
@@ -1286,6 +1294,48 @@ class PipelineService(BaseService):
             'resource_allocation': context.resource_allocation
         }
 
+    async def list_pipelines(
+            self,
+            db_session: AsyncSession,
+            filters: Optional[Dict[str, Any]] = None,
+            page_size: int = 50,
+            cursor: Optional[str] = None,
+            count_mode: str = COUNT_EXACT
+    ) -> Page:
+        """
+        One page of stored pipelines, most recently updated first
+
+        Runs the keyset ``PipelineRepository.list_pipelines`` on the
+        request's session; items are plain dicts.
+        """
+        return await db_session.run_sync(
+            lambda session: PipelineRepository(session).list_pipelines(
+                filters or {}, page_size=page_size, cursor=cursor, count_mode=count_mode
+            )
+        )
+
+    def get_pipeline_statuses(self, pipeline_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Runtime status of many pipelines in one call
+
+        Pipelines orchestrated by this service report their live context;
+        the rest come from the shared status index. Both are reduced to the
+        index's ``STATUS_FIELDS`` so every status on a page has one shape.
+        Pipelines with no runtime state are absent from the result.
+        """
+        pipeline_ids = [str(pipeline_id) for pipeline_id in pipeline_ids]
+        statuses = pipeline_status_index.get_many(
+            pipeline_id for pipeline_id in pipeline_ids if pipeline_id not in self.active_contexts
+        )
+        for pipeline_id in pipeline_ids:
+            context = self.active_contexts.get(pipeline_id)
+            if context is not None:
+                statuses[pipeline_id] = status_view({
+                    **self.get_pipeline_status(pipeline_id),
+                    'last_error': context.error_history[-1].get('error') if context.error_history else None
+                })
+        return statuses
+
     async def _handle_stage_complete(self, message: ProcessingMessage) -> None:
         """
         Handle stage completion and determine next stage.
@@ -2,6 +2,8 @@ import logging
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from ..base.base_service import BaseService
 from ...messaging.broker import MessageBroker
 from ...messaging.event_types import (
@@ -17,6 +19,9 @@ from ...messaging.event_types import (
     RecommendationType,
     RecommendationCandidate
 )
+from db.models.staging.processing import StagedRecommendationOutput
+from db.repository.base import BaseRepository
+from db.repository.pagination import COUNT_EXACT, Page
 
 logger = logging.getLogger(__name__)
 
@@ -361,6 +366,25 @@ class RecommendationService(BaseService):
         except Exception as e:
             logger.error(f"Handler message publishing failed: {str(e)}")
 
+    async def list_recommendations(
+            self,
+            db_session: AsyncSession,
+            filters: Optional[Dict[str, Any]] = None,
+            page_size: int = 50,
+            cursor: Optional[str] = None,
+            count_mode: str = COUNT_EXACT
+    ) -> Page:
+        """One keyset page of staged recommendations, newest first; items are dicts"""
+        page = await BaseRepository(db_session).list_all(
+            StagedRecommendationOutput,
+            filters=filters,
+            page_size=page_size,
+            cursor=cursor,
+            count_mode=count_mode
+        )
+        page.items = [BaseRepository.to_dict(item) for item in page.items]
+        return page
+
     async def cleanup(self) -> None:
         """Cleanup service resources"""
         try:
@@ -5,6 +5,8 @@ from typing import Dict, Any, Optional
 from datetime import datetime
 from uuid import uuid4
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from ..base.base_service import BaseService
 from ...messaging.broker import MessageBroker
 from ...messaging.event_types import (
@@ -17,6 +19,9 @@ from ...messaging.event_types import (
     ProcessingStatus,
     StagingContext
 )
+from db.models.staging.base import BaseStagedOutput
+from db.repository.pagination import COUNT_EXACT, Page
+from db.repository.staging import StagingRepository
 
 logger = logging.getLogger(__name__)
 
@@ -313,6 +318,23 @@ class StagingService(BaseService):
             )
         )
 
+    async def list_outputs(
+            self,
+            db_session: AsyncSession,
+            filters: Optional[Dict[str, Any]] = None,
+            page_size: int = 50,
+            cursor: Optional[str] = None,
+            count_mode: str = COUNT_EXACT
+    ) -> Page:
+        """One keyset page of staged outputs, newest first; items are model instances"""
+        return await StagingRepository(db_session).list_all(
+            BaseStagedOutput,
+            filters=filters,
+            page_size=page_size,
+            cursor=cursor,
+            count_mode=count_mode
+        )
+
     async def cleanup(self) -> None:
         """
         Gracefully clean up service resources
@@ -1,39 +1,46 @@
 # modules/data_preparation/data_transformer.py
+import numpy as np
 import pandas as pd
 from typing import Dict, Any
 
 
 async def transform_data(data: pd.DataFrame) -> pd.DataFrame:
-    """Transform data for insight"""
+    """
+    Transform data for insight
+
+    Outlier filtering is tracked as a row mask and applied once, with each
+    column normalized using the statistics of the rows that survived the
+    filters up to that column, so the frame is copied only at the end.
+    """
     try:
-        # Apply standard transformations
-        transformed_data = data.copy()
+        numeric_cols = data.select_dtypes(include=['int64', 'float64']).columns
+        mask = np.ones(len(data), dtype=bool)
+        normalization = {}
 
         # Handle numeric transformations
-        numeric_cols = transformed_data.select_dtypes(include=['int64', 'float64']).columns
         for col in numeric_cols:
+            values = data[col].to_numpy(dtype=np.float64)
+
             # Remove outliers using IQR method
-            Q1 = transformed_data[col].quantile(0.25)
-            Q3 = transformed_data[col].quantile(0.75)
+            Q1, Q3 = pd.Series(values[mask]).quantile([0.25, 0.75])
             IQR = Q3 - Q1
-            transformed_data = transformed_data[
-                (transformed_data[col] >= (Q1 - 1.5 * IQR)) &
-                (transformed_data[col] <= (Q3 + 1.5 * IQR))
-                ]
+            mask &= (values >= (Q1 - 1.5 * IQR)) & (values <= (Q3 + 1.5 * IQR))
+
+            # Record normalization statistics for the surviving rows
+            kept = pd.Series(values[mask])
+            normalization[col] = (kept.mean(), kept.std())
 
-            # Apply normalization
-            transformed_data[col] = (transformed_data[col] - transformed_data[col].mean()) / transformed_data[col].std()
+        transformed_data = data.loc[mask].copy()
+        for col, (mean, std) in normalization.items():
+            transformed_data[col] = (transformed_data[col] - mean) / std
 
-        # Handle categorical transformations
+        # Handle categorical transformations: one-hot encode in a single call
         categorical_cols = transformed_data.select_dtypes(include=['object']).columns
-        for col in categorical_cols:
-            # Apply one-hot encoding
-            dummies = pd.get_dummies(transformed_data[col], prefix=col)
-            transformed_data = pd.concat([transformed_data, dummies], axis=1)
-            transformed_data = transformed_data.drop(col, axis=1)
+        if len(categorical_cols):
+            transformed_data = pd.get_dummies(transformed_data, columns=list(categorical_cols))
 
         return transformed_data
 
     except Exception as e:
         print(f"Error in transform_data: {str(e)}")
-        raise
\ No newline at end of file
+        raise
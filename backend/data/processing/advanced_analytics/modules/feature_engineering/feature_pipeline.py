@@ -0,0 +1,301 @@
+# modules/feature_engineering/feature_pipeline.py
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+import pandas as pd
+from sklearn.feature_selection import f_classif, mutual_info_regression
+
+DATETIME_PARTS = ('year', 'month', 'day', 'dayofweek')
+
+
+@dataclass
+class FeatureSpec:
+    """One output feature: its source column and the operation producing it"""
+    name: str
+    source: str
+    op: str  # 'identity', 'squared', 'log', or a datetime part
+
+
+@dataclass
+class FittedFeatureState:
+    """Everything learned during fit; applying it needs no refitting"""
+    specs: List[FeatureSpec]
+    extracted: List[str] = field(default_factory=list)
+    scale_center: Dict[str, float] = field(default_factory=dict)
+    scale_iqr: Dict[str, float] = field(default_factory=dict)
+    log_columns: List[str] = field(default_factory=list)
+    dropped_correlated: List[str] = field(default_factory=list)
+    feature_scores: Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class FeatureEngineeringResult:
+    """
+    Final features plus lineage
+
+    Only the transformed frame is materialized; extracted/selected stages
+    are described by ``extracted_features`` and ``selected_features``
+    name lists instead of full intermediate copies.
+    """
+    features: pd.DataFrame
+    extracted_features: List[str]
+    selected_features: List[str]
+    dropped_correlated: List[str]
+    feature_scores: Dict[str, float]
+    lineage: Dict[str, str]
+    cache_hit: bool
+
+
+def data_fingerprint(data: pd.DataFrame) -> str:
+    """Content fingerprint of a frame, including its schema"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+    digest.update(json.dumps([(str(c), str(t)) for c, t in data.dtypes.items()]).encode())
+    return digest.hexdigest()
+
+
+def correlated_columns(
+        matrix: np.ndarray,
+        columns: List[str],
+        threshold: float = 0.95,
+        block_size: int = 256
+) -> List[str]:
+    """
+    Columns whose |correlation| with any earlier column exceeds ``threshold``
+
+    Same rule as masking the upper triangle of ``corr().abs()``, but the
+    full correlation matrix is never materialized: columns are standardized
+    once and correlated ``block_size`` columns at a time, so working memory
+    beyond the standardized copy is O(block_size^2) rather than O(columns^2).
+    Missing values are treated as the column mean.
+    """
+    n_rows, n_cols = matrix.shape
+    if n_cols < 2 or n_rows < 2:
+        return []
+
+    standardized = np.array(matrix, dtype=np.float64, copy=True)
+    means = np.nanmean(standardized, axis=0)
+    standardized -= means
+    standardized[np.isnan(standardized)] = 0.0
+    norms = np.linalg.norm(standardized, axis=0)
+    norms[norms == 0] = np.inf  # constant columns correlate with nothing
+    standardized /= norms
+
+    drop = np.zeros(n_cols, dtype=bool)
+    for start in range(0, n_cols, block_size):
+        stop = min(start + block_size, n_cols)
+        block = standardized[:, start:stop]
+        for left in range(0, stop, block_size):
+            left_stop = min(left + block_size, stop)
+            corr = np.abs(standardized[:, left:left_stop].T @ block)
+            # Only pairs with the earlier column on the left count
+            rows = np.arange(left, left_stop)[:, None]
+            cols = np.arange(start, stop)[None, :]
+            corr[rows >= cols] = 0.0
+            drop[start:stop] |= (corr > threshold).any(axis=0)
+
+    return [column for column, flag in zip(columns, drop) if flag]
+
+
+class FittedStateCache:
+    """LRU of fitted feature states keyed by data fingerprint and config"""
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, FittedFeatureState]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[FittedFeatureState]:
+        state = self._entries.get(key)
+        if state is not None:
+            self._entries.move_to_end(key)
+        return state
+
+    def put(self, key: str, state: FittedFeatureState) -> None:
+        self._entries[key] = state
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+_STATE_CACHE = FittedStateCache()
+
+
+class FeaturePipeline:
+    """
+    Feature extraction, selection and transformation compiled into one plan
+
+    ``compile`` inspects the schema once and produces the list of candidate
+    features. ``fit_transform`` evaluates every candidate in a single pass
+    into a preallocated matrix, drops correlated and weak features, learns
+    robust scaling, and builds the output frame once. Fitted state is
+    cached by data fingerprint and config, so a re-run on unchanged data
+    only applies the plan.
+    """
+
+    def __init__(
+            self,
+            config: Optional[Dict[str, Any]] = None,
+            cache: Optional[FittedStateCache] = None
+    ):
+        self.config = {
+            'target': 'target',
+            'correlation_threshold': 0.95,
+            'correlation_block_size': 256,
+            'skew_threshold': 1.0,
+            **(config or {})
+        }
+        self.cache = cache or _STATE_CACHE
+        self.config_key = hashlib.blake2b(
+            json.dumps(self.config, sort_keys=True, default=str).encode(), digest_size=8
+        ).hexdigest()
+
+    def compile(self, data: pd.DataFrame) -> List[FeatureSpec]:
+        """Plan candidate features from the schema"""
+        target = self.config['target']
+        specs = []
+        for column, dtype in data.dtypes.items():
+            if column == target:
+                continue
+            if pd.api.types.is_datetime64_any_dtype(dtype):
+                specs.extend(FeatureSpec(f'{column}_{part}', column, part) for part in DATETIME_PARTS)
+            elif dtype in ('int64', 'float64'):
+                specs.append(FeatureSpec(column, column, 'identity'))
+                specs.append(FeatureSpec(f'{column}_squared', column, 'squared'))
+                specs.append(FeatureSpec(f'{column}_log', column, 'log'))
+            else:
+                specs.append(FeatureSpec(column, column, 'identity'))
+        return specs
+
+    def _evaluate(self, data: pd.DataFrame, spec: FeatureSpec) -> Optional[np.ndarray]:
+        source = data[spec.source]
+        if spec.op in DATETIME_PARTS:
+            return getattr(source.dt, spec.op).to_numpy(dtype=np.float64, na_value=np.nan)
+        values = source.to_numpy()
+        if spec.op == 'identity':
+            return values
+        values = values.astype(np.float64, copy=False)
+        if spec.op == 'squared':
+            return values ** 2
+        if spec.op == 'log':
+            return np.log(values) if np.nanmin(values) > 0 else None
+        raise ValueError(f"Unknown feature op: {spec.op}")
+
+    def fit_transform(self, data: pd.DataFrame) -> FeatureEngineeringResult:
+        cache_key = f'{data_fingerprint(data)}:{self.config_key}'
+        state = self.cache.get(cache_key)
+        if state is not None:
+            return self._apply(data, state, cache_hit=True)
+
+        target = self.config['target']
+        y = data[target] if target in data.columns else None
+
+        # Single pass over the planned features
+        candidates = self.compile(data)
+        extracted, numeric_values, other_specs = [], [], []
+        for spec in candidates:
+            values = self._evaluate(data, spec)
+            if values is None:
+                continue
+            extracted.append(spec)
+            if values.dtype.kind in 'fiub':
+                numeric_values.append((spec, values))
+            else:
+                other_specs.append(spec)
+
+        numeric_specs = [spec for spec, _ in numeric_values]
+        matrix = np.empty((len(data), len(numeric_specs)), dtype=np.float64)
+        for index, (_, values) in enumerate(numeric_values):
+            matrix[:, index] = values
+
+        names = [spec.name for spec in numeric_specs]
+        dropped = set(correlated_columns(
+            matrix,
+            names,
+            threshold=self.config['correlation_threshold'],
+            block_size=self.config['correlation_block_size']
+        ))
+        keep_index = [i for i, name in enumerate(names) if name not in dropped]
+
+        scores: Dict[str, float] = {}
+        if y is not None and keep_index:
+            scores = self._score_features(matrix[:, keep_index], y, [names[i] for i in keep_index])
+            mean_score = np.mean(list(scores.values()))
+            keep_index = [i for i in keep_index if scores[names[i]] > mean_score]
+
+        kept = matrix[:, keep_index]
+        center = np.nanmedian(kept, axis=0) if kept.size else np.array([])
+        iqr = (np.nanpercentile(kept, 75, axis=0) - np.nanpercentile(kept, 25, axis=0)) if kept.size else np.array([])
+        iqr[iqr == 0] = 1.0
+        scaled = (kept - center) / iqr if kept.size else kept
+
+        skew = pd.DataFrame(scaled).skew().to_numpy() if scaled.size else np.array([])
+        log_columns = [
+            names[i] for j, i in enumerate(keep_index)
+            if abs(skew[j]) > self.config['skew_threshold'] and np.nanmin(scaled[:, j]) > 0
+        ]
+
+        state = FittedFeatureState(
+            specs=[numeric_specs[i] for i in keep_index] + other_specs,
+            extracted=[spec.name for spec in extracted],
+            scale_center={names[i]: float(center[j]) for j, i in enumerate(keep_index)},
+            scale_iqr={names[i]: float(iqr[j]) for j, i in enumerate(keep_index)},
+            log_columns=log_columns,
+            dropped_correlated=sorted(dropped),
+            feature_scores=scores
+        )
+        self.cache.put(cache_key, state)
+        return self._apply(data, state, cache_hit=False)
+
+    def _score_features(self, matrix: np.ndarray, y: pd.Series, names: List[str]) -> Dict[str, float]:
+        filled = np.where(np.isnan(matrix), np.nanmean(matrix, axis=0), matrix)
+        if y.dtype in ['int64', 'bool']:
+            scores, _ = f_classif(filled, y)
+        else:
+            scores = mutual_info_regression(filled, y)
+        return {name: float(score) for name, score in zip(names, np.nan_to_num(scores))}
+
+    def _apply(self, data: pd.DataFrame, state: FittedFeatureState, cache_hit: bool) -> FeatureEngineeringResult:
+        """Evaluate only the kept features and build the output frame once"""
+        log_columns = set(state.log_columns)
+        output: Dict[str, Any] = {}
+        for spec in state.specs:
+            values = self._evaluate(data, spec)
+            if spec.name in state.scale_center:
+                values = (values.astype(np.float64) - state.scale_center[spec.name]) / state.scale_iqr[spec.name]
+                if spec.name in log_columns:
+                    values = np.log1p(values)
+            output[spec.name] = values
+
+        features = pd.DataFrame(output, index=data.index)
+        return FeatureEngineeringResult(
+            features=features,
+            extracted_features=state.extracted,
+            selected_features=list(features.columns),
+            dropped_correlated=state.dropped_correlated,
+            feature_scores=state.feature_scores,
+            lineage={spec.name: spec.source for spec in state.specs},
+            cache_hit=cache_hit
+        )
+
+
+async def engineer_features(
+        data: pd.DataFrame,
+        config: Optional[Dict[str, Any]] = None
+) -> FeatureEngineeringResult:
+    """
+    Run the compiled feature pipeline on ``data``
+
+    This is the supported entry point: any async caller can use it directly.
+    Fitting is CPU bound and runs on a worker thread.
+    """
+    try:
+        return await asyncio.to_thread(FeaturePipeline(config).fit_transform, data)
+
+    except Exception as e:
+        print(f"Error in engineer_features: {str(e)}")
+        raise
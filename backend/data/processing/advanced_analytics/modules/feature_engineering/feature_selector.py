@@ -4,6 +4,8 @@ import numpy as np
 from typing import Dict, Any
 from sklearn.feature_selection import SelectKBest, f_classif, mutual_info_regression
 
+from .feature_pipeline import correlated_columns
+
 
 async def select_features(data: pd.DataFrame) -> pd.DataFrame:
     """Select most important features"""
@@ -12,18 +14,13 @@ async def select_features(data: pd.DataFrame) -> pd.DataFrame:
         X = data.drop('target', axis=1) if 'target' in data.columns else data
         y = data['target'] if 'target' in data.columns else None
 
-        selected_features = X.copy()
-
-        # Remove highly correlated features
-        correlation_matrix = selected_features.corr().abs()
-        upper = correlation_matrix.where(
-            np.triu(np.ones(correlation_matrix.shape), k=1).astype(bool)
+        # Remove highly correlated features (blocked, no dense corr matrix)
+        to_drop = correlated_columns(
+            X.to_numpy(dtype=np.float64),
+            list(X.columns),
+            threshold=0.95
         )
-        to_drop = [
-            column for column in upper.columns
-            if any(upper[column] > 0.95)
-        ]
-        selected_features = selected_features.drop(to_drop, axis=1)
+        selected_features = X.drop(to_drop, axis=1)
 
         # If target exists, use statistical feature selection
         if y is not None:
@@ -0,0 +1,203 @@
+# modules/model_evaluation/drift_detector.py
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Deque
+
+import numpy as np
+import pandas as pd
+
+OTHER_CATEGORY = '__other__'
+_EPS = 1e-6
+
+# Conventional alerting levels for each statistic
+DEFAULT_THRESHOLDS = {
+    'psi': 0.2,
+    'ks': 0.1,
+    'js': 0.1
+}
+
+
+@dataclass
+class FeatureSketch:
+    """
+    Compact reference distribution of one training feature
+
+    Numeric features store quantile bin edges (open-ended at both sides);
+    categorical features store their top categories plus an overflow bucket.
+    ``reference`` holds bucket probabilities in either case.
+    """
+    feature: str
+    kind: str  # 'numeric' or 'categorical'
+    reference: np.ndarray
+    edges: Optional[np.ndarray] = None
+    categories: Optional[List[str]] = None
+
+    @property
+    def n_bins(self) -> int:
+        return len(self.reference)
+
+    def bucketize(self, values: pd.Series) -> np.ndarray:
+        """Bucket counts for a batch of values (missing values are ignored)"""
+        values = values.dropna()
+        if self.kind == 'numeric':
+            indices = np.searchsorted(self.edges, values.to_numpy(dtype=np.float64), side='right')
+            return np.bincount(indices, minlength=self.n_bins)[:self.n_bins]
+
+        lookup = {category: index for index, category in enumerate(self.categories)}
+        other = lookup[OTHER_CATEGORY]
+        indices = values.astype(str).map(lookup).fillna(other).to_numpy(dtype=np.int64)
+        return np.bincount(indices, minlength=self.n_bins)[:self.n_bins]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'feature': self.feature,
+            'kind': self.kind,
+            'reference': self.reference.round(8).tolist(),
+            'edges': self.edges.tolist() if self.edges is not None else None,
+            'categories': self.categories
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'FeatureSketch':
+        return cls(
+            feature=data['feature'],
+            kind=data['kind'],
+            reference=np.asarray(data['reference'], dtype=np.float64),
+            edges=np.asarray(data['edges'], dtype=np.float64) if data.get('edges') is not None else None,
+            categories=data.get('categories')
+        )
+
+
+def build_reference_sketches(
+        X: pd.DataFrame,
+        bins: int = 20,
+        top_k: int = 50
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Build per-feature reference sketches at training time
+
+    Returns a JSON-serializable mapping suitable for model metadata.
+    """
+    sketches = {}
+    for column in X.columns:
+        series = X[column].dropna()
+        if series.empty:
+            continue
+
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            values = series.to_numpy(dtype=np.float64)
+            # Interior quantile edges; duplicates collapse for low-cardinality data
+            edges = np.unique(np.quantile(values, np.linspace(0, 1, bins + 1)[1:-1]))
+            indices = np.searchsorted(edges, values, side='right')
+            counts = np.bincount(indices, minlength=len(edges) + 1)
+            sketch = FeatureSketch(str(column), 'numeric', counts / counts.sum(), edges=edges)
+        else:
+            frequencies = series.astype(str).value_counts()
+            top = frequencies.head(top_k)
+            categories = list(top.index) + [OTHER_CATEGORY]
+            counts = np.append(top.to_numpy(), frequencies.iloc[top_k:].sum())
+            sketch = FeatureSketch(str(column), 'categorical', counts / counts.sum(), categories=categories)
+
+        sketches[str(column)] = sketch.to_dict()
+    return sketches
+
+
+def population_stability_index(reference: np.ndarray, current: np.ndarray) -> float:
+    ref = np.clip(reference, _EPS, None)
+    cur = np.clip(current, _EPS, None)
+    return float(np.sum((cur - ref) * np.log(cur / ref)))
+
+
+def ks_statistic(reference: np.ndarray, current: np.ndarray) -> float:
+    """Kolmogorov-Smirnov distance between the binned CDFs"""
+    return float(np.max(np.abs(np.cumsum(reference) - np.cumsum(current))))
+
+
+def jensen_shannon_distance(reference: np.ndarray, current: np.ndarray) -> float:
+    """Jensen-Shannon distance (base 2, bounded in [0, 1])"""
+    mixture = 0.5 * (reference + current)
+
+    def _kl(p: np.ndarray, q: np.ndarray) -> float:
+        mask = p > 0
+        return float(np.sum(p[mask] * np.log2(p[mask] / q[mask])))
+
+    divergence = 0.5 * _kl(reference, mixture) + 0.5 * _kl(current, mixture)
+    return float(np.sqrt(max(divergence, 0.0)))
+
+
+@dataclass
+class _FeatureWindow:
+    sketch: FeatureSketch
+    batches: Deque[np.ndarray] = field(default_factory=deque)
+    totals: Optional[np.ndarray] = None
+
+
+class SlidingWindowDriftMonitor:
+    """
+    Incremental input-drift monitor over a sliding window of scoring batches
+
+    Each batch is reduced to per-feature bucket counts; the window keeps a
+    running sum that is updated by adding the new batch and subtracting the
+    expired one, so drift for a feature costs O(bins) per window regardless
+    of how many rows the window covers.
+    """
+
+    def __init__(
+            self,
+            sketches: Dict[str, Dict[str, Any]],
+            window_batches: int = 10,
+            min_window_rows: int = 100,
+            thresholds: Optional[Dict[str, float]] = None
+    ):
+        self.window_batches = window_batches
+        self.min_window_rows = min_window_rows
+        self.thresholds = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
+        self.windows: Dict[str, _FeatureWindow] = {
+            name: _FeatureWindow(FeatureSketch.from_dict(data))
+            for name, data in sketches.items()
+        }
+
+    def update(self, batch: pd.DataFrame) -> None:
+        """Add one scoring batch, expiring the oldest if the window is full"""
+        for name, window in self.windows.items():
+            if name not in batch.columns:
+                continue
+            counts = window.sketch.bucketize(batch[name])
+            window.batches.append(counts)
+            window.totals = counts.copy() if window.totals is None else window.totals + counts
+            if len(window.batches) > self.window_batches:
+                window.totals -= window.batches.popleft()
+
+    def compute(self) -> Dict[str, Any]:
+        """Drift statistics for the current window"""
+        features = {}
+        drifted = []
+        for name, window in self.windows.items():
+            if window.totals is None or window.totals.sum() < self.min_window_rows:
+                continue
+
+            current = window.totals / window.totals.sum()
+            reference = window.sketch.reference
+            stats = {
+                'psi': population_stability_index(reference, current),
+                'js': jensen_shannon_distance(reference, current),
+                'window_rows': int(window.totals.sum())
+            }
+            # Categorical buckets have no order, so a CDF distance is meaningless
+            if window.sketch.kind == 'numeric':
+                stats['ks'] = ks_statistic(reference, current)
+            stats['drifted'] = any(
+                stats[metric] > limit
+                for metric, limit in self.thresholds.items()
+                if metric in stats
+            )
+            features[name] = stats
+            if stats['drifted']:
+                drifted.append(name)
+
+        return {
+            'drift_detected': bool(drifted),
+            'drifted_features': drifted,
+            'features': features,
+            'thresholds': self.thresholds
+        }
@@ -1,15 +1,21 @@
 # modules/model_evaluation/stability_tester.py
+import asyncio
 import pandas as pd
 import numpy as np
 from typing import Dict, Any, List
 from sklearn.model_selection import KFold
 from sklearn.metrics import mean_squared_error, accuracy_score
 
+from ..model_training.tuning_engine import feature_drop_scores
+
 
 async def test_model_stability(model_info: Dict[str, Any]) -> Dict[str, Any]:
     """Test model stability across different data splits and conditions"""
     try:
         model = model_info['tuned_model']
+        data = model_info['data']
+        X = data.drop('target', axis=1)
+        y = data['target']
         stability_metrics = {}
 
         # Cross-validation stability
@@ -20,8 +26,8 @@ async def test_model_stability(model_info: Dict[str, Any]) -> Dict[str, Any]:
             'coefficient_of_variation': np.std(cv_scores) / np.mean(cv_scores)
         }
 
-        # Feature stability
-        feature_stability = _check_feature_stability(model, X, y)
+        # Feature stability (per-feature refits run on the shared tuning pool)
+        feature_stability = await asyncio.to_thread(_check_feature_stability, model, X, y)
         stability_metrics['feature_stability'] = feature_stability
 
         # Performance stability under noise
@@ -70,14 +76,12 @@ def _check_feature_stability(
         X: pd.DataFrame,
         y: pd.Series
 ) -> Dict[str, float]:
-    """Check model stability when removing features"""
-    baseline_score = _get_model_score(model, X, y)
-    feature_impacts = {}
-
-    for column in X.columns:
-        X_reduced = X.drop(column, axis=1)
-        reduced_score = _get_model_score(model, X_reduced, y)
-        feature_impacts[column] = abs(baseline_score - reduced_score)
+    """Check model stability when each feature is removed and the model refit"""
+    baseline_score, reduced_scores = feature_drop_scores(model, X, y)
+    feature_impacts = {
+        column: abs(baseline_score - reduced_score)
+        for column, reduced_score in reduced_scores.items()
+    }
 
     return {
         'feature_impacts': feature_impacts,
@@ -4,6 +4,8 @@ from typing import Dict, Any
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score, r2_score, mean_squared_error
 
+from ..model_evaluation.drift_detector import build_reference_sketches
+
 
 async def train_model(
         model_info: Dict[str, Any],
@@ -45,7 +47,9 @@ async def train_model(
         return {
             'trained_model': model,
             'metrics': metrics,
-            'feature_importance': _get_feature_importance(model, X.columns)
+            'feature_importance': _get_feature_importance(model, X.columns),
+            # Reference distributions for input-drift monitoring at scoring time
+            'reference_sketches': build_reference_sketches(X_train)
         }
 
     except Exception as e:
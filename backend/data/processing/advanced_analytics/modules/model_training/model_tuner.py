@@ -2,16 +2,26 @@
 import pandas as pd
 import numpy as np
 from typing import Dict, Any
-from sklearn.model_selection import GridSearchCV
 from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
 
+from .tuning_engine import run_successive_halving
+
 
 async def tune_model(
         training_info: Dict[str, Any],
-        data: pd.DataFrame
+        data: pd.DataFrame,
+        tuning_config: Dict[str, Any] = None
 ) -> Dict[str, Any]:
-    """Tune model hyperparameters"""
+    """
+    Tune model hyperparameters
+
+    Uses successive halving on the shared tuning pool: all candidates start on
+    a small slice of each cached fold and only the best third advance to the
+    next, larger rung.
+    """
     try:
+        tuning_config = tuning_config or {}
+
         # Separate features and target
         X = data.drop('target', axis=1) if 'target' in data.columns else data
         y = data['target'] if 'target' in data.columns else None
@@ -31,22 +41,26 @@ async def tune_model(
                 'tuning_scores': {}
             }
 
-        # Perform grid search
-        grid_search = GridSearchCV(
-            model, param_grid,
-            cv=5,
-            n_jobs=-1,
-            scoring='accuracy' if y.dtype in ['int64', 'bool'] else 'r2'
+        tuned_model, report = await run_successive_halving(
+            model,
+            param_grid,
+            X,
+            y,
+            eta=tuning_config.get('eta', 3),
+            min_resource=tuning_config.get('min_resource'),
+            max_candidates=tuning_config.get('max_candidates'),
+            n_splits=tuning_config.get('cv_folds', 5)
         )
 
-        grid_search.fit(X, y)
-
         return {
-            'tuned_model': grid_search.best_estimator_,
-            'best_params': grid_search.best_params_,
+            'tuned_model': tuned_model,
+            'best_params': report.best_params,
             'tuning_scores': {
-                'best_score': grid_search.best_score_,
-                'cv_results': grid_search.cv_results_
+                'best_score': report.best_score,
+                'rungs': report.rungs,
+                'time_to_best': report.time_to_best,
+                'candidates_evaluated': len(report.results),
+                'elapsed_seconds': report.elapsed_seconds
             }
         }
 
@@ -0,0 +1,386 @@
+# modules/model_training/tuning_engine.py
+import atexit
+import hashlib
+import math
+import os
+import tempfile
+import threading
+import time
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.metrics import get_scorer
+from sklearn.model_selection import KFold, StratifiedKFold, ParameterGrid, ParameterSampler
+
+# One pool per process shared by every pipeline: its worker count is the
+# global CPU budget, so concurrent tuning jobs queue instead of oversubscribing.
+_POOL: Optional[ProcessPoolExecutor] = None
+_CPU_BUDGET = int(os.getenv('TUNING_CPU_BUDGET', '0')) or max((os.cpu_count() or 2) - 1, 1)
+
+# Per-worker cache of memory-mapped matrices, keyed by (file path, mtime)
+_WORKER_ARRAYS: Dict[Tuple[str, int], np.ndarray] = {}
+
+
+def configure_cpu_budget(cores: int) -> None:
+    """Set the number of cores tuning may use; takes effect on next pool start"""
+    global _CPU_BUDGET
+    _CPU_BUDGET = max(int(cores), 1)
+    shutdown_pool()
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """Shared process pool sized to the CPU budget"""
+    global _POOL
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(max_workers=_CPU_BUDGET)
+    return _POOL
+
+
+def shutdown_pool() -> None:
+    global _POOL
+    if _POOL is not None:
+        _POOL.shutdown(wait=False, cancel_futures=True)
+        _POOL = None
+
+
+atexit.register(shutdown_pool)
+
+
+@dataclass
+class PreparedData:
+    """Feature/target matrices and fold splits persisted for worker reuse"""
+    fingerprint: str
+    x_path: str
+    y_path: str
+    folds: List[Tuple[str, str]]
+    n_samples: int
+    scoring: str
+    is_classification: bool
+
+
+@dataclass
+class CandidateResult:
+    params: Dict[str, Any]
+    rung: int
+    resource: int
+    mean_score: float
+    std_score: float
+    fit_seconds: float
+
+
+@dataclass
+class TuningReport:
+    """Outcome of a tuning run, including the time-to-best-score curve"""
+    best_params: Dict[str, Any]
+    best_score: float
+    results: List[CandidateResult] = field(default_factory=list)
+    time_to_best: List[Dict[str, Any]] = field(default_factory=list)
+    rungs: List[Dict[str, Any]] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+
+class MatrixCache:
+    """
+    Caches preprocessed matrices and fold indices on disk by data fingerprint
+
+    Arrays are written once as ``.npy`` and memory-mapped by workers, so every
+    candidate (and the stability tester) reuses the same splits and matrices
+    instead of re-pickling the frame per task.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_entries: int = 8):
+        self.cache_dir = Path(cache_dir or Path(tempfile.gettempdir()) / 'tuning_cache')
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._entries: Dict[str, PreparedData] = {}
+        # prepare() runs on worker threads; one writer at a time per cache
+        self._lock = threading.Lock()
+
+    def prepare(
+            self,
+            X: pd.DataFrame,
+            y: pd.Series,
+            n_splits: int = 5,
+            random_state: int = 42
+    ) -> PreparedData:
+        """Hash and persist ``X``/``y`` and their folds; blocking, run off the event loop"""
+        with self._lock:
+            return self._prepare(X, y, n_splits, random_state)
+
+    def _prepare(
+            self,
+            X: pd.DataFrame,
+            y: pd.Series,
+            n_splits: int,
+            random_state: int
+    ) -> PreparedData:
+        is_classification = y.dtype in ['int64', 'bool']
+        scoring = 'accuracy' if is_classification else 'r2'
+        fingerprint = self._fingerprint(X, y, n_splits, random_state)
+        if fingerprint in self._entries:
+            return self._entries[fingerprint]
+
+        entry_dir = self.cache_dir / fingerprint
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        x_path = str(entry_dir / 'X.npy')
+        y_path = str(entry_dir / 'y.npy')
+        np.save(x_path, X.to_numpy(dtype=np.float64))
+        np.save(y_path, y.to_numpy())
+
+        splitter = (
+            StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+            if is_classification
+            else KFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+        )
+        # Training indices are shuffled so a prefix of length ``resource`` is a
+        # random subsample of the fold rather than its earliest rows
+        rng = np.random.default_rng(random_state)
+        folds = []
+        for index, (train_idx, test_idx) in enumerate(splitter.split(X, y)):
+            train_idx = rng.permutation(train_idx)
+            train_path = str(entry_dir / f'fold{index}_train.npy')
+            test_path = str(entry_dir / f'fold{index}_test.npy')
+            np.save(train_path, train_idx)
+            np.save(test_path, test_idx)
+            folds.append((train_path, test_path))
+
+        prepared = PreparedData(
+            fingerprint=fingerprint,
+            x_path=x_path,
+            y_path=y_path,
+            folds=folds,
+            n_samples=len(X),
+            scoring=scoring,
+            is_classification=is_classification
+        )
+        self._entries[fingerprint] = prepared
+        self._evict()
+        return prepared
+
+    def _fingerprint(self, X: pd.DataFrame, y: pd.Series, n_splits: int, random_state: int) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(pd.util.hash_pandas_object(X, index=False).to_numpy().tobytes())
+        digest.update(pd.util.hash_pandas_object(y, index=False).to_numpy().tobytes())
+        digest.update(f'{list(X.columns)}|{n_splits}|{random_state}'.encode())
+        return digest.hexdigest()
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries:
+            fingerprint = next(iter(self._entries))
+            prepared = self._entries.pop(fingerprint)
+            for path in Path(prepared.x_path).parent.glob('*.npy'):
+                path.unlink(missing_ok=True)
+        # Workers release their mappings of the removed files on their next miss
+        _release_stale_arrays()
+
+
+_MATRIX_CACHE: Optional[MatrixCache] = None
+
+
+def get_matrix_cache() -> MatrixCache:
+    global _MATRIX_CACHE
+    if _MATRIX_CACHE is None:
+        _MATRIX_CACHE = MatrixCache()
+    return _MATRIX_CACHE
+
+
+def _release_stale_arrays() -> None:
+    """Drop mappings whose file was evicted or rewritten since it was mapped"""
+    for key in list(_WORKER_ARRAYS):
+        path, mtime = key
+        try:
+            current = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            current = None
+        if current != mtime:
+            del _WORKER_ARRAYS[key]
+
+
+def _load(path: str) -> np.ndarray:
+    """
+    Memory-map an array once per worker process
+
+    The mtime in the key means a file MatrixCache evicted and later rewrote
+    at the same path is mapped afresh instead of served from a stale map.
+    """
+    key = (path, os.stat(path).st_mtime_ns)
+    array = _WORKER_ARRAYS.get(key)
+    if array is None:
+        _release_stale_arrays()
+        array = np.load(path, mmap_mode='r')
+        _WORKER_ARRAYS[key] = array
+    return array
+
+
+def _evaluate_candidate(
+        estimator: Any,
+        params: Dict[str, Any],
+        prepared: PreparedData,
+        resource: int,
+        drop_column: Optional[int] = None
+) -> Tuple[float, float, float]:
+    """Cross-validate one candidate on cached folds (runs in a worker)"""
+    X = _load(prepared.x_path)
+    y = _load(prepared.y_path)
+    if drop_column is not None:
+        X = np.delete(X, drop_column, axis=1)
+    scorer = get_scorer(prepared.scoring)
+
+    started = time.perf_counter()
+    scores = []
+    for train_path, test_path in prepared.folds:
+        train_idx = _load(train_path)[:resource]
+        test_idx = _load(test_path)
+        model = clone(estimator).set_params(**params)
+        if 'n_jobs' in model.get_params():
+            model.set_params(n_jobs=1)
+        model.fit(X[train_idx], y[train_idx])
+        scores.append(scorer(model, X[test_idx], y[test_idx]))
+
+    return float(np.mean(scores)), float(np.std(scores)), time.perf_counter() - started
+
+
+def _fit_final(estimator: Any, params: Dict[str, Any], prepared: PreparedData) -> Any:
+    """Refit the winning candidate on all rows (runs in a worker)"""
+    model = clone(estimator).set_params(**params)
+    n_jobs = model.get_params().get('n_jobs')
+    if n_jobs is not None:
+        model.set_params(n_jobs=1)
+    model.fit(_load(prepared.x_path), _load(prepared.y_path))
+    if n_jobs is not None:
+        model.set_params(n_jobs=n_jobs)
+    return model
+
+
+def successive_halving_schedule(
+        n_candidates: int,
+        max_resource: int,
+        min_resource: int,
+        eta: int
+) -> List[Tuple[int, int]]:
+    """(candidates, resource) per rung; the final rung uses ``max_resource``"""
+    n_rungs = max(int(math.floor(math.log(max_resource / max(min_resource, 1), eta))) + 1, 1)
+    n_rungs = min(n_rungs, max(int(math.ceil(math.log(max(n_candidates, 1), eta))) + 1, 1))
+
+    schedule = []
+    for rung in range(n_rungs):
+        candidates = max(int(math.ceil(n_candidates / eta ** rung)), 1)
+        resource = int(max_resource / eta ** (n_rungs - 1 - rung))
+        schedule.append((candidates, max(resource, min_resource)))
+    return schedule
+
+
+async def run_successive_halving(
+        estimator: Any,
+        param_grid: Dict[str, list],
+        X: pd.DataFrame,
+        y: pd.Series,
+        eta: int = 3,
+        min_resource: Optional[int] = None,
+        max_candidates: Optional[int] = None,
+        n_splits: int = 5,
+        random_state: int = 42
+) -> Tuple[Any, TuningReport]:
+    """
+    Successive-halving search over ``param_grid``
+
+    Each rung trains every surviving candidate on ``resource`` training rows
+    per cached fold, in parallel on the shared pool, then keeps the top
+    ``1/eta``. Only the last rung sees the full training folds.
+
+    Returns:
+        Refit best estimator and the tuning report
+    """
+    loop = asyncio.get_running_loop()
+    pool = get_pool()
+    started = time.perf_counter()
+
+    prepared = await asyncio.to_thread(
+        get_matrix_cache().prepare, X, y, n_splits=n_splits, random_state=random_state
+    )
+    max_resource = int(prepared.n_samples * (n_splits - 1) / n_splits)
+    min_resource = min_resource or max(min(max_resource, 100), max_resource // eta ** 3)
+
+    candidates = list(ParameterGrid(param_grid))
+    if max_candidates and len(candidates) > max_candidates:
+        candidates = list(ParameterSampler(param_grid, n_iter=max_candidates, random_state=random_state))
+
+    report = TuningReport(best_params={}, best_score=-np.inf)
+    schedule = successive_halving_schedule(len(candidates), max_resource, min_resource, eta)
+    final_rung = len(schedule) - 1
+
+    async def _evaluate(params: Dict[str, Any], resource: int) -> Tuple[Dict[str, Any], Tuple[float, float, float]]:
+        future = pool.submit(_evaluate_candidate, estimator, params, prepared, resource)
+        return params, await asyncio.wrap_future(future, loop=loop)
+
+    curve_best = -np.inf
+    for rung, (_, resource) in enumerate(schedule):
+        scored = []
+        for next_done in asyncio.as_completed([_evaluate(params, resource) for params in candidates]):
+            params, (mean_score, std_score, fit_seconds) = await next_done
+            result = CandidateResult(params, rung, resource, mean_score, std_score, fit_seconds)
+            report.results.append(result)
+            scored.append(result)
+
+            # Best score seen so far, at whatever resource level it was measured
+            if mean_score > curve_best:
+                curve_best = mean_score
+                report.time_to_best.append({
+                    'elapsed_seconds': time.perf_counter() - started,
+                    'best_score': mean_score,
+                    'rung': rung,
+                    'resource': resource,
+                    'params': params
+                })
+
+        scored.sort(key=lambda item: item.mean_score, reverse=True)
+        keep = schedule[rung + 1][0] if rung < final_rung else 1
+        report.rungs.append({
+            'rung': rung,
+            'resource': resource,
+            'candidates': len(candidates),
+            'kept': min(keep, len(scored)),
+            'best_score': scored[0].mean_score if scored else None,
+            'elapsed_seconds': time.perf_counter() - started
+        })
+        candidates = [item.params for item in scored[:keep]]
+
+    report.best_params = candidates[0] if candidates else {}
+    report.best_score = scored[0].mean_score if scored else -np.inf
+
+    best_model = await asyncio.wrap_future(
+        pool.submit(_fit_final, estimator, report.best_params, prepared), loop=loop
+    )
+    report.elapsed_seconds = time.perf_counter() - started
+    return best_model, report
+
+
+def feature_drop_scores(
+        estimator: Any,
+        X: pd.DataFrame,
+        y: pd.Series,
+        n_splits: int = 5
+) -> Tuple[float, Dict[str, float]]:
+    """
+    Cross-validated score with all features and with each feature dropped
+
+    Refits run in parallel on the shared pool using the cached folds.
+    """
+    prepared = get_matrix_cache().prepare(X, y, n_splits=n_splits)
+    resource = prepared.n_samples
+    params = {}
+
+    pool = get_pool()
+    baseline = pool.submit(_evaluate_candidate, estimator, params, prepared, resource)
+    dropped = {
+        column: pool.submit(_evaluate_candidate, estimator, params, prepared, resource, index)
+        for index, column in enumerate(X.columns)
+    }
+
+    return baseline.result()[0], {column: future.result()[0] for column, future in dropped.items()}
@@ -60,7 +60,8 @@ from ..modules.data_preparation import (
 from ..modules.feature_engineering import (
     feature_extractor,
     feature_selector,
-    feature_transformer
+    feature_transformer,
+    feature_pipeline
 )
 from ..modules.model_training import (
     model_selector,
@@ -566,18 +567,23 @@ class AnalyticsProcessor:
             if not prepared_data:
                 raise ValueError("No prepared data found in staging")
 
-            results = {}
-
-            # Run feature engineering steps
-            results['extracted_features'] = await feature_extractor.extract_features(
-                prepared_data['data']
-            )
-            results['selected_features'] = await feature_selector.select_features(
-                results['extracted_features']
-            )
-            results['transformed_features'] = await feature_transformer.transform_features(
-                results['selected_features']
-            )
+            # Extraction, selection and transformation run as one compiled
+            # pass; fitted state is reused when the data and config repeat
+            engineered = await feature_pipeline.engineer_features(
+                prepared_data['data'],
+                config.get('feature_config')
+            )
+
+            # Only the final frame is staged; earlier steps are kept as
+            # feature-name references and lineage
+            results = {
+                'transformed_features': engineered.features,
+                'extracted_features': engineered.extracted_features,
+                'selected_features': engineered.selected_features,
+                'dropped_correlated': engineered.dropped_correlated,
+                'feature_scores': engineered.feature_scores,
+                'lineage': engineered.lineage
+            }
 
             # Store results in staging
             results_staged_id = await self.staging_manager.store_staged_data(
@@ -586,15 +592,16 @@ class AnalyticsProcessor:
                 metadata={
                     'phase': AnalysisPhase.FEATURE_ENGINEERING.value,
                     'pipeline_id': pipeline_id,
-                    'feature_count': len(results['selected_features'])
+                    'feature_count': len(engineered.selected_features),
+                    'fitted_state_reused': engineered.cache_hit
                 }
             )
 
             context.phase_results['feature_engineering'] = {
                 'staged_id': results_staged_id,
                 'feature_metadata': {
-                    'total_features': len(results['extracted_features']),
-                    'selected_features': len(results['selected_features'])
+                    'total_features': len(engineered.extracted_features),
+                    'selected_features': len(engineered.selected_features)
                 }
             }
 
@@ -0,0 +1,218 @@
+# data/processing/decisions/modules/decision_store.py
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Same location as Config.STATE_FOLDER; config is not imported to keep the store standalone
+DEFAULT_STORE_PATH = str(Path(__file__).resolve().parents[4] / 'state' / 'decision_history.db')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS decision_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    decision_id TEXT NOT NULL,
+    pipeline_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    requested_at REAL NOT NULL,
+    completed_at REAL NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_decision_history_pipeline
+    ON decision_history (pipeline_id, completed_at, id);
+CREATE INDEX IF NOT EXISTS ix_decision_history_status
+    ON decision_history (status, completed_at, id);
+CREATE INDEX IF NOT EXISTS ix_decision_history_completed
+    ON decision_history (completed_at, id);
+"""
+
+
+@dataclass
+class HistoryPage:
+    """One page of decision history, newest first"""
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'items': self.items, 'next_cursor': self.next_cursor}
+
+
+@dataclass
+class StoreStats:
+    appended: int = 0
+    flushes: int = 0
+    pending: int = 0
+    flush_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'appended': self.appended,
+            'flushes': self.flushes,
+            'pending': self.pending,
+            'flush_seconds': self.flush_seconds
+        }
+
+
+def _encode_cursor(completed_at: float, row_id: int) -> str:
+    return f"{completed_at!r}:{row_id}"
+
+
+def _decode_cursor(cursor: str) -> Tuple[float, int]:
+    try:
+        completed_at, row_id = cursor.rsplit(':', 1)
+        return float(completed_at), int(row_id)
+    except ValueError:
+        raise ValueError(f"Invalid history cursor: {cursor}")
+
+
+class DecisionHistoryStore:
+    """
+    Append-only store of finished decisions backed by SQLite
+
+    Records are buffered and written in batches inside one transaction.
+    History is indexed by pipeline, status and completion time, and read
+    with keyset pagination so page cost does not grow with history size.
+    """
+
+    def __init__(
+            self,
+            path: Optional[str] = None,
+            batch_size: int = 500,
+            flush_interval: float = 1.0
+    ):
+        path = path or DEFAULT_STORE_PATH
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.stats = StoreStats()
+        self._pending: List[Tuple[str, str, str, float, float, str]] = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.RLock()
+
+        if path != ':memory:':
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ':memory:':
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.executescript(_SCHEMA)
+
+    def append(
+            self,
+            decision_id: str,
+            pipeline_id: str,
+            status: str,
+            requested_at: float,
+            completed_at: float,
+            record: Dict[str, Any]
+    ) -> None:
+        """Queue a finished decision; flushed by size or age"""
+        row = (decision_id, pipeline_id, status, requested_at, completed_at, json.dumps(record, default=str))
+        with self._lock:
+            self._pending.append(row)
+            self.stats.pending = len(self._pending)
+            if len(self._pending) >= self.batch_size or \
+                    time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
+
+    def flush(self) -> int:
+        """Write buffered records in a single transaction"""
+        with self._lock:
+            if not self._pending:
+                self._last_flush = time.monotonic()
+                return 0
+            rows, self._pending = self._pending, []
+            started = time.perf_counter()
+            try:
+                with self._connection:
+                    self._connection.execute('BEGIN')
+                    self._connection.executemany(
+                        'INSERT INTO decision_history '
+                        '(decision_id, pipeline_id, status, requested_at, completed_at, record) '
+                        'VALUES (?, ?, ?, ?, ?, ?)',
+                        rows
+                    )
+            except sqlite3.Error as e:
+                # Keep the batch for the next attempt rather than lose it
+                self._pending = rows + self._pending
+                self.stats.pending = len(self._pending)
+                logger.error(f"Failed to flush decision history: {str(e)}")
+                raise
+            self.stats.appended += len(rows)
+            self.stats.flushes += 1
+            self.stats.pending = 0
+            self.stats.flush_seconds += time.perf_counter() - started
+            self._last_flush = time.monotonic()
+            return len(rows)
+
+    def query(
+            self,
+            pipeline_id: Optional[str] = None,
+            status: Optional[str] = None,
+            start: Optional[float] = None,
+            end: Optional[float] = None,
+            limit: int = 100,
+            cursor: Optional[str] = None
+    ) -> HistoryPage:
+        """
+        Finished decisions, newest first
+
+        ``start``/``end`` bound the completion time (epoch seconds,
+        end exclusive); pass the returned ``next_cursor`` to continue.
+        """
+        clauses, params = [], []
+        if pipeline_id is not None:
+            clauses.append('pipeline_id = ?')
+            params.append(pipeline_id)
+        if status is not None:
+            clauses.append('status = ?')
+            params.append(status)
+        if start is not None:
+            clauses.append('completed_at >= ?')
+            params.append(start)
+        if end is not None:
+            clauses.append('completed_at < ?')
+            params.append(end)
+        if cursor is not None:
+            completed_at, row_id = _decode_cursor(cursor)
+            clauses.append('(completed_at < ? OR (completed_at = ? AND id < ?))')
+            params.extend([completed_at, completed_at, row_id])
+
+        sql = 'SELECT id, completed_at, record FROM decision_history'
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        sql += ' ORDER BY completed_at DESC, id DESC LIMIT ?'
+        params.append(limit + 1)
+
+        with self._lock:
+            # Reads see everything appended so far
+            self.flush()
+            rows = self._connection.execute(sql, params).fetchall()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = _encode_cursor(rows[-1][1], rows[-1][0])
+        return HistoryPage([json.loads(row[2]) for row in rows], next_cursor)
+
+    def count(self, pipeline_id: Optional[str] = None) -> int:
+        with self._lock:
+            self.flush()
+            if pipeline_id is None:
+                return self._connection.execute('SELECT COUNT(*) FROM decision_history').fetchone()[0]
+            return self._connection.execute(
+                'SELECT COUNT(*) FROM decision_history WHERE pipeline_id = ?', (pipeline_id,)
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self.flush()
+            finally:
+                self._connection.close()
@@ -1,21 +1,83 @@
 # data/processing/decisions/modules/decision_tracker.py
 
 import logging
-from typing import Dict, Any, Optional, List
+import os
+import sqlite3
+import time
+import uuid
+from typing import Dict, Any, Optional
 from datetime import datetime
 
+from .decision_store import DecisionHistoryStore, HistoryPage
+
 logger = logging.getLogger(__name__)
 
 
+def _iso(timestamp: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(timestamp).isoformat() if timestamp is not None else None
+
+
+class ActiveDecision:
+    """Compact in-flight decision state; timestamps are epoch seconds"""
+
+    __slots__ = (
+        'decision_id', 'context', 'status', 'requested_at', 'decided_at',
+        'validated_at', 'completed_at', 'decision', 'validation', 'result'
+    )
+
+    def __init__(self, context: Dict[str, Any]):
+        self.decision_id = str(uuid.uuid4())
+        self.context = context
+        self.status = 'pending'
+        self.requested_at = time.time()
+        self.decided_at: Optional[float] = None
+        self.validated_at: Optional[float] = None
+        self.completed_at: Optional[float] = None
+        self.decision: Optional[Dict[str, Any]] = None
+        self.validation: Optional[Dict[str, Any]] = None
+        self.result: Optional[Dict[str, Any]] = None
+
+    def to_dict(self, pipeline_id: str) -> Dict[str, Any]:
+        return {
+            'decision_id': self.decision_id,
+            'pipeline_id': pipeline_id,
+            'status': self.status,
+            'timeline': {
+                'requested_at': _iso(self.requested_at),
+                'decided_at': _iso(self.decided_at),
+                'validated_at': _iso(self.validated_at),
+                'completed_at': _iso(self.completed_at)
+            },
+            'context': self.context,
+            'decision': self.decision,
+            'validation': self.validation,
+            'result': self.result
+        }
+
+
 class DecisionTracker:
     """
     Tracks decision states and progress across the pipeline.
     Maintains decision history and relationships.
+
+    Only active decisions are held in memory; finished decisions are
+    appended to a persistent, indexed history store in batches. The store
+    lives under the app's state folder unless ``store_path`` or
+    DECISION_STORE_PATH points elsewhere.
     """
 
-    def __init__(self):
-        self.active_decisions: Dict[str, Dict[str, Any]] = {}
-        self.decision_history: Dict[str, List[Dict[str, Any]]] = {}
+    def __init__(
+            self,
+            store_path: Optional[str] = None,
+            batch_size: int = 500,
+            flush_interval: float = 1.0
+    ):
+        self.active_decisions: Dict[str, ActiveDecision] = {}
+        self.history_store = DecisionHistoryStore(
+            store_path or os.getenv('DECISION_STORE_PATH'),
+            batch_size=batch_size,
+            flush_interval=flush_interval
+        )
         self.logger = logging.getLogger(__name__)
 
     def track_request(
@@ -24,15 +86,7 @@ class DecisionTracker:
             context: Dict[str, Any]
     ) -> None:
         """Track new decision request"""
-        if pipeline_id not in self.decision_history:
-            self.decision_history[pipeline_id] = []
-
-        self.active_decisions[pipeline_id] = {
-            'context': context,
-            'status': 'pending',
-            'requested_at': datetime.now().isoformat(),
-            'updates': []
-        }
+        self.active_decisions[pipeline_id] = ActiveDecision(context)
 
     def track_decision(
             self,
@@ -40,11 +94,11 @@ class DecisionTracker:
             decision: Dict[str, Any]
     ) -> None:
         """Track made decision"""
-        if pipeline_id in self.active_decisions:
-            active = self.active_decisions[pipeline_id]
-            active['decision'] = decision
-            active['decided_at'] = datetime.now().isoformat()
-            active['status'] = 'decided'
+        active = self.active_decisions.get(pipeline_id)
+        if active:
+            active.decision = decision
+            active.decided_at = time.time()
+            active.status = 'decided'
 
     def track_validation(
             self,
@@ -52,27 +106,37 @@ class DecisionTracker:
             validation_result: Dict[str, Any]
     ) -> None:
         """Track decision validation"""
-        if pipeline_id in self.active_decisions:
-            active = self.active_decisions[pipeline_id]
-            active['validation'] = validation_result
-            active['validated_at'] = datetime.now().isoformat()
-            active['status'] = 'validated'
+        active = self.active_decisions.get(pipeline_id)
+        if active:
+            active.validation = validation_result
+            active.validated_at = time.time()
+            active.status = 'validated'
 
     def track_completion(
             self,
             pipeline_id: str,
-            result: Dict[str, Any]
+            result: Dict[str, Any],
+            status: str = 'completed'
     ) -> None:
-        """Track decision completion"""
-        if pipeline_id in self.active_decisions:
-            active = self.active_decisions[pipeline_id]
-            active['result'] = result
-            active['completed_at'] = datetime.now().isoformat()
-            active['status'] = 'completed'
+        """Track decision completion (or another terminal status)"""
+        active = self.active_decisions.pop(pipeline_id, None)
+        if active:
+            active.result = result
+            active.completed_at = time.time()
+            active.status = status
 
-            # Move to history
-            self.decision_history[pipeline_id].append(active)
-            del self.active_decisions[pipeline_id]
+            # Move to history; a failed flush keeps the batch for the next attempt
+            try:
+                self.history_store.append(
+                    active.decision_id,
+                    pipeline_id,
+                    status,
+                    active.requested_at,
+                    active.completed_at,
+                    active.to_dict(pipeline_id)
+                )
+            except sqlite3.Error as e:
+                self.logger.error(f"Failed to record decision history: {str(e)}")
 
     def get_status(
             self,
@@ -81,25 +145,31 @@ class DecisionTracker:
         """Get current decision status"""
         active = self.active_decisions.get(pipeline_id)
         if active:
-            return {
-                'pipeline_id': pipeline_id,
-                'status': active['status'],
-                'timeline': {
-                    'requested_at': active.get('requested_at'),
-                    'decided_at': active.get('decided_at'),
-                    'validated_at': active.get('validated_at'),
-                    'completed_at': active.get('completed_at')
-                },
-                'context': active.get('context'),
-                'decision': active.get('decision'),
-                'validation': active.get('validation'),
-                'result': active.get('result')
-            }
+            return active.to_dict(pipeline_id)
         return None
 
     def get_history(
             self,
-            pipeline_id: str
-    ) -> List[Dict[str, Any]]:
-        """Get decision history for pipeline"""
-        return self.decision_history.get(pipeline_id, [])
\ No newline at end of file
+            pipeline_id: str,
+            status: Optional[str] = None,
+            start: Optional[datetime] = None,
+            end: Optional[datetime] = None,
+            limit: int = 100,
+            cursor: Optional[str] = None
+    ) -> HistoryPage:
+        """Get a page of decision history for pipeline, newest first"""
+        return self.history_store.query(
+            pipeline_id=pipeline_id,
+            status=status,
+            start=start.timestamp() if start else None,
+            end=end.timestamp() if end else None,
+            limit=limit,
+            cursor=cursor
+        )
+
+    def flush(self) -> None:
+        """Write any buffered history records"""
+        self.history_store.flush()
+
+    def close(self) -> None:
+        self.history_store.close()
@@ -1,9 +1,12 @@
 # backend/core/processors/insight_processor.py
 
 import logging
+from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
+import pandas as pd
+
 from core.messaging.broker import MessageBroker
 from core.messaging.event_types import (
     MessageType,
@@ -32,6 +35,11 @@ from ...insights.validators import (
     business_goal_validator
 )
 
+from ...staging.modules.incremental_module import (
+    IncrementalExecutor,
+    IncrementalResultStore
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,9 +49,18 @@ class InsightProcessor:
     Maintains message-based coordination while having direct module access.
     """
 
-    def __init__(self, message_broker: MessageBroker):
+    def __init__(
+            self,
+            message_broker: MessageBroker,
+            incremental_store_path: Optional[Path] = None
+    ):
         self.message_broker = message_broker
 
+        # Chunk-level summary partials reused across re-runs of a pipeline
+        self.incremental_executor = IncrementalExecutor(
+            IncrementalResultStore(incremental_store_path or Path("staged_data") / "incremental")
+        )
+
         # Processor identification
         self.module_identifier = ModuleIdentifier(
             component_name="insight_processor",
@@ -136,8 +153,19 @@ class InsightProcessor:
             # Get data from staging
             data = await self._get_staged_data(pipeline_id)
 
-            # Generate insights by type
+            # Summary statistics only recompute chunks changed since the last run
             insights = {}
+            if isinstance(data, pd.DataFrame):
+                summary = await self.incremental_executor.run(
+                    pipeline_id,
+                    "insight",
+                    data,
+                    force_full=config.get('execution_mode') == 'full'
+                )
+                insights['summary_statistics'] = summary['result']
+                context.metrics['incremental_execution'] = summary['execution']
+
+            # Generate insights by type
             total_types = len(config.get('enabled_types', self.generators.keys()))
             for idx, insight_type in enumerate(config.get('enabled_types', self.generators.keys())):
                 if insight_type in self.generators:
@@ -9,6 +9,7 @@ import asyncio
 from collections import defaultdict
 import psutil
 import json
+from backend.core.monitoring.system_sampler import get_system_sampler
 from backend.data.processing.monitoring.collectors.metric_collector import MetricsCollector
 
 logger = logging.getLogger(__name__)
@@ -50,7 +51,7 @@ class ResourceMonitor:
     async def _collect_metrics(self):
         """Collect system metrics"""
         # CPU metrics
-        cpu_percent = psutil.cpu_percent(interval=1)
+        cpu_percent = get_system_sampler().latest().cpu_percent
         await self.metrics_collector.record_metric(
             'system_cpu_usage',
             cpu_percent,
@@ -1,11 +1,305 @@
 # backend/data/processing/monitoring/collectors/log_collector.py
+import asyncio
+import hashlib
+import inspect
+import json
 import logging
 import os
-from typing import Dict, Any, List, Optional
+import re
+import uuid
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Callable, Dict, Iterator, List, Optional, Pattern, Tuple
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+FileId = Tuple[int, int]  # (st_dev, st_ino)
+
+FINGERPRINT_SIZE = 256
+COMPRESSED_SUFFIXES = ('.gz', '.bz2', '.xz', '.zip', '.zst')
+
+LOG_TYPE_FILENAMES = {
+    'system': ['syslog', 'messages', 'system.log'],
+    'application': ['application', 'app.log', 'service.log'],
+    'error': ['error.log', 'errors']
+}
+
+# Tried in order; the parser starts with whichever pattern matched last
+LOG_PATTERNS: List[Tuple[str, Pattern]] = [
+    ('python', re.compile(
+        r'^(?P<timestamp>\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?) - '
+        r'(?P<source>\S+) - (?P<level>[A-Z]+) - (?P<message>.*)$'
+    )),
+    ('celery', re.compile(
+        r'^\[(?P<timestamp>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(?:,\d+)?): '
+        r'(?P<level>[A-Z]+)/(?P<source>[^\]]+)\] (?P<message>.*)$'
+    )),
+    ('syslog', re.compile(
+        r'^(?P<timestamp>[A-Z][a-z]{2} [ \d]\d \d{2}:\d{2}:\d{2}) (?P<host>\S+) '
+        r'(?P<source>[^:\[\s]+)(?:\[(?P<pid>\d+)\])?: (?P<message>.*)$'
+    )),
+    ('iso', re.compile(
+        r'^(?P<timestamp>\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?(?:Z|[+-]\d{2}:?\d{2})?)\s+'
+        r'(?:\[?(?P<level>DEBUG|INFO|WARN|WARNING|ERROR|CRITICAL|FATAL)\]?:?\s+)?(?P<message>.*)$'
+    ))
+]
+
+
+@dataclass
+class FileCursor:
+    """Read position of one log file, keyed by device and inode"""
+    device: int
+    inode: int
+    path: str
+    offset: int = 0
+    fingerprint: str = ''
+    fingerprint_size: int = 0
+    mtime: float = 0.0
+
+    @property
+    def file_id(self) -> FileId:
+        return self.device, self.inode
+
+
+@dataclass
+class TailStats:
+    """IO counters for the last collection cycle"""
+    files_scanned: int = 0
+    files_read: int = 0
+    bytes_read: int = 0
+    lines: int = 0
+    records: int = 0
+    rotations: int = 0
+    truncations: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+def _fingerprint(head: bytes) -> str:
+    return hashlib.blake2b(head, digest_size=8).hexdigest()
+
+
+class LogTailer:
+    """
+    Incremental reader for a set of growing log files
+
+    Each file is tracked by (device, inode) with the byte offset of the
+    last complete line, so a rotated file keeps its cursor under its new
+    name and the replacement file starts from zero. Truncation resets the
+    offset, and a fingerprint of the first bytes detects inode reuse.
+    Offsets are persisted so a restart resumes where it left off.
+    """
+
+    def __init__(
+            self,
+            state_file: Optional[str] = None,
+            read_size: int = 1 << 20,
+            max_bytes_per_cycle: int = 64 << 20,
+            max_line_bytes: int = 1 << 20
+    ):
+        self.state_file = state_file
+        self.read_size = read_size
+        self.max_bytes_per_cycle = max_bytes_per_cycle
+        self.max_line_bytes = max_line_bytes
+        self.cursors: Dict[FileId, FileCursor] = {}
+        self._path_ids: Dict[str, FileId] = {}
+        self.stats = TailStats()
+        self._load()
+
+    def track(self, path: str, stat: os.stat_result, start_at_end: bool = False) -> FileCursor:
+        """Cursor for a file, creating one (at the end if requested) if new"""
+        file_id = (stat.st_dev, stat.st_ino)
+        cursor = self.cursors.get(file_id)
+        previous_id = self._path_ids.get(path)
+
+        if cursor is None:
+            if previous_id is not None and previous_id != file_id:
+                # The path now names a new file; the old one was rotated away
+                self.stats.rotations += 1
+                start_at_end = False
+            cursor = FileCursor(stat.st_dev, stat.st_ino, path, stat.st_size if start_at_end else 0)
+            self.cursors[file_id] = cursor
+        elif cursor.path != path:
+            cursor.path = path
+
+        self._path_ids[path] = file_id
+        return cursor
+
+    def read_lines(self, path: str, stat: os.stat_result, start_at_end: bool = False) -> Iterator[Tuple[int, bytes]]:
+        """
+        Yield ``(offset, line)`` for complete lines appended since the last read
+
+        Files whose size has not moved past the cursor are never opened.
+        """
+        self.stats.files_scanned += 1
+        cursor = self.track(path, stat, start_at_end)
+
+        if stat.st_size < cursor.offset:
+            logger.info(f"Log file {path} was truncated, reading from start")
+            self.stats.truncations += 1
+            self._reset(cursor)
+        if stat.st_size == cursor.offset and stat.st_mtime == cursor.mtime:
+            return
+
+        try:
+            handle = open(path, 'rb', buffering=0)
+        except OSError as e:
+            logger.warning(f"Could not read log file {path}: {e}")
+            return
+
+        with handle:
+            self.stats.files_read += 1
+            cursor.mtime = stat.st_mtime
+            # Same size but rewritten (e.g. copytruncate) shows up as a new head
+            self._check_fingerprint(handle, cursor, stat.st_size)
+            if stat.st_size == cursor.offset:
+                return
+            handle.seek(cursor.offset)
+
+            position = cursor.offset
+            remaining = min(stat.st_size - cursor.offset, self.max_bytes_per_cycle)
+            pending = b''
+            while remaining > 0:
+                chunk = handle.read(min(self.read_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                self.stats.bytes_read += len(chunk)
+
+                lines = (pending + chunk).split(b'\n')
+                pending = lines.pop()
+                for line in lines:
+                    line_offset = position
+                    position += len(line) + 1
+                    cursor.offset = position
+                    self.stats.lines += 1
+                    yield line_offset, line
+
+                if len(pending) >= self.max_line_bytes:
+                    line_offset = position
+                    position += len(pending)
+                    cursor.offset = position
+                    self.stats.lines += 1
+                    yield line_offset, pending
+                    pending = b''
+            # A trailing partial line stays unread until its newline arrives
+
+    def _check_fingerprint(self, handle, cursor: FileCursor, size: int) -> None:
+        if cursor.fingerprint_size:
+            handle.seek(0)
+            if _fingerprint(handle.read(cursor.fingerprint_size)) != cursor.fingerprint:
+                logger.info(f"Log file {cursor.path} was replaced, reading from start")
+                self.stats.truncations += 1
+                self._reset(cursor)
+        # Widen the fingerprint as a small file grows
+        if cursor.fingerprint_size < FINGERPRINT_SIZE and size > cursor.fingerprint_size:
+            handle.seek(0)
+            head = handle.read(FINGERPRINT_SIZE)
+            cursor.fingerprint = _fingerprint(head)
+            cursor.fingerprint_size = len(head)
+
+    @staticmethod
+    def _reset(cursor: FileCursor) -> None:
+        cursor.offset = 0
+        cursor.fingerprint = ''
+        cursor.fingerprint_size = 0
+
+    def checkpoint(self) -> Tuple[Dict[FileId, FileCursor], Dict[str, FileId]]:
+        """Copy of every cursor, for rolling back reads whose lines were not delivered"""
+        return {file_id: replace(cursor) for file_id, cursor in self.cursors.items()}, dict(self._path_ids)
+
+    def restore(self, checkpoint: Tuple[Dict[FileId, FileCursor], Dict[str, FileId]]) -> None:
+        cursors, path_ids = checkpoint
+        self.cursors = {file_id: replace(cursor) for file_id, cursor in cursors.items()}
+        self._path_ids = dict(path_ids)
+
+    def reset_stats(self) -> TailStats:
+        stats, self.stats = self.stats, TailStats()
+        return stats
+
+    def prune(self, live_ids: Optional[set] = None) -> int:
+        """Forget cursors for files that no longer exist"""
+        stale = []
+        for file_id, cursor in self.cursors.items():
+            if live_ids is not None and file_id in live_ids:
+                continue
+            try:
+                stat = os.stat(cursor.path)
+                if (stat.st_dev, stat.st_ino) == file_id:
+                    continue
+            except OSError:
+                pass
+            stale.append(file_id)
+        for file_id in stale:
+            cursor = self.cursors.pop(file_id)
+            if self._path_ids.get(cursor.path) == file_id:
+                del self._path_ids[cursor.path]
+        return len(stale)
+
+    def save(self) -> None:
+        """Persist cursors atomically"""
+        if not self.state_file:
+            return
+        state = {'version': 1, 'files': [asdict(cursor) for cursor in self.cursors.values()]}
+        tmp_path = f"{self.state_file}.tmp"
+        try:
+            directory = os.path.dirname(self.state_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.state_file)
+        except OSError as e:
+            logger.error(f"Failed to persist log offsets: {e}")
+
+    def _load(self) -> None:
+        if not self.state_file or not os.path.exists(self.state_file):
+            return
+        try:
+            with open(self.state_file) as f:
+                state = json.load(f)
+            for entry in state.get('files', []):
+                cursor = FileCursor(**entry)
+                self.cursors[cursor.file_id] = cursor
+                self._path_ids[cursor.path] = cursor.file_id
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable log offset state {self.state_file}: {e}")
+
+
+class LogLineParser:
+    """Parses lines into structured records with precompiled patterns"""
+
+    def __init__(self, patterns: Optional[List[Tuple[str, Pattern]]] = None):
+        self.patterns = list(patterns or LOG_PATTERNS)
+        self._last = 0
+
+    def parse(self, line: str) -> Optional[Dict[str, Any]]:
+        count = len(self.patterns)
+        for step in range(count):
+            index = (self._last + step) % count
+            name, pattern = self.patterns[index]
+            match = pattern.match(line)
+            if match:
+                self._last = index
+                record = {k: v for k, v in match.groupdict().items() if v is not None}
+                record['format'] = name
+                record['timestamp'] = self._parse_timestamp(name, record.get('timestamp', ''))
+                return record
+        return None
+
+    @staticmethod
+    def _parse_timestamp(name: str, value: str) -> Optional[datetime]:
+        try:
+            if name == 'syslog':
+                # Syslog omits the year
+                return datetime.strptime(f"{datetime.now().year} {value}", '%Y %b %d %H:%M:%S')
+            value = value.replace(',', '.').replace('Z', '+00:00')
+            parsed = datetime.fromisoformat(value)
+            return parsed.replace(tzinfo=None) if parsed.tzinfo else parsed
+        except ValueError:
+            return None
+
 
 class LogCollector:
     """
@@ -15,12 +309,21 @@ class LogCollector:
     - Collect logs from various system sources
     - Provide log filtering and aggregation
     - Support multiple log formats and sources
+
+    Logs are tailed incrementally: each cycle reads only bytes appended
+    since the previous one, so cost follows new log volume rather than
+    directory size.
     """
 
     def __init__(
             self,
             log_directories: Optional[List[str]] = None,
-            max_log_age_hours: int = 24
+            max_log_age_hours: int = 24,
+            state_file: Optional[str] = None,
+            batch_size: int = 1000,
+            sink: Optional[Callable[[List[Dict[str, Any]]], Any]] = None,
+            read_size: int = 1 << 20,
+            max_bytes_per_cycle: int = 64 << 20
     ):
         """
         Initialize LogCollector with configurable log sources
@@ -28,6 +331,11 @@ class LogCollector:
         Args:
             log_directories: List of log directory paths
             max_log_age_hours: Maximum age of logs to collect
+            state_file: Where file offsets are persisted between restarts
+            batch_size: Number of records per shipped batch
+            sink: Optional callable (sync or async) receiving record batches
+            read_size: Bytes per read call
+            max_bytes_per_cycle: Upper bound of bytes read per file per cycle
         """
         self.log_directories = log_directories or [
             '/var/log',  # Linux standard log directory
@@ -35,8 +343,16 @@ class LogCollector:
             '/var/log/application'  # Custom application logs
         ]
         self.max_log_age_hours = max_log_age_hours
+        self.batch_size = batch_size
+        self.sink = sink
+        self.tailer = LogTailer(
+            state_file if state_file is not None else os.getenv('LOG_COLLECTOR_STATE_FILE'),
+            read_size=read_size,
+            max_bytes_per_cycle=max_bytes_per_cycle
+        )
+        self.last_cycle_stats = TailStats()
 
-    def collect(
+    async def collect(
             self,
             metrics_types: Optional[List[str]] = None,
             pipeline_id: Optional[str] = None
@@ -62,11 +378,26 @@ class LogCollector:
                 'logs': {}
             }
 
-            for log_type in metrics_types:
-                method = getattr(self, f'_collect_{log_type}_logs', None)
-                if method:
-                    log_collection['logs'][log_type] = method()
+            # Reading advances the cursors; a failed delivery rewinds them so
+            # the same lines are read again next cycle
+            checkpoint = self.tailer.checkpoint()
+            try:
+                # File IO runs off the event loop
+                logs = await asyncio.to_thread(self._collect_types, metrics_types)
+                log_collection['logs'] = logs
+
+                if self.sink is not None:
+                    for batch in self._batches([r for records in logs.values() for r in records]):
+                        result = self.sink(batch)
+                        if inspect.isawaitable(result):
+                            await result
+            except Exception:
+                self.tailer.restore(checkpoint)
+                raise
 
+            # Offsets are committed only once records have been shipped
+            await asyncio.to_thread(self.tailer.save)
+            log_collection['stats'] = self.last_cycle_stats.to_dict()
             return log_collection
 
         except Exception as e:
@@ -76,30 +407,57 @@ class LogCollector:
                 'error': str(e)
             }
 
+    def _collect_types(self, metrics_types: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        logs = {}
+        for log_type in metrics_types:
+            method = getattr(self, f'_collect_{log_type}_logs', None)
+            if method:
+                logs[log_type] = method()
+        self.tailer.prune()
+        self.last_cycle_stats = self.tailer.reset_stats()
+        return logs
+
+    def _batches(self, records: List[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+        for start in range(0, len(records), self.batch_size):
+            yield records[start:start + self.batch_size]
+
     def _collect_system_logs(self) -> List[Dict[str, Any]]:
         """Collect system-level logs"""
-        return self._read_logs_from_directories(
-            log_types=['syslog', 'messages', 'system.log']
-        )
+        return self._read_logs_from_directories(log_types=LOG_TYPE_FILENAMES['system'])
 
     def _collect_application_logs(self) -> List[Dict[str, Any]]:
         """Collect application-specific logs"""
-        return self._read_logs_from_directories(
-            log_types=['application', 'app.log', 'service.log']
-        )
+        return self._read_logs_from_directories(log_types=LOG_TYPE_FILENAMES['application'])
 
     def _collect_error_logs(self) -> List[Dict[str, Any]]:
         """Collect error and critical logs"""
-        return self._read_logs_from_directories(
-            log_types=['error.log', 'errors']
-        )
+        return self._read_logs_from_directories(log_types=LOG_TYPE_FILENAMES['error'])
+
+    def _discover(self, log_types: List[str]) -> Iterator[Tuple[str, os.stat_result]]:
+        """Matching log files with their stat; one directory listing per cycle"""
+        for directory in self.log_directories:
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                name = entry.name.lower()
+                if name.endswith(COMPRESSED_SUFFIXES):
+                    continue
+                if not any(log_type in name for log_type in log_types):
+                    continue
+                try:
+                    if entry.is_file():
+                        yield entry.path, os.stat(entry.path)
+                except OSError:
+                    continue
 
     def _read_logs_from_directories(
             self,
             log_types: List[str]
     ) -> List[Dict[str, Any]]:
         """
-        Read logs from specified directories with type filtering
+        Read new log lines from matching files in the configured directories
 
         Args:
             log_types: Types of log files to collect
@@ -109,65 +467,75 @@ class LogCollector:
         """
         collected_logs = []
         cutoff_time = datetime.now() - timedelta(hours=self.max_log_age_hours)
+        cutoff_epoch = cutoff_time.timestamp()
 
-        for directory in self.log_directories:
-            if not os.path.exists(directory):
-                continue
-
-            for filename in os.listdir(directory):
-                if any(log_type in filename.lower() for log_type in log_types):
-                    full_path = os.path.join(directory, filename)
-                    try:
-                        with open(full_path, 'r') as log_file:
-                            collected_logs.extend(
-                                self._parse_log_file(log_file, cutoff_time)
-                            )
-                    except Exception as e:
-                        logger.warning(f"Could not read log file {full_path}: {e}")
+        for path, stat in self._discover(log_types):
+            # Files untouched since before the cutoff start at their end
+            start_at_end = stat.st_mtime < cutoff_epoch
+            collected_logs.extend(
+                self._parse_log_file(path, self.tailer.read_lines(path, stat, start_at_end), cutoff_time)
+            )
 
+        self.tailer.stats.records += len(collected_logs)
         return collected_logs
 
     def _parse_log_file(
             self,
-            log_file,
+            path: str,
+            lines: Iterator[Tuple[int, bytes]],
             cutoff_time: datetime
     ) -> List[Dict[str, Any]]:
         """
-        Parse individual log file with timestamp filtering
+        Parse new lines of one file with timestamp filtering
+
+        Lines that match no pattern (e.g. traceback frames) are appended to
+        the preceding record.
 
         Args:
-            log_file: File object to parse
+            path: Log file path
+            lines: ``(offset, line)`` pairs from the tailer
             cutoff_time: Minimum timestamp to include
 
         Returns:
             List of parsed log entries
         """
+        parser = LogLineParser()
         parsed_logs = []
-        for line in log_file:
-            try:
-                # Implement log parsing logic based on expected log format
-                # This is a simplified example and should be customized
-                entry = self._parse_log_line(line)
-                if entry and entry['timestamp'] >= cutoff_time:
-                    parsed_logs.append(entry)
-            except Exception as e:
-                logger.warning(f"Log parsing error: {e}")
+        previous = None
+        for offset, raw in lines:
+            line = raw.decode('utf-8', errors='replace').rstrip('\r')
+            if not line:
+                continue
+            entry = self._parse_log_line(line, parser)
+            if entry is None:
+                if previous is not None:
+                    previous['message'] = f"{previous.get('message', '')}\n{line}"
+                continue
+
+            timestamp = entry.get('timestamp')
+            if timestamp is not None and timestamp < cutoff_time:
+                previous = None
+                continue
+            entry['timestamp'] = timestamp.isoformat() if timestamp else None
+            entry['file'] = path
+            entry['offset'] = offset
+            parsed_logs.append(entry)
+            previous = entry
 
         return parsed_logs
 
-    def _parse_log_line(self, line: str) -> Optional[Dict[str, Any]]:
+    def _parse_log_line(self, line: str, parser: Optional[LogLineParser] = None) -> Optional[Dict[str, Any]]:
         """
         Parse individual log line
 
         Args:
             line: Raw log line to parse
+            parser: Parser carrying per-file pattern affinity
 
         Returns:
             Parsed log entry or None
         """
-        # Implement sophisticated log parsing
-        # This is a placeholder and should be replaced with actual parsing logic
-        return None
+        return (parser or LogLineParser()).parse(line)
 
 
-log_collector = LogCollector()
\ No newline at end of file
+log_collector = LogCollector()
@@ -6,6 +6,8 @@ import uuid
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+from core.monitoring.system_sampler import get_system_sampler
+
 logger = logging.getLogger(__name__)
 
 
@@ -76,9 +78,10 @@ class MetricsCollector:
 
     def _collect_cpu_details(self) -> Dict[str, Any]:
         """Collect detailed CPU metrics"""
+        snapshot = get_system_sampler().latest()
         return {
-            'count': psutil.cpu_count(),
-            'usage_percent': psutil.cpu_percent(interval=1),
+            'count': snapshot.cpu_count,
+            'usage_percent': snapshot.cpu_percent,
             'logical_cores': psutil.cpu_count(logical=True),
             'frequency': psutil.cpu_freq()._asdict()
         }
@@ -0,0 +1,401 @@
+import asyncio
+import json
+import logging
+import math
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+DROP_OLDEST = 'drop_oldest'
+DROP_NEWEST = 'drop_newest'
+
+
+@dataclass
+class MetricRecord:
+    """One flattened metric sample"""
+    measurement: str
+    tags: Dict[str, str]
+    fields: Dict[str, float]
+    timestamp_ns: int
+
+
+@dataclass
+class ExportPipelineConfig:
+    """Batching, concurrency and overload settings for an export pipeline"""
+    max_queue_size: int = 10_000
+    batch_size: int = 500
+    flush_interval: float = 1.0
+    max_concurrent_flushes: int = 2
+    max_retries: int = 3
+    retry_backoff: float = 0.5
+    drop_policy: str = DROP_OLDEST
+    spill_directory: Optional[str] = None
+    max_spill_files: int = 1000
+
+
+@dataclass
+class ExportStats:
+    """Export counters; throughput is records per second since start"""
+    submitted: int = 0
+    exported: int = 0
+    dropped: int = 0
+    batches: int = 0
+    failed_batches: int = 0
+    spilled_batches: int = 0
+    replayed_batches: int = 0
+    bytes_sent: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def throughput(self) -> float:
+        elapsed = time.monotonic() - self.started_at
+        return self.exported / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'submitted': self.submitted,
+            'exported': self.exported,
+            'dropped': self.dropped,
+            'batches': self.batches,
+            'failed_batches': self.failed_batches,
+            'spilled_batches': self.spilled_batches,
+            'replayed_batches': self.replayed_batches,
+            'bytes_sent': self.bytes_sent,
+            'records_per_second': self.throughput
+        }
+
+
+def flatten_metrics(
+        metrics: Dict[str, Any],
+        tags: Optional[Dict[str, str]] = None,
+        timestamp: Optional[datetime] = None
+) -> List[MetricRecord]:
+    """Flatten ``{'metrics': {category: {name: value}}}`` into records"""
+    timestamp_ns = int((timestamp or datetime.now()).timestamp() * 1e9)
+    records = []
+    for category, data in metrics.get('metrics', {}).items():
+        if not isinstance(data, dict):
+            continue
+        for metric_name, value in data.items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+                continue
+            records.append(MetricRecord(
+                measurement=category,
+                tags={**(tags or {}), 'metric': metric_name},
+                fields={'value': float(value)},
+                timestamp_ns=timestamp_ns
+            ))
+    return records
+
+
+def _escape(value: str, characters: str) -> str:
+    for character in characters:
+        value = value.replace(character, f'\\{character}')
+    return value
+
+
+def encode_line_protocol(records: List[MetricRecord]) -> bytes:
+    """Encode a whole batch as InfluxDB line protocol in one pass"""
+    lines = []
+    for record in records:
+        tags = ''.join(
+            f",{_escape(key, ', =')}={_escape(str(value), ', =')}"
+            for key, value in sorted(record.tags.items())
+        )
+        fields = ','.join(f"{_escape(key, ', =')}={value!r}" for key, value in record.fields.items())
+        lines.append(f"{_escape(record.measurement, ', ')}{tags} {fields} {record.timestamp_ns}")
+    return '\n'.join(lines).encode()
+
+
+def encode_prometheus_text(records: List[MetricRecord]) -> bytes:
+    """Encode a batch in Prometheus text exposition format (last value wins)"""
+    latest: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+    for record in records:
+        labels = tuple(sorted((k, v) for k, v in record.tags.items() if k != 'metric'))
+        name = f"{record.measurement}_{record.tags.get('metric', 'value')}"
+        latest[(name, labels)] = record.fields.get('value', 0.0)
+
+    lines = []
+    for (name, labels), value in latest.items():
+        label_text = ','.join(f'{k}="{v}"' for k, v in labels)
+        lines.append(f"{name}{{{label_text}}} {value!r}" if label_text else f"{name} {value!r}")
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def encode_json_lines(records: List[MetricRecord]) -> bytes:
+    """Encode a batch as newline-delimited JSON"""
+    return ''.join(
+        json.dumps({
+            'measurement': record.measurement,
+            'tags': record.tags,
+            'fields': record.fields,
+            'timestamp_ns': record.timestamp_ns
+        }) + '\n'
+        for record in records
+    ).encode()
+
+
+class HTTPSink:
+    """Sends encoded batches to an HTTP endpoint"""
+
+    def __init__(
+            self,
+            url: str,
+            encoder,
+            headers: Optional[Dict[str, str]] = None,
+            method: str = 'POST',
+            timeout: float = 10.0
+    ):
+        self.url = url
+        self.encoder = encoder
+        self.headers = headers or {}
+        self.method = method
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def name(self) -> str:
+        return self.url
+
+    def encode(self, records: List[MetricRecord]) -> bytes:
+        return self.encoder(records)
+
+    async def send(self, payload: bytes) -> None:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=self.timeout)
+        async with self._session.request(self.method, self.url, data=payload, headers=self.headers) as response:
+            if response.status >= 300:
+                body = await response.text()
+                raise RuntimeError(f"Export to {self.url} failed ({response.status}): {body[:200]}")
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class FileSink:
+    """Appends encoded batches to a rotating file"""
+
+    def __init__(
+            self,
+            directory: str,
+            encoder,
+            prefix: str = 'metrics_export_',
+            suffix: str = '.jsonl',
+            max_file_size_mb: int = 50,
+            max_files: int = 10
+    ):
+        self.directory = directory
+        self.encoder = encoder
+        self.prefix = prefix
+        self.suffix = suffix
+        self.max_file_size = max_file_size_mb * 1024 * 1024
+        self.max_files = max_files
+        self._path: Optional[str] = None
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def name(self) -> str:
+        return self.directory
+
+    @property
+    def current_path(self) -> Optional[str]:
+        return self._path
+
+    def encode(self, records: List[MetricRecord]) -> bytes:
+        return self.encoder(records)
+
+    async def send(self, payload: bytes) -> None:
+        await asyncio.to_thread(self._append, payload)
+
+    def _append(self, payload: bytes) -> None:
+        if self._path is None or os.path.getsize(self._path) >= self.max_file_size:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            self._path = os.path.join(self.directory, f"{self.prefix}{timestamp}{self.suffix}")
+            self._rotate()
+        with open(self._path, 'ab') as f:
+            f.write(payload)
+
+    def _rotate(self) -> None:
+        """Keep at most ``max_files`` export files, newest first"""
+        files = sorted(
+            (name for name in os.listdir(self.directory) if name.startswith(self.prefix)),
+            reverse=True
+        )
+        for name in files[max(self.max_files - 1, 0):]:
+            os.remove(os.path.join(self.directory, name))
+
+    async def close(self) -> None:
+        return None
+
+
+class ExportPipeline:
+    """
+    Bounded, batched, asynchronous metric export
+
+    ``submit`` never blocks: records go into a bounded queue and, when it
+    is full, the drop policy decides which records are discarded. A
+    worker groups records into batches by size or by ``flush_interval``,
+    encodes each batch once, and flushes up to ``max_concurrent_flushes``
+    batches at a time with retries. Batches that still fail are spilled
+    to disk and replayed after the next successful flush.
+    """
+
+    def __init__(self, sink, config: Optional[ExportPipelineConfig] = None):
+        self.sink = sink
+        self.config = config or ExportPipelineConfig()
+        self.stats = ExportStats()
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._flush_slots: Optional[asyncio.Semaphore] = None
+        self._inflight: set = set()
+        self._spill_sequence = 0
+        self._replaying = False
+
+        if self.config.spill_directory:
+            os.makedirs(self.config.spill_directory, exist_ok=True)
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.config.max_queue_size)
+        self._flush_slots = asyncio.Semaphore(self.config.max_concurrent_flushes)
+        self.stats = ExportStats()
+        self._worker = asyncio.create_task(self._run())
+
+    def submit(self, records: List[MetricRecord]) -> int:
+        """Queue records without blocking; returns how many were accepted"""
+        if self._queue is None:
+            raise RuntimeError("Export pipeline not started")
+
+        accepted = 0
+        for record in records:
+            self.stats.submitted += 1
+            if self._queue.full():
+                if self.config.drop_policy == DROP_NEWEST:
+                    self.stats.dropped += 1
+                    continue
+                self._queue.get_nowait()
+                self._queue.task_done()
+                self.stats.dropped += 1
+            self._queue.put_nowait(record)
+            accepted += 1
+        return accepted
+
+    async def flush(self) -> None:
+        """Wait until everything queued so far has been flushed"""
+        if self._queue is not None:
+            await self._queue.join()
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    async def stop(self) -> None:
+        """Drain the queue, finish in-flight flushes and close the sink"""
+        if self.running:
+            await self.flush()
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+        self._worker = None
+        await self.sink.close()
+
+    async def _run(self) -> None:
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            deadline = time.monotonic() + self.config.flush_interval
+            while len(batch) < self.config.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._flush_slots.acquire()
+            task = asyncio.create_task(self._flush(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _flush(self, batch: List[MetricRecord]) -> None:
+        try:
+            payload = self.sink.encode(batch)
+            if await self._send_with_retry(payload):
+                self.stats.exported += len(batch)
+                self.stats.batches += 1
+                await self._replay_spilled()
+            else:
+                self.stats.failed_batches += 1
+                await asyncio.to_thread(self._spill, payload)
+        except Exception as e:
+            logger.error(f"Metric batch flush failed: {e}")
+        finally:
+            self._flush_slots.release()
+            for _ in batch:
+                self._queue.task_done()
+
+    async def _send_with_retry(self, payload: bytes) -> bool:
+        for attempt in range(self.config.max_retries + 1):
+            try:
+                await self.sink.send(payload)
+                self.stats.bytes_sent += len(payload)
+                return True
+            except Exception as e:
+                logger.warning(f"Export to {self.sink.name} failed (attempt {attempt + 1}): {e}")
+                if attempt < self.config.max_retries:
+                    await asyncio.sleep(self.config.retry_backoff * (2 ** attempt))
+        return False
+
+    def _spill(self, payload: bytes) -> None:
+        directory = self.config.spill_directory
+        if not directory:
+            logger.error(f"Dropping failed metric batch ({len(payload)} bytes): no spill directory")
+            return
+
+        spilled = self._spill_files()
+        if len(spilled) >= self.config.max_spill_files:
+            os.remove(os.path.join(directory, spilled[0]))
+
+        self._spill_sequence += 1
+        path = os.path.join(directory, f"{time.time_ns()}_{self._spill_sequence:06d}.batch")
+        with open(path, 'wb') as f:
+            f.write(payload)
+        self.stats.spilled_batches += 1
+
+    def _spill_files(self) -> List[str]:
+        directory = self.config.spill_directory
+        if not directory or not os.path.isdir(directory):
+            return []
+        return sorted(name for name in os.listdir(directory) if name.endswith('.batch'))
+
+    async def _replay_spilled(self) -> None:
+        """Resend spilled batches, oldest first, while the sink is healthy"""
+        if self._replaying or not self.config.spill_directory:
+            return
+        self._replaying = True
+        try:
+            for name in await asyncio.to_thread(self._spill_files):
+                path = os.path.join(self.config.spill_directory, name)
+                with open(path, 'rb') as f:
+                    payload = f.read()
+                try:
+                    await self.sink.send(payload)
+                except Exception as e:
+                    logger.warning(f"Replay of spilled batch {name} failed: {e}")
+                    return
+                os.remove(path)
+                self.stats.bytes_sent += len(payload)
+                self.stats.replayed_batches += 1
+        finally:
+            self._replaying = False
@@ -1,9 +1,16 @@
 #
 import logging
-from typing import Dict, Any, List
-from influxdb_client import InfluxDBClient, Point
-from influxdb_client.client.write_api import SYNCHRONOUS
-from datetime import datetime
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlencode
+from influxdb_client import InfluxDBClient
+
+from .export_pipeline import (
+    ExportPipeline,
+    ExportPipelineConfig,
+    HTTPSink,
+    encode_line_protocol,
+    flatten_metrics
+)
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +22,9 @@ class InfluxDBExporter:
     - Export system and application metrics
     - Manage time-series data storage
     - Support high-performance metric logging
+
+    Writes go through a batched ExportPipeline that posts line protocol
+    to the v2 write endpoint; the client is kept for queries only.
     """
 
     def __init__(
@@ -22,7 +32,8 @@ class InfluxDBExporter:
         url: str = 'http://localhost:8086',
         token: str = '',
         org: str = 'default',
-        bucket: str = 'monitoring'
+        bucket: str = 'monitoring',
+        pipeline_config: Optional[ExportPipelineConfig] = None
     ):
         """
         Initialize InfluxDB connection with configurable parameters
@@ -32,53 +43,49 @@ class InfluxDBExporter:
             token: Authentication token
             org: Organization name
             bucket: Storage bucket name
+            pipeline_config: Batching, retry and spill settings
         """
         try:
             self.client = InfluxDBClient(url=url, token=token, org=org)
-            self.write_api = self.client.write_api(write_options=SYNCHRONOUS)
             self.org = org
             self.bucket = bucket
+
+            write_url = f"{url.rstrip('/')}/api/v2/write?" + urlencode(
+                {'org': org, 'bucket': bucket, 'precision': 'ns'}
+            )
+            self.pipeline = ExportPipeline(
+                HTTPSink(
+                    write_url,
+                    encode_line_protocol,
+                    headers={
+                        'Authorization': f'Token {token}',
+                        'Content-Type': 'text/plain; charset=utf-8'
+                    }
+                ),
+                pipeline_config
+            )
         except Exception as e:
             logger.error(f"InfluxDB connection error: {e}")
             raise
 
-    def export(self, metrics: Dict[str, Any]) -> None:
+    async def export(self, metrics: Dict[str, Any], tags: Optional[Dict[str, str]] = None) -> int:
         """
-        Export metrics to InfluxDB time-series database
+        Queue metrics for export to InfluxDB
 
         Args:
             metrics: Comprehensive metrics dictionary
+            tags: Extra tags added to every point
+
+        Returns:
+            Number of points accepted into the export queue
         """
         try:
-            points = self._create_points(metrics)
-            self.write_api.write(bucket=self.bucket, org=self.org, record=points)
-            logger.info(f"Exported {len(points)} metrics points")
+            if not self.pipeline.running:
+                await self.pipeline.start()
+            return self.pipeline.submit(flatten_metrics(metrics, tags))
         except Exception as e:
             logger.error(f"Metrics export to InfluxDB failed: {e}")
-
-    def _create_points(self, metrics: Dict[str, Any]) -> List[Point]:
-        """
-        Transform metrics into InfluxDB data points
-
-        Args:
-            metrics: Raw metrics dictionary
-
-        Returns:
-            List of InfluxDB data points
-        """
-        points = []
-        timestamp = datetime.now()
-
-        for category, data in metrics.get('metrics', {}).items():
-            for metric_name, value in data.items():
-                point = (Point(category)
-                    .tag('metric', metric_name)
-                    .field('value', float(value) if isinstance(value, (int, float)) else 0)
-                    .time(timestamp)
-                )
-                points.append(point)
-
-        return points
+            return 0
 
     def query(
         self,
@@ -103,6 +110,7 @@ class InfluxDBExporter:
             logger.error(f"InfluxDB query error: {e}")
             return []
 
-    def close(self) -> None:
-        """Close InfluxDB client connection"""
-        self.client.close()
\ No newline at end of file
+    async def close(self) -> None:
+        """Flush pending points and close InfluxDB connections"""
+        await self.pipeline.stop()
+        self.client.close()
@@ -1,8 +1,16 @@
 #
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from prometheus_client import start_http_server, Gauge, Counter, Summary
 
+from .export_pipeline import (
+    ExportPipeline,
+    ExportPipelineConfig,
+    HTTPSink,
+    encode_prometheus_text,
+    flatten_metrics
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,14 +22,24 @@ class PrometheusExporter:
     - Expose system and application metrics
     - Create Prometheus metric collectors
     - Manage metric registration and updates
+    - Optionally push batched samples to a Pushgateway
     """
 
-    def __init__(self, port: int = 8000):
+    def __init__(
+            self,
+            port: int = 8000,
+            pushgateway_url: Optional[str] = None,
+            job: str = 'data_pipeline',
+            pipeline_config: Optional[ExportPipelineConfig] = None
+    ):
         """
         Initialize Prometheus metrics exposition server
 
         Args:
             port: HTTP server port for metric exposition
+            pushgateway_url: Pushgateway base URL; enables batched push export
+            job: Pushgateway job name
+            pipeline_config: Batching, retry and spill settings for pushes
         """
         self.port = port
         self._metrics = {
@@ -29,6 +47,16 @@ class PrometheusExporter:
             'counters': {},
             'summaries': {}
         }
+        self.pipeline: Optional[ExportPipeline] = None
+        if pushgateway_url:
+            self.pipeline = ExportPipeline(
+                HTTPSink(
+                    f"{pushgateway_url.rstrip('/')}/metrics/job/{job}",
+                    encode_prometheus_text,
+                    headers={'Content-Type': 'text/plain; version=0.0.4'}
+                ),
+                pipeline_config
+            )
         self._start_exposition_server()
 
     def _start_exposition_server(self) -> None:
@@ -41,18 +69,30 @@ class PrometheusExporter:
         except Exception as e:
             logger.error(f"Could not start Prometheus server: {e}")
 
-    def export(self, metrics: Dict[str, Any]) -> None:
+    async def export(self, metrics: Dict[str, Any]) -> None:
         """
         Export metrics to Prometheus collectors
 
+        Gauges are updated in place for scraping; with a Pushgateway the
+        samples are also queued and pushed in batches.
+
         Args:
             metrics: Comprehensive metrics dictionary
         """
         try:
             self._update_metrics(metrics.get('metrics', {}))
+            if self.pipeline is not None:
+                if not self.pipeline.running:
+                    await self.pipeline.start()
+                self.pipeline.submit(flatten_metrics(metrics))
         except Exception as e:
             logger.error(f"Metrics export to Prometheus failed: {e}")
 
+    async def close(self) -> None:
+        """Flush pending Pushgateway batches"""
+        if self.pipeline is not None:
+            await self.pipeline.stop()
+
     def _update_metrics(self, metrics_data: Dict[str, Any]) -> None:
         """
         Update Prometheus metric collectors
@@ -3,9 +3,12 @@ Enhanced QualityProcessor with message-based architecture and comprehensive qual
 """
 
 import logging
+from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
+import pandas as pd
+
 from core.messaging.broker import MessageBroker
 from core.messaging.event_types import (
     QualityMessageType, QualityState, QualityCheckType,
@@ -28,6 +31,10 @@ from .detectors import (
     text_standardization
 )
 
+from ...staging.modules.incremental_module import (
+    IncrementalExecutor, IncrementalResultStore
+)
+
 from .resolvers import (
     basic_resolver, address_resolver, code_resolver,
     datetime_resolver, domain_resolver, id_resolver,
@@ -40,10 +47,19 @@ logger = logging.getLogger(__name__)
 class QualityProcessor:
     """Enhanced quality processor with comprehensive quality management"""
 
-    def __init__(self, message_broker: MessageBroker):
+    def __init__(
+            self,
+            message_broker: MessageBroker,
+            incremental_store_path: Optional[Path] = None
+    ):
         self.message_broker = message_broker
         self.active_processes: Dict[str, QualityContext] = {}
 
+        # Chunk-level profile partials reused across re-runs of a pipeline
+        self.incremental_executor = IncrementalExecutor(
+            IncrementalResultStore(incremental_store_path or Path("staged_data") / "incremental")
+        )
+
         self.module_identifier = ModuleIdentifier(
             component_name="quality_processor",
             component_type=ComponentType.QUALITY_PROCESSOR,
@@ -148,9 +164,13 @@ class QualityProcessor:
             context = self.active_processes[pipeline_id]
             context.update_state(QualityState.CONTEXT_ANALYSIS)
 
-            # Profile data
+            # Profile data, recomputing only chunks changed since the last run
             data = message.content.get("data")
-            profile_results = await self._profile_data(data)
+            profile_results = await self._profile_data(
+                pipeline_id,
+                data,
+                force_full=message.content.get("execution_mode") == "full"
+            )
             context.column_profiles = profile_results
 
             # Identify relationships
@@ -167,6 +187,27 @@ class QualityProcessor:
             logger.error(f"Context analysis failed: {str(e)}")
             await self._publish_error(pipeline_id, str(e))
 
+    async def _profile_data(
+            self,
+            pipeline_id: str,
+            data: Any,
+            force_full: bool = False
+    ) -> Dict[str, Any]:
+        """Build column profiles from per-chunk mergeable partials"""
+        if not isinstance(data, pd.DataFrame):
+            data = pd.DataFrame(data)
+
+        outcome = await self.incremental_executor.run(
+            pipeline_id, "quality", data, force_full=force_full
+        )
+        await self._publish_status_update(
+            pipeline_id,
+            QualityState.CONTEXT_ANALYSIS,
+            f"Profiled {outcome['execution']['chunks_computed']} changed chunks, "
+            f"reused {outcome['execution']['chunks_reused']}"
+        )
+        return outcome['result']['columns']
+
     async def _handle_detection_start(self, message: ProcessingMessage) -> None:
         """Handle quality issue detection"""
         pipeline_id = message.content["pipeline_id"]
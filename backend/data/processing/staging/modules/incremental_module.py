@@ -0,0 +1,452 @@
+# backend/data/processing/staging/modules/incremental_module.py
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import reduce
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Callable, Union
+
+import aiofiles
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ChunkInfo:
+    """Row range of a staged dataset and its content fingerprint"""
+    index: int
+    start: int
+    stop: int
+    fingerprint: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'index': self.index,
+            'start': self.start,
+            'stop': self.stop,
+            'fingerprint': self.fingerprint
+        }
+
+
+@dataclass
+class ChunkManifest:
+    """Per-chunk fingerprints for one staged dataset"""
+    schema_fingerprint: str
+    chunk_size: int
+    row_count: int
+    chunks: List[ChunkInfo] = field(default_factory=list)
+    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+
+    @property
+    def fingerprints(self) -> List[str]:
+        return [chunk.fingerprint for chunk in self.chunks]
+
+    def diff(self, previous: Optional['ChunkManifest']) -> Dict[str, Any]:
+        """Compare against a previous manifest of the same dataset"""
+        if previous is None or previous.schema_fingerprint != self.schema_fingerprint:
+            return {
+                'full_rebuild': True,
+                'unchanged': 0,
+                'changed': 0,
+                'added': len(self.chunks),
+                'removed': len(previous.chunks) if previous else 0
+            }
+
+        previous_by_index = {chunk.index: chunk.fingerprint for chunk in previous.chunks}
+        unchanged = changed = added = 0
+        for chunk in self.chunks:
+            before = previous_by_index.get(chunk.index)
+            if before is None:
+                added += 1
+            elif before == chunk.fingerprint:
+                unchanged += 1
+            else:
+                changed += 1
+
+        return {
+            'full_rebuild': False,
+            'unchanged': unchanged,
+            'changed': changed,
+            'added': added,
+            'removed': max(len(previous.chunks) - len(self.chunks), 0)
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'schema_fingerprint': self.schema_fingerprint,
+            'chunk_size': self.chunk_size,
+            'row_count': self.row_count,
+            'chunks': [chunk.to_dict() for chunk in self.chunks],
+            'created_at': self.created_at
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ChunkManifest':
+        return cls(
+            schema_fingerprint=data['schema_fingerprint'],
+            chunk_size=data['chunk_size'],
+            row_count=data['row_count'],
+            chunks=[ChunkInfo(**chunk) for chunk in data.get('chunks', [])],
+            created_at=data.get('created_at', datetime.utcnow().isoformat())
+        )
+
+
+class ChunkFingerprinter:
+    """
+    Splits a frame into fixed-size row chunks and fingerprints each one.
+
+    Chunks are positional, so appending rows leaves every earlier full chunk
+    (and its fingerprint) unchanged; only the trailing partial chunk and the
+    new chunks differ from the previous run.
+    """
+
+    def __init__(self, chunk_size: int = 50_000):
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self.chunk_size = chunk_size
+
+    def schema_fingerprint(self, data: pd.DataFrame) -> str:
+        schema = [(str(name), str(dtype)) for name, dtype in data.dtypes.items()]
+        return hashlib.blake2b(json.dumps(schema).encode(), digest_size=16).hexdigest()
+
+    def chunk_fingerprint(self, chunk: pd.DataFrame, schema_fingerprint: str) -> str:
+        row_hashes = pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(schema_fingerprint.encode())
+        digest.update(np.ascontiguousarray(row_hashes).tobytes())
+        return digest.hexdigest()
+
+    def build_manifest(self, data: pd.DataFrame) -> ChunkManifest:
+        schema = self.schema_fingerprint(data)
+        chunks = []
+        for index, start in enumerate(range(0, len(data), self.chunk_size)):
+            stop = min(start + self.chunk_size, len(data))
+            chunks.append(ChunkInfo(
+                index=index,
+                start=start,
+                stop=stop,
+                fingerprint=self.chunk_fingerprint(data.iloc[start:stop], schema)
+            ))
+        return ChunkManifest(
+            schema_fingerprint=schema,
+            chunk_size=self.chunk_size,
+            row_count=len(data),
+            chunks=chunks
+        )
+
+
+class ColumnStatsPartial:
+    """
+    Mergeable per-column statistics for one chunk.
+
+    Numeric columns keep count/mean/M2/min/max and merge with Chan's
+    parallel update; other columns keep bounded value counts. Merging is
+    associative, so results for any set of chunks combine in any order.
+    """
+
+    def __init__(
+            self,
+            rows: int = 0,
+            columns: Optional[Dict[str, Dict[str, Any]]] = None,
+            max_categories: int = 1000
+    ):
+        self.rows = rows
+        self.columns = columns or {}
+        self.max_categories = max_categories
+
+    @classmethod
+    def from_frame(
+            cls,
+            data: pd.DataFrame,
+            include_values: bool = True,
+            max_categories: int = 1000
+    ) -> 'ColumnStatsPartial':
+        columns = {}
+        for name in data.columns:
+            series = data[name]
+            nulls = int(series.isna().sum())
+            stats: Dict[str, Any] = {'nulls': nulls, 'count': int(len(series) - nulls)}
+
+            if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+                values = series.dropna().to_numpy(dtype=float)
+                stats['kind'] = 'numeric'
+                if len(values):
+                    stats['mean'] = float(values.mean())
+                    stats['m2'] = float(((values - stats['mean']) ** 2).sum())
+                    stats['min'] = float(values.min())
+                    stats['max'] = float(values.max())
+                else:
+                    stats.update({'mean': 0.0, 'm2': 0.0, 'min': None, 'max': None})
+            else:
+                stats['kind'] = 'categorical'
+                if include_values:
+                    counts = series.dropna().astype(str).value_counts()
+                    stats['truncated'] = len(counts) > max_categories
+                    stats['values'] = {k: int(v) for k, v in counts.head(max_categories).items()}
+
+            columns[str(name)] = stats
+
+        return cls(rows=len(data), columns=columns, max_categories=max_categories)
+
+    def merge(self, other: 'ColumnStatsPartial') -> 'ColumnStatsPartial':
+        merged = {}
+        for name in set(self.columns) | set(other.columns):
+            left = self.columns.get(name)
+            right = other.columns.get(name)
+            if left is None or right is None:
+                merged[name] = dict(left or right)
+                continue
+            merged[name] = self._merge_column(left, right)
+        return ColumnStatsPartial(
+            rows=self.rows + other.rows,
+            columns=merged,
+            max_categories=self.max_categories
+        )
+
+    def _merge_column(self, left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
+        result = {
+            'kind': left['kind'],
+            'nulls': left['nulls'] + right['nulls'],
+            'count': left['count'] + right['count']
+        }
+
+        if left['kind'] == 'numeric':
+            n_a, n_b = left['count'], right['count']
+            total = n_a + n_b
+            if total == 0:
+                result.update({'mean': 0.0, 'm2': 0.0, 'min': None, 'max': None})
+                return result
+            delta = right['mean'] - left['mean']
+            result['mean'] = left['mean'] + delta * n_b / total
+            result['m2'] = left['m2'] + right['m2'] + delta ** 2 * n_a * n_b / total
+            result['min'] = min(v for v in (left['min'], right['min']) if v is not None)
+            result['max'] = max(v for v in (left['max'], right['max']) if v is not None)
+            return result
+
+        if 'values' in left or 'values' in right:
+            values = dict(left.get('values', {}))
+            for key, count in right.get('values', {}).items():
+                values[key] = values.get(key, 0) + count
+            truncated = left.get('truncated', False) or right.get('truncated', False)
+            if len(values) > self.max_categories:
+                top = sorted(values.items(), key=lambda item: item[1], reverse=True)
+                values = dict(top[:self.max_categories])
+                truncated = True
+            result['values'] = values
+            result['truncated'] = truncated
+        return result
+
+    def finalize(self) -> Dict[str, Any]:
+        """Turn merged partials into a column profile"""
+        profile = {}
+        for name, stats in self.columns.items():
+            total = stats['count'] + stats['nulls']
+            column = {
+                'kind': stats['kind'],
+                'count': stats['count'],
+                'null_count': stats['nulls'],
+                'null_ratio': stats['nulls'] / total if total else 0.0
+            }
+            if stats['kind'] == 'numeric':
+                variance = stats['m2'] / (stats['count'] - 1) if stats['count'] > 1 else 0.0
+                column.update({
+                    'mean': stats['mean'],
+                    'std': math.sqrt(variance),
+                    'min': stats['min'],
+                    'max': stats['max']
+                })
+            elif 'values' in stats:
+                top = sorted(stats['values'].items(), key=lambda item: item[1], reverse=True)
+                column.update({
+                    'distinct_count': len(stats['values']),
+                    'distinct_is_lower_bound': stats.get('truncated', False),
+                    'top_values': dict(top[:10])
+                })
+            profile[name] = column
+        return {'row_count': self.rows, 'columns': profile}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'rows': self.rows, 'columns': self.columns, 'max_categories': self.max_categories}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ColumnStatsPartial':
+        return cls(
+            rows=data['rows'],
+            columns=data['columns'],
+            max_categories=data.get('max_categories', 1000)
+        )
+
+
+# Stage -> builder producing a mergeable partial for one chunk
+PARTIAL_BUILDERS: Dict[str, Callable[[pd.DataFrame], ColumnStatsPartial]] = {
+    'quality': lambda chunk: ColumnStatsPartial.from_frame(chunk, include_values=True),
+    'insight': lambda chunk: ColumnStatsPartial.from_frame(chunk, include_values=True),
+    'analytics': lambda chunk: ColumnStatsPartial.from_frame(chunk, include_values=False)
+}
+
+
+class IncrementalResultStore:
+    """
+    File-backed store for chunk manifests and per-chunk partial results
+
+    Layout::
+
+        <base>/<pipeline_id>/<stage>/manifest.json
+        <base>/<pipeline_id>/<stage>/chunks/<fingerprint>.json
+
+    Partials are content addressed, so a chunk whose rows did not change
+    between runs maps to the same file.
+    """
+
+    def __init__(self, base_path: Union[str, Path]):
+        self.base_path = Path(base_path)
+
+    def _stage_path(self, pipeline_id: str, stage: str) -> Path:
+        return self.base_path / str(pipeline_id) / stage
+
+    async def load_manifest(self, pipeline_id: str, stage: str) -> Optional[ChunkManifest]:
+        path = self._stage_path(pipeline_id, stage) / "manifest.json"
+        if not path.exists():
+            return None
+        async with aiofiles.open(path, 'r') as f:
+            return ChunkManifest.from_dict(json.loads(await f.read()))
+
+    async def save_manifest(self, pipeline_id: str, stage: str, manifest: ChunkManifest) -> None:
+        stage_path = self._stage_path(pipeline_id, stage)
+        stage_path.mkdir(parents=True, exist_ok=True)
+        async with aiofiles.open(stage_path / "manifest.json", 'w') as f:
+            await f.write(json.dumps(manifest.to_dict()))
+
+    async def load_partial(self, pipeline_id: str, stage: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        path = self._stage_path(pipeline_id, stage) / "chunks" / f"{fingerprint}.json"
+        if not path.exists():
+            return None
+        async with aiofiles.open(path, 'r') as f:
+            return json.loads(await f.read())
+
+    async def save_partial(
+            self,
+            pipeline_id: str,
+            stage: str,
+            fingerprint: str,
+            partial: Dict[str, Any]
+    ) -> None:
+        chunk_path = self._stage_path(pipeline_id, stage) / "chunks"
+        chunk_path.mkdir(parents=True, exist_ok=True)
+        async with aiofiles.open(chunk_path / f"{fingerprint}.json", 'w') as f:
+            await f.write(json.dumps(partial))
+
+    async def prune(self, pipeline_id: str, stage: str, keep: List[str]) -> int:
+        """Remove partials no longer referenced by the current manifest"""
+        return await asyncio.to_thread(self._prune, pipeline_id, stage, keep)
+
+    def _prune(self, pipeline_id: str, stage: str, keep: List[str]) -> int:
+        chunk_path = self._stage_path(pipeline_id, stage) / "chunks"
+        if not chunk_path.exists():
+            return 0
+        keep_set = set(keep)
+        removed = 0
+        for path in chunk_path.glob("*.json"):
+            if path.stem not in keep_set:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    async def clear(self, pipeline_id: str, stage: str) -> None:
+        stage_path = self._stage_path(pipeline_id, stage)
+        await self.prune(pipeline_id, stage, keep=[])
+        await asyncio.to_thread((stage_path / "manifest.json").unlink, missing_ok=True)
+
+
+class IncrementalExecutor:
+    """
+    Runs a stage's chunk computation only for new or changed chunks
+
+    Unchanged chunks reuse their stored partial; all partials are merged
+    into the stage result. ``force_full`` drops stored state and recomputes
+    every chunk.
+    """
+
+    def __init__(
+            self,
+            store: IncrementalResultStore,
+            fingerprinter: Optional[ChunkFingerprinter] = None,
+            builders: Optional[Dict[str, Callable[[pd.DataFrame], ColumnStatsPartial]]] = None
+    ):
+        self.store = store
+        self.fingerprinter = fingerprinter or ChunkFingerprinter()
+        self.builders = builders or PARTIAL_BUILDERS
+
+    async def run(
+            self,
+            pipeline_id: str,
+            stage: str,
+            data: pd.DataFrame,
+            force_full: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Compute the merged stage result for ``data``
+
+        Returns:
+            Dict with the finalized ``result`` and an ``execution`` summary
+            (mode, chunk diff, computed/reused counts)
+        """
+        builder = self.builders.get(stage)
+        if builder is None:
+            raise ValueError(f"No incremental builder registered for stage: {stage}")
+
+        # Hashing every row is CPU bound; keep it off the event loop
+        manifest = await asyncio.to_thread(self.fingerprinter.build_manifest, data)
+        previous = None
+        if force_full:
+            await self.store.clear(pipeline_id, stage)
+        else:
+            previous = await self.store.load_manifest(pipeline_id, stage)
+        diff = manifest.diff(previous)
+
+        partials = []
+        computed = reused = 0
+        for chunk in manifest.chunks:
+            stored = None
+            if not diff['full_rebuild']:
+                stored = await self.store.load_partial(pipeline_id, stage, chunk.fingerprint)
+
+            if stored is not None:
+                partials.append(ColumnStatsPartial.from_dict(stored))
+                reused += 1
+                continue
+
+            partial = await asyncio.to_thread(builder, data.iloc[chunk.start:chunk.stop])
+            await self.store.save_partial(pipeline_id, stage, chunk.fingerprint, partial.to_dict())
+            partials.append(partial)
+            computed += 1
+
+        merged = await asyncio.to_thread(
+            reduce, lambda a, b: a.merge(b), partials, ColumnStatsPartial()
+        )
+        await self.store.save_manifest(pipeline_id, stage, manifest)
+        await self.store.prune(pipeline_id, stage, keep=manifest.fingerprints)
+
+        logger.info(
+            f"Incremental {stage} run for {pipeline_id}: "
+            f"{computed} chunks computed, {reused} reused"
+        )
+
+        return {
+            'result': merged.finalize(),
+            'execution': {
+                'mode': 'full' if force_full or diff['full_rebuild'] else 'incremental',
+                'chunks_total': len(manifest.chunks),
+                'chunks_computed': computed,
+                'chunks_reused': reused,
+                'diff': diff,
+                'row_count': manifest.row_count
+            }
+        }
@@ -0,0 +1,562 @@
+# backend/source_handlers/cloud/cloud_transfer.py
+
+import asyncio
+import io
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Tuple
+
+import boto3
+from botocore.config import Config as BotoConfig
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CloudTransferConfig:
+    """
+    Tuning parameters for S3 transfers.
+
+    Attributes:
+        part_size: Size of each byte-range GET for large objects
+        multipart_threshold: Objects larger than this are fetched in ranges
+        max_concurrency: Maximum in-flight S3 requests per engine
+        small_object_threshold: Objects up to this size are batch candidates
+        batch_max_objects: Maximum objects packed into one staged dataset
+        batch_max_bytes: Maximum bytes packed into one staged dataset
+        list_page_size: MaxKeys per ListObjectsV2 request
+        list_fanout_depth: Prefix depth up to which listing is parallelised
+        range_cache_blocks: Blocks kept by the ranged reader used for projection
+    """
+    part_size: int = 8 * 1024 * 1024
+    multipart_threshold: int = 16 * 1024 * 1024
+    max_concurrency: int = 8
+    small_object_threshold: int = 1024 * 1024
+    batch_max_objects: int = 1000
+    batch_max_bytes: int = 256 * 1024 * 1024
+    list_page_size: int = 1000
+    list_fanout_depth: int = 2
+    range_cache_blocks: int = 16
+
+
+@dataclass
+class TransferStats:
+    """Counters collected during a transfer"""
+    objects: int = 0
+    bytes_transferred: int = 0
+    requests: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+    finished_at: Optional[float] = None
+
+    def finish(self) -> 'TransferStats':
+        self.finished_at = time.perf_counter()
+        return self
+
+    @property
+    def elapsed_seconds(self) -> float:
+        end = self.finished_at or time.perf_counter()
+        return max(end - self.started_at, 1e-9)
+
+    @property
+    def throughput_mb_s(self) -> float:
+        return self.bytes_transferred / (1024 * 1024) / self.elapsed_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'objects': self.objects,
+            'bytes_transferred': self.bytes_transferred,
+            'requests': self.requests,
+            'elapsed_seconds': round(self.elapsed_seconds, 6),
+            'throughput_mb_s': round(self.throughput_mb_s, 3)
+        }
+
+
+class S3RangeReader(io.RawIOBase):
+    """
+    Seekable, read-only file object over an S3 object.
+
+    Reads are served with byte-range GETs in block-sized units and a small
+    LRU of recent blocks, so columnar readers such as pyarrow only pull the
+    footer and the column chunks they actually decode.
+    """
+
+    def __init__(
+            self,
+            client: Any,
+            bucket: str,
+            key: str,
+            size: int,
+            block_size: int,
+            cache_blocks: int,
+            stats: Optional[TransferStats] = None
+    ):
+        super().__init__()
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.size = size
+        self.block_size = block_size
+        self.cache_blocks = cache_blocks
+        self.stats = stats or TransferStats()
+        self._position = 0
+        self._blocks: Dict[int, bytes] = {}
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._position = offset
+        elif whence == io.SEEK_CUR:
+            self._position += offset
+        elif whence == io.SEEK_END:
+            self._position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        self._position = max(0, min(self._position, self.size))
+        return self._position
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self.size - self._position
+        end = min(self._position + size, self.size)
+        if end <= self._position:
+            return b''
+
+        data = self._read_range(self._position, end)
+        self._position = end
+        return data
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def _read_range(self, start: int, end: int) -> bytes:
+        """Assemble [start, end) from cached blocks, fetching misses in one GET"""
+        first_block = start // self.block_size
+        last_block = (end - 1) // self.block_size
+        missing = [b for b in range(first_block, last_block + 1) if b not in self._blocks]
+
+        if missing:
+            fetch_start = missing[0] * self.block_size
+            fetch_end = min((missing[-1] + 1) * self.block_size, self.size)
+            payload = self._get_range(fetch_start, fetch_end)
+            for block in range(missing[0], missing[-1] + 1):
+                offset = (block - missing[0]) * self.block_size
+                self._blocks[block] = payload[offset:offset + self.block_size]
+
+        parts = [self._blocks[b] for b in range(first_block, last_block + 1)]
+        self._evict(keep=range(first_block, last_block + 1))
+
+        joined = b''.join(parts)
+        offset = start - first_block * self.block_size
+        return joined[offset:offset + (end - start)]
+
+    def _get_range(self, start: int, end: int) -> bytes:
+        response = self.client.get_object(
+            Bucket=self.bucket,
+            Key=self.key,
+            Range=f"bytes={start}-{end - 1}"
+        )
+        payload = response['Body'].read()
+        self.stats.requests += 1
+        self.stats.bytes_transferred += len(payload)
+        return payload
+
+    def _evict(self, keep: range) -> None:
+        while len(self._blocks) > max(self.cache_blocks, len(keep)):
+            victim = next(b for b in self._blocks if b not in keep)
+            del self._blocks[victim]
+
+
+class S3TransferEngine:
+    """
+    Concurrent S3 transfer engine.
+
+    Wraps a (thread-safe) boto3 S3 client and fans requests out over worker
+    threads, bounded by a single semaphore per engine:
+
+    - large objects are fetched as concurrent byte-range GETs written at
+      their offset directly into the destination file
+    - listings fan out across common prefixes, each prefix paginating with
+      its own continuation tokens
+    - many small objects are packed into a single staged dataset
+    - Parquet/CSV objects can be projected to a subset of columns
+    """
+
+    def __init__(
+            self,
+            client: Any,
+            config: Optional[CloudTransferConfig] = None
+    ):
+        self.client = client
+        self.config = config or CloudTransferConfig()
+        self._semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+    @classmethod
+    def from_auth(
+            cls,
+            auth: Optional[Dict[str, Any]] = None,
+            endpoint_url: Optional[str] = None,
+            config: Optional[CloudTransferConfig] = None
+    ) -> 'S3TransferEngine':
+        """Build an engine from handler auth parameters"""
+        auth = auth or {}
+        config = config or CloudTransferConfig()
+        session = boto3.Session(
+            aws_access_key_id=auth.get('aws_access_key_id'),
+            aws_secret_access_key=auth.get('aws_secret_access_key'),
+            aws_session_token=auth.get('aws_session_token'),
+            region_name=auth.get('region', 'us-east-1')
+        )
+        client = session.client(
+            's3',
+            endpoint_url=endpoint_url or auth.get('endpoint_url'),
+            config=BotoConfig(max_pool_connections=config.max_concurrency * 2)
+        )
+        return cls(client, config)
+
+    async def _call(self, method: str, stats: Optional[TransferStats] = None, **kwargs) -> Dict[str, Any]:
+        """Run a blocking client call on a worker thread under the semaphore"""
+        async with self._semaphore:
+            response = await asyncio.to_thread(getattr(self.client, method), **kwargs)
+        if stats is not None:
+            stats.requests += 1
+        return response
+
+    async def head_object(self, bucket: str, key: str) -> Dict[str, Any]:
+        return await self._call('head_object', Bucket=bucket, Key=key)
+
+    async def download_to_file(
+            self,
+            bucket: str,
+            key: str,
+            destination: Path,
+            size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Download an object into a file, using parallel ranged GETs when large
+
+        Args:
+            bucket: Source bucket
+            key: Object key
+            destination: Target file, created or truncated
+            size: Object size if already known from a listing
+
+        Returns:
+            Object info and transfer statistics
+        """
+        stats = TransferStats()
+        head = None
+        if size is None:
+            head = await self.head_object(bucket, key)
+            stats.requests += 1
+            size = head['ContentLength']
+
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        ranges = self._plan_ranges(size)
+
+        fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, size)
+            await asyncio.gather(*(
+                self._fetch_range_into(fd, bucket, key, start, end, stats)
+                for start, end in ranges
+            ))
+        except BaseException:
+            # Never leave a partially written object behind
+            os.close(fd)
+            destination.unlink(missing_ok=True)
+            raise
+        os.close(fd)
+
+        stats.objects = 1
+        stats.finish()
+        return {
+            'bucket': bucket,
+            'key': key,
+            'size_bytes': size,
+            'content_type': (head or {}).get('ContentType'),
+            'storage_location': str(destination),
+            'parts': len(ranges),
+            'transfer': stats.to_dict()
+        }
+
+    def _plan_ranges(self, size: int) -> List[Tuple[int, int]]:
+        """Split [0, size) into part-sized ranges; small objects use one GET"""
+        if size <= self.config.multipart_threshold:
+            return [(0, size)] if size else []
+        part = self.config.part_size
+        return [(start, min(start + part, size)) for start in range(0, size, part)]
+
+    async def _fetch_range_into(
+            self,
+            fd: int,
+            bucket: str,
+            key: str,
+            start: int,
+            end: int,
+            stats: TransferStats
+    ) -> None:
+        def _fetch_and_write() -> int:
+            response = self.client.get_object(
+                Bucket=bucket,
+                Key=key,
+                Range=f"bytes={start}-{end - 1}"
+            )
+            body = response['Body']
+            offset = start
+            # Stream the part so memory per worker stays at one read buffer
+            for chunk in body.iter_chunks(chunk_size=1024 * 1024):
+                os.pwrite(fd, chunk, offset)
+                offset += len(chunk)
+            return offset - start
+
+        async with self._semaphore:
+            written = await asyncio.to_thread(_fetch_and_write)
+        stats.requests += 1
+        stats.bytes_transferred += written
+        if written != end - start:
+            raise IOError(
+                f"Short read for s3://{bucket}/{key} bytes {start}-{end - 1}: "
+                f"got {written} of {end - start} bytes"
+            )
+
+    async def list_objects(
+            self,
+            bucket: str,
+            prefix: str = '',
+            delimiter: str = '/',
+            max_objects: Optional[int] = None,
+            continuation_token: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        List objects under a prefix
+
+        Without ``max_objects`` every object is returned, fanning out across
+        sub-prefixes found via the delimiter up to ``list_fanout_depth``;
+        below that, each prefix is paginated flat. With ``max_objects`` one
+        page is returned in key order, with a ``continuation_token`` to pass
+        back for the next page (None once the listing is exhausted).
+        """
+        stats = TransferStats()
+        if max_objects is not None or continuation_token:
+            objects, next_token = await self._list_page(
+                bucket, prefix, max_objects, continuation_token, stats
+            )
+        else:
+            objects, next_token = [], None
+            await self._list_prefix(bucket, prefix, delimiter, 0, objects, stats)
+            objects.sort(key=lambda item: item['key'])
+
+        stats.objects = len(objects)
+        stats.finish()
+        return {
+            'objects': objects,
+            'continuation_token': next_token,
+            'transfer': stats.to_dict()
+        }
+
+    async def _list_page(
+            self,
+            bucket: str,
+            prefix: str,
+            max_objects: Optional[int],
+            continuation_token: Optional[str],
+            stats: TransferStats
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """One page of a flat listing; pages end exactly at ``max_objects``"""
+        objects: List[Dict[str, Any]] = []
+        token = continuation_token
+        while True:
+            remaining = self.config.list_page_size
+            if max_objects is not None:
+                remaining = min(remaining, max_objects - len(objects))
+            kwargs = {'Bucket': bucket, 'Prefix': prefix, 'MaxKeys': remaining}
+            if token:
+                kwargs['ContinuationToken'] = token
+
+            page = await self._call('list_objects_v2', stats, **kwargs)
+            objects.extend(self._object_info(item) for item in page.get('Contents', []))
+            token = page.get('NextContinuationToken') if page.get('IsTruncated') else None
+            if token is None or (max_objects is not None and len(objects) >= max_objects):
+                return objects, token
+
+    async def _list_prefix(
+            self,
+            bucket: str,
+            prefix: str,
+            delimiter: str,
+            depth: int,
+            objects: List[Dict[str, Any]],
+            stats: TransferStats
+    ) -> None:
+        fan_out = depth < self.config.list_fanout_depth
+        sub_prefixes: List[str] = []
+        token = None
+
+        while True:
+            kwargs = {
+                'Bucket': bucket,
+                'Prefix': prefix,
+                'MaxKeys': self.config.list_page_size
+            }
+            if fan_out:
+                kwargs['Delimiter'] = delimiter
+            if token:
+                kwargs['ContinuationToken'] = token
+
+            page = await self._call('list_objects_v2', stats, **kwargs)
+            objects.extend(self._object_info(item) for item in page.get('Contents', []))
+            sub_prefixes.extend(p['Prefix'] for p in page.get('CommonPrefixes', []))
+
+            if not page.get('IsTruncated'):
+                break
+            token = page.get('NextContinuationToken')
+
+        if sub_prefixes:
+            await asyncio.gather(*(
+                self._list_prefix(bucket, sub, delimiter, depth + 1, objects, stats)
+                for sub in sub_prefixes
+            ))
+
+    @staticmethod
+    def _object_info(item: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'key': item['Key'],
+            'size': item['Size'],
+            'etag': item.get('ETag', '').strip('"'),
+            'last_modified': item['LastModified'].isoformat()
+            if item.get('LastModified') else None
+        }
+
+    async def download_batch(
+            self,
+            bucket: str,
+            objects: List[Dict[str, Any]],
+            destination: Path
+    ) -> Dict[str, Any]:
+        """
+        Pack many small objects into a single staged file
+
+        Objects are fetched concurrently and appended to ``destination``;
+        the returned index records each object's offset and length so the
+        staged dataset can be split again downstream.
+        """
+        stats = TransferStats()
+        batch = self._select_batch(objects)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+
+        async def _fetch(item: Dict[str, Any]) -> bytes:
+            response = await self._call('get_object', stats, Bucket=bucket, Key=item['key'])
+            return await asyncio.to_thread(response['Body'].read)
+
+        payloads = await asyncio.gather(*(_fetch(item) for item in batch))
+
+        index = []
+        offset = 0
+        try:
+            with open(destination, 'wb') as handle:
+                for item, payload in zip(batch, payloads):
+                    handle.write(payload)
+                    index.append({'key': item['key'], 'offset': offset, 'size': len(payload)})
+                    offset += len(payload)
+        except BaseException:
+            destination.unlink(missing_ok=True)
+            raise
+
+        stats.objects = len(batch)
+        stats.bytes_transferred = offset
+        stats.finish()
+        return {
+            'bucket': bucket,
+            'size_bytes': offset,
+            'storage_location': str(destination),
+            'index': index,
+            'skipped': len(objects) - len(batch),
+            'transfer': stats.to_dict()
+        }
+
+    def _select_batch(self, objects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        batch = []
+        total = 0
+        for item in objects:
+            if item['size'] > self.config.small_object_threshold:
+                continue
+            if len(batch) >= self.config.batch_max_objects:
+                break
+            if total + item['size'] > self.config.batch_max_bytes:
+                break
+            batch.append(item)
+            total += item['size']
+        return batch
+
+    async def read_columns(
+            self,
+            bucket: str,
+            key: str,
+            columns: List[str],
+            size: Optional[int] = None,
+            file_format: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Read only the requested columns of a Parquet or CSV object
+
+        Parquet is read through :class:`S3RangeReader`, so only the footer
+        and the selected column chunks are transferred. CSV has no column
+        index, so the object is streamed once and parsed with ``usecols``.
+        """
+        stats = TransferStats()
+        if size is None:
+            head = await self.head_object(bucket, key)
+            stats.requests += 1
+            size = head['ContentLength']
+
+        file_format = file_format or Path(key).suffix.lstrip('.').lower()
+
+        def _read():
+            import pandas as pd
+
+            if file_format == 'parquet':
+                import pyarrow.parquet as pq
+
+                reader = S3RangeReader(
+                    self.client, bucket, key, size,
+                    block_size=min(self.config.part_size, 1024 * 1024),
+                    cache_blocks=self.config.range_cache_blocks,
+                    stats=stats
+                )
+                return pq.ParquetFile(reader).read(columns=columns).to_pandas()
+
+            if file_format == 'csv':
+                response = self.client.get_object(Bucket=bucket, Key=key)
+                stats.requests += 1
+                frame = pd.read_csv(response['Body'], usecols=columns)
+                stats.bytes_transferred += size
+                return frame
+
+            raise ValueError(f"Column projection not supported for format: {file_format}")
+
+        async with self._semaphore:
+            frame = await asyncio.to_thread(_read)
+
+        stats.objects = 1
+        stats.finish()
+        return {
+            'bucket': bucket,
+            'key': key,
+            'size_bytes': size,
+            'columns': list(frame.columns),
+            'data': frame,
+            'transfer': stats.to_dict()
+        }
@@ -0,0 +1,32 @@
+"""keyset_pagination_indexes
+
+Revision ID: 5b1f0c2d7a3e
+Revises: ae5e0c665ffa
+Create Date: 2026-10-18 09:00:00.000000+00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '5b1f0c2d7a3e'
+down_revision = 'ae5e0c665ffa'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Composite (sort_key, id) indexes backing keyset pagination
+    op.create_index('ix_pipelines_updated_keyset', 'pipelines', ['updated_at', 'id'], unique=False)
+    op.create_index('ix_pipeline_runs_created_keyset', 'pipeline_runs', ['created_at', 'id'], unique=False)
+    op.create_index('ix_staged_outputs_created_keyset', 'staged_outputs', ['created_at', 'id'], unique=False)
+    op.drop_index('ix_pipeline_logs_pipeline_timestamp', table_name='pipeline_logs')
+    op.create_index('ix_pipeline_logs_pipeline_timestamp', 'pipeline_logs', ['pipeline_id', 'timestamp', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pipeline_logs_pipeline_timestamp', table_name='pipeline_logs')
+    op.create_index('ix_pipeline_logs_pipeline_timestamp', 'pipeline_logs', ['pipeline_id', 'timestamp'], unique=False)
+    op.drop_index('ix_staged_outputs_created_keyset', table_name='staged_outputs')
+    op.drop_index('ix_pipeline_runs_created_keyset', table_name='pipeline_runs')
+    op.drop_index('ix_pipelines_updated_keyset', table_name='pipelines')
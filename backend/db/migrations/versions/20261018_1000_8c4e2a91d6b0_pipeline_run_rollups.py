@@ -0,0 +1,55 @@
+"""pipeline_run_rollups
+
+Revision ID: 8c4e2a91d6b0
+Revises: 5b1f0c2d7a3e
+Create Date: 2026-10-18 10:00:00.000000+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '8c4e2a91d6b0'
+down_revision = '5b1f0c2d7a3e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('pipeline_run_rollups',
+    sa.Column('pipeline_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('bucket_start', sa.DateTime(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('run_count', sa.Integer(), nullable=False),
+    sa.Column('duration_count', sa.Integer(), nullable=False),
+    sa.Column('duration_sum', sa.Float(), nullable=False),
+    sa.Column('duration_min', sa.Float(), nullable=True),
+    sa.Column('duration_max', sa.Float(), nullable=True),
+    sa.Column('last_run_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['pipeline_id'], ['pipelines.id'], name=op.f('fk_pipeline_run_rollups_pipeline_id'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('pipeline_id', 'bucket_start', 'status', name=op.f('pk_pipeline_run_rollups'))
+    )
+    op.create_index('ix_pipeline_run_rollups_bucket', 'pipeline_run_rollups', ['bucket_start'], unique=False)
+    op.create_index('ix_pipeline_runs_pipeline_start', 'pipeline_runs', ['pipeline_id', 'start_time'], unique=False)
+
+    # Backfill from existing finished runs
+    op.execute("""
+        INSERT INTO pipeline_run_rollups (
+            pipeline_id, bucket_start, status, run_count, duration_count,
+            duration_sum, duration_min, duration_max, last_run_at
+        )
+        SELECT pipeline_id, date_trunc('hour', start_time), status::text,
+               count(*), count(duration), coalesce(sum(duration), 0),
+               min(duration), max(duration), max(start_time)
+        FROM pipeline_runs
+        WHERE status IN ('completed', 'failed', 'cancelled')
+        GROUP BY pipeline_id, date_trunc('hour', start_time), status
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pipeline_runs_pipeline_start', table_name='pipeline_runs')
+    op.drop_index('ix_pipeline_run_rollups_bucket', table_name='pipeline_run_rollups')
+    op.drop_table('pipeline_run_rollups')
@@ -0,0 +1,188 @@
+"""durable_event_queue
+
+Revision ID: 3d7f5b9e2c41
+Revises: 8c4e2a91d6b0
+Create Date: 2026-10-18 11:00:00.000000+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '3d7f5b9e2c41'
+down_revision = '8c4e2a91d6b0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('event_processors',
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('event_type', sa.String(length=100), nullable=False),
+    sa.Column('handler_class', sa.String(length=255), nullable=False),
+    sa.Column('config', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('processor_order', sa.Integer(), nullable=True),
+    sa.Column('timeout', sa.Integer(), nullable=True),
+    sa.Column('max_retries', sa.Integer(), nullable=True),
+    sa.Column('retry_delay', sa.Integer(), nullable=True),
+    sa.Column('last_run', sa.DateTime(), nullable=True),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('success_count', sa.Integer(), nullable=True),
+    sa.Column('error_count', sa.Integer(), nullable=True),
+    sa.Column('average_processing_time', sa.Float(), nullable=True),
+    sa.Column('peak_processing_time', sa.Float(), nullable=True),
+    sa.Column('total_events_processed', sa.Integer(), nullable=True),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('is_deleted', sa.Boolean(), nullable=True),
+    sa.Column('deleted_at', sa.DateTime(), nullable=True),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('version_notes', sa.Text(), nullable=True),
+    sa.Column('previous_version', sa.UUID(), nullable=True),
+    sa.Column('audit_trail', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('last_audit_at', sa.DateTime(), nullable=True),
+    sa.Column('tenant_id', sa.UUID(), nullable=True),
+    sa.Column('tags', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('meta_data', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('created_by', sa.UUID(), nullable=True),
+    sa.Column('updated_by', sa.UUID(), nullable=True),
+    sa.Column('deleted_by', sa.UUID(), nullable=True),
+    sa.Column('last_audit_by', sa.UUID(), nullable=True),
+    sa.CheckConstraint('error_count >= 0', name='ck_error_count_valid'),
+    sa.CheckConstraint('max_retries >= 0', name='ck_max_retries_valid'),
+    sa.CheckConstraint('processor_order >= 0', name='ck_processor_order_valid'),
+    sa.CheckConstraint('retry_delay >= 0', name='ck_retry_delay_valid'),
+    sa.CheckConstraint('success_count >= 0', name='ck_success_count_valid'),
+    sa.CheckConstraint('timeout > 0', name='ck_timeout_positive'),
+    sa.CheckConstraint('total_events_processed >= 0', name='ck_total_events_valid'),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], name=op.f('fk_event_processors_created_by'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['deleted_by'], ['users.id'], name=op.f('fk_event_processors_deleted_by'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['last_audit_by'], ['users.id'], name=op.f('fk_event_processors_last_audit_by'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['updated_by'], ['users.id'], name=op.f('fk_event_processors_updated_by'), ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_event_processors')),
+    sa.UniqueConstraint('id', name=op.f('uq_event_processors_id'))
+    )
+    op.create_table('events',
+    sa.Column('type', sa.Enum('pipeline_state', 'data_sync', 'validation', 'security', 'system', 'user_action', 'resource_change', name='event_type'), nullable=False),
+    sa.Column('severity', sa.Enum('info', 'warning', 'error', 'critical', name='event_severity'), nullable=True),
+    sa.Column('category', sa.String(length=100), nullable=True),
+    sa.Column('subcategory', sa.String(length=100), nullable=True),
+    sa.Column('source', sa.String(length=100), nullable=False),
+    sa.Column('entity_type', sa.String(length=50), nullable=True),
+    sa.Column('entity_id', sa.UUID(), nullable=True),
+    sa.Column('message', sa.Text(), nullable=False),
+    sa.Column('details', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('correlation_id', sa.String(length=100), nullable=True),
+    sa.Column('parent_event_id', sa.UUID(), nullable=True),
+    sa.Column('tags', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('environment', sa.String(length=50), nullable=True),
+    sa.Column('component', sa.String(length=100), nullable=True),
+    sa.Column('version', sa.String(length=50), nullable=True),
+    sa.Column('processed', sa.Boolean(), nullable=True),
+    sa.Column('processed_at', sa.DateTime(), nullable=True),
+    sa.Column('processing_attempts', sa.Integer(), nullable=True),
+    sa.Column('error_details', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('retry_until', sa.DateTime(), nullable=True),
+    sa.Column('next_retry_at', sa.DateTime(), nullable=True),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('is_deleted', sa.Boolean(), nullable=True),
+    sa.Column('deleted_at', sa.DateTime(), nullable=True),
+    sa.Column('version_notes', sa.Text(), nullable=True),
+    sa.Column('previous_version', sa.UUID(), nullable=True),
+    sa.Column('audit_trail', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('last_audit_at', sa.DateTime(), nullable=True),
+    sa.Column('tenant_id', sa.UUID(), nullable=True),
+    sa.Column('meta_data', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('created_by', sa.UUID(), nullable=True),
+    sa.Column('updated_by', sa.UUID(), nullable=True),
+    sa.Column('deleted_by', sa.UUID(), nullable=True),
+    sa.Column('last_audit_by', sa.UUID(), nullable=True),
+    sa.CheckConstraint('processing_attempts >= 0', name='ck_processing_attempts_valid'),
+    sa.CheckConstraint('retry_until IS NULL OR retry_until > created_at', name='ck_retry_until_valid'),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], name=op.f('fk_events_created_by'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['deleted_by'], ['users.id'], name=op.f('fk_events_deleted_by'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['last_audit_by'], ['users.id'], name=op.f('fk_events_last_audit_by'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['parent_event_id'], ['events.id'], name=op.f('fk_events_parent_event_id')),
+    sa.ForeignKeyConstraint(['updated_by'], ['users.id'], name=op.f('fk_events_updated_by'), ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_events')),
+    sa.UniqueConstraint('id', name=op.f('uq_events_id'))
+    )
+    op.create_table('event_queue',
+    sa.Column('event_id', sa.UUID(), nullable=False),
+    sa.Column('priority', sa.Integer(), nullable=True),
+    sa.Column('status', sa.Enum('pending', 'processing', 'completed', 'failed', name='queue_status'), nullable=True),
+    sa.Column('processor_id', sa.UUID(), nullable=True),
+    sa.Column('scheduled_time', sa.DateTime(), nullable=True),
+    sa.Column('processing_started', sa.DateTime(), nullable=True),
+    sa.Column('processing_completed', sa.DateTime(), nullable=True),
+    sa.Column('lease_expires_at', sa.DateTime(), nullable=True),
+    sa.Column('attempt_count', sa.Integer(), nullable=True),
+    sa.Column('execution_time', sa.Float(), nullable=True),
+    sa.Column('memory_usage', sa.Float(), nullable=True),
+    sa.Column('error_log', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('is_deleted', sa.Boolean(), nullable=True),
+    sa.Column('deleted_at', sa.DateTime(), nullable=True),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('version_notes', sa.Text(), nullable=True),
+    sa.Column('previous_version', sa.UUID(), nullable=True),
+    sa.Column('audit_trail', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('last_audit_at', sa.DateTime(), nullable=True),
+    sa.Column('tenant_id', sa.UUID(), nullable=True),
+    sa.Column('tags', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('meta_data', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('created_by', sa.UUID(), nullable=True),
+    sa.Column('updated_by', sa.UUID(), nullable=True),
+    sa.Column('deleted_by', sa.UUID(), nullable=True),
+    sa.Column('last_audit_by', sa.UUID(), nullable=True),
+    sa.CheckConstraint('attempt_count >= 0', name='ck_attempt_count_valid'),
+    sa.CheckConstraint('execution_time >= 0 OR execution_time IS NULL', name='ck_execution_time_valid'),
+    sa.CheckConstraint('memory_usage >= 0 OR memory_usage IS NULL', name='ck_memory_usage_valid'),
+    sa.CheckConstraint('priority >= 0', name='ck_priority_valid'),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], name=op.f('fk_event_queue_created_by'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['deleted_by'], ['users.id'], name=op.f('fk_event_queue_deleted_by'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], name=op.f('fk_event_queue_event_id'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['last_audit_by'], ['users.id'], name=op.f('fk_event_queue_last_audit_by'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['processor_id'], ['event_processors.id'], name=op.f('fk_event_queue_processor_id')),
+    sa.ForeignKeyConstraint(['updated_by'], ['users.id'], name=op.f('fk_event_queue_updated_by'), ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_event_queue')),
+    sa.UniqueConstraint('id', name=op.f('uq_event_queue_id'))
+    )
+    op.create_index('ix_event_processors_active', 'event_processors', ['is_active'], unique=False)
+    op.create_index(op.f('ix_event_processors_created_at'), 'event_processors', ['created_at'], unique=False)
+    op.create_index(op.f('ix_event_processors_created_by'), 'event_processors', ['created_by'], unique=False)
+    op.create_index(op.f('ix_event_processors_tenant_id'), 'event_processors', ['tenant_id'], unique=False)
+    op.create_index('ix_event_processors_type', 'event_processors', ['event_type'], unique=False)
+    op.create_index('ix_events_correlation', 'events', ['correlation_id'], unique=False)
+    op.create_index(op.f('ix_events_created_at'), 'events', ['created_at'], unique=False)
+    op.create_index(op.f('ix_events_created_by'), 'events', ['created_by'], unique=False)
+    op.create_index('ix_events_entity', 'events', ['entity_type', 'entity_id'], unique=False)
+    op.create_index('ix_events_processing', 'events', ['processed', 'next_retry_at'], unique=False)
+    op.create_index(op.f('ix_events_tenant_id'), 'events', ['tenant_id'], unique=False)
+    op.create_index('ix_events_type_severity', 'events', ['type', 'severity'], unique=False)
+    op.create_index('ix_event_queue_claim', 'event_queue', [sa.text('priority DESC'), 'scheduled_time'], unique=False, postgresql_where=sa.text("status = 'pending'"))
+    op.create_index(op.f('ix_event_queue_created_at'), 'event_queue', ['created_at'], unique=False)
+    op.create_index(op.f('ix_event_queue_created_by'), 'event_queue', ['created_by'], unique=False)
+    op.create_index('ix_event_queue_lease', 'event_queue', ['lease_expires_at'], unique=False, postgresql_where=sa.text("status = 'processing'"))
+    op.create_index('ix_event_queue_scheduled', 'event_queue', ['scheduled_time'], unique=False)
+    op.create_index('ix_event_queue_status_priority', 'event_queue', ['status', 'priority'], unique=False)
+    op.create_index(op.f('ix_event_queue_tenant_id'), 'event_queue', ['tenant_id'], unique=False)
+    # ### end Alembic commands ###
+
+
+def downgrade() -> None:
+    op.drop_table('event_queue')
+    op.drop_table('events')
+    op.drop_table('event_processors')
+    sa.Enum(name='queue_status').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='event_severity').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='event_type').drop(op.get_bind(), checkfirst=True)
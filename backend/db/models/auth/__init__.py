@@ -1,7 +1,7 @@
 # backend/db/models/auth/__init__.py
 
 from .user import User, UserActivityLog, PasswordResetToken, ServiceAccount
-from .session import UserSession, SessionDevice, RefreshToken
+from .session import UserSession, SessionDevice, RefreshToken, revoked_tokens
 from .team import Team, TeamMember, TeamResource, TeamInvitation
 
 __all__ = [
@@ -12,6 +12,7 @@ __all__ = [
     'UserSession',
     'SessionDevice',
     'RefreshToken',
+    'revoked_tokens',
     'Team',
     'TeamMember',
     'TeamResource',
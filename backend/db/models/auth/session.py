@@ -1,12 +1,25 @@
 from datetime import datetime
 from sqlalchemy import (
     Column, String, DateTime, Boolean, ForeignKey, Index,
-    CheckConstraint, Integer
+    CheckConstraint, Integer, Table
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from ..core.base import BaseModel
 
+# Revoked access/refresh token ids, kept until the token itself expires
+revoked_tokens = Table(
+    'revoked_tokens',
+    BaseModel.metadata,
+    Column('jti', String(64), primary_key=True),
+    Column('user_id', UUID(as_uuid=True)),
+    Column('expires_at', DateTime, nullable=False),
+    Column('revoked_at', DateTime, nullable=False, default=datetime.utcnow),
+    Column('reason', String(255)),
+    Index('ix_revoked_tokens_expires_at', 'expires_at'),
+    Index('ix_revoked_tokens_revoked_at', 'revoked_at')
+)
+
 
 class UserSession(BaseModel):
     """Model for managing user authentication sessions."""
@@ -2,7 +2,7 @@ from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from sqlalchemy import (
     Column, String, DateTime, JSON, Enum, ForeignKey, Text,
-    Integer, Index, Boolean, CheckConstraint, Float
+    Integer, Index, Boolean, CheckConstraint, Float, text
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship, validates
@@ -61,7 +61,7 @@ class Event(BaseModel):
     related_events = relationship(
         "Event",
         backref="parent_event",
-        remote_side=[id]
+        remote_side="Event.id"
     )
 
     # Subscriptions that match this event
@@ -142,7 +142,7 @@ class EventSubscription(BaseModel):
     notification_count = Column(Integer, default=0)
 
     # Relationships
-    user = relationship("User", back_populates="event_subscriptions")
+    user = relationship("User", foreign_keys=[user_id])
     matched_events = relationship(
         "Event",
         secondary="event_subscription_matches",
@@ -317,6 +317,7 @@ class EventQueue(BaseModel):
     scheduled_time = Column(DateTime)
     processing_started = Column(DateTime)
     processing_completed = Column(DateTime)
+    lease_expires_at = Column(DateTime)  # Visibility timeout of a claimed item
     attempt_count = Column(Integer, default=0)
 
     # Performance tracking
@@ -331,6 +332,14 @@ class EventQueue(BaseModel):
     __table_args__ = (
         Index('ix_event_queue_status_priority', 'status', 'priority'),
         Index('ix_event_queue_scheduled', 'scheduled_time'),
+        Index(
+            'ix_event_queue_claim', text('priority DESC'), 'scheduled_time',
+            postgresql_where=text("status = 'pending'")
+        ),
+        Index(
+            'ix_event_queue_lease', 'lease_expires_at',
+            postgresql_where=text("status = 'processing'")
+        ),
         CheckConstraint(
             'priority >= 0',
             name='ck_priority_valid'
@@ -23,6 +23,24 @@ pipeline_tags = Table(
     Index('ix_pipeline_tags_tag', 'tag_id')
 )
 
+# Hourly per-status run aggregates, maintained on run completion
+pipeline_run_rollups = Table(
+    'pipeline_run_rollups',
+    BaseModel.metadata,
+    Column('pipeline_id', UUID(as_uuid=True),
+           ForeignKey('pipelines.id', ondelete='CASCADE'),
+           primary_key=True),
+    Column('bucket_start', DateTime, primary_key=True),
+    Column('status', String(20), primary_key=True),
+    Column('run_count', Integer, nullable=False, default=0),
+    Column('duration_count', Integer, nullable=False, default=0),
+    Column('duration_sum', Float, nullable=False, default=0.0),
+    Column('duration_min', Float),
+    Column('duration_max', Float),
+    Column('last_run_at', DateTime),
+    Index('ix_pipeline_run_rollups_bucket', 'bucket_start')
+)
+
 
 class Pipeline(BaseModel):
     """Model for managing data processing pipelines."""
@@ -107,6 +125,7 @@ class Pipeline(BaseModel):
         Index('ix_pipelines_status', 'status'),
         Index('ix_pipelines_mode', 'mode'),
         Index('ix_pipelines_owner', 'owner_id'),
+        Index('ix_pipelines_updated_keyset', 'updated_at', 'id'),
         UniqueConstraint('name', 'owner_id', name='uq_pipeline_name_owner'),
         CheckConstraint('progress >= 0 AND progress <= 100',
                        name='ck_progress_range'),
@@ -261,6 +280,8 @@ class PipelineRun(BaseModel):
     __table_args__ = (
         Index('ix_pipeline_runs_status', 'status'),
         Index('ix_pipeline_runs_pipeline', 'pipeline_id'),
+        Index('ix_pipeline_runs_created_keyset', 'created_at', 'id'),
+        Index('ix_pipeline_runs_pipeline_start', 'pipeline_id', 'start_time'),
         CheckConstraint('duration >= 0', name='ck_run_duration_positive'),
         CheckConstraint(
             'end_time IS NULL OR end_time >= start_time',
@@ -546,7 +567,7 @@ class PipelineLog(BaseModel):
     run = relationship('PipelineRun')
 
     __table_args__ = (
-        Index('ix_pipeline_logs_pipeline_timestamp', 'pipeline_id', 'timestamp'),
+        Index('ix_pipeline_logs_pipeline_timestamp', 'pipeline_id', 'timestamp', 'id'),
         Index('ix_pipeline_logs_level', 'level'),
         Index('ix_pipeline_logs_trace', 'trace_id'),
         {'extend_existing': True}
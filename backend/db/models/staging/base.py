@@ -129,6 +129,7 @@ class BaseStagedOutput(BaseModel):
         Index('ix_staged_outputs_status', 'status'),
         Index('ix_staged_outputs_component', 'component_type'),
         Index('ix_staged_outputs_stage', 'stage'),
+        Index('ix_staged_outputs_created_keyset', 'created_at', 'id'),
         CheckConstraint(
             'data_size >= 0',
             name='ck_data_size_non_negative'
@@ -1,17 +1,32 @@
 # backend/db/repository/auth.py
 
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, func
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import and_, or_, desc
 from typing import List, Dict, Any, Optional, Tuple
 from uuid import UUID
 from datetime import datetime, timedelta
 import logging
-from db.models.pipeline import (
+from db.models.data.pipeline import (
     Pipeline, PipelineStep, PipelineRun,
     PipelineStepRun, QualityGate, PipelineLog,
     PipelineTemplate, PipelineVersion
 )
 from sqlalchemy.exc import SQLAlchemyError
+from .metrics import run_metrics_statement, summarize_runs
+from .pagination import (
+    COUNT_EXACT,
+    COUNT_ESTIMATE,
+    COUNT_MODES,
+    COUNT_NONE,
+    KeysetPaginator,
+    Page,
+    count_cache,
+    explain_estimate_statement,
+    filter_fingerprint,
+    parse_estimate,
+    supports_estimates,
+    table_estimate_statement
+)
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +78,7 @@ class PipelineRepository:
 
             self.db_session.add(pipeline)
             self.db_session.commit()
+            count_cache.invalidate(Pipeline.__tablename__)
 
             return self._to_dict(pipeline)
 
@@ -137,6 +153,7 @@ class PipelineRepository:
 
             pipeline.updated_at = datetime.utcnow()
             self.db_session.commit()
+            count_cache.invalidate(Pipeline.__tablename__)
 
             return self._to_dict(pipeline)
 
@@ -169,6 +186,7 @@ class PipelineRepository:
 
             self.db_session.delete(pipeline)
             self.db_session.commit()
+            count_cache.invalidate(Pipeline.__tablename__)
             return True
 
         except SQLAlchemyError as e:
@@ -180,12 +198,17 @@ class PipelineRepository:
             self.db_session.rollback()
             raise
 
-    def list_pipelines(self, filters: Dict[str, Any], 
-                      page: int = 1, 
-                      page_size: int = 50) -> Tuple[List[Dict[str, Any]], int]:
-        """List pipelines with filtering and pagination"""
+    def list_pipelines(self, filters: Dict[str, Any],
+                      page_size: int = 50,
+                      cursor: Optional[str] = None,
+                      count_mode: str = COUNT_EXACT) -> Page:
+        """List pipelines with filtering and keyset pagination, most recently updated first"""
         try:
-            query = self.db_session.query(Pipeline)
+            # Steps and gates load in one query per page, not per pipeline
+            query = self.db_session.query(Pipeline).options(
+                selectinload(Pipeline.steps),
+                selectinload(Pipeline.quality_gates)
+            )
 
             # Apply filters
             if filters.get('status'):
@@ -203,16 +226,17 @@ class PipelineRepository:
                     )
                 )
 
-            # Get total count
-            total_count = query.count()
+            active_filters = {k: v for k, v in filters.items() if v}
+            fingerprint = filter_fingerprint(Pipeline.__tablename__, active_filters, 'updated_at')
+            paginator = KeysetPaginator(Pipeline.updated_at, Pipeline.id, fingerprint, page_size)
 
-            # Apply pagination
-            query = query.order_by(desc(Pipeline.updated_at))\
-                .offset((page - 1) * page_size)\
-                .limit(page_size)
+            total_count, estimated = self._page_count(
+                query, Pipeline.__tablename__, bool(active_filters), fingerprint, count_mode
+            )
 
-            pipelines = [self._to_dict(p) for p in query.all()]
-            return pipelines, total_count
+            page = paginator.page(paginator.apply(query, cursor).all(), total_count, estimated)
+            page.items = [self._to_dict(p) for p in page.items]
+            return page
 
         except SQLAlchemyError as e:
             self.logger.error(f"Database error listing pipelines: {str(e)}")
@@ -221,6 +245,33 @@ class PipelineRepository:
             self.logger.error(f"Error listing pipelines: {str(e)}")
             raise
 
+    def _page_count(self, query, table: str, filtered: bool,
+                    fingerprint: str, count_mode: str) -> Tuple[Optional[int], bool]:
+        """Total rows for a listing as (count, estimated); exact counts are cached"""
+        if count_mode not in COUNT_MODES:
+            raise ValueError(f"Unknown count mode: {count_mode}")
+        if count_mode == COUNT_NONE:
+            return None, False
+
+        dialect = self.db_session.get_bind().dialect
+        if count_mode == COUNT_ESTIMATE and supports_estimates(dialect.name):
+            if filtered:
+                result = self.db_session.connection().exec_driver_sql(
+                    *explain_estimate_statement(query.statement, dialect)
+                )
+            else:
+                result = self.db_session.execute(*table_estimate_statement(table))
+            estimate = parse_estimate(result.scalar())
+            if estimate is not None:
+                return estimate, True
+
+        cached = count_cache.get(table, fingerprint)
+        if cached is not None:
+            return cached, False
+        total_count = query.order_by(None).count()
+        count_cache.set(table, fingerprint, total_count)
+        return total_count, False
+
     def save_pipeline_state(self, pipeline_id: UUID, state: Dict[str, Any]) -> None:
         """Save pipeline state with optimistic locking"""
         try:
@@ -278,31 +329,17 @@ class PipelineRepository:
                            time_range: Optional[timedelta] = None) -> Dict[str, Any]:
         """Get pipeline performance metrics"""
         try:
-            # Base query
-            query = self.db_session.query(PipelineRun)\
-                .filter(PipelineRun.pipeline_id == pipeline_id)
-
-            # Apply time range if specified
-            if time_range:
-                start_time = datetime.utcnow() - time_range
-                query = query.filter(PipelineRun.start_time >= start_time)
-
-            # Calculate metrics
-            metrics = {
-                'total_runs': query.count(),
-                'successful_runs': query.filter(PipelineRun.status == 'completed').count(),
-                'failed_runs': query.filter(PipelineRun.status == 'failed').count(),
-                'average_duration': query.with_entities(
-                    func.avg(PipelineRun.end_time - PipelineRun.start_time)
-                ).scalar(),
-                'last_run': query.order_by(desc(PipelineRun.start_time)).first(),
-                'failure_rate': 0  # Calculated below
-            }
+            since = datetime.utcnow() - time_range if time_range else None
+            statement = run_metrics_statement(
+                pipeline_id, self.db_session.get_bind().dialect.name, since
+            )
 
-            if metrics['total_runs'] > 0:
-                metrics['failure_rate'] = (
-                    metrics['failed_runs'] / metrics['total_runs']
-                ) * 100
+            # Counts and durations aggregated in one grouped statement
+            metrics = summarize_runs(self.db_session.execute(statement).one())
+            metrics['failure_rate'] = (
+                (metrics['failed_runs'] / metrics['total_runs']) * 100
+                if metrics['total_runs'] > 0 else 0
+            )
 
             return metrics
 
@@ -326,18 +363,17 @@ class PipelineRepository:
             'status': pipeline.status,
             'version': pipeline.version,
             'config': pipeline.config,
-            'source_id': str(pipeline.source_id) if pipeline.source_id else None,
-            'target_id': str(pipeline.target_id) if pipeline.target_id else None,
-            'owner_id': str(pipeline.owner_id),
+            'source_id': str(pipeline.pipeline_source_id) if pipeline.pipeline_source_id else None,
+            'target_id': str(pipeline.pipeline_target_id) if pipeline.pipeline_target_id else None,
+            'owner_id': str(pipeline.owner_id) if pipeline.owner_id else None,
             'progress': pipeline.progress,
-            'current_step': pipeline.current_step,
             'steps': [
                 {
                     'id': str(step.id),
                     'name': step.name,
                     'type': step.type,
                     'config': step.config,
-                    'order': step.order,
+                    'order': step.pipeline_step_order,
                     'enabled': step.enabled
                 }
                 for step in pipeline.steps
@@ -468,6 +504,7 @@ class PipelineRepository:
             )
             self.db_session.add(log_entry)
             self.db_session.commit()
+            count_cache.invalidate(PipelineLog.__tablename__)
         except SQLAlchemyError as e:
             self.logger.error(f"Database error logging pipeline event: {str(e)}")
             self.db_session.rollback()
@@ -481,9 +518,10 @@ class PipelineRepository:
                          start_time: Optional[datetime] = None,
                          end_time: Optional[datetime] = None,
                          event_types: Optional[List[str]] = None,
-                         page: int = 1,
-                         page_size: int = 50) -> Tuple[List[Dict[str, Any]], int]:
-        """Get pipeline logs with filtering and pagination"""
+                         page_size: int = 50,
+                         cursor: Optional[str] = None,
+                         count_mode: str = COUNT_EXACT) -> Page:
+        """Get pipeline logs with filtering and keyset pagination, newest first"""
         try:
             query = self.db_session.query(PipelineLog)\
                 .filter(PipelineLog.pipeline_id == pipeline_id)
@@ -495,20 +533,31 @@ class PipelineRepository:
             if event_types:
                 query = query.filter(PipelineLog.event_type.in_(event_types))
 
-            total_count = query.count()
+            fingerprint = filter_fingerprint(
+                PipelineLog.__tablename__,
+                {
+                    'pipeline_id': pipeline_id,
+                    'start_time': start_time,
+                    'end_time': end_time,
+                    'event_types': sorted(event_types or [])
+                },
+                'timestamp'
+            )
+            paginator = KeysetPaginator(PipelineLog.timestamp, PipelineLog.id, fingerprint, page_size)
 
-            logs = query.order_by(desc(PipelineLog.timestamp))\
-                .offset((page - 1) * page_size)\
-                .limit(page_size)\
-                .all()
+            total_count, estimated = self._page_count(
+                query, PipelineLog.__tablename__, True, fingerprint, count_mode
+            )
 
-            return [{
+            page = paginator.page(paginator.apply(query, cursor).all(), total_count, estimated)
+            page.items = [{
                 'id': str(log.id),
                 'event_type': log.event_type,
                 'message': log.message,
                 'details': log.details,
                 'timestamp': log.timestamp.isoformat()
-            } for log in logs], total_count
+            } for log in page.items]
+            return page
 
         except SQLAlchemyError as e:
             self.logger.error(f"Database error getting pipeline logs: {str(e)}")
@@ -1,11 +1,29 @@
-from typing import TypeVar, Generic, Dict, List, Any, Optional, Tuple
+from typing import TypeVar, Generic, Dict, Any, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import func, select, update, delete, desc
+from sqlalchemy import func, select, update, delete
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import InstrumentedAttribute
 from datetime import datetime
 from uuid import UUID
 import logging
 
+from .pagination import (
+    COUNT_EXACT,
+    COUNT_MODES,
+    COUNT_NONE,
+    COUNT_ESTIMATE,
+    KeysetPaginator,
+    Page,
+    count_cache,
+    explain_estimate_statement,
+    filter_fingerprint,
+    parse_estimate,
+    supports_estimates,
+    table_estimate_statement
+)
+from ..routing import read_only
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
@@ -14,12 +32,14 @@ T = TypeVar('T')
 class BaseRepository(Generic[T]):
     """Base repository providing fundamental database operations."""
 
-    def __init__(self, db_session: AsyncSession):
+    def __init__(self, db_session: AsyncSession, write_behind: Optional[Any] = None):
         """
         Initialize repository with database session.
 
         Args:
             db_session: SQLAlchemy AsyncSession instance
+            write_behind: Optional WriteBehindBuffer for append-only records;
+                the process-wide buffer is used when omitted
 
         Raises:
             ValueError: If db_session is not an AsyncSession
@@ -29,12 +49,33 @@ class BaseRepository(Generic[T]):
                 f"db_session must be AsyncSession, got {type(db_session)}"
             )
         self._db_session = db_session
+        self._write_behind = write_behind
 
     @property
     def db_session(self) -> AsyncSession:
         """Get the current database session."""
         return self._db_session
 
+    @property
+    def write_behind(self):
+        """Buffer that persists append-only records in batches."""
+        if self._write_behind is None:
+            from .write_behind import get_write_behind
+            self._write_behind = get_write_behind()
+        return self._write_behind
+
+    async def append_after_commit(self, table: Any, row: Dict[str, Any]) -> None:
+        """
+        Buffer a record for a change that is already committed.
+
+        Failures are logged rather than raised, so a committed change is
+        never reported to the caller as failed.
+        """
+        try:
+            await self.write_behind.append(table, row)
+        except Exception as e:
+            logger.error(f"Failed to buffer {table.name} record: {str(e)}")
+
     async def set_session(self, session: AsyncSession) -> None:
         """
         Set a new database session.
@@ -69,6 +110,7 @@ class BaseRepository(Generic[T]):
             await self.db_session.flush()
             await self.db_session.commit()
             await self.db_session.refresh(instance)
+            count_cache.invalidate(model_class.__tablename__)
             logger.info(f"Created new {model_class.__name__} instance")
             return instance
         except Exception as e:
@@ -105,57 +147,131 @@ class BaseRepository(Generic[T]):
             logger.error(f"Error retrieving {model_class.__name__} by ID: {str(e)}")
             raise
 
+    @read_only
     async def list_all(
             self,
             model_class: T,
             filters: Optional[Dict[str, Any]] = None,
             sort_by: Optional[str] = None,
-            page: int = 1,
-            page_size: int = 50
-    ) -> Tuple[List[T], int]:
+            page_size: int = 50,
+            cursor: Optional[str] = None,
+            count_mode: str = COUNT_EXACT
+    ) -> Page:
         """
-        List instances with filtering, sorting and pagination.
+        List instances with filtering, sorting and keyset pagination.
+
+        Rows are ordered newest first on ``(sort_by, id)`` and each page
+        seeks past the previous one, so deep pages cost the same as the
+        first. Pass the returned ``next_cursor`` back to continue.
 
         Args:
             model_class: Model class to query
             filters: Optional filter criteria
-            sort_by: Optional sort field
-            page: Page number
+            sort_by: Optional sort field (defaults to created_at)
             page_size: Items per page
+            cursor: Continuation token from the previous page
+            count_mode: 'exact' (cached per filter set), 'estimate'
+                (planner statistics) or 'none'
 
         Returns:
-            Tuple of (items list, total count)
+            Page of items with continuation token and total count
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or was issued
+                for different filters or sort
         """
         try:
-            query = select(model_class)
-
-            # Apply filters
-            if filters:
-                for key, value in filters.items():
-                    if hasattr(model_class, key):
-                        query = query.where(getattr(model_class, key) == value)
+            query = self._apply_filters(select(model_class), model_class, filters)
 
-            # Get total count
-            count_result = await self.db_session.execute(
-                select(func.count()).select_from(query.subquery())
+            sort_column = self._sort_column(model_class, sort_by)
+            fingerprint = filter_fingerprint(
+                model_class.__tablename__, filters, sort_column.key
+            )
+            paginator = KeysetPaginator(
+                sort_column, model_class.id, fingerprint, page_size
             )
-            total_count = count_result.scalar_one()
-
-            # Apply sorting
-            if sort_by and hasattr(model_class, sort_by):
-                query = query.order_by(desc(getattr(model_class, sort_by)))
-
-            # Apply pagination
-            query = query.offset((page - 1) * page_size).limit(page_size)
 
-            result = await self.db_session.execute(query)
-            items = result.scalars().all()
+            total_count, estimated = await self._page_count(
+                model_class, query, filters, fingerprint, count_mode
+            )
 
-            return items, total_count
+            result = await self.db_session.execute(paginator.apply(query, cursor))
+            return paginator.page(result.scalars().all(), total_count, estimated)
         except Exception as e:
             logger.error(f"Error listing {model_class.__name__}: {str(e)}")
             raise
 
+    @staticmethod
+    def to_dict(instance: Any) -> Dict[str, Any]:
+        """Column values of a model instance, including inherited columns"""
+        return {
+            attribute.key: getattr(instance, attribute.key)
+            for attribute in sa_inspect(instance).mapper.column_attrs
+        }
+
+    @staticmethod
+    def _apply_filters(query: Any, model_class: T, filters: Optional[Dict[str, Any]]) -> Any:
+        if filters:
+            for key, value in filters.items():
+                if hasattr(model_class, key):
+                    query = query.where(getattr(model_class, key) == value)
+        return query
+
+    @staticmethod
+    def _sort_column(model_class: T, sort_by: Optional[str]) -> Any:
+        for name in (sort_by, 'created_at'):
+            if name and isinstance(getattr(model_class, name, None), InstrumentedAttribute):
+                return getattr(model_class, name)
+        return model_class.id
+
+    async def _page_count(
+            self,
+            model_class: T,
+            query: Any,
+            filters: Optional[Dict[str, Any]],
+            fingerprint: str,
+            count_mode: str
+    ) -> Tuple[Optional[int], bool]:
+        """Total rows for a listing as ``(count, estimated)``"""
+        if count_mode not in COUNT_MODES:
+            raise ValueError(f"Unknown count mode: {count_mode}")
+        if count_mode == COUNT_NONE:
+            return None, False
+
+        table = model_class.__tablename__
+        dialect = self._dialect()
+        if count_mode == COUNT_ESTIMATE and dialect is not None and supports_estimates(dialect.name):
+            if filters:
+                connection = await self.db_session.connection()
+                result = await connection.exec_driver_sql(
+                    *explain_estimate_statement(query, dialect)
+                )
+            else:
+                result = await self.db_session.execute(*table_estimate_statement(table))
+            estimate = parse_estimate(result.scalar())
+            if estimate is not None:
+                return estimate, True
+
+        cached = count_cache.get(table, fingerprint)
+        if cached is not None:
+            return cached, False
+        result = await self.db_session.execute(
+            select(func.count()).select_from(query.subquery())
+        )
+        total_count = result.scalar_one()
+        count_cache.set(table, fingerprint, total_count)
+        return total_count, False
+
+    def _dialect(self) -> Optional[Any]:
+        try:
+            return self.db_session.get_bind().dialect
+        except Exception:
+            return None
+
+    def _dialect_name(self) -> str:
+        dialect = self._dialect()
+        return dialect.name if dialect is not None else ''
+
     async def update(
             self,
             id: UUID,
@@ -185,6 +301,7 @@ class BaseRepository(Generic[T]):
 
                 await self.db_session.commit()
                 await self.db_session.refresh(instance)
+                count_cache.invalidate(model_class.__tablename__)
                 logger.info(f"Updated {model_class.__name__} instance {id}")
             return instance
         except Exception as e:
@@ -220,6 +337,7 @@ class BaseRepository(Generic[T]):
                     await self.db_session.delete(instance)
                     await self.db_session.commit()
 
+                count_cache.invalidate(model_class.__tablename__)
                 logger.info(
                     f"{'Soft' if soft_delete else 'Hard'} deleted "
                     f"{model_class.__name__} {id}"
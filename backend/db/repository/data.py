@@ -1,4 +1,4 @@
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Sequence, Tuple
 from datetime import datetime, timedelta
 from uuid import UUID
 from sqlalchemy import and_, or_, desc, func, select
@@ -6,6 +6,18 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from .base import BaseRepository
+from .metrics import (
+    DEFAULT_PERCENTILES,
+    FINISHED_RUN_STATUSES,
+    bucketed_runs,
+    rebuild_run_rollups_statements,
+    run_metrics_statement,
+    run_rollup_statement,
+    run_rollup_upsert,
+    summarize_runs
+)
+from .write_behind import pipeline_log_row
+from ..routing import analytic
 from ..models.data.sources import (
     DataSource, DatabaseSourceConfig, APISourceConfig,
     S3SourceConfig, StreamSourceConfig, FileSourceInfo,
@@ -25,9 +37,9 @@ logger = logging.getLogger(__name__)
 class DataRepository(BaseRepository[DataSource]):
     """Repository for managing data sources and pipeline operations."""
 
-    def __init__(self, db_session: AsyncSession):
+    def __init__(self, db_session: AsyncSession, write_behind: Optional[Any] = None):
         """Initialize with async session."""
-        super().__init__(db_session)
+        super().__init__(db_session, write_behind)
 
     # Data Source Management
     async def create_data_source(
@@ -261,12 +273,12 @@ class DataRepository(BaseRepository[DataSource]):
             run = await self.create(run_data, PipelineRun)
 
             # Log run creation
-            await self.create({
-                'pipeline_id': pipeline_id,
-                'event_type': 'run_started',
-                'message': f"Pipeline run {run.id} started",
-                'timestamp': datetime.utcnow()
-            }, PipelineLog)
+            await self.append_after_commit(PipelineLog.__table__, pipeline_log_row(
+                pipeline_id,
+                f"Pipeline run {run.id} started",
+                event_type='run_started',
+                run_id=run.id
+            ))
 
             return run
         except Exception as e:
@@ -281,27 +293,40 @@ class DataRepository(BaseRepository[DataSource]):
     ) -> None:
         """Update pipeline run status with metrics."""
         try:
-            run = await self.get_by_id(run_id, PipelineRun)
+            # Lock the row so concurrent finishers fold the run into its rollup once
+            run = (await self.db_session.execute(
+                select(PipelineRun)
+                .where(PipelineRun.id == run_id)
+                .with_for_update()
+                .execution_options(populate_existing=True)
+            )).scalar_one_or_none()
             if not run:
                 raise ValueError(f"Pipeline run not found: {run_id}")
 
+            already_finished = run.status in FINISHED_RUN_STATUSES
             run.status = status
-            if status in ['completed', 'failed']:
+            if status in FINISHED_RUN_STATUSES:
                 run.end_time = datetime.utcnow()
                 run.duration = (run.end_time - run.start_time).total_seconds()
 
             if metrics:
                 run.metrics = metrics
 
+            # Fold the finished run into its rollup in the same transaction
+            if status in FINISHED_RUN_STATUSES and not already_finished:
+                dialect_name = self._dialect_name()
+                await self.db_session.execute(run_rollup_upsert(run, dialect_name))
+
             await self.db_session.commit()
 
             # Log status update
-            await self.create({
-                'pipeline_id': run.pipeline_id,
-                'event_type': f"run_{status}",
-                'message': f"Pipeline run {run_id} {status}",
-                'timestamp': datetime.utcnow()
-            }, PipelineLog)
+            await self.append_after_commit(PipelineLog.__table__, pipeline_log_row(
+                run.pipeline_id,
+                f"Pipeline run {run_id} {status}",
+                level='ERROR' if status == 'failed' else 'INFO',
+                event_type=f"run_{status}",
+                run_id=run_id
+            ))
         except Exception as e:
             logger.error(f"Failed to update run status: {str(e)}")
             raise
@@ -324,42 +349,68 @@ class DataRepository(BaseRepository[DataSource]):
             logger.error(f"Failed to create quality check: {str(e)}")
             raise
 
+    @analytic
     async def get_pipeline_metrics(
             self,
             pipeline_id: UUID,
-            time_range: Optional[timedelta] = None
+            time_range: Optional[timedelta] = None,
+            bucket: Optional[str] = None,
+            use_rollups: bool = False,
+            percentiles: Sequence[float] = DEFAULT_PERCENTILES
     ) -> Dict[str, Any]:
-        """Get comprehensive pipeline metrics."""
+        """
+        Get comprehensive pipeline metrics.
+
+        Counts, duration aggregates and percentiles are computed in one
+        grouped statement rather than by loading runs. With ``use_rollups``
+        the figures come from the hourly rollup table instead, which stays
+        constant-cost however many runs a pipeline has (percentiles are not
+        available from rollups, and in-flight runs are not counted).
+
+        Args:
+            pipeline_id: Pipeline ID
+            time_range: Optional look-back window
+            bucket: Optional time bucket ('minute', 'hour', 'day', 'week', 'month')
+            use_rollups: Read from pipeline_run_rollups
+            percentiles: Duration percentiles to compute
+
+        Returns:
+            Metrics summary, with a per-bucket series when ``bucket`` is set
+        """
         try:
-            query = select(PipelineRun).where(
-                PipelineRun.pipeline_id == pipeline_id
-            )
+            dialect_name = self._dialect_name()
+            since = datetime.utcnow() - time_range if time_range else None
 
-            if time_range:
-                start_time = datetime.utcnow() - time_range
-                query = query.where(PipelineRun.start_time >= start_time)
+            def statement(time_bucket: Optional[str] = None):
+                if use_rollups:
+                    return run_rollup_statement(pipeline_id, dialect_name, since, time_bucket)
+                return run_metrics_statement(pipeline_id, dialect_name, since, time_bucket, percentiles)
 
-            result = await self.db_session.execute(query)
-            runs = result.scalars().all()
+            result = await self.db_session.execute(statement())
+            metrics = summarize_runs(result.one(), percentiles)
+            metrics['source'] = 'rollup' if use_rollups else 'live'
 
-            successful_runs = sum(1 for run in runs if run.status == 'completed')
-            failed_runs = sum(1 for run in runs if run.status == 'failed')
-            total_duration = sum(
-                (run.duration or 0) for run in runs if run.duration is not None
-            )
+            if bucket:
+                result = await self.db_session.execute(statement(bucket))
+                metrics['buckets'] = bucketed_runs(result.all(), percentiles)
 
-            return {
-                'total_runs': len(runs),
-                'successful_runs': successful_runs,
-                'failed_runs': failed_runs,
-                'success_rate': (successful_runs / len(runs)) * 100 if runs else 0,
-                'average_duration': total_duration / len(runs) if runs else 0,
-                'last_run': max(runs, key=lambda r: r.start_time).start_time if runs else None
-            }
+            return metrics
         except Exception as e:
             logger.error(f"Error getting pipeline metrics: {str(e)}")
             raise
 
+    async def rebuild_run_rollups(self, pipeline_id: Optional[UUID] = None) -> None:
+        """Recompute run rollups from pipeline_runs, for backfill or repair."""
+        try:
+            dialect_name = self._dialect_name()
+            for statement in rebuild_run_rollups_statements(dialect_name, pipeline_id):
+                await self.db_session.execute(statement)
+            await self.db_session.commit()
+        except Exception as e:
+            await self.db_session.rollback()
+            logger.error(f"Failed to rebuild run rollups: {str(e)}")
+            raise
+
     async def _create_version_snapshot(self, pipeline: Pipeline) -> None:
         """Create version snapshot of pipeline state."""
         try:
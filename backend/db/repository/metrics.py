@@ -0,0 +1,335 @@
+# backend/db/repository/metrics.py
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from ..models.data.pipeline import PipelineRun, pipeline_run_rollups
+from ..models.staging.base import BaseStagedOutput
+
+BUCKETS = ('minute', 'hour', 'day', 'week', 'month')
+ROLLUP_BUCKETS = ('hour', 'day', 'week', 'month')
+RUN_STATUSES = ('running', 'completed', 'failed', 'cancelled')
+FINISHED_RUN_STATUSES = ('completed', 'failed', 'cancelled')
+DEFAULT_PERCENTILES = (0.5, 0.95, 0.99)
+
+_SQLITE_BUCKET_FORMATS = {
+    'minute': '%Y-%m-%d %H:%M:00',
+    'hour': '%Y-%m-%d %H:00:00',
+    'day': '%Y-%m-%d 00:00:00',
+    'month': '%Y-%m-01 00:00:00'
+}
+
+
+def time_bucket(column: Any, bucket: str, dialect_name: str) -> Any:
+    """Truncate a timestamp column to ``bucket`` in SQL"""
+    if bucket not in BUCKETS:
+        raise ValueError(f"Unsupported time bucket: {bucket}")
+    if dialect_name == 'postgresql':
+        return func.date_trunc(bucket, column)
+    if bucket == 'week':
+        # Monday-based weeks, matching date_trunc
+        return func.strftime('%Y-%m-%d 00:00:00', column, 'weekday 0', '-6 days')
+    return func.strftime(_SQLITE_BUCKET_FORMATS[bucket], column)
+
+
+def percentile_columns(
+        column: Any,
+        percentiles: Sequence[float],
+        dialect_name: str,
+        prefix: str
+) -> List[Any]:
+    """Continuous percentiles as ordered-set aggregates (PostgreSQL only)"""
+    if dialect_name != 'postgresql':
+        return []
+    return [
+        func.percentile_cont(q).within_group(column).label(f"{prefix}_p{_percent(q)}")
+        for q in percentiles
+    ]
+
+
+def _percent(q: float) -> str:
+    return f"{q * 100:g}".replace('.', '_')
+
+
+def _bucket_key(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+
+def run_metrics_statement(
+        pipeline_id: Any,
+        dialect_name: str,
+        since: Optional[datetime] = None,
+        bucket: Optional[str] = None,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES
+) -> Any:
+    """
+    One grouped statement over ``pipeline_runs``: per-status counts,
+    duration sum/min/max and percentiles, optionally per time bucket
+    """
+    columns = [
+        func.count().label('total_runs'),
+        *[
+            func.count().filter(PipelineRun.status == status).label(f"{status}_runs")
+            for status in RUN_STATUSES
+        ],
+        func.count(PipelineRun.duration).label('duration_count'),
+        func.coalesce(func.sum(PipelineRun.duration), 0.0).label('duration_sum'),
+        func.min(PipelineRun.duration).label('duration_min'),
+        func.max(PipelineRun.duration).label('duration_max'),
+        func.max(PipelineRun.start_time).label('last_run'),
+        *percentile_columns(PipelineRun.duration, percentiles, dialect_name, 'duration')
+    ]
+    conditions = [PipelineRun.pipeline_id == pipeline_id]
+    if since is not None:
+        conditions.append(PipelineRun.start_time >= since)
+
+    if bucket is None:
+        return select(*columns).where(and_(*conditions))
+    bucket_column = time_bucket(PipelineRun.start_time, bucket, dialect_name).label('bucket')
+    return select(bucket_column, *columns)\
+        .where(and_(*conditions))\
+        .group_by(bucket_column)\
+        .order_by(bucket_column)
+
+
+def run_rollup_statement(
+        pipeline_id: Any,
+        dialect_name: str,
+        since: Optional[datetime] = None,
+        bucket: Optional[str] = None
+) -> Any:
+    """The same figures as ``run_metrics_statement`` read from hourly rollups"""
+    if bucket is not None and bucket not in ROLLUP_BUCKETS:
+        raise ValueError(f"Rollups are hourly; cannot bucket by {bucket}")
+    rollup = pipeline_run_rollups.c
+    columns = [
+        func.coalesce(func.sum(rollup.run_count), 0).label('total_runs'),
+        *[
+            func.coalesce(
+                func.sum(rollup.run_count).filter(rollup.status == status), 0
+            ).label(f"{status}_runs")
+            for status in RUN_STATUSES
+        ],
+        func.coalesce(func.sum(rollup.duration_count), 0).label('duration_count'),
+        func.coalesce(func.sum(rollup.duration_sum), 0.0).label('duration_sum'),
+        func.min(rollup.duration_min).label('duration_min'),
+        func.max(rollup.duration_max).label('duration_max'),
+        func.max(rollup.last_run_at).label('last_run')
+    ]
+    conditions = [rollup.pipeline_id == pipeline_id]
+    if since is not None:
+        conditions.append(rollup.bucket_start >= since)
+
+    if bucket is None:
+        return select(*columns).where(and_(*conditions))
+    bucket_column = time_bucket(rollup.bucket_start, bucket, dialect_name).label('bucket')
+    return select(bucket_column, *columns)\
+        .where(and_(*conditions))\
+        .group_by(bucket_column)\
+        .order_by(bucket_column)
+
+
+def summarize_runs(row: Any, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, Any]:
+    """Dashboard figures from one aggregate row"""
+    data = row._mapping
+    total = data['total_runs'] or 0
+    successful = data['completed_runs'] or 0
+    duration_count = data['duration_count'] or 0
+    last_run = data['last_run']
+    if isinstance(last_run, str):
+        last_run = datetime.fromisoformat(last_run)
+    return {
+        'total_runs': total,
+        'successful_runs': successful,
+        'failed_runs': data['failed_runs'] or 0,
+        'success_rate': (successful / total) * 100 if total else 0,
+        'average_duration': data['duration_sum'] / duration_count if duration_count else 0,
+        'last_run': last_run,
+        'status_breakdown': {status: data[f"{status}_runs"] or 0 for status in RUN_STATUSES},
+        'duration': {
+            'min': data['duration_min'],
+            'max': data['duration_max'],
+            **{
+                f"p{_percent(q)}": data.get(f"duration_p{_percent(q)}")
+                for q in percentiles
+            }
+        }
+    }
+
+
+def bucketed_runs(rows: Iterable[Any], percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> List[Dict[str, Any]]:
+    return [
+        {'bucket': _bucket_key(row._mapping['bucket']), **summarize_runs(row, percentiles)}
+        for row in rows
+    ]
+
+
+def output_metrics_statement(
+        pipeline_id: Any,
+        dialect_name: str,
+        component_type: Optional[Any] = None,
+        since: Optional[datetime] = None,
+        bucket: Optional[str] = None,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES
+) -> Any:
+    """
+    One statement grouped by component type and status (and optionally
+    time bucket) with counts, processing-time and error aggregates
+    """
+    group_columns = [
+        BaseStagedOutput.component_type.label('component_type'),
+        BaseStagedOutput.status.label('status')
+    ]
+    if bucket is not None:
+        group_columns.insert(
+            0, time_bucket(BaseStagedOutput.created_at, bucket, dialect_name).label('bucket')
+        )
+
+    conditions = [BaseStagedOutput.pipeline_id == pipeline_id]
+    if component_type is not None:
+        conditions.append(BaseStagedOutput.component_type == component_type)
+    if since is not None:
+        conditions.append(BaseStagedOutput.created_at >= since)
+
+    return select(
+        *group_columns,
+        func.count().label('output_count'),
+        func.coalesce(func.sum(BaseStagedOutput.processing_time), 0.0).label('processing_time_sum'),
+        func.count(BaseStagedOutput.processing_time).label('processing_time_count'),
+        func.coalesce(func.sum(BaseStagedOutput.error_count), 0).label('error_sum'),
+        func.coalesce(func.sum(BaseStagedOutput.data_size), 0).label('data_size_sum'),
+        *percentile_columns(BaseStagedOutput.processing_time, percentiles, dialect_name, 'processing_time')
+    ).where(and_(*conditions)).group_by(*group_columns).order_by(*group_columns)
+
+
+def summarize_outputs(rows: Iterable[Any], percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, Any]:
+    """Fold the grouped output rows into totals and breakdowns"""
+    total = processing_time_sum = error_sum = data_size = 0
+    status_counts: Dict[str, int] = {}
+    components: Dict[str, Dict[str, Any]] = {}
+    buckets: Dict[str, Dict[str, Any]] = {}
+
+    for row in rows:
+        data = row._mapping
+        status = _enum_value(data['status'])
+        component = _enum_value(data['component_type'])
+        count = data['output_count']
+
+        total += count
+        processing_time_sum += data['processing_time_sum'] or 0
+        error_sum += data['error_sum'] or 0
+        data_size += data['data_size_sum'] or 0
+        status_counts[status] = status_counts.get(status, 0) + count
+
+        group = components.setdefault(component, {'total': 0, 'status_distribution': {}, 'error_count': 0})
+        group['total'] += count
+        group['error_count'] += data['error_sum'] or 0
+        group['status_distribution'][status] = group['status_distribution'].get(status, 0) + count
+        processing = {
+            f"p{_percent(q)}": data[f"processing_time_p{_percent(q)}"]
+            for q in percentiles if f"processing_time_p{_percent(q)}" in data
+        }
+        if processing:
+            group.setdefault('processing_time', {})[status] = processing
+
+        if 'bucket' in data:
+            key = _bucket_key(data['bucket'])
+            entry = buckets.setdefault(key, {'bucket': key, 'total': 0, 'status_distribution': {}})
+            entry['total'] += count
+            entry['status_distribution'][status] = entry['status_distribution'].get(status, 0) + count
+
+    summary = {
+        'total_outputs': total,
+        'status_distribution': status_counts,
+        'component_breakdown': components,
+        'average_processing_time': processing_time_sum / total if total else 0,
+        'error_rate': error_sum / total if total else 0,
+        'total_data_size': data_size
+    }
+    if buckets:
+        summary['buckets'] = list(buckets.values())
+    return summary
+
+
+def _enum_value(value: Any) -> Any:
+    return getattr(value, 'value', value)
+
+
+def run_rollup_upsert(run: Any, dialect_name: str) -> Any:
+    """
+    Fold one finished run into its hourly rollup row
+
+    Counts and sums are added, min/max widened; the conflict target is the
+    ``(pipeline_id, bucket_start, status)`` primary key, so concurrent
+    completions in the same hour merge instead of racing.
+    """
+    bucket_start = run.start_time.replace(minute=0, second=0, microsecond=0)
+    duration = run.duration
+    values = {
+        'pipeline_id': run.pipeline_id,
+        'bucket_start': bucket_start,
+        'status': run.status,
+        'run_count': 1,
+        'duration_count': 1 if duration is not None else 0,
+        'duration_sum': duration or 0.0,
+        'duration_min': duration,
+        'duration_max': duration,
+        'last_run_at': run.start_time
+    }
+    dialect = postgresql if dialect_name == 'postgresql' else sqlite
+    least, greatest = (func.least, func.greatest) if dialect_name == 'postgresql' else (func.min, func.max)
+
+    statement = dialect.insert(pipeline_run_rollups).values(**values)
+    current, incoming = pipeline_run_rollups.c, statement.excluded
+    return statement.on_conflict_do_update(
+        index_elements=['pipeline_id', 'bucket_start', 'status'],
+        set_={
+            'run_count': current.run_count + incoming.run_count,
+            'duration_count': current.duration_count + incoming.duration_count,
+            'duration_sum': current.duration_sum + incoming.duration_sum,
+            'duration_min': least(
+                func.coalesce(current.duration_min, incoming.duration_min),
+                func.coalesce(incoming.duration_min, current.duration_min)
+            ),
+            'duration_max': greatest(
+                func.coalesce(current.duration_max, incoming.duration_max),
+                func.coalesce(incoming.duration_max, current.duration_max)
+            ),
+            'last_run_at': greatest(current.last_run_at, incoming.last_run_at)
+        }
+    )
+
+
+def rebuild_run_rollups_statements(dialect_name: str, pipeline_id: Optional[Any] = None) -> List[Any]:
+    """Delete and recompute rollups from ``pipeline_runs`` (backfill/repair)"""
+    rollup = pipeline_run_rollups
+    delete = rollup.delete()
+    conditions = [PipelineRun.status.in_(FINISHED_RUN_STATUSES)]
+    if pipeline_id is not None:
+        delete = delete.where(rollup.c.pipeline_id == pipeline_id)
+        conditions.append(PipelineRun.pipeline_id == pipeline_id)
+
+    bucket = time_bucket(PipelineRun.start_time, 'hour', dialect_name)
+    aggregate = select(
+        PipelineRun.pipeline_id,
+        bucket,
+        PipelineRun.status,
+        func.count(),
+        func.count(PipelineRun.duration),
+        func.coalesce(func.sum(PipelineRun.duration), 0.0),
+        func.min(PipelineRun.duration),
+        func.max(PipelineRun.duration),
+        func.max(PipelineRun.start_time)
+    ).where(and_(*conditions)).group_by(PipelineRun.pipeline_id, bucket, PipelineRun.status)
+
+    insert = rollup.insert().from_select(
+        ['pipeline_id', 'bucket_start', 'status', 'run_count', 'duration_count',
+         'duration_sum', 'duration_min', 'duration_max', 'last_run_at'],
+        aggregate
+    )
+    return [delete, insert]
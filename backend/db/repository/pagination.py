@@ -0,0 +1,261 @@
+# backend/db/repository/pagination.py
+
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import asc, desc, text, tuple_
+
+COUNT_EXACT = 'exact'
+COUNT_ESTIMATE = 'estimate'
+COUNT_NONE = 'none'
+COUNT_MODES = (COUNT_EXACT, COUNT_ESTIMATE, COUNT_NONE)
+
+
+class InvalidCursorError(ValueError):
+    """Continuation token is malformed or belongs to another query"""
+
+
+@dataclass
+class Page:
+    """One page of a keyset-paginated listing"""
+    items: List[Any]
+    next_cursor: Optional[str] = None
+    total_count: Optional[int] = None
+    count_estimated: bool = False
+    page_size: int = 0
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+    def to_dict(self, items_key: str = 'items') -> Dict[str, Any]:
+        return {
+            items_key: self.items,
+            'next_cursor': self.next_cursor,
+            'total_count': self.total_count,
+            'count_estimated': self.count_estimated,
+            'page_size': self.page_size
+        }
+
+
+def filter_fingerprint(table: str, filters: Optional[Dict[str, Any]], sort_key: str = '') -> str:
+    """Stable digest of a table, its filters and sort key"""
+    payload = json.dumps(
+        [table, sort_key, sorted((filters or {}).items())],
+        default=str,
+        separators=(',', ':')
+    )
+    return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
+
+def _dump_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {'dt': value.isoformat()}
+    if isinstance(value, date):
+        return {'d': value.isoformat()}
+    if isinstance(value, UUID):
+        return {'uuid': str(value)}
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _load_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if 'dt' in value:
+            return datetime.fromisoformat(value['dt'])
+        if 'd' in value:
+            return date.fromisoformat(value['d'])
+        if 'uuid' in value:
+            return UUID(value['uuid'])
+    return value
+
+
+def encode_cursor(values: Sequence[Any], fingerprint: str) -> str:
+    """Opaque, URL-safe continuation token for the last row of a page"""
+    payload = json.dumps(
+        {'k': [_dump_value(v) for v in values], 'f': fingerprint},
+        separators=(',', ':')
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, fingerprint: str) -> List[Any]:
+    """Key values from a token produced by ``encode_cursor`` for the same query"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values = [_load_value(v) for v in payload['k']]
+        token_fingerprint = payload['f']
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid pagination cursor: {str(e)}")
+    if token_fingerprint != fingerprint:
+        raise InvalidCursorError("Pagination cursor does not match the requested filters or sort")
+    return values
+
+
+class KeysetPaginator:
+    """
+    Keyset (seek) pagination on a ``(sort_key, id)`` tuple
+
+    Pages are fetched with ``WHERE (sort_key, id) < (:last_sort, :last_id)``
+    ordered by the same tuple, so a composite index on it serves every page
+    with an index range scan and the cost does not grow with page depth as
+    ``OFFSET`` does. One extra row is fetched to tell whether a next page
+    exists. The sort key should be non-null.
+    """
+
+    def __init__(
+            self,
+            sort_column: Any,
+            id_column: Any,
+            fingerprint: str,
+            page_size: int,
+            descending: bool = True
+    ):
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+        self.sort_column = sort_column
+        self.id_column = id_column
+        self.fingerprint = fingerprint
+        self.page_size = page_size
+        self.descending = descending
+
+    def apply(self, statement: Any, cursor: Optional[str] = None) -> Any:
+        """Seek past ``cursor`` and order/limit a ``Select`` or legacy ``Query``"""
+        key = tuple_(self.sort_column, self.id_column)
+        if cursor:
+            last_sort, last_id = decode_cursor(cursor, self.fingerprint)
+            bound = tuple_(last_sort, last_id)
+            statement = _where(statement, key < bound if self.descending else key > bound)
+
+        direction = desc if self.descending else asc
+        return statement.order_by(
+            direction(self.sort_column), direction(self.id_column)
+        ).limit(self.page_size + 1)
+
+    def page(
+            self,
+            rows: Sequence[Any],
+            total_count: Optional[int] = None,
+            count_estimated: bool = False
+    ) -> Page:
+        """Trim the look-ahead row and build the continuation token"""
+        rows = list(rows)
+        next_cursor = None
+        if len(rows) > self.page_size:
+            rows = rows[:self.page_size]
+            last = rows[-1]
+            next_cursor = encode_cursor(
+                [getattr(last, self.sort_column.key), getattr(last, self.id_column.key)],
+                self.fingerprint
+            )
+        return Page(rows, next_cursor, total_count, count_estimated, self.page_size)
+
+
+def _where(statement: Any, clause: Any) -> Any:
+    # Select has .where, legacy Query has .filter
+    return statement.where(clause) if hasattr(statement, 'where') else statement.filter(clause)
+
+
+class CountCache:
+    """
+    TTL cache of exact counts keyed by table and filter fingerprint
+
+    Listings ask for the same filtered count on every page; caching it
+    turns all but the first page into a single index seek. Writes through
+    the repositories invalidate every entry for their table.
+    """
+
+    def __init__(self, ttl: float = 30.0, max_entries: int = 1024, clock=time.monotonic):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries: 'OrderedDict[Tuple[str, str], Tuple[int, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, table: str, fingerprint: str) -> Optional[int]:
+        with self._lock:
+            entry = self._entries.get((table, fingerprint))
+            if entry is None or entry[1] <= self.clock():
+                if entry is not None:
+                    del self._entries[(table, fingerprint)]
+                self.misses += 1
+                return None
+            self._entries.move_to_end((table, fingerprint))
+            self.hits += 1
+            return entry[0]
+
+    def set(self, table: str, fingerprint: str, count: int) -> None:
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[(table, fingerprint)] = (count, self.clock() + self.ttl)
+            self._entries.move_to_end((table, fingerprint))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, table: Optional[str] = None) -> None:
+        with self._lock:
+            if table is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[0] == table]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+count_cache = CountCache(ttl=float(os.getenv('PAGINATION_COUNT_CACHE_TTL', '30')))
+
+
+def table_estimate_statement(table: str) -> Tuple[Any, Dict[str, Any]]:
+    """Planner row estimate for a whole table (``pg_class.reltuples``)"""
+    return (
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+        {'table': table}
+    )
+
+
+def explain_estimate_statement(statement: Any, dialect: Any) -> Tuple[str, Any]:
+    """
+    Driver-level ``EXPLAIN`` of a filtered query, read for the planner's
+    row estimate; run it with ``exec_driver_sql``
+    """
+    compiled = statement.compile(dialect=dialect)
+    params = compiled.params
+    if dialect.positional:
+        params = tuple(params[name] for name in compiled.positiontup)
+    return f"EXPLAIN (FORMAT JSON) {compiled}", params
+
+
+def parse_estimate(value: Any) -> Optional[int]:
+    """Row count from a reltuples scalar or an EXPLAIN JSON document"""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        # reltuples is -1 (or 0 on older servers) before the first ANALYZE
+        return int(value) if value > 0 else None
+    if isinstance(value, (str, bytes)):
+        value = json.loads(value)
+    try:
+        return int(value[0]['Plan']['Plan Rows'])
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
+def supports_estimates(dialect_name: str) -> bool:
+    return dialect_name == 'postgresql'
@@ -0,0 +1,130 @@
+from typing import Optional, List, Tuple, AsyncIterator
+from datetime import datetime
+from uuid import UUID
+import logging
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .base import BaseRepository
+from ..models.auth.session import revoked_tokens
+
+logger = logging.getLogger(__name__)
+
+
+class TokenRevocationRepository(BaseRepository):
+    """
+    Revoked token ids in ``revoked_tokens``.
+
+    Rows live until the token's own expiry and are purged afterwards, so
+    the table only ever holds revocations that can still matter.
+    """
+
+    table = revoked_tokens
+
+    def __init__(self, db_session: AsyncSession):
+        super().__init__(db_session)
+
+    async def revoke(
+            self,
+            jti: str,
+            expires_at: datetime,
+            user_id: Optional[UUID] = None,
+            reason: Optional[str] = None
+    ) -> bool:
+        """
+        Record a revocation; revoking the same token again is a no-op.
+
+        Returns:
+            True if the token was not already revoked
+        """
+        values = {
+            'jti': jti,
+            'user_id': user_id,
+            'expires_at': expires_at,
+            'revoked_at': datetime.utcnow(),
+            'reason': reason
+        }
+        dialect_name = self._dialect_name()
+        if dialect_name in ('postgresql', 'sqlite'):
+            dialect = postgresql if dialect_name == 'postgresql' else sqlite
+            statement = dialect.insert(self.table).values(**values).on_conflict_do_nothing(
+                index_elements=['jti']
+            )
+        else:
+            statement = insert(self.table).values(**values)
+
+        try:
+            result = await self.db_session.execute(statement)
+            await self.db_session.commit()
+            return result.rowcount != 0
+        except Exception as e:
+            await self.db_session.rollback()
+            logger.error(f"Failed to revoke token {jti}: {str(e)}")
+            raise
+
+    async def is_revoked(self, jti: str) -> bool:
+        t = self.table
+        result = await self.db_session.execute(
+            select(t.c.jti).where(t.c.jti == jti, t.c.expires_at > datetime.utcnow())
+        )
+        return result.first() is not None
+
+    async def revoked_since(self, since: datetime) -> List[Tuple[str, datetime]]:
+        """Unexpired revocations recorded after ``since``, oldest first."""
+        t = self.table
+        result = await self.db_session.execute(
+            select(t.c.jti, t.c.revoked_at)
+            .where(t.c.revoked_at > since, t.c.expires_at > datetime.utcnow())
+            .order_by(t.c.revoked_at)
+        )
+        return [(row.jti, row.revoked_at) for row in result]
+
+    async def active_jtis(self, batch_size: int = 10000) -> AsyncIterator[List[str]]:
+        """Every unexpired revoked token id, in keyset-paginated batches."""
+        t = self.table
+        now = datetime.utcnow()
+        last: Optional[str] = None
+        while True:
+            query = select(t.c.jti).where(t.c.expires_at > now)
+            if last is not None:
+                query = query.where(t.c.jti > last)
+            result = await self.db_session.execute(query.order_by(t.c.jti).limit(batch_size))
+            batch = list(result.scalars())
+            if batch:
+                yield batch
+            if len(batch) < batch_size:
+                return
+            last = batch[-1]
+
+    async def purge_expired(self, batch_size: int = 1000, max_batches: Optional[int] = None) -> int:
+        """
+        Delete expired revocations in bounded batches, each committed on
+        its own so the purge never holds long locks.
+
+        Returns:
+            Number of rows deleted
+        """
+        t = self.table
+        deleted = 0
+        batches = 0
+        try:
+            while max_batches is None or batches < max_batches:
+                expired = (
+                    select(t.c.jti)
+                    .where(t.c.expires_at <= datetime.utcnow())
+                    .limit(batch_size)
+                    .scalar_subquery()
+                )
+                result = await self.db_session.execute(delete(t).where(t.c.jti.in_(expired)))
+                await self.db_session.commit()
+                batches += 1
+                deleted += result.rowcount
+                if result.rowcount < batch_size:
+                    break
+            return deleted
+        except Exception as e:
+            await self.db_session.rollback()
+            logger.error(f"Failed to purge expired revocations: {str(e)}")
+            raise
@@ -1,14 +1,19 @@
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, AsyncIterator, Sequence, Tuple
 from datetime import datetime, timedelta
 from uuid import UUID
+import time
 import uuid
-from sqlalchemy import and_, or_, desc, func, select
+from sqlalchemy import and_, or_, desc, func, select, update, delete
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from core.messaging.event_types import ComponentType
 from .base import BaseRepository
-from ..models.staging.base import BaseStagedOutput
+from .metrics import DEFAULT_PERCENTILES, output_metrics_statement, summarize_outputs
+from .pagination import count_cache
+from .write_behind import processing_history_row
+from ..routing import analytic, read_only
+from ..models.staging.base import BaseStagedOutput, ProcessingStatus, StagingProcessingHistory
 from ..models.staging.processing import (
     StagedMonitoringOutput,
     StagedQualityOutput,
@@ -34,8 +39,8 @@ class StagingRepository(BaseRepository[BaseStagedOutput]):
     components with comprehensive tracking and validation.
     """
 
-    def __init__(self, db_session: AsyncSession):
-        super().__init__(db_session)
+    def __init__(self, db_session: AsyncSession, write_behind: Optional[Any] = None):
+        super().__init__(db_session, write_behind)
 
     async def create_staged_output(
             self,
@@ -227,6 +232,7 @@ class StagingRepository(BaseRepository[BaseStagedOutput]):
             logger.error(f"Failed to create staged output: {str(e)}", exc_info=True)
             raise
 
+    @read_only
     async def get_pipeline_outputs(
         self,
         pipeline_id: UUID,
@@ -312,111 +318,234 @@ class StagingRepository(BaseRepository[BaseStagedOutput]):
             logger.error(f"Failed to update output status: {str(e)}")
             raise
 
+        # The status change is committed; a failed history append must not undo that
+        try:
+            await self.record_processing_event(
+                output_id,
+                'status_changed',
+                status=status,
+                details={'status': str(status), 'metrics': metrics},
+                error_details={'error': error} if error else None
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to record output status change: {str(e)}")
+
+    async def record_processing_event(
+            self,
+            output_id: UUID,
+            event_type: str,
+            status: Optional[Any] = None,
+            **fields: Any
+    ) -> None:
+        """
+        Append a processing history entry through the write-behind buffer.
+
+        The entry is persisted with the next batched flush rather than in
+        its own transaction; see WriteBehindBuffer for the guarantees.
+
+        Args:
+            output_id: Staged output ID
+            event_type: History event type
+            status: Optional ProcessingStatus recorded with the entry
+            **fields: Further processing_history_row fields
+        """
+        await self.write_behind.append(
+            StagingProcessingHistory.__table__,
+            processing_history_row(
+                output_id,
+                event_type,
+                status=status if isinstance(status, ProcessingStatus) else None,
+                **fields
+            )
+        )
+
+    @analytic
     async def get_output_metrics(
         self,
         pipeline_id: UUID,
         output_type: Optional[str] = None,
-        time_range: Optional[timedelta] = None
+        time_range: Optional[timedelta] = None,
+        bucket: Optional[str] = None,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES
     ) -> Dict[str, Any]:
         """
         Get comprehensive metrics for staged outputs.
 
+        Aggregation runs in a single statement grouped by component type
+        and status, so only the group rows cross the wire.
+
         Args:
             pipeline_id: Pipeline ID
             output_type: Optional output type filter
             time_range: Optional time range
+            bucket: Optional time bucket ('minute', 'hour', 'day', 'week', 'month')
+            percentiles: Processing-time percentiles per group (PostgreSQL)
 
         Returns:
             Dictionary of metrics
         """
         try:
-            query = select(BaseStagedOutput).where(
-                BaseStagedOutput.pipeline_id == pipeline_id
+            start_time = datetime.utcnow() - time_range if time_range else None
+            query = output_metrics_statement(
+                pipeline_id,
+                self._dialect_name(),
+                component_type=output_type,
+                since=start_time,
+                bucket=bucket,
+                percentiles=percentiles
             )
 
-            if output_type:
-                query = query.where(BaseStagedOutput.component_type == output_type)
-            if time_range:
-                start_time = datetime.utcnow() - time_range
-                query = query.where(BaseStagedOutput.created_at >= start_time)
-
-                # Execute query
-                result = await self.db_session.execute(query)
-                outputs = result.scalars().all()
-
-                # Calculate metrics
-                total_count = len(outputs)
-                status_counts = {}
-                total_processing_time = 0
-                error_count = 0
-
-                for output in outputs:
-                    # Status counts
-                    status_counts[output.status] = status_counts.get(output.status, 0) + 1
-
-                    # Processing time
-                    if output.processing_time:
-                        total_processing_time += output.processing_time
-
-                    # Error tracking
-                    if output.error_count:
-                        error_count += output.error_count
-
-                return {
-                    'total_outputs': total_count,
-                    'status_distribution': status_counts,
-                    'average_processing_time': (
-                        total_processing_time / total_count if total_count > 0 else 0
-                    ),
-                    'error_rate': (
-                        error_count / total_count if total_count > 0 else 0
-                    ),
-                    'time_period': {
-                        'start': start_time.isoformat() if time_range else None,
-                        'end': datetime.utcnow().isoformat()
-                    }
-                }
+            result = await self.db_session.execute(query)
+            metrics = summarize_outputs(result.all(), percentiles)
+            metrics['time_period'] = {
+                'start': start_time.isoformat() if start_time else None,
+                'end': datetime.utcnow().isoformat()
+            }
+            return metrics
         except Exception as e:
             logger.error(f"Error getting output metrics: {str(e)}")
             raise
 
-    async def cleanup_expired_outputs(self) -> List[UUID]:
+    async def cleanup_expired_outputs(
+            self,
+            batch_size: int = 1000,
+            max_batches: Optional[int] = None
+    ) -> List[UUID]:
         """
-        Clean up expired staged outputs.
+        Cancel pending/in-progress outputs whose expiry has passed.
+
+        Works set-based in bounded batches: each batch is one
+        ``UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED)
+        RETURNING id`` committed on its own, so concurrent maintenance
+        workers claim disjoint rows and locks are held only briefly.
+        The processing status enum has no expired state, so expired
+        outputs are cancelled with ``last_error`` set to 'expired'.
+
+        Args:
+            batch_size: Rows per batch
+            max_batches: Optional cap on batches per call
 
         Returns:
             List of expired output IDs
         """
+        current_time = datetime.utcnow()
+        return await self._update_in_batches(
+            [
+                BaseStagedOutput.expires_at <= current_time,
+                BaseStagedOutput.status.in_([ProcessingStatus.PENDING, ProcessingStatus.IN_PROGRESS])
+            ],
+            {
+                'status': ProcessingStatus.CANCELLED,
+                'last_error': 'expired',
+                'updated_at': current_time
+            },
+            batch_size,
+            max_batches,
+            'expired'
+        )
+
+    async def _update_in_batches(
+            self,
+            conditions: List[Any],
+            values: Dict[str, Any],
+            batch_size: int,
+            max_batches: Optional[int],
+            operation: str
+    ) -> List[UUID]:
+        """Apply ``values`` to rows matching ``conditions`` batch by batch."""
+        updated_ids: List[UUID] = []
+        batches = 0
+        started = time.perf_counter()
         try:
-            current_time = datetime.utcnow()
-            query = select(BaseStagedOutput).where(
-                and_(
-                    BaseStagedOutput.expires_at <= current_time,
-                    BaseStagedOutput.status.in_(['pending', 'in_progress'])
-                )
-            )
-
-            result = await self.db_session.execute(query)
-            expired_outputs = result.scalars().all()
-
-            expired_ids = []
-            for output in expired_outputs:
-                output.status = 'expired'
-                output.updated_at = current_time
-                expired_ids.append(output.id)
-
-            if expired_ids:
+            while max_batches is None or batches < max_batches:
+                claimed = select(BaseStagedOutput.id)\
+                    .where(and_(*conditions))\
+                    .limit(batch_size)\
+                    .with_for_update(skip_locked=True)
+                statement = update(BaseStagedOutput.__table__)\
+                    .where(BaseStagedOutput.id.in_(claimed.scalar_subquery()))\
+                    .values(**values)\
+                    .returning(BaseStagedOutput.id)
+
+                result = await self.db_session.execute(statement)
+                batch = result.scalars().all()
                 await self.db_session.commit()
-                logger.info(f"Cleaned up {len(expired_ids)} expired outputs")
-
-            return expired_ids
 
+                updated_ids.extend(batch)
+                batches += 1
+                if len(batch) < batch_size:
+                    break
         except Exception as e:
             await self.db_session.rollback()
-            logger.error(f"Failed to cleanup expired outputs: {str(e)}")
+            logger.error(f"Failed to apply {operation} maintenance: {str(e)}")
             raise
 
+        if updated_ids:
+            count_cache.invalidate(BaseStagedOutput.__tablename__)
+            elapsed = time.perf_counter() - started
+            logger.info(
+                f"Maintenance {operation}: {len(updated_ids)} outputs in {batches} batches "
+                f"({len(updated_ids) / elapsed if elapsed else 0:.0f} rows/s)"
+            )
+        return updated_ids
+
+    async def delete_expired_outputs(
+            self,
+            older_than: datetime,
+            batch_size: int = 1000
+    ) -> AsyncIterator[List[Tuple[UUID, Optional[str]]]]:
+        """
+        Delete outputs created before ``older_than`` in bounded batches.
 
+        Each batch claims rows with ``FOR UPDATE SKIP LOCKED``, removes the
+        subtype rows of the joined-inheritance tables, then deletes the base
+        rows with ``RETURNING id, storage_path`` and commits. Batches are
+        yielded so callers can remove the stored files while the next batch
+        is claimed.
+
+        Args:
+            older_than: Creation cutoff
+            batch_size: Rows per batch
+
+        Yields:
+            Lists of (output ID, storage path) for each deleted batch
+        """
+        base_table = BaseStagedOutput.__table__
+        subtype_keys = _subtype_key_columns()
+        while True:
+            try:
+                claimed = select(BaseStagedOutput.id)\
+                    .where(BaseStagedOutput.created_at <= older_than)\
+                    .order_by(BaseStagedOutput.created_at)\
+                    .limit(batch_size)\
+                    .with_for_update(skip_locked=True)
+                ids = (await self.db_session.execute(claimed)).scalars().all()
+                if not ids:
+                    return
+
+                for key_column in subtype_keys:
+                    await self.db_session.execute(
+                        delete(key_column.table).where(key_column.in_(ids))
+                    )
+                result = await self.db_session.execute(
+                    delete(base_table)
+                    .where(base_table.c.id.in_(ids))
+                    .returning(base_table.c.id, base_table.c.storage_path)
+                )
+                batch = [(row.id, row.storage_path) for row in result]
+                await self.db_session.commit()
+            except Exception as e:
+                await self.db_session.rollback()
+                logger.error(f"Failed to delete expired outputs: {str(e)}")
+                raise
+
+            count_cache.invalidate(BaseStagedOutput.__tablename__)
+            yield batch
+            if len(ids) < batch_size:
+                return
+
+    @read_only
     async def get_component_outputs(
             self,
             pipeline_id: UUID,
@@ -534,48 +663,39 @@ class StagingRepository(BaseRepository[BaseStagedOutput]):
     async def retry_failed_outputs(
             self,
             pipeline_id: UUID,
-            max_retries: int = 3
+            max_retries: int = 3,
+            batch_size: int = 1000
     ) -> List[UUID]:
         """
         Retry failed outputs within retry limit.
 
+        Set-based like ``cleanup_expired_outputs``: rows are flipped back
+        to pending with one ``UPDATE ... RETURNING id`` per batch.
+
         Args:
             pipeline_id: Pipeline ID
             max_retries: Maximum retry attempts
+            batch_size: Rows per batch
 
         Returns:
             List of retried output IDs
         """
-        try:
-            query = select(BaseStagedOutput).where(
-                and_(
-                    BaseStagedOutput.pipeline_id == pipeline_id,
-                    BaseStagedOutput.status == 'failed',
-                    BaseStagedOutput.retry_count < max_retries
-                )
-            )
-
-            result = await self.db_session.execute(query)
-            failed_outputs = result.scalars().all()
-
-            retried_ids = []
-            for output in failed_outputs:
-                output.status = 'pending'
-                output.retry_count += 1
-                output.updated_at = datetime.utcnow()
-                output.error = None
-                retried_ids.append(output.id)
-
-            if retried_ids:
-                await self.db_session.commit()
-                logger.info(f"Retried {len(retried_ids)} failed outputs")
-
-            return retried_ids
-
-        except Exception as e:
-            await self.db_session.rollback()
-            logger.error(f"Failed to retry outputs: {str(e)}")
-            raise
+        return await self._update_in_batches(
+            [
+                BaseStagedOutput.pipeline_id == pipeline_id,
+                BaseStagedOutput.status == ProcessingStatus.FAILED,
+                BaseStagedOutput.retry_count < max_retries
+            ],
+            {
+                'status': ProcessingStatus.PENDING,
+                'retry_count': BaseStagedOutput.retry_count + 1,
+                'last_error': None,
+                'updated_at': datetime.utcnow()
+            },
+            batch_size,
+            None,
+            'retry'
+        )
 
 
     async def validate_output(
@@ -629,4 +749,18 @@ class StagingRepository(BaseRepository[BaseStagedOutput]):
 
         except Exception as e:
             logger.error(f"Error validating output: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+
+def _subtype_key_columns() -> List[Any]:
+    """Primary-key columns of the joined-inheritance subtype tables"""
+    base_id = BaseStagedOutput.__table__.c.id
+    columns = []
+    for mapper in sa_inspect(BaseStagedOutput).self_and_descendants:
+        table = mapper.local_table
+        if table is BaseStagedOutput.__table__:
+            continue
+        for column in table.primary_key.columns:
+            if any(fk.column is base_id for fk in column.foreign_keys):
+                columns.append(column)
+    return columns
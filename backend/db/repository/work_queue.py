@@ -0,0 +1,280 @@
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Iterable, Callable
+from datetime import datetime, timedelta
+from uuid import UUID
+import random
+import logging
+
+from sqlalchemy import and_, bindparam, case, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .base import BaseRepository
+from ..routing import read_only
+from ..models.core.events import EventQueue
+
+logger = logging.getLogger(__name__)
+
+QUEUE_PENDING = 'pending'
+QUEUE_PROCESSING = 'processing'
+QUEUE_COMPLETED = 'completed'
+QUEUE_FAILED = 'failed'
+
+# Matches EventQueue.can_process
+DEFAULT_MAX_ATTEMPTS = 5
+
+
+@dataclass
+class ClaimedItem:
+    """A queue item leased to one worker until ``lease_expires_at``"""
+    id: UUID
+    event_id: UUID
+    priority: int
+    scheduled_time: datetime
+    attempt_count: int
+    lease_expires_at: datetime
+
+
+@dataclass
+class ItemResult:
+    """Outcome of processing a claimed item; ``error`` marks a failure"""
+    item: ClaimedItem
+    execution_time: float
+    memory_usage: Optional[float] = None
+    error: Optional[str] = None
+
+
+def retry_delay(
+        attempt: int,
+        base: float = 5.0,
+        cap: float = 900.0,
+        rand: Callable[[], float] = random.random
+) -> float:
+    """
+    Exponential backoff in seconds for the given (1-based) attempt.
+
+    Half of the delay is jittered so items failing together do not
+    become visible again in lockstep.
+    """
+    delay = min(cap, base * 2 ** max(attempt - 1, 0))
+    return delay / 2 + rand() * delay / 2
+
+
+class WorkQueueRepository(BaseRepository[EventQueue]):
+    """
+    Durable work queue on the ``event_queue`` table.
+
+    Items are claimed with ``UPDATE ... WHERE id IN (SELECT ... FOR UPDATE
+    SKIP LOCKED) RETURNING``, so concurrent workers take disjoint batches
+    in one round trip. A claim leases the item for a visibility timeout and
+    increments ``attempt_count``, which doubles as a fencing token: acks
+    from a worker whose lease was reclaimed no longer match and are ignored.
+    """
+
+    table = EventQueue.__table__
+
+    def __init__(self, db_session: AsyncSession):
+        super().__init__(db_session)
+
+    async def enqueue_many(
+            self,
+            items: Iterable[Dict[str, Any]],
+            processor_id: Optional[UUID] = None
+    ) -> int:
+        """
+        Insert queue items in a single executemany.
+
+        Args:
+            items: Dicts with ``event_id`` and optional ``priority`` and
+                ``scheduled_time``
+            processor_id: Optional processor the items are routed to
+
+        Returns:
+            Number of items enqueued
+        """
+        now = datetime.utcnow()
+        rows = [
+            {
+                'event_id': item['event_id'],
+                'priority': item.get('priority', 0),
+                'scheduled_time': item.get('scheduled_time') or now,
+                'processor_id': item.get('processor_id', processor_id),
+                'status': QUEUE_PENDING,
+                'attempt_count': 0
+            }
+            for item in items
+        ]
+        if not rows:
+            return 0
+
+        try:
+            await self.db_session.execute(insert(self.table), rows)
+            await self.db_session.commit()
+            return len(rows)
+        except Exception as e:
+            await self.db_session.rollback()
+            logger.error(f"Failed to enqueue {len(rows)} items: {str(e)}")
+            raise
+
+    async def claim(
+            self,
+            limit: int,
+            visibility_timeout: float,
+            processor_id: Optional[UUID] = None
+    ) -> List[ClaimedItem]:
+        """
+        Lease up to ``limit`` due items, highest priority first.
+
+        Args:
+            limit: Maximum items to claim
+            visibility_timeout: Lease length in seconds
+            processor_id: Restrict to items routed to this processor
+
+        Returns:
+            Claimed items in priority order
+        """
+        t = self.table
+        now = datetime.utcnow()
+        conditions = [t.c.status == QUEUE_PENDING, t.c.scheduled_time <= now]
+        if processor_id is not None:
+            conditions.append(t.c.processor_id == processor_id)
+
+        candidates = select(t.c.id)\
+            .where(and_(*conditions))\
+            .order_by(t.c.priority.desc(), t.c.scheduled_time)\
+            .limit(limit)\
+            .with_for_update(skip_locked=True)
+        statement = update(t)\
+            .where(t.c.id.in_(candidates.scalar_subquery()))\
+            .values(
+                status=QUEUE_PROCESSING,
+                processing_started=now,
+                lease_expires_at=now + timedelta(seconds=visibility_timeout),
+                attempt_count=t.c.attempt_count + 1,
+                updated_at=now
+            )\
+            .returning(
+                t.c.id, t.c.event_id, t.c.priority, t.c.scheduled_time,
+                t.c.attempt_count, t.c.lease_expires_at
+            )
+
+        try:
+            result = await self.db_session.execute(statement)
+            items = [ClaimedItem(*row) for row in result.all()]
+            await self.db_session.commit()
+        except Exception as e:
+            await self.db_session.rollback()
+            logger.error(f"Failed to claim queue items: {str(e)}")
+            raise
+
+        items.sort(key=lambda item: (-item.priority, item.scheduled_time))
+        return items
+
+    async def reclaim_expired(self, max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> int:
+        """
+        Return items whose lease expired to the queue.
+
+        Items that already used ``max_attempts`` are marked failed instead,
+        so a message that keeps crashing its worker cannot loop forever.
+
+        Returns:
+            Number of items reclaimed or failed
+        """
+        t = self.table
+        now = datetime.utcnow()
+        statement = update(t)\
+            .where(and_(t.c.status == QUEUE_PROCESSING, t.c.lease_expires_at <= now))\
+            .values(
+                status=case((t.c.attempt_count >= max_attempts, QUEUE_FAILED), else_=QUEUE_PENDING),
+                scheduled_time=now,
+                lease_expires_at=None,
+                updated_at=now
+            )\
+            .returning(t.c.id)
+
+        try:
+            result = await self.db_session.execute(statement)
+            reclaimed = len(result.all())
+            await self.db_session.commit()
+        except Exception as e:
+            await self.db_session.rollback()
+            logger.error(f"Failed to reclaim expired leases: {str(e)}")
+            raise
+
+        if reclaimed:
+            logger.warning(f"Reclaimed {reclaimed} queue items with expired leases")
+        return reclaimed
+
+    async def acknowledge(
+            self,
+            results: List[ItemResult],
+            max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+            backoff: Callable[[int], float] = retry_delay
+    ) -> None:
+        """
+        Record a batch of outcomes in one transaction.
+
+        Successes are completed with their execution time and memory usage.
+        Failures are rescheduled after ``backoff(attempt_count)`` seconds, or
+        marked failed once ``max_attempts`` is reached.
+        """
+        if not results:
+            return
+
+        t = self.table
+        now = datetime.utcnow()
+        statement = update(t)\
+            .where(and_(
+                t.c.id == bindparam('item_id'),
+                t.c.attempt_count == bindparam('attempt'),
+                t.c.status == QUEUE_PROCESSING
+            ))\
+            .values(
+                status=bindparam('next_status'),
+                scheduled_time=func.coalesce(bindparam('next_time', type_=t.c.scheduled_time.type), t.c.scheduled_time),
+                processing_completed=bindparam('completed_at'),
+                lease_expires_at=None,
+                execution_time=bindparam('elapsed'),
+                memory_usage=bindparam('memory'),
+                error_log=bindparam('errors', type_=t.c.error_log.type),
+                updated_at=now
+            )
+
+        params = []
+        for result in results:
+            item = result.item
+            if result.error is None:
+                next_status, next_time, completed_at, errors = QUEUE_COMPLETED, None, now, None
+            elif item.attempt_count >= max_attempts:
+                next_status, next_time, completed_at = QUEUE_FAILED, None, now
+                errors = {'error': result.error, 'attempt': item.attempt_count, 'at': now.isoformat()}
+            else:
+                next_status, completed_at = QUEUE_PENDING, None
+                next_time = now + timedelta(seconds=backoff(item.attempt_count))
+                errors = {'error': result.error, 'attempt': item.attempt_count, 'at': now.isoformat()}
+            params.append({
+                'item_id': item.id,
+                'attempt': item.attempt_count,
+                'next_status': next_status,
+                'next_time': next_time,
+                'completed_at': completed_at,
+                'elapsed': max(result.execution_time, 0.0),
+                'memory': None if result.memory_usage is None else max(result.memory_usage, 0.0),
+                'errors': errors
+            })
+
+        try:
+            await self.db_session.execute(statement, params)
+            await self.db_session.commit()
+        except Exception as e:
+            await self.db_session.rollback()
+            logger.error(f"Failed to acknowledge {len(params)} queue items: {str(e)}")
+            raise
+
+    @read_only
+    async def get_queue_depth(self) -> Dict[str, int]:
+        """Item counts per queue status."""
+        t = self.table
+        result = await self.db_session.execute(
+            select(t.c.status, func.count()).group_by(t.c.status)
+        )
+        return {status: count for status, count in result.all()}
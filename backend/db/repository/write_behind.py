@@ -0,0 +1,337 @@
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Callable
+from datetime import datetime
+from uuid import UUID
+import asyncio
+import logging
+import os
+import time
+
+from sqlalchemy import Table, insert
+from sqlalchemy.exc import InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.data.pipeline import PipelineLog
+from ..models.staging.base import StagingProcessingHistory
+
+logger = logging.getLogger(__name__)
+
+# Tables whose rows are append-only and safe to persist asynchronously
+WRITE_BEHIND_TABLES = (
+    PipelineLog.__table__,
+    StagingProcessingHistory.__table__
+)
+
+
+class WriteBehindClosedError(RuntimeError):
+    """Raised when appending to a buffer that has been closed"""
+
+
+@dataclass
+class WriteBehindStats:
+    """Counters for the write-behind buffer"""
+    appended: int = 0
+    written: int = 0
+    dropped: int = 0
+    flushes: int = 0
+    statements: int = 0
+    backpressure_waits: int = 0
+    flush_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'appended': self.appended,
+            'written': self.written,
+            'dropped': self.dropped,
+            'flushes': self.flushes,
+            'statements': self.statements,
+            'backpressure_waits': self.backpressure_waits,
+            'mean_flush_seconds': self.flush_seconds / self.flushes if self.flushes else 0.0
+        }
+
+
+def with_column_defaults(table: Table, row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Fill Python-side column defaults (ids, timestamps, version) up front.
+
+    Every buffered row of a table then carries the same keys, so a flush
+    is one multi-row INSERT instead of one statement per key shape.
+    """
+    filled = dict(row)
+    for column in table.columns:
+        if column.name in filled or column.default is None:
+            continue
+        default = column.default
+        if default.is_scalar:
+            filled[column.name] = default.arg
+        elif default.is_callable:
+            filled[column.name] = default.arg(None)
+    return filled
+
+
+class WriteBehindBuffer:
+    """
+    Buffers append-only rows and persists them in batched INSERTs
+
+    Rows are held per table and flushed with one multi-row INSERT per table
+    when ``max_batch`` rows are pending (size trigger) or every
+    ``flush_interval`` seconds (time trigger), whichever comes first.
+
+    Guarantees:
+
+    - Ordering: rows of one table are inserted in append order and a row is
+      never written before rows appended to the same table earlier. Tables
+      are flushed in the order they were first appended to. There is no
+      ordering relative to writes that bypass the buffer.
+    - Durability: ``append`` returns before the row is persisted; a row is
+      durable once the flush containing it commits. A crash can lose up to
+      ``max_pending`` rows or ``flush_interval`` seconds of records.
+      ``flush()`` gives read-your-writes, and ``close()`` flushes everything
+      on shutdown.
+    - Memory is bounded by ``max_pending``, counting rows of a flush still
+      in flight: when it is reached, ``append`` waits for a flush
+      (backpressure) rather than growing the buffer.
+    - A batch rejected by the database is retried row by row, each row in
+      its own savepoint; rows that still fail are logged and dropped, not
+      retried forever. Any other failure (database unreachable, a failed
+      commit) keeps the unwritten rows buffered, in order, for the next
+      flush.
+    """
+
+    def __init__(
+            self,
+            session_factory: Callable[[], AsyncSession],
+            max_batch: int = 500,
+            flush_interval: float = 1.0,
+            max_pending: int = 10000
+    ):
+        self.session_factory = session_factory
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.max_pending = max(max_pending, max_batch)
+        self.stats = WriteBehindStats()
+        self._buffers: Dict[str, List[Dict[str, Any]]] = {}
+        self._tables: Dict[str, Table] = {}
+        self._pending = 0
+        self._flush_lock = asyncio.Lock()
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def append(self, table: Table, row: Dict[str, Any]) -> None:
+        """Buffer one row, waiting for a flush if the buffer is full"""
+        if self._closed:
+            raise WriteBehindClosedError(f"Write-behind buffer closed; dropped row for {table.name}")
+        if table not in WRITE_BEHIND_TABLES:
+            raise ValueError(f"{table.name} is not an append-only write-behind table")
+
+        while self._pending >= self.max_pending:
+            self.stats.backpressure_waits += 1
+            await self.flush()
+
+        self._tables.setdefault(table.name, table)
+        self._buffers.setdefault(table.name, []).append(with_column_defaults(table, row))
+        self._pending += 1
+        self.stats.appended += 1
+
+        if self._pending >= self.max_batch:
+            if self._task is not None:
+                self._wake.set()
+            else:
+                await self.flush()
+
+    async def flush(self) -> int:
+        """Persist every buffered row; returns the number written"""
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            # Swap the buffers out; rows stay counted in _pending until they
+            # are written or dropped, so appends during the flush still see
+            # backpressure at max_pending
+            batches = [[self._tables[name], rows] for name, rows in self._buffers.items() if rows]
+            self._buffers = {}
+            taken = sum(len(rows) for _, rows in batches)
+
+            started = time.perf_counter()
+            written = 0
+            try:
+                async with self.session_factory() as session:
+                    while batches:
+                        table, rows = batches[0]
+                        chunk = rows[:self.max_batch]
+                        written += await self._write_chunk(session, table, chunk)
+                        del rows[:len(chunk)]
+                        if not rows:
+                            batches.pop(0)
+            except Exception as e:
+                # Only rows rejected one by one are dropped; anything else
+                # keeps the unwritten rows, in order, for the next flush
+                kept = self._requeue(batches)
+                self._pending -= taken - kept
+                logger.error(f"Write-behind flush failed, {kept} rows kept: {str(e)}")
+                raise
+            finally:
+                self.stats.written += written
+
+            self._pending -= taken
+            self.stats.flushes += 1
+            self.stats.flush_seconds += time.perf_counter() - started
+            return written
+
+    def _requeue(self, batches: List[List[Any]]) -> int:
+        buffers = {}
+        kept = 0
+        for table, rows in batches:
+            buffers[table.name] = rows
+            kept += len(rows)
+        for name, rows in self._buffers.items():
+            buffers[name] = buffers.get(name, []) + rows
+        self._buffers = buffers
+        return kept
+
+    async def _write_chunk(self, session: AsyncSession, table: Table, chunk: List[Dict[str, Any]]) -> int:
+        try:
+            await session.execute(insert(table), chunk)
+            await session.commit()
+            self.stats.statements += 1
+            return len(chunk)
+        except (OperationalError, InterfaceError):
+            await session.rollback()
+            raise
+        except Exception as e:
+            await session.rollback()
+            logger.warning(
+                f"Batched insert of {len(chunk)} {table.name} rows failed, "
+                f"retrying row by row: {str(e)}"
+            )
+
+        written = 0
+        for row in chunk:
+            try:
+                async with session.begin_nested():
+                    await session.execute(insert(table).values(**row))
+                written += 1
+            except (OperationalError, InterfaceError):
+                raise
+            except Exception as e:
+                self.stats.dropped += 1
+                logger.error(f"Dropped {table.name} row {row.get('id')}: {str(e)}")
+        await session.commit()
+        self.stats.statements += len(chunk)
+        return written
+
+    async def _run(self) -> None:
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Write-behind flush failed: {str(e)}")
+
+    def start(self) -> None:
+        """Start the background flusher for the time trigger"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop accepting rows and flush everything still buffered"""
+        self._closed = True
+        if self._task is not None:
+            self._wake.set()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+
+
+def pipeline_log_row(
+        pipeline_id: UUID,
+        message: str,
+        level: str = 'INFO',
+        event_type: Optional[str] = None,
+        run_id: Optional[UUID] = None,
+        step_id: Optional[UUID] = None,
+        context: Optional[Dict[str, Any]] = None,
+        trace_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """Row for ``pipeline_logs``; ``event_type`` is kept in the context"""
+    if event_type:
+        context = {**(context or {}), 'event_type': event_type}
+    return {
+        'pipeline_id': pipeline_id,
+        'level': level,
+        'message': message,
+        'timestamp': datetime.utcnow(),
+        'run_id': run_id,
+        'step_id': step_id,
+        'context': context,
+        'trace_id': trace_id
+    }
+
+
+def processing_history_row(
+        staged_output_id: UUID,
+        event_type: str,
+        status: Any = None,
+        details: Optional[Dict[str, Any]] = None,
+        duration: Optional[float] = None,
+        memory_usage: Optional[float] = None,
+        error_details: Optional[Dict[str, Any]] = None,
+        component: Optional[str] = None,
+        user_id: Optional[UUID] = None,
+        trace_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """Row for ``staging_processing_history``"""
+    return {
+        'staged_output_id': staged_output_id,
+        'event_type': event_type,
+        'history_status': status,
+        'details': details,
+        'duration': duration,
+        'memory_usage': memory_usage,
+        'error_details': error_details,
+        'component': component,
+        'user_id': user_id,
+        'trace_id': trace_id
+    }
+
+
+_buffer: Optional[WriteBehindBuffer] = None
+
+
+def _default_session_factory() -> AsyncSession:
+    from config.database import db_config
+    return db_config.session_factory()()
+
+
+def get_write_behind() -> WriteBehindBuffer:
+    """Process-wide write-behind buffer, sized from the environment"""
+    global _buffer
+    if _buffer is None:
+        _buffer = WriteBehindBuffer(
+            _default_session_factory,
+            max_batch=int(os.getenv('WRITE_BEHIND_MAX_BATCH', '500')),
+            flush_interval=float(os.getenv('WRITE_BEHIND_FLUSH_INTERVAL', '1.0')),
+            max_pending=int(os.getenv('WRITE_BEHIND_MAX_PENDING', '10000'))
+        )
+        try:
+            _buffer.start()
+        except RuntimeError:
+            # No running loop; size triggers flush inline until started
+            pass
+    return _buffer
+
+
+async def shutdown_write_behind() -> None:
+    global _buffer
+    if _buffer is not None:
+        await _buffer.close()
+        _buffer = None
@@ -0,0 +1,341 @@
+"""
+Role-based connection pools and read/write routing
+
+Three roles share the database: ``write`` (OLTP writes), ``read`` (API
+reads, optionally on a replica) and ``analytics`` (long analytic and
+maintenance queries). Each role has its own pool size, checkout timeout
+and server-side statement_timeout, so a slow report cannot starve the
+connections that latency-sensitive writes need.
+
+A role without its own URL points at the primary. Roles can alias another
+role's engine outright (``DB_READ_ALIAS=write``). SQLite roles alias the
+write engine unless they name themselves (``DB_READ_ALIAS=read``), so a
+single local database exercises every path.
+"""
+
+import contextvars
+import functools
+import logging
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Delete, Insert, Update
+
+logger = logging.getLogger(__name__)
+
+ROLE_WRITE = 'write'
+ROLE_READ = 'read'
+ROLE_ANALYTICS = 'analytics'
+ROLES = (ROLE_WRITE, ROLE_READ, ROLE_ANALYTICS)
+
+# pool_size, max_overflow, pool_timeout (s), statement_timeout (ms)
+ROLE_DEFAULTS = {
+    ROLE_WRITE: (10, 5, 5, 15000),
+    ROLE_READ: (10, 10, 10, 30000),
+    ROLE_ANALYTICS: (3, 2, 60, 600000)
+}
+
+_current_role: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar('db_role', default=None)
+
+
+@dataclass
+class PoolSettings:
+    """Connection settings for one role"""
+    role: str
+    url: str
+    pool_size: int
+    max_overflow: int
+    pool_timeout: float
+    statement_timeout_ms: Optional[int]
+    prepared_statement_cache_size: int = 500
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    pool_use_lifo: bool = True
+    alias: Optional[str] = None
+    application_name: str = 'fastapi_app'
+
+    @classmethod
+    def from_env(
+            cls,
+            role: str,
+            primary_url: str,
+            defaults: Optional[tuple] = None,
+            **overrides: Any
+    ) -> 'PoolSettings':
+        """
+        Settings for ``role`` from ``DB_<ROLE>_*`` environment variables
+
+        Recognised suffixes: URL, POOL_SIZE, MAX_OVERFLOW, POOL_TIMEOUT,
+        STATEMENT_TIMEOUT_MS, PREPARED_CACHE_SIZE and ALIAS. The read role
+        also honours DB_READ_REPLICA_URL.
+        """
+        prefix = f"DB_{role.upper()}_"
+        pool_size, max_overflow, pool_timeout, statement_timeout = defaults or ROLE_DEFAULTS[role]
+        url = os.getenv(prefix + 'URL')
+        if role == ROLE_READ:
+            url = url or os.getenv('DB_READ_REPLICA_URL')
+        settings = cls(
+            role=role,
+            url=url or primary_url,
+            pool_size=int(os.getenv(prefix + 'POOL_SIZE', pool_size)),
+            max_overflow=int(os.getenv(prefix + 'MAX_OVERFLOW', max_overflow)),
+            pool_timeout=float(os.getenv(prefix + 'POOL_TIMEOUT', pool_timeout)),
+            statement_timeout_ms=int(os.getenv(prefix + 'STATEMENT_TIMEOUT_MS', statement_timeout)),
+            prepared_statement_cache_size=int(os.getenv(prefix + 'PREPARED_CACHE_SIZE', 500)),
+            alias=os.getenv(prefix + 'ALIAS') or None
+        )
+        return replace(settings, **overrides)
+
+    @property
+    def capacity(self) -> int:
+        return self.pool_size + self.max_overflow
+
+    def engine_kwargs(self, **extra: Any) -> Dict[str, Any]:
+        """``create_async_engine`` arguments for this role's dialect"""
+        url = make_url(self.url)
+        kwargs: Dict[str, Any] = dict(extra)
+        if url.get_backend_name() == 'sqlite':
+            kwargs.pop('isolation_level', None)
+            return kwargs
+
+        kwargs.update(
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            pool_timeout=self.pool_timeout,
+            pool_recycle=self.pool_recycle,
+            pool_pre_ping=self.pool_pre_ping,
+            pool_use_lifo=self.pool_use_lifo
+        )
+        if url.get_driver_name() == 'asyncpg':
+            server_settings = {
+                'application_name': f"{self.application_name}:{self.role}",
+                'client_encoding': 'utf8',
+                'timezone': 'UTC'
+            }
+            if self.statement_timeout_ms:
+                server_settings['statement_timeout'] = str(self.statement_timeout_ms)
+            kwargs['connect_args'] = {
+                'server_settings': server_settings,
+                # Per-connection LRU of asyncpg prepared statements
+                'prepared_statement_cache_size': self.prepared_statement_cache_size
+            }
+        return kwargs
+
+
+@dataclass
+class PoolStats:
+    """Checkout counters for one pool"""
+    capacity: int
+    checked_out: int = 0
+    peak_checked_out: int = 0
+    checkouts: int = 0
+    saturated_checkouts: int = 0
+    timeouts: int = 0
+    connects: int = 0
+
+    @property
+    def saturation(self) -> float:
+        return self.checked_out / self.capacity if self.capacity else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'capacity': self.capacity,
+            'checked_out': self.checked_out,
+            'peak_checked_out': self.peak_checked_out,
+            'saturation': self.saturation,
+            'checkouts': self.checkouts,
+            'saturated_checkouts': self.saturated_checkouts,
+            'timeouts': self.timeouts,
+            'connects': self.connects
+        }
+
+
+def instrument_pool(engine: AsyncEngine, capacity: int) -> PoolStats:
+    """Attach checkout/checkin listeners that track pool saturation"""
+    stats = PoolStats(capacity=capacity)
+
+    @event.listens_for(engine.sync_engine, 'connect')
+    def on_connect(dbapi_connection, connection_record):
+        stats.connects += 1
+
+    @event.listens_for(engine.sync_engine, 'checkout')
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        stats.checkouts += 1
+        stats.checked_out += 1
+        stats.peak_checked_out = max(stats.peak_checked_out, stats.checked_out)
+        if stats.checked_out >= stats.capacity:
+            stats.saturated_checkouts += 1
+
+    @event.listens_for(engine.sync_engine, 'checkin')
+    def on_checkin(dbapi_connection, connection_record):
+        stats.checked_out = max(stats.checked_out - 1, 0)
+
+    return stats
+
+
+class RoutingSession(Session):
+    """
+    Session that picks an engine per statement
+
+    Flushes, INSERT/UPDATE/DELETE and SELECT ... FOR UPDATE always go to
+    the write engine. Other statements go to the role active in
+    ``use_role`` (set by the ``read_only``/``analytic`` repository
+    decorators), else to write.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        router: Optional['DatabaseRouter'] = self.info.get('router')
+        if router is None:
+            return super().get_bind(mapper, clause, **kwargs)
+        if (
+                self._flushing
+                or isinstance(clause, (Insert, Update, Delete))
+                or getattr(clause, '_for_update_arg', None) is not None
+        ):
+            return router.engine(ROLE_WRITE).sync_engine
+        return router.engine(_current_role.get() or ROLE_WRITE).sync_engine
+
+
+@contextmanager
+def use_role(role: str) -> Iterator[None]:
+    """Route reads issued inside the block to ``role``"""
+    token = _current_role.set(role)
+    try:
+        yield
+    finally:
+        _current_role.reset(token)
+
+
+def _routed(role: str) -> Callable:
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        async def wrapper(*args, **kwargs):
+            # An outer routing decision (e.g. analytics) wins
+            if _current_role.get() is not None:
+                return await method(*args, **kwargs)
+            with use_role(role):
+                try:
+                    return await method(*args, **kwargs)
+                except PoolTimeoutError as e:
+                    session = getattr(args[0], 'db_session', None) if args else None
+                    router = session.info.get('router') if session is not None else None
+                    if router is not None:
+                        router.record_timeout(e, role)
+                    raise
+        return wrapper
+    return decorator
+
+
+# Repository method decorators. Only for methods that read without writing
+# in the same session and tolerate replica lag: their reads run on another
+# connection and do not see the session's uncommitted changes.
+read_only = _routed(ROLE_READ)
+analytic = _routed(ROLE_ANALYTICS)
+
+
+@dataclass
+class DatabaseRouter:
+    """Engines, pool statistics and session factories for every role"""
+    settings: Dict[str, PoolSettings]
+    engine_options: Dict[str, Any] = field(default_factory=dict)
+    engines: Dict[str, AsyncEngine] = field(default_factory=dict)
+    stats: Dict[str, PoolStats] = field(default_factory=dict)
+    aliases: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_env(
+            cls,
+            primary_url: str,
+            write_defaults: Optional[tuple] = None,
+            write_overrides: Optional[Dict[str, Any]] = None,
+            **engine_options: Any
+    ) -> 'DatabaseRouter':
+        overrides = {ROLE_WRITE: write_overrides or {}}
+        return cls(
+            {
+                role: PoolSettings.from_env(
+                    role, primary_url, write_defaults if role == ROLE_WRITE else None,
+                    **overrides.get(role, {})
+                )
+                for role in ROLES
+            },
+            engine_options
+        )
+
+    def start(self) -> 'DatabaseRouter':
+        """Create one engine per distinct role; aliased roles share it"""
+        write = self.settings[ROLE_WRITE]
+        for role in ROLES:
+            settings = self.settings[role]
+            target = settings.alias
+            if target is None and role != ROLE_WRITE and make_url(settings.url).get_backend_name() == 'sqlite':
+                target = ROLE_WRITE
+            if target is not None and target != role:
+                self.aliases[role] = target
+                continue
+            engine = create_async_engine(settings.url, **settings.engine_kwargs(**self.engine_options))
+            self.engines[role] = engine
+            self.stats[role] = instrument_pool(engine, settings.capacity)
+            logger.info(
+                f"Database pool '{role}': size={settings.pool_size}, overflow={settings.max_overflow}, "
+                f"statement_timeout={settings.statement_timeout_ms}ms, "
+                f"replica={settings.url != write.url}"
+            )
+        return self
+
+    def resolve(self, role: str) -> str:
+        seen = set()
+        while role in self.aliases and role not in seen:
+            seen.add(role)
+            role = self.aliases[role]
+        return role
+
+    def engine(self, role: str = ROLE_WRITE) -> AsyncEngine:
+        return self.engines[self.resolve(role)]
+
+    def session_factory(self, **options: Any) -> async_sessionmaker[AsyncSession]:
+        """Sessions that route each statement through ``RoutingSession``"""
+        return async_sessionmaker(
+            bind=self.engine(ROLE_WRITE),
+            class_=AsyncSession,
+            sync_session_class=RoutingSession,
+            info={'router': self},
+            **options
+        )
+
+    def record_timeout(self, error: PoolTimeoutError, role: Optional[str] = None) -> None:
+        """Count a pool checkout timeout once, against the role that hit it"""
+        if getattr(error, 'pool_role', None) is not None:
+            return
+        role = self.resolve(role or _current_role.get() or ROLE_WRITE)
+        error.pool_role = role
+        self.stats[role].timeouts += 1
+
+    def pool_metrics(self) -> Dict[str, Any]:
+        """Saturation metrics per role; aliased roles report their target"""
+        metrics = {}
+        for role in ROLES:
+            target = self.resolve(role)
+            entry = self.stats[target].to_dict()
+            pool = self.engines[target].pool
+            entry['pool_size'] = pool.size() if hasattr(pool, 'size') else None
+            entry['overflow'] = pool.overflow() if hasattr(pool, 'overflow') else None
+            if target != role:
+                entry['alias_of'] = target
+            metrics[role] = entry
+        return metrics
+
+    async def dispose(self) -> None:
+        for engine in self.engines.values():
+            await engine.dispose()
+        self.engines.clear()
+        self.stats.clear()
+        self.aliases.clear()
+
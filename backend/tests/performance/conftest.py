@@ -0,0 +1,13 @@
+import os
+
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    """Benchmarks measure wall-clock time; run them with RUN_BENCHMARKS=1"""
+    if os.getenv('RUN_BENCHMARKS'):
+        return
+    skip = pytest.mark.skip(reason="benchmark; set RUN_BENCHMARKS=1 to run")
+    for item in items:
+        if 'tests/performance/' in str(item.fspath).replace(os.sep, '/'):
+            item.add_marker(skip)
@@ -0,0 +1,42 @@
+import os
+import time
+from datetime import datetime
+
+from data.processing.monitoring.collectors.log_collector import LogCollector
+
+
+def _line(i):
+    stamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S,%f')[:-3]
+    return f"{stamp} - pipeline.worker - INFO - processed batch {i}\n"
+
+
+async def test_initial_and_incremental_collection(tmp_path):
+    """Set LOG_COLLECTOR_BENCH_MB (e.g. 4096) to benchmark multi-GB directories"""
+    log_dir = tmp_path / 'logs'
+    log_dir.mkdir()
+    target_bytes = int(os.getenv('LOG_COLLECTOR_BENCH_MB', '16')) * (1 << 20)
+    block = ''.join(_line(i) for i in range(10000))
+    files = 8
+    for index in range(files):
+        with open(log_dir / f'worker{index}-app.log', 'w') as f:
+            for _ in range(max(1, target_bytes // files // len(block))):
+                f.write(block)
+
+    collector = LogCollector(
+        [str(log_dir)], state_file=str(tmp_path / 'offsets.json'),
+        max_bytes_per_cycle=1 << 40
+    )
+    start = time.perf_counter()
+    initial = await collector.collect(['application'])
+    initial_elapsed = time.perf_counter() - start
+
+    with open(log_dir / 'worker0-app.log', 'a') as f:
+        f.write(''.join(_line(i) for i in range(100)))
+    start = time.perf_counter()
+    incremental = await collector.collect(['application'])
+    incremental_elapsed = time.perf_counter() - start
+
+    megabytes = initial['stats']['bytes_read'] / (1 << 20)
+    print(f"\nInitial: {megabytes:.0f} MB in {initial_elapsed:.2f}s "
+          f"({megabytes / initial_elapsed:.0f} MB/s); "
+          f"incremental: {incremental['stats']['bytes_read']} bytes in {incremental_elapsed * 1000:.1f} ms")
@@ -0,0 +1,56 @@
+import os
+import time
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import select
+
+from db.repository.base import BaseRepository
+from db.repository.pagination import encode_cursor, filter_fingerprint
+from tests.unit.test_pagination import Item, _session_with_rows
+
+
+async def test_deep_page_latency_matches_first_page():
+    """Set PAGINATION_BENCH_ROWS (e.g. 1000000) to benchmark larger tables"""
+    page_size = 10
+    rows = int(os.getenv('PAGINATION_BENCH_ROWS', str(page_size * 10000 + page_size)))
+    engine, session = await _session_with_rows(rows)
+    repository = BaseRepository(session)
+    try:
+        deep_page = rows // page_size - 1
+        ordered = select(Item).order_by(Item.created_at.desc(), Item.id.desc())
+        anchor = (await session.execute(
+            ordered.offset((deep_page - 1) * page_size - 1).limit(1)
+        )).scalar_one()
+        fingerprint = filter_fingerprint(Item.__tablename__, None, 'created_at')
+        deep_cursor = encode_cursor([anchor.created_at, anchor.id], fingerprint)
+
+        async def timed(**kwargs):
+            start = time.perf_counter()
+            for _ in range(20):
+                page = await repository.list_all(Item, page_size=page_size, count_mode='none', **kwargs)
+            return (time.perf_counter() - start) / 20, page
+
+        first_elapsed, _ = await timed()
+        deep_elapsed, deep = await timed(cursor=deep_cursor)
+
+        start = time.perf_counter()
+        for _ in range(20):
+            offset_rows = (await session.execute(
+                ordered.offset((deep_page - 1) * page_size).limit(page_size)
+            )).scalars().all()
+        offset_elapsed = (time.perf_counter() - start) / 20
+
+        print(
+            f"\n{rows} rows: page 1 {first_elapsed * 1000:.2f} ms, "
+            f"page {deep_page} keyset {deep_elapsed * 1000:.2f} ms, "
+            f"OFFSET {offset_elapsed * 1000:.2f} ms"
+        )
+        assert [item.id for item in deep.items] == [item.id for item in offset_rows]
+        assert deep_elapsed < max(first_elapsed * 5, 0.005)
+    finally:
+        await session.close()
+        await engine.dispose()
@@ -0,0 +1,61 @@
+import asyncio
+import os
+import statistics
+import time
+
+import pytest
+
+pytest.importorskip("passlib")
+pytest.importorskip("bcrypt")
+
+from core.services.auth.password_hasher import PasswordHasher, crypt_context
+
+
+async def test_login_burst_keeps_the_loop_responsive():
+    """Set PASSWORD_BENCH_ROUNDS / PASSWORD_BENCH_LOGINS for heavier runs"""
+    rounds = int(os.getenv('PASSWORD_BENCH_ROUNDS', '10'))
+    logins = int(os.getenv('PASSWORD_BENCH_LOGINS', '16'))
+    context = crypt_context(rounds)
+    stored = context.hash('s3cret')
+
+    async def measure(login):
+        lags = []
+        stop = asyncio.Event()
+
+        async def ticker():
+            # Stands in for every other request the API is serving
+            while not stop.is_set():
+                started = time.perf_counter()
+                await asyncio.sleep(0.005)
+                lags.append(time.perf_counter() - started - 0.005)
+
+        tick = asyncio.create_task(ticker())
+        latencies = await asyncio.gather(*(login(index) for index in range(logins)))
+        stop.set()
+        await tick
+        return max(lags), latencies
+
+    async def inline_login(index):
+        started = time.perf_counter()
+        await asyncio.sleep(0)
+        assert context.verify('s3cret', stored)
+        return time.perf_counter() - started
+
+    hasher = PasswordHasher(rounds=rounds, max_pending=logins, per_key_limit=logins)
+
+    async def pooled_login(index):
+        started = time.perf_counter()
+        valid, _ = await hasher.verify_and_update('s3cret', stored, [f"account:user{index}", 'ip:10.0.0.1'])
+        assert valid
+        return time.perf_counter() - started
+
+    try:
+        inline_lag, _ = await measure(inline_login)
+        pooled_lag, latencies = await measure(pooled_login)
+    finally:
+        hasher.shutdown()
+
+    print(f"\n{logins} concurrent logins at cost {rounds}: loop stall inline {inline_lag * 1000:.0f} ms, "
+          f"pooled {pooled_lag * 1000:.0f} ms; pooled login p50 {statistics.median(latencies) * 1000:.0f} ms, "
+          f"max {max(latencies) * 1000:.0f} ms on {hasher.workers} workers")
+    assert pooled_lag < inline_lag / 4
@@ -0,0 +1,39 @@
+import asyncio
+import time
+
+from core.control.status_index import PipelineStatusIndex
+
+
+async def test_page_status_latency_stays_flat_with_page_size():
+    index = PipelineStatusIndex()
+    for number in range(1000):
+        index.set(f"p{number}", {'state': 'running', 'progress': number / 1000})
+
+    async def status_call(pipeline_id):
+        # One hop through the service layer per pipeline
+        await asyncio.sleep(0.0002)
+        return index.get(pipeline_id)
+
+    async def per_pipeline(ids):
+        return {pipeline_id: await status_call(pipeline_id) for pipeline_id in ids}
+
+    async def bulk(ids):
+        await asyncio.sleep(0.0002)
+        return index.get_many(ids)
+
+    timings = {}
+    for size in (10, 100, 1000):
+        ids = [f"p{number}" for number in range(size)]
+        for name, resolve in (('per_pipeline', per_pipeline), ('bulk', bulk)):
+            started = time.perf_counter()
+            statuses = await resolve(ids)
+            timings[name, size] = time.perf_counter() - started
+            assert len(statuses) == size
+
+    print("\n" + ", ".join(
+        f"{size}/page: per-pipeline {timings['per_pipeline', size] * 1000:.1f} ms, "
+        f"bulk {timings['bulk', size] * 1000:.1f} ms"
+        for size in (10, 100, 1000)
+    ))
+    assert timings['bulk', 1000] < timings['per_pipeline', 100]
+    assert timings['bulk', 1000] < timings['per_pipeline', 1000] / 20
@@ -0,0 +1,38 @@
+import os
+import time
+from datetime import timedelta
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+
+from db.repository.staging import StagingRepository
+from tests.unit.test_staging_maintenance import NOW, _seeded_session
+
+
+async def test_maintenance_throughput():
+    """Set STAGING_MAINTENANCE_BENCH_ROWS=1000000 for the full-size benchmark"""
+    rows = int(os.getenv('STAGING_MAINTENANCE_BENCH_ROWS', '40000'))
+    engine, session = await _seeded_session(rows)
+    repository = StagingRepository(session)
+    try:
+        start = time.perf_counter()
+        expired = await repository.cleanup_expired_outputs(batch_size=5000)
+        update_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        deleted = 0
+        async for batch in repository.delete_expired_outputs(NOW - timedelta(days=1), batch_size=5000):
+            deleted += len(batch)
+        delete_elapsed = time.perf_counter() - start
+
+        print(
+            f"\n{rows} outputs: expired {len(expired)} at {len(expired) / update_elapsed:,.0f} rows/s, "
+            f"deleted {deleted} at {deleted / delete_elapsed:,.0f} rows/s"
+        )
+        assert len(expired) == rows // 4
+        assert deleted == rows // 2
+    finally:
+        await session.close()
+        await engine.dispose()
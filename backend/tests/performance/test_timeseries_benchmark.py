@@ -0,0 +1,29 @@
+import time
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from core.monitoring.timeseries import TimeSeriesStore
+
+
+def test_range_query_against_linear_scan():
+    store = TimeSeriesStore(raw_capacity=100_000)
+    for second in range(150_000):
+        store.record('cpu', float(second), timestamp=float(second))
+    series = store.series('cpu')
+
+    start = time.perf_counter()
+    for offset in range(1000):
+        series.range(100_000.0 + offset, 100_060.0 + offset)
+    indexed = time.perf_counter() - start
+
+    timestamps = store.query('cpu')[0].timestamps
+    start = time.perf_counter()
+    for offset in range(1000):
+        mask = (timestamps >= 100_000.0 + offset) & (timestamps < 100_060.0 + offset)
+        timestamps[mask]
+    scanned = time.perf_counter() - start
+
+    print(f"\n1000 range queries: indexed {indexed * 1e3:.1f} ms, linear scan {scanned * 1e3:.1f} ms, "
+          f"{store.nbytes / 1024:.0f} KB per full series")
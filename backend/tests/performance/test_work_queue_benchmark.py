@@ -0,0 +1,31 @@
+import os
+import time
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+pytest.importorskip("psutil")
+
+from core.control.work_queue import DurableWorkQueue
+from tests.unit.test_work_queue import _event_id, sessions  # noqa: F401 (fixture)
+
+
+async def test_claim_throughput(sessions):
+    """Set WORK_QUEUE_BENCH_ITEMS to benchmark larger backlogs"""
+    items = int(os.getenv('WORK_QUEUE_BENCH_ITEMS', '20000'))
+
+    async def handler(item):
+        return None
+
+    queue = DurableWorkQueue(sessions, handler, batch_size=500)
+    await queue.enqueue({'event_id': _event_id(index), 'priority': index % 3} for index in range(items))
+
+    started = time.perf_counter()
+    while await queue.run_once():
+        pass
+    elapsed = time.perf_counter() - started
+
+    print(f"\n{items} items: {items / elapsed:,.0f} claims+acks/s, "
+          f"{queue.stats.to_dict()['mean_claim_seconds'] * 1000:.2f} ms per batch claim")
+    assert queue.stats.completed == items
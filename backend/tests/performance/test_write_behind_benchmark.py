@@ -0,0 +1,63 @@
+import os
+import time
+import uuid
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import CheckConstraint, MetaData, insert
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateTable
+
+from db.models.data.pipeline import PipelineLog
+from db.repository.write_behind import WriteBehindBuffer, pipeline_log_row, with_column_defaults
+
+
+@compiles(JSONB, 'sqlite')
+def _jsonb_on_sqlite(element, compiler, **kw):
+    return 'JSON'
+
+
+PIPELINE_ID = uuid.uuid4()
+LOGS = PipelineLog.__table__
+
+
+@pytest.fixture
+async def sessions():
+    engine = create_async_engine('sqlite+aiosqlite://', poolclass=StaticPool)
+    async with engine.begin() as connection:
+        copy = LOGS.to_metadata(MetaData())
+        for constraint in [c for c in copy.constraints if isinstance(c, CheckConstraint)]:
+            copy.constraints.discard(constraint)
+        await connection.execute(CreateTable(copy, include_foreign_key_constraints=[]))
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def test_write_behind_throughput(sessions):
+    """Set WRITE_BEHIND_BENCH_ROWS to benchmark larger volumes"""
+    rows = int(os.getenv('WRITE_BEHIND_BENCH_ROWS', '5000'))
+
+    started = time.perf_counter()
+    async with sessions() as session:
+        for index in range(rows):
+            await session.execute(insert(LOGS).values(**with_column_defaults(
+                LOGS, pipeline_log_row(PIPELINE_ID, f"direct {index}")
+            )))
+            await session.commit()
+    direct = time.perf_counter() - started
+
+    buffer = WriteBehindBuffer(sessions, max_batch=500)
+    started = time.perf_counter()
+    for index in range(rows):
+        await buffer.append(LOGS, pipeline_log_row(PIPELINE_ID, f"buffered {index}"))
+    await buffer.close()
+    buffered = time.perf_counter() - started
+
+    print(f"\n{rows} log rows: per-row commit {rows / direct:,.0f} rows/s, "
+          f"write-behind {rows / buffered:,.0f} rows/s in {buffer.stats.statements} statements")
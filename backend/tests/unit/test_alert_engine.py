@@ -0,0 +1,157 @@
+import uuid
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from core.services.monitoring.alert_engine import (
+    AlertDeduplicator,
+    AlertRuleEngine,
+    WindowAggregate,
+    group_alerts
+)
+
+
+def make_rule(metric, operator, threshold, rule_type='metric_threshold', **condition):
+    return {
+        'rule_id': str(uuid.uuid4()),
+        'rule_type': rule_type,
+        'condition': {'metric_name': metric, 'operator': operator, 'threshold': threshold, **condition}
+    }
+
+
+@pytest.fixture
+def engine():
+    return AlertRuleEngine()
+
+
+def test_threshold_operators_match_by_binary_search(engine):
+    """Each operator fires exactly the rules its comparison selects"""
+    rules = {
+        (op, t): make_rule('cpu', op, t)
+        for op in ('>', '>=', '<', '<=', '==', '!=')
+        for t in (50, 80, 90)
+    }
+    for rule in rules.values():
+        engine.add_rule(rule)
+
+    matches, _ = engine.evaluate('metric_threshold', [('cpu', 80.0, {})])
+    fired = {m.rule_id for m in matches}
+
+    expected = {
+        rule['rule_id'] for (op, t), rule in rules.items()
+        if {'>': 80 > t, '>=': 80 >= t, '<': 80 < t, '<=': 80 <= t, '==': 80 == t, '!=': 80 != t}[op]
+    }
+    assert fired == expected
+
+
+def test_label_matchers_and_removal(engine):
+    """Rules only see series whose labels satisfy their matchers"""
+    prod = make_rule('cpu', '>', 80, labels={'env': 'prod'})
+    anywhere = make_rule('cpu', '>', 80)
+    engine.add_rule(prod)
+    engine.add_rule(anywhere)
+
+    matches, _ = engine.evaluate('metric_threshold', [('cpu', 95, {'env': 'dev', 'host': 'a'})])
+    assert {m.rule_id for m in matches} == {anywhere['rule_id']}
+
+    matches, _ = engine.evaluate('metric_threshold', [('cpu', 95, {'env': 'prod', 'host': 'a'})])
+    assert {m.rule_id for m in matches} == {prod['rule_id'], anywhere['rule_id']}
+
+    engine.remove_rule(anywhere['rule_id'])
+    matches, _ = engine.evaluate('metric_threshold', [('cpu', 95, {'env': 'dev'})])
+    assert matches == []
+    assert len(engine) == 1
+
+
+def test_status_rules_match_strings(engine):
+    rule = make_rule(None, '==', 'error', rule_type='status_change', component_id='db')
+    engine.add_rule(rule)
+
+    matches, _ = engine.evaluate('status_change', [('db', 'error', {}), ('cache', 'error', {})])
+
+    assert [m.rule_id for m in matches] == [rule['rule_id']]
+
+
+def test_window_aggregate_is_incremental():
+    window = WindowAggregate(window=10)
+    for second in range(30):
+        window.add(float(second), float(second))
+
+    # Points 19..29 remain inside the window
+    assert window.value('count') == 11
+    assert window.value('avg') == pytest.approx(24.0)
+    assert window.value('min') == 19
+    assert window.value('max') == 29
+    assert window.value('rate') == pytest.approx(1.0)
+
+
+def test_windowed_rule_uses_rolling_average(engine):
+    rule = make_rule('latency', '>', 100, aggregation='avg', window=300)
+    engine.add_rule(rule)
+
+    fired = []
+    for second, value in enumerate([50, 150, 160, 170]):
+        matches, _ = engine.evaluate('metric_threshold', [('latency', value, {})], timestamp=float(second))
+        fired.append(bool(matches))
+
+    # avg: 50, 100, 120, 132.5
+    assert fired == [False, False, True, True]
+
+
+def test_deduplicates_until_resolved(engine):
+    rule = make_rule('cpu', '>', 80)
+    engine.add_rule(rule)
+    dedup = AlertDeduplicator()
+
+    def step(values):
+        return dedup.update(*engine.evaluate(
+            'metric_threshold', [('cpu', v, {'host': h}) for h, v in values.items()]
+        ))
+
+    first = step({'a': 90, 'b': 95})
+    assert len(first.fired) == 2
+    assert len(group_alerts(first.fired)[rule['rule_id']]) == 2
+
+    repeat = step({'a': 91, 'b': 96})
+    assert repeat.fired == [] and repeat.resolved == []
+
+    cleared = step({'a': 10})
+    assert [a.labels for a in cleared.resolved] == [{'host': 'a'}]
+    assert len(dedup) == 1
+
+
+def test_evaluation_cost_tracks_update_not_rule_count(engine):
+    """Rules on other metrics are never touched"""
+    for i in range(5000):
+        engine.add_rule(make_rule(f'metric_{i}', '>', 50))
+    engine.add_rule(make_rule('cpu', '>', 80))
+
+    for _ in range(1000):
+        engine.evaluate('metric_threshold', [('cpu', 90.0, {}), ('memory', 10.0, {})])
+
+    assert engine.stats.groups_examined == 1000
+
+
+def test_rejected_rule_keeps_the_indexed_one(engine):
+    rule = make_rule('cpu', '>', 80)
+    engine.add_rule(rule)
+
+    broken = {**rule, 'condition': {**rule['condition'], 'aggregation': 'median', 'window': 60}}
+    with pytest.raises(ValueError):
+        engine.add_rule(broken)
+
+    assert rule['rule_id'] in engine
+    matches, _ = engine.evaluate('metric_threshold', [('cpu', 90.0, {})])
+    assert [m.rule_id for m in matches] == [rule['rule_id']]
+
+
+def test_window_state_evicts_least_recently_updated():
+    engine = AlertRuleEngine(max_window_series=2)
+    engine.add_rule(make_rule('cpu', '>', 80, aggregation='avg', window=60))
+
+    for host in ('a', 'b', 'a', 'c'):
+        engine.evaluate('metric_threshold', [('cpu', 50.0, {'host': host})], timestamp=0.0)
+
+    hosts = {dict(labels)['host'] for _, labels, _ in engine._windows}
+    assert hosts == {'a', 'c'}
@@ -341,4 +341,47 @@ async def test_cleanup_old_alerts(alert_manager):
     
     # Verify only recent alert remains
     assert len(alert_manager.alert_history) == 1
-    assert alert_manager.alert_history[0].message == 'Recent alert' 
\ No newline at end of file
+    assert alert_manager.alert_history[0].message == 'Recent alert' 
+
+
+@pytest.mark.asyncio
+async def test_metrics_update_alerts_once_per_episode(alert_manager, mock_message_broker, sample_alert_rule):
+    """A breached rule alerts once, then resolves when the metric recovers"""
+    alert_manager.alert_rules[sample_alert_rule['rule_id']] = AlertRule(**sample_alert_rule)
+    alert_manager.cooldown_period = 0
+
+    for value in (90.0, 92.0, 95.0):
+        await alert_manager._handle_metrics_update(ProcessingMessage(
+            message_type=MessageType.MONITORING_METRICS_UPDATE,
+            content={'metrics': {'cpu_usage': value}}
+        ))
+    assert len(alert_manager.alert_history) == 1
+
+    await alert_manager._handle_metrics_update(ProcessingMessage(
+        message_type=MessageType.MONITORING_METRICS_UPDATE,
+        content={'metrics': {'cpu_usage': 40.0}}
+    ))
+    published = [call[0][0].message_type for call in mock_message_broker.publish.call_args_list]
+    assert MessageType.MONITORING_ALERT_RESOLVE in published
+    assert len(alert_manager.active_alerts) == 0
+
+
+def test_rule_mapping_mutators_keep_the_index(alert_manager, sample_alert_rule):
+    """Bulk mutators index rules, and rejected rules are never stored"""
+    rule = AlertRule(**sample_alert_rule)
+    alert_manager.alert_rules.update({rule.rule_id: rule})
+    assert rule.rule_id in alert_manager.alert_engine
+
+    other = AlertRule(**{**sample_alert_rule, 'rule_id': str(uuid.uuid4())})
+    alert_manager.alert_rules.setdefault(other.rule_id, other)
+    alert_manager.alert_rules |= {}
+    assert len(alert_manager.alert_engine) == 2
+
+    broken = AlertRule(**{
+        **sample_alert_rule,
+        'rule_id': str(uuid.uuid4()),
+        'condition': {**sample_alert_rule['condition'], 'window': 60}
+    })
+    with pytest.raises(ValueError):
+        alert_manager.alert_rules[broken.rule_id] = broken
+    assert broken.rule_id not in alert_manager.alert_rules
@@ -0,0 +1,129 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("jose")
+pytest.importorskip("passlib")
+
+from api.fastapi_app.utils.route_registry import APIRoutes, RouteDefinition, RouteMatcher
+from core.services.auth.auth_service import AuthService
+from core.services.auth.principal_cache import PrincipalCache, token_key
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _principal(user_id='u1', roles=('user',)):
+    return {'id': user_id, 'email': f"{user_id}@example.com", 'roles': list(roles), 'permissions': ['pipeline:read']}
+
+
+def test_cached_principal_expires_with_ttl_or_token():
+    clock = Clock()
+    cache = PrincipalCache(ttl=60, clock=clock)
+    cache.set('a', _principal())
+    cache.set('b', _principal(), expires_at=clock.now + 5)
+
+    assert cache.get('a')['roles'] == ['user']
+    clock.now += 10
+    assert cache.get('b') is None
+    clock.now += 60
+    assert cache.get('a') is None
+    assert cache.hits == 1 and cache.misses == 2
+
+
+def test_returned_principals_do_not_alias_the_cache():
+    cache = PrincipalCache()
+    cache.set('a', _principal())
+    first = cache.get('a')
+    first['permissions'] += ['admin:manage']
+    first['roles'] = ['admin']
+    assert cache.get('a') == {**_principal(), 'permissions': ['pipeline:read']}
+
+
+def test_lru_bound_and_user_invalidation():
+    cache = PrincipalCache(max_entries=2)
+    cache.set('a', _principal('u1'))
+    cache.set('b', _principal('u2'))
+    cache.get('a')
+    cache.set('c', _principal('u1'))
+    assert len(cache) == 2
+    assert cache.get('b') is None
+
+    # A role change drops every token of that user
+    cache.invalidate_user('u1')
+    assert len(cache) == 0
+
+
+def test_invalidated_token_is_dropped():
+    cache = PrincipalCache()
+    cache.set('a', _principal())
+    cache.set('b', _principal())
+    cache.invalidate_token('a')
+    assert cache.get('a') is None and cache.get('b') is not None
+
+
+def test_token_key_prefers_jti():
+    assert token_key({'jti': 'abc'}, 'token') == 'abc'
+    assert token_key({}, 'token') == token_key({}, 'token') != token_key({}, 'other')
+
+
+def test_hashing_limits_key_accounts_by_normalized_email():
+    # Login, password change and reset must share one per-account limit
+    assert AuthService._limit_keys(' Alice@Example.com ', '10.0.0.1') == [
+        'account:alice@example.com', 'ip:10.0.0.1'
+    ]
+
+
+def _concrete(path):
+    return '/'.join('x1' if part.startswith('{') else part for part in path.split('/'))
+
+
+def test_matcher_agrees_with_registry():
+    matcher = RouteMatcher.from_registry()
+    for route in APIRoutes:
+        route_def = route.value
+        for method in route_def.methods:
+            found = matcher.match(_concrete(route_def.path), method)
+            assert found is not None and method in found.methods
+            assert len(found.path.split('/')) == len(route_def.path.split('/'))
+    assert matcher.match('/data-sources/x1', 'PATCH') is None
+    assert matcher.match('/unknown/path', 'GET') is None
+
+
+def test_literal_segments_win_and_fall_back_to_params():
+    matcher = RouteMatcher([
+        RouteDefinition('/items/{item_id}/detail', ['GET']),
+        RouteDefinition('/items/{item_id}', ['GET', 'DELETE']),
+        RouteDefinition('/items/search', ['GET'], requires_auth=False),
+    ])
+    assert matcher.match('/items/search', 'GET').requires_auth is False
+    # No DELETE on the literal route, so the parameter route answers
+    assert matcher.match('/items/search', 'DELETE').path == '/items/{item_id}'
+    assert matcher.match('/items/42/detail/', 'get').path == '/items/{item_id}/detail'
+
+
+def test_matcher_is_at_least_as_specific_as_linear_scan():
+    matcher = RouteMatcher.from_registry()
+    routes = [route.value for route in APIRoutes]
+
+    def linear(path, method):
+        parts = path.split('/')
+        for route_def in routes:
+            route_parts = route_def.path.split('/')
+            if len(parts) == len(route_parts) and method in route_def.methods and all(
+                r.startswith('{') or p == r for p, r in zip(parts, route_parts)
+            ):
+                return route_def
+
+    def literals(path):
+        return sum(1 for part in path.split('/') if not part.startswith('{'))
+
+    for route_def in routes:
+        path, method = _concrete(route_def.path), route_def.methods[0]
+        found, scanned = matcher.match(path, method), linear(path, method)
+        assert found is not None and scanned is not None
+        assert literals(found.path) >= literals(scanned.path)
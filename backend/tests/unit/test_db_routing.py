@@ -0,0 +1,186 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import column, select, table, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from db.repository.base import BaseRepository
+from db.routing import (
+    ROLE_ANALYTICS,
+    ROLE_READ,
+    ROLE_WRITE,
+    DatabaseRouter,
+    PoolSettings,
+    analytic,
+    read_only
+)
+
+
+class ProbeRepository(BaseRepository):
+    """Reports which database served each kind of statement"""
+
+    async def source(self):
+        result = await self.db_session.execute(text("SELECT name FROM source"))
+        return result.scalar_one()
+
+    @read_only
+    async def read_source(self):
+        return await self.source()
+
+    @analytic
+    async def analytic_source(self):
+        return await self.source()
+
+    @analytic
+    async def report(self):
+        # Reads nested inside an analytic call stay on the analytics pool
+        return await self.read_source()
+
+
+async def _seed(url: str, name: str) -> None:
+    engine = create_async_engine(url)
+    async with engine.begin() as connection:
+        await connection.execute(text("CREATE TABLE source (name TEXT)"))
+        await connection.execute(text("INSERT INTO source VALUES (:name)"), {'name': name})
+    await engine.dispose()
+
+
+@pytest.fixture
+async def replicated(tmp_path, monkeypatch):
+    primary = f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}"
+    replica = f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}"
+    await _seed(primary, 'primary')
+    await _seed(replica, 'replica')
+
+    monkeypatch.setenv('DB_READ_REPLICA_URL', replica)
+    # SQLite roles alias write by default; naming itself gives read its own engine
+    monkeypatch.setenv('DB_READ_ALIAS', 'read')
+    router = DatabaseRouter.from_env(primary).start()
+    yield router
+    await router.dispose()
+
+
+async def test_sqlite_roles_alias_the_write_engine(tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'single.db'}"
+    await _seed(url, 'primary')
+    router = DatabaseRouter.from_env(url).start()
+    try:
+        assert list(router.engines) == [ROLE_WRITE]
+        assert router.engine(ROLE_READ) is router.engine(ROLE_ANALYTICS) is router.engine(ROLE_WRITE)
+
+        async with router.session_factory()() as session:
+            repository = ProbeRepository(session)
+            assert await repository.read_source() == 'primary'
+            assert await repository.analytic_source() == 'primary'
+
+        metrics = router.pool_metrics()
+        assert metrics[ROLE_READ]['alias_of'] == ROLE_WRITE
+        assert metrics[ROLE_WRITE]['checkouts'] >= 1
+    finally:
+        await router.dispose()
+
+
+async def test_reads_route_to_replica_and_writes_to_primary(replicated):
+    async with replicated.session_factory()() as session:
+        repository = ProbeRepository(session)
+        assert await repository.read_source() == 'replica'
+        # Undecorated reads and analytics (aliased to write on SQLite) hit the primary
+        assert await repository.source() == 'primary'
+        assert await repository.analytic_source() == 'primary'
+        assert await repository.report() == 'primary'
+
+        await session.execute(text("INSERT INTO source VALUES ('written')"))
+        await session.commit()
+
+    async with replicated.engine(ROLE_WRITE).connect() as connection:
+        names = (await connection.execute(text("SELECT name FROM source"))).scalars().all()
+    assert names == ['primary', 'written']
+    async with replicated.engine(ROLE_READ).connect() as connection:
+        names = (await connection.execute(text("SELECT name FROM source"))).scalars().all()
+    assert names == ['replica']
+
+
+async def test_locking_reads_go_to_primary(replicated):
+    source = table('source', column('name'))
+    async with replicated.session_factory()() as session:
+        repository = ProbeRepository(session)
+
+        @read_only
+        async def locked(repo):
+            result = await repo.db_session.execute(select(source.c.name).with_for_update())
+            return result.scalar_one()
+
+        @read_only
+        async def plain(repo):
+            result = await repo.db_session.execute(select(source.c.name))
+            return result.scalar_one()
+
+        assert await locked(repository) == 'primary'
+        assert await plain(repository) == 'replica'
+
+
+def test_engine_kwargs_for_asyncpg(monkeypatch):
+    monkeypatch.setenv('DB_ANALYTICS_POOL_SIZE', '2')
+    monkeypatch.setenv('DB_ANALYTICS_STATEMENT_TIMEOUT_MS', '120000')
+    monkeypatch.setenv('DB_ANALYTICS_PREPARED_CACHE_SIZE', '50')
+    settings = PoolSettings.from_env(ROLE_ANALYTICS, 'postgresql+asyncpg://app@db/pipeline')
+
+    kwargs = settings.engine_kwargs(echo=False)
+    assert kwargs['pool_size'] == 2 and kwargs['max_overflow'] == 2
+    assert kwargs['pool_timeout'] == 60
+    server_settings = kwargs['connect_args']['server_settings']
+    assert server_settings['statement_timeout'] == '120000'
+    assert server_settings['application_name'].endswith(':analytics')
+    assert kwargs['connect_args']['prepared_statement_cache_size'] == 50
+
+    sqlite = PoolSettings.from_env(ROLE_WRITE, 'sqlite+aiosqlite://').engine_kwargs(isolation_level='READ COMMITTED')
+    assert 'isolation_level' not in sqlite and 'pool_size' not in sqlite
+
+
+def test_write_overrides_reach_only_the_write_pool():
+    router = DatabaseRouter.from_env(
+        'postgresql+asyncpg://app@db/pipeline',
+        write_overrides={'pool_pre_ping': False, 'pool_use_lifo': False}
+    )
+
+    write = router.settings[ROLE_WRITE].engine_kwargs()
+    assert write['pool_pre_ping'] is False and write['pool_use_lifo'] is False
+    analytics = router.settings[ROLE_ANALYTICS].engine_kwargs()
+    assert analytics['pool_pre_ping'] is True and analytics['pool_use_lifo'] is True
+
+
+async def test_pool_saturation_and_timeouts_are_attributed(tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'small.db'}"
+    await _seed(url, 'primary')
+    settings = {
+        role: PoolSettings.from_env(role, url, pool_size=1, max_overflow=0, pool_timeout=0.1)
+        for role in (ROLE_WRITE, ROLE_READ, ROLE_ANALYTICS)
+    }
+    router = DatabaseRouter(settings, {'pool_size': 1, 'max_overflow': 0, 'pool_timeout': 0.1}).start()
+    try:
+        async with router.engine(ROLE_WRITE).connect():
+            async with router.session_factory()() as session:
+                with pytest.raises(PoolTimeoutError):
+                    await ProbeRepository(session).read_source()
+
+        metrics = router.pool_metrics()
+        # The read role aliases write, so the timeout lands on the shared pool
+        assert metrics[ROLE_WRITE]['timeouts'] == 1
+        assert metrics[ROLE_WRITE]['saturated_checkouts'] >= 1
+        assert metrics[ROLE_WRITE]['peak_checked_out'] == 1
+        assert metrics[ROLE_WRITE]['checked_out'] == 0
+
+        async def hold():
+            async with router.session_factory()() as session:
+                await ProbeRepository(session).source()
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(hold() for _ in range(3)))
+        assert router.pool_metrics()[ROLE_WRITE]['timeouts'] == 1
+    finally:
+        await router.dispose()
@@ -0,0 +1,104 @@
+import asyncio
+import random
+import time
+
+import pytest
+
+from core.control.deadline_scheduler import DeadlineScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def scheduler(clock):
+    return DeadlineScheduler(clock=clock)
+
+
+def test_expired_keys_come_out_in_deadline_order(scheduler, clock):
+    scheduler.schedule('late', 30)
+    scheduler.schedule('early', 10)
+    scheduler.schedule('middle', 20)
+
+    clock.now = 25
+    assert scheduler.pop_expired() == ['early', 'middle']
+    assert len(scheduler) == 1
+    assert scheduler.next_deadline() == 30
+
+
+def test_cancel_and_extend(scheduler, clock):
+    scheduler.schedule('done', 10)
+    scheduler.schedule('extended', 10)
+
+    assert scheduler.cancel('done')
+    assert not scheduler.cancel('done')
+    assert scheduler.extend('extended', 60) == 70
+
+    clock.now = 15
+    assert scheduler.pop_expired() == []
+    clock.now = 70
+    assert scheduler.pop_expired() == ['extended']
+    assert scheduler.stats.fired == 1
+
+
+def test_extend_refuses_deadlines_that_already_passed(scheduler, clock):
+    scheduler.schedule('due', 10)
+    scheduler.schedule('fired', 5)
+    clock.now = 8
+    assert scheduler.pop_expired() == ['fired']
+
+    assert scheduler.extend('fired', 60) is None
+    clock.now = 12
+    # Due but not yet popped: the timeout still fires
+    assert scheduler.extend('due', 60) is None
+    assert scheduler.pop_expired() == ['due']
+
+
+def test_expiry_cost_tracks_expired_not_active(scheduler, clock):
+    """With 100k pending deadlines, one expiry examines only a handful of entries"""
+    rng = random.Random(7)
+    for index in range(100_000):
+        scheduler.schedule(f'cp-{index}', rng.uniform(60, 3600))
+    for index in range(0, 100_000, 2):
+        scheduler.cancel(f'cp-{index}')
+
+    first = scheduler.next_deadline()
+    clock.now = first
+    expired = scheduler.pop_expired()
+
+    assert len(expired) == 1
+    assert scheduler.stats.entries_examined < 100
+    assert len(scheduler) == 49_999
+
+
+@pytest.mark.asyncio
+async def test_run_fires_at_deadline():
+    """The runner wakes for a sooner deadline and fires close to it"""
+    scheduler = DeadlineScheduler()
+    fired = {}
+
+    async def on_expiry(key):
+        fired[key] = time.monotonic()
+
+    runner = asyncio.create_task(scheduler.run(on_expiry))
+    scheduler.schedule('slow', 5)
+    await asyncio.sleep(0)
+    deadline = scheduler.schedule('fast', 0.05)
+
+    await asyncio.sleep(0.2)
+    scheduler.stop()
+    await runner
+
+    assert list(fired) == ['fast']
+    assert fired['fast'] - deadline < 0.05
+    assert scheduler.stats.max_lateness < 0.05
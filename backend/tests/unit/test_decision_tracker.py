@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from data.processing.decisions.modules import decision_store
+from data.processing.decisions.modules.decision_tracker import DecisionTracker
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    tracker = DecisionTracker(store_path=str(tmp_path / 'decisions.db'), batch_size=50)
+    yield tracker
+    tracker.close()
+
+
+def run_decision(tracker, pipeline_id, index=0, status='completed'):
+    tracker.track_request(pipeline_id, {'index': index})
+    tracker.track_decision(pipeline_id, {'choice': 'retry'})
+    tracker.track_validation(pipeline_id, {'valid': True})
+    tracker.track_completion(pipeline_id, {'index': index}, status=status)
+
+
+def test_active_decision_lifecycle(tracker):
+    tracker.track_request('p1', {'reason': 'quality'})
+    tracker.track_decision('p1', {'choice': 'retry'})
+
+    status = tracker.get_status('p1')
+    assert status['status'] == 'decided'
+    assert status['timeline']['decided_at'] is not None
+
+    tracker.track_completion('p1', {'ok': True})
+    assert tracker.get_status('p1') is None
+    assert tracker.active_decisions == {}
+
+    [record] = tracker.get_history('p1').items
+    assert record['status'] == 'completed'
+    assert record['result'] == {'ok': True}
+
+
+def test_history_is_paginated_and_filtered(tracker):
+    for index in range(120):
+        run_decision(tracker, 'p1', index, status='failed' if index % 10 == 0 else 'completed')
+        run_decision(tracker, 'p2', index)
+
+    seen, cursor = [], None
+    while True:
+        page = tracker.get_history('p1', limit=25, cursor=cursor)
+        seen.extend(record['result']['index'] for record in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == list(range(119, -1, -1))
+    failed = tracker.get_history('p1', status='failed', limit=100).items
+    assert len(failed) == 12
+
+    future = tracker.get_history('p1', start=datetime.now() + timedelta(minutes=1))
+    assert future.items == []
+
+
+def test_history_survives_restart(tmp_path):
+    path = str(tmp_path / 'decisions.db')
+    tracker = DecisionTracker(store_path=path)
+    run_decision(tracker, 'p1')
+    tracker.close()
+
+    restarted = DecisionTracker(store_path=path)
+    assert len(restarted.get_history('p1').items) == 1
+    restarted.close()
+
+
+def test_default_store_is_a_file(tmp_path, monkeypatch):
+    path = tmp_path / 'state' / 'decision_history.db'
+    monkeypatch.delenv('DECISION_STORE_PATH', raising=False)
+    monkeypatch.setattr(decision_store, 'DEFAULT_STORE_PATH', str(path))
+
+    tracker = DecisionTracker()
+    run_decision(tracker, 'p1')
+    tracker.close()
+    assert path.exists()
+
+
+def test_failed_flush_is_logged_and_retried(tmp_path, caplog):
+    tracker = DecisionTracker(store_path=str(tmp_path / 'decisions.db'), batch_size=1)
+    tracker.history_store._connection.execute('ALTER TABLE decision_history RENAME TO moved')
+
+    run_decision(tracker, 'p1')
+    assert 'Failed to record decision history' in caplog.text
+    assert tracker.history_store.stats.pending == 1
+
+    tracker.history_store._connection.execute('ALTER TABLE moved RENAME TO decision_history')
+    assert len(tracker.get_history('p1').items) == 1
+    tracker.close()
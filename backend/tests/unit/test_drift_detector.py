@@ -0,0 +1,76 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data.processing.advanced_analytics.modules.model_evaluation.drift_detector import (
+    build_reference_sketches,
+    SlidingWindowDriftMonitor
+)
+
+
+@pytest.fixture
+def training_frame():
+    rng = np.random.default_rng(5)
+    return pd.DataFrame({
+        'amount': rng.normal(100, 15, size=5000),
+        'channel': rng.choice(['web', 'store', 'phone'], p=[0.6, 0.3, 0.1], size=5000)
+    })
+
+
+def _batch(rng, size, shift=0.0, channel_p=(0.6, 0.3, 0.1)):
+    return pd.DataFrame({
+        'amount': rng.normal(100 + shift, 15, size=size),
+        'channel': rng.choice(['web', 'store', 'phone'], p=list(channel_p), size=size)
+    })
+
+
+def test_sketches_are_serializable(training_frame):
+    """Sketches survive a JSON round trip into model metadata"""
+    sketches = build_reference_sketches(training_frame, bins=10)
+    restored = json.loads(json.dumps(sketches))
+
+    assert restored['amount']['kind'] == 'numeric'
+    assert len(restored['amount']['reference']) == 10
+    assert restored['channel']['categories'][-1] == '__other__'
+    assert sum(restored['channel']['reference']) == pytest.approx(1.0)
+
+
+def test_stable_inputs_do_not_drift(training_frame):
+    """Batches from the training distribution stay under all thresholds"""
+    rng = np.random.default_rng(1)
+    monitor = SlidingWindowDriftMonitor(build_reference_sketches(training_frame))
+    for _ in range(5):
+        monitor.update(_batch(rng, 1000))
+
+    result = monitor.compute()
+    assert not result['drift_detected']
+    assert result['features']['amount']['window_rows'] == 5000
+
+
+def test_shifted_inputs_drift_and_window_expires(training_frame):
+    """Shifted batches are flagged and old batches leave the window"""
+    rng = np.random.default_rng(2)
+    monitor = SlidingWindowDriftMonitor(build_reference_sketches(training_frame), window_batches=3)
+    for _ in range(3):
+        monitor.update(_batch(rng, 1000, shift=20.0, channel_p=(0.1, 0.3, 0.6)))
+
+    result = monitor.compute()
+    assert set(result['drifted_features']) == {'amount', 'channel'}
+    assert result['features']['amount']['psi'] > 0.2
+
+    for _ in range(3):
+        monitor.update(_batch(rng, 1000))
+    assert not monitor.compute()['drift_detected']
+
+
+def test_ks_is_only_reported_for_numeric_features(training_frame):
+    """Categorical buckets are unordered, so they get PSI and JS only"""
+    rng = np.random.default_rng(3)
+    monitor = SlidingWindowDriftMonitor(build_reference_sketches(training_frame))
+    monitor.update(_batch(rng, 1000))
+
+    features = monitor.compute()['features']
+    assert 'ks' in features['amount']
+    assert 'ks' not in features['channel']
@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web
+
+from data.processing.monitoring.exporters.export_pipeline import (
+    DROP_NEWEST,
+    ExportPipeline,
+    ExportPipelineConfig,
+    HTTPSink,
+    MetricRecord,
+    encode_line_protocol,
+    flatten_metrics
+)
+
+
+class StubSink:
+    """Local HTTP server that records payloads and can be switched off"""
+
+    def __init__(self):
+        self.payloads = []
+        self.available = True
+
+    async def handle(self, request):
+        if not self.available:
+            return web.Response(status=503, text='unavailable')
+        self.payloads.append(await request.read())
+        return web.Response(status=204)
+
+    @property
+    def lines(self):
+        return [line for payload in self.payloads for line in payload.decode().split('\n') if line]
+
+
+@pytest.fixture
+async def stub_server():
+    stub = StubSink()
+    app = web.Application()
+    app.router.add_post('/api/v2/write', stub.handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield stub, f'http://127.0.0.1:{port}/api/v2/write'
+    await runner.cleanup()
+
+
+def _records(count, measurement='system'):
+    return [
+        MetricRecord(measurement, {'metric': f'm{i % 10}'}, {'value': float(i)}, 1_700_000_000_000_000_000 + i)
+        for i in range(count)
+    ]
+
+
+def test_line_protocol_escapes_and_flattens():
+    records = flatten_metrics(
+        {'metrics': {'system cpu': {'usage,pct': 12.5, 'label': 'x', 'nan': float('nan')}}},
+        tags={'host': 'a b'}
+    )
+    payload = encode_line_protocol(records).decode()
+
+    assert len(records) == 1
+    assert payload.startswith('system\\ cpu,host=a\\ b,metric=usage\\,pct value=12.5 ')
+
+
+@pytest.mark.asyncio
+async def test_batches_by_size(stub_server):
+    stub, url = stub_server
+    pipeline = ExportPipeline(
+        HTTPSink(url, encode_line_protocol),
+        ExportPipelineConfig(
+            batch_size=1000, flush_interval=0.5, max_concurrent_flushes=4, max_queue_size=20_000
+        )
+    )
+    await pipeline.start()
+
+    pipeline.submit(_records(20_000))
+    await pipeline.flush()
+    await pipeline.stop()
+
+    assert len(stub.lines) == 20_000
+    assert len(stub.payloads) == 20
+    assert pipeline.stats.exported == 20_000
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_flushes_on_interval(stub_server):
+    stub, url = stub_server
+    pipeline = ExportPipeline(HTTPSink(url, encode_line_protocol), ExportPipelineConfig(flush_interval=0.05))
+    await pipeline.start()
+
+    pipeline.submit(_records(3))
+    await asyncio.sleep(0.3)
+
+    assert len(stub.lines) == 3
+    await pipeline.stop()
+
+
+@pytest.mark.asyncio
+async def test_unavailable_sink_spills_then_replays(stub_server, tmp_path):
+    stub, url = stub_server
+    stub.available = False
+    pipeline = ExportPipeline(
+        HTTPSink(url, encode_line_protocol),
+        ExportPipelineConfig(
+            batch_size=10, flush_interval=0.01, max_retries=1, retry_backoff=0.01,
+            spill_directory=str(tmp_path)
+        )
+    )
+    await pipeline.start()
+
+    pipeline.submit(_records(10))
+    await pipeline.flush()
+    assert pipeline.stats.spilled_batches == 1
+    assert len(list(tmp_path.glob('*.batch'))) == 1
+
+    stub.available = True
+    pipeline.submit(_records(10, measurement='later'))
+    await pipeline.flush()
+    await pipeline.stop()
+
+    assert len(stub.lines) == 20
+    assert pipeline.stats.replayed_batches == 1
+    assert list(tmp_path.glob('*.batch')) == []
+
+
+@pytest.mark.asyncio
+async def test_drop_policies_bound_the_queue(stub_server):
+    _, url = stub_server
+    pipeline = ExportPipeline(
+        HTTPSink(url, encode_line_protocol),
+        ExportPipelineConfig(max_queue_size=100, drop_policy=DROP_NEWEST)
+    )
+    await pipeline.start()
+
+    accepted = pipeline.submit(_records(250))
+    await pipeline.stop()
+
+    assert accepted == 100
+    assert pipeline.stats.dropped == 150
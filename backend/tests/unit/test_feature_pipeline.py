@@ -0,0 +1,79 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from data.processing.advanced_analytics.modules.feature_engineering.feature_pipeline import (
+    FeaturePipeline,
+    FittedStateCache,
+    correlated_columns,
+    engineer_features
+)
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(3)
+    a = rng.normal(size=500)
+    return pd.DataFrame({
+        'a': a,
+        'a_copy': a * 2 + 0.001 * rng.normal(size=500),
+        'b': rng.normal(size=500),
+        'c': rng.uniform(1, 5, size=500),
+        'target': (a > 0).astype('int64')
+    })
+
+
+def test_blocked_correlation_matches_dense_rule():
+    """Blocked correlation drops exactly what the dense upper-triangle scan drops"""
+    rng = np.random.default_rng(11)
+    base = rng.normal(size=(300, 40))
+    base[:, 25] = base[:, 3] * 0.99 + rng.normal(scale=0.01, size=300)
+    base[:, 39] = -base[:, 10]
+    columns = [f'f{i}' for i in range(40)]
+    frame = pd.DataFrame(base, columns=columns)
+
+    corr = frame.corr().abs()
+    upper = corr.where(np.triu(np.ones(corr.shape), k=1).astype(bool))
+    expected = [c for c in upper.columns if any(upper[c] > 0.95)]
+
+    assert correlated_columns(base, columns, threshold=0.95, block_size=7) == expected
+
+
+def test_pipeline_excludes_target_and_correlated_features(frame):
+    """The target never becomes a feature and near-duplicates are dropped"""
+    result = FeaturePipeline(cache=FittedStateCache()).fit_transform(frame)
+
+    assert 'target' not in result.features.columns
+    assert 'target_squared' not in result.extracted_features
+    assert 'a_copy' in result.dropped_correlated
+    assert set(result.features.columns) == set(result.selected_features)
+    assert all(result.lineage[name] in frame.columns for name in result.selected_features)
+
+
+def test_rerun_reuses_fitted_state(frame):
+    """A second run on identical data skips refitting and yields the same frame"""
+    cache = FittedStateCache()
+    first = FeaturePipeline(cache=cache).fit_transform(frame)
+    second = FeaturePipeline(cache=cache).fit_transform(frame)
+
+    assert not first.cache_hit
+    assert second.cache_hit
+    pd.testing.assert_frame_equal(first.features, second.features)
+
+
+def test_config_change_invalidates_fitted_state(frame):
+    """Fitted state is keyed by config as well as data"""
+    cache = FittedStateCache()
+    FeaturePipeline(cache=cache).fit_transform(frame)
+    result = FeaturePipeline({'correlation_threshold': 0.5}, cache=cache).fit_transform(frame)
+
+    assert not result.cache_hit
+
+
+async def test_engineer_features_is_the_async_entry_point(frame):
+    """Callers outside the analytics processor get the full result shape"""
+    result = await engineer_features(frame, {'correlation_threshold': 0.9})
+
+    assert 'target' not in result.features.columns
+    assert 'a_copy' in result.dropped_correlated or 'a' in result.dropped_correlated
+    assert set(result.lineage) == set(result.selected_features)
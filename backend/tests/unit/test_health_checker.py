@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 import asyncio
 from typing import Dict, Any, List
 
+from core.monitoring.health_probes import HealthProbeRegistry
 from core.services.monitoring.health_checker import HealthChecker, HealthCheckType
 from core.messaging.broker import MessageBroker
 from core.messaging.event_types import (
@@ -23,6 +24,13 @@ def mock_message_broker():
     broker.is_connected = Mock(return_value=True)
     return broker
 
+@pytest.fixture(autouse=True)
+def probe_registry():
+    # Probe results are cached process-wide; isolate them per test
+    registry = HealthProbeRegistry()
+    with patch('core.services.monitoring.health_checker.get_health_registry', return_value=registry):
+        yield registry
+
 @pytest.fixture
 def health_checker(mock_message_broker):
     return HealthChecker(mock_message_broker)
@@ -132,16 +140,18 @@ async def test_handle_component_status(health_checker, mock_message_broker, samp
 @pytest.mark.asyncio
 async def test_check_system_resources(health_checker):
     """Test system resource checking"""
-    with patch('psutil.cpu_percent') as mock_cpu_percent, \
-         patch('psutil.cpu_count') as mock_cpu_count, \
-         patch('psutil.virtual_memory') as mock_virtual_memory, \
-         patch('psutil.disk_usage') as mock_disk_usage:
-        
-        # Set up mock values
-        mock_cpu_percent.return_value = 50.0
-        mock_cpu_count.return_value = 4
-        mock_virtual_memory.return_value = Mock(percent=60.0, available=8000000000)
-        mock_disk_usage.return_value = Mock(percent=70.0, free=1000000000000)
+    snapshot = Mock(
+        cpu_percent=50.0,
+        cpu_count=4,
+        memory_percent=60.0,
+        memory_available=8000000000,
+        disk_percent=70.0,
+        disk_free=1000000000000,
+        timestamp=datetime.now().timestamp()
+    )
+    with patch('core.services.monitoring.health_checker.get_system_sampler') as mock_sampler:
+        # Resources come from the shared sampler snapshot
+        mock_sampler.return_value.latest.return_value = snapshot
         
         # Check system resources
         result = await health_checker._check_system_resources()
@@ -203,7 +213,8 @@ async def test_check_network_connectivity(health_checker):
         result = await health_checker._check_network_connectivity()
         
         # Verify results
-        assert result['endpoints']['api'] is True
+        # The API has its own probe and is not probed twice
+        assert 'api' not in result['endpoints']
         assert result['endpoints']['database'] is True
         assert result['status'] == 'healthy'
 
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from core.monitoring.health_probes import CircuitState, HealthProbeRegistry
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def counting_check(outcomes, delay=0.0):
+    calls = []
+
+    async def check():
+        calls.append(1)
+        if delay:
+            await asyncio.sleep(delay)
+        outcome = outcomes[min(len(calls), len(outcomes)) - 1]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return check, calls
+
+
+@pytest.mark.asyncio
+async def test_probes_run_concurrently_with_timeouts():
+    registry = HealthProbeRegistry()
+    in_flight, peak = [0], [0]
+
+    async def overlapping_check():
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        await asyncio.sleep(0.05)
+        in_flight[0] -= 1
+        return True
+
+    for name in ('a', 'b', 'c'):
+        registry.register(name, overlapping_check)
+    registry.register('slow', counting_check([True], delay=5)[0], timeout=0.1)
+
+    results = await registry.run_all()
+
+    assert peak[0] == 3
+    assert all(results[name].healthy for name in ('a', 'b', 'c'))
+    assert results['slow'].healthy is False
+    assert 'timed out' in results['slow'].error
+
+
+@pytest.mark.asyncio
+async def test_results_are_cached_and_shared():
+    clock = FakeClock()
+    registry = HealthProbeRegistry(clock=clock)
+    check, calls = counting_check([True], delay=0.05)
+    registry.register('db', check, ttl=15)
+
+    # Concurrent callers join the in-flight probe
+    await asyncio.gather(*(registry.run('db') for _ in range(20)))
+    assert len(calls) == 1
+
+    clock.now += 10
+    await registry.run('db')
+    assert len(calls) == 1
+
+    clock.now += 10
+    await registry.run('db')
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_and_recovers():
+    clock = FakeClock()
+    registry = HealthProbeRegistry(clock=clock)
+    check, calls = counting_check([ConnectionError('refused')] * 3 + [True])
+    registry.register('api', check, ttl=0, failure_threshold=3, recovery_timeout=30)
+
+    for _ in range(3):
+        result = await registry.run('api')
+    assert result.circuit == CircuitState.OPEN
+    assert result.consecutive_failures == 3
+
+    # Open circuit: no probe is sent
+    skipped = await registry.run('api')
+    assert skipped.healthy is False and len(calls) == 3
+
+    clock.now += 31
+    recovered = await registry.run('api')
+    assert recovered.healthy is True
+    assert recovered.circuit == CircuitState.CLOSED
+    assert registry.circuit_states()['api']['state'] == 'closed'
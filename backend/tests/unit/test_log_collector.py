@@ -0,0 +1,162 @@
+import os
+from datetime import datetime
+
+import pytest
+
+from data.processing.monitoring.collectors.log_collector import LogCollector, LogLineParser
+
+
+def _line(i, level='INFO'):
+    stamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S,%f')[:-3]
+    return f"{stamp} - pipeline.worker - {level} - processed batch {i}\n"
+
+
+def _append(path, text):
+    with open(path, 'a') as f:
+        f.write(text)
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    directory = tmp_path / 'logs'
+    directory.mkdir()
+    return directory
+
+
+@pytest.fixture
+def collector(log_dir, tmp_path):
+    return LogCollector([str(log_dir)], state_file=str(tmp_path / 'offsets.json'), batch_size=3)
+
+
+def test_parser_handles_known_formats():
+    parser = LogLineParser()
+
+    python_record = parser.parse("2024-05-01 10:00:00,123 - core.broker - ERROR - lost connection")
+    syslog_record = parser.parse("May  1 10:00:00 host1 sshd[42]: Accepted publickey")
+    celery_record = parser.parse("[2024-05-01 10:00:00,123: WARNING/MainProcess] retrying")
+
+    assert python_record['level'] == 'ERROR' and python_record['source'] == 'core.broker'
+    assert syslog_record['host'] == 'host1' and syslog_record['pid'] == '42'
+    assert celery_record['format'] == 'celery' and celery_record['message'] == 'retrying'
+    assert parser.parse("not a log line") is None
+
+
+@pytest.mark.asyncio
+async def test_reads_only_new_complete_lines(collector, log_dir):
+    path = log_dir / 'app.log'
+    _append(path, _line(1) + _line(2))
+
+    first = await collector.collect(['application'])
+    assert [r['message'] for r in first['logs']['application']] == ['processed batch 1', 'processed batch 2']
+
+    # A partial line is held back until its newline arrives
+    _append(path, _line(3) + _line(4)[:20])
+    second = await collector.collect(['application'])
+    assert [r['message'] for r in second['logs']['application']] == ['processed batch 3']
+
+    _append(path, _line(4)[20:])
+    third = await collector.collect(['application'])
+    assert [r['message'] for r in third['logs']['application']] == ['processed batch 4']
+
+    idle = await collector.collect(['application'])
+    assert idle['logs']['application'] == []
+    assert idle['stats']['bytes_read'] == 0
+    assert idle['stats']['files_read'] == 0
+
+
+@pytest.mark.asyncio
+async def test_traceback_lines_join_previous_record(collector, log_dir):
+    _append(log_dir / 'error.log', _line(1, 'ERROR') + "Traceback (most recent call last):\n  File \"x.py\"\n")
+
+    result = await collector.collect(['error'])
+
+    [record] = result['logs']['error']
+    assert record['message'].splitlines() == ['processed batch 1', 'Traceback (most recent call last):', '  File "x.py"']
+
+
+@pytest.mark.asyncio
+async def test_rotation_and_truncation(collector, log_dir):
+    path = log_dir / 'app.log'
+    _append(path, _line(1))
+    await collector.collect(['application'])
+
+    # Rotate: the old file keeps its cursor under the new name
+    _append(path, _line(2))
+    os.rename(path, log_dir / 'app.log.1')
+    _append(path, _line(3))
+    rotated = await collector.collect(['application'])
+    assert sorted(r['message'] for r in rotated['logs']['application']) == ['processed batch 2', 'processed batch 3']
+    assert rotated['stats']['rotations'] == 1
+
+    # Truncate in place (copytruncate)
+    with open(path, 'w') as f:
+        f.write(_line(4))
+    truncated = await collector.collect(['application'])
+    assert [r['message'] for r in truncated['logs']['application']] == ['processed batch 4']
+    assert truncated['stats']['truncations'] == 1
+
+
+@pytest.mark.asyncio
+async def test_offsets_survive_restart(collector, log_dir, tmp_path):
+    path = log_dir / 'service.log'
+    _append(path, _line(1))
+    await collector.collect(['application'])
+
+    _append(path, _line(2))
+    restarted = LogCollector([str(log_dir)], state_file=str(tmp_path / 'offsets.json'))
+    result = await restarted.collect(['application'])
+
+    assert [r['message'] for r in result['logs']['application']] == ['processed batch 2']
+
+
+@pytest.mark.asyncio
+async def test_records_are_shipped_in_batches(log_dir, tmp_path):
+    batches = []
+
+    async def sink(batch):
+        batches.append(batch)
+
+    collector = LogCollector([str(log_dir)], state_file=str(tmp_path / 'offsets.json'), batch_size=3, sink=sink)
+    _append(log_dir / 'app.log', ''.join(_line(i) for i in range(7)))
+
+    await collector.collect(['application'])
+
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+
+
+@pytest.mark.asyncio
+async def test_collection_cost_follows_new_volume(log_dir, tmp_path):
+    """A second cycle reads only the file that grew, and only its new bytes"""
+    block = ''.join(_line(i) for i in range(1000))
+    for index in range(8):
+        _append(log_dir / f'worker{index}-app.log', block)
+
+    collector = LogCollector([str(log_dir)], state_file=str(tmp_path / 'offsets.json'))
+    initial = await collector.collect(['application'])
+
+    _append(log_dir / 'worker0-app.log', ''.join(_line(i) for i in range(100)))
+    incremental = await collector.collect(['application'])
+
+    assert initial['stats']['files_read'] == 8
+    assert len(incremental['logs']['application']) == 100
+    assert incremental['stats']['files_read'] == 1
+    assert incremental['stats']['bytes_read'] < 100 * 100
+
+
+@pytest.mark.asyncio
+async def test_failed_sink_rereads_the_same_lines(log_dir, tmp_path):
+    shipped = []
+    failures = [RuntimeError("sink unavailable")]
+
+    def sink(batch):
+        if failures:
+            raise failures.pop()
+        shipped.extend(record['message'] for record in batch)
+
+    collector = LogCollector([str(log_dir)], state_file=str(tmp_path / 'offsets.json'), sink=sink)
+    _append(log_dir / 'app.log', ''.join(_line(i) for i in range(5)))
+
+    assert (await collector.collect(['application']))['status'] == 'error'
+    await collector.collect(['application'])
+
+    assert shipped == [f'processed batch {i}' for i in range(5)]
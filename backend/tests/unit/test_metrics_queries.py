@@ -0,0 +1,176 @@
+import random
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.schema import CreateTable
+
+from db.models.data.pipeline import PipelineRun, pipeline_run_rollups
+from db.models.staging.base import BaseStagedOutput
+from db.repository.data import DataRepository
+from db.repository.metrics import (
+    output_metrics_statement,
+    run_metrics_statement,
+    run_rollup_upsert,
+    summarize_outputs
+)
+
+
+@compiles(JSONB, 'sqlite')
+def _jsonb_on_sqlite(element, compiler, **kw):
+    return 'JSON'
+
+
+PIPELINE_ID = uuid.uuid4()
+START = datetime(2025, 3, 1)
+
+
+def make_runs(count):
+    rng = random.Random(7)
+    runs = []
+    for index in range(count):
+        status = rng.choice(['completed', 'completed', 'completed', 'failed', 'running'])
+        start = START + timedelta(minutes=7 * index)
+        duration = None if status == 'running' else float(rng.randint(1, 600))
+        runs.append({
+            'id': uuid.uuid4(),
+            'pipeline_id': PIPELINE_ID,
+            'version': 1,
+            'status': status,
+            'start_time': start,
+            'end_time': start + timedelta(seconds=duration) if duration else None,
+            'duration': duration,
+            'created_at': start,
+            'updated_at': start
+        })
+    return runs
+
+
+@pytest.fixture
+async def session():
+    engine = create_async_engine('sqlite+aiosqlite://')
+    tables = [PipelineRun.__table__, pipeline_run_rollups, BaseStagedOutput.__table__]
+    async with engine.begin() as connection:
+        # Plain DDL; the models' after_create hooks are PostgreSQL-only
+        for table in tables:
+            await connection.execute(CreateTable(table))
+    session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)()
+    yield session
+    await session.close()
+    await engine.dispose()
+
+
+async def test_pipeline_metrics_are_aggregated_in_sql(session):
+    runs = make_runs(500)
+    await session.execute(insert(PipelineRun.__table__), runs)
+    await session.commit()
+
+    statements = []
+    event.listen(
+        session.bind.sync_engine, 'before_cursor_execute',
+        lambda *args: statements.append(args[2])
+    )
+    metrics = await DataRepository(session).get_pipeline_metrics(PIPELINE_ID, bucket='day')
+
+    finished = [r for r in runs if r['duration'] is not None]
+    completed = [r for r in runs if r['status'] == 'completed']
+    assert metrics['total_runs'] == 500
+    assert metrics['successful_runs'] == len(completed)
+    assert metrics['status_breakdown']['running'] == 500 - len(finished)
+    assert metrics['average_duration'] == pytest.approx(
+        sum(r['duration'] for r in finished) / len(finished)
+    )
+    assert metrics['last_run'] == max(r['start_time'] for r in runs)
+    assert sum(b['total_runs'] for b in metrics['buckets']) == 500
+    assert metrics['buckets'][0]['bucket'].startswith('2025-03-01')
+    # One statement for the totals and one for the series
+    assert len(statements) == 2
+
+
+async def test_rollups_match_live_figures(session):
+    runs = make_runs(300)
+    await session.execute(insert(PipelineRun.__table__), runs)
+    for run in runs:
+        if run['status'] != 'running':
+            await session.execute(run_rollup_upsert(PipelineRun(**run), 'sqlite'))
+    await session.commit()
+
+    repository = DataRepository(session)
+    live = await repository.get_pipeline_metrics(PIPELINE_ID, bucket='day')
+    rolled = await repository.get_pipeline_metrics(PIPELINE_ID, bucket='day', use_rollups=True)
+
+    rows = (await session.execute(select(pipeline_run_rollups))).all()
+    assert len(rows) < 300
+    for key in ('successful_runs', 'failed_runs', 'average_duration'):
+        assert rolled[key] == pytest.approx(live[key])
+    assert rolled['duration']['min'] == live['duration']['min']
+    assert rolled['duration']['max'] == live['duration']['max']
+    assert [b['failed_runs'] for b in rolled['buckets']] == [b['failed_runs'] for b in live['buckets']]
+
+    # A rebuild from pipeline_runs reproduces the incremental rollups
+    await repository.rebuild_run_rollups(PIPELINE_ID)
+    rebuilt = await repository.get_pipeline_metrics(PIPELINE_ID, use_rollups=True)
+    assert rebuilt['successful_runs'] == rolled['successful_runs']
+    assert rebuilt['average_duration'] == pytest.approx(rolled['average_duration'])
+
+
+async def test_finishing_a_run_twice_folds_it_once(session):
+    [run] = [dict(r, status='running', end_time=None, duration=None) for r in make_runs(1)]
+    await session.execute(insert(PipelineRun.__table__), [run])
+    await session.commit()
+
+    repository = DataRepository(session)
+    await repository.update_run_status(run['id'], 'completed')
+    await repository.update_run_status(run['id'], 'completed')
+
+    rows = (await session.execute(select(pipeline_run_rollups))).all()
+    assert [(row.status, row.run_count) for row in rows] == [('completed', 1)]
+
+
+async def test_output_metrics_group_by_component_and_status(session):
+    outputs = []
+    for index in range(60):
+        outputs.append({
+            'id': uuid.uuid4(),
+            'stage_key': f'stage-{index}',
+            'pipeline_id': PIPELINE_ID,
+            'component_type': ['ANALYTICS', 'QUALITY'][index % 2],
+            'status': ['COMPLETED', 'FAILED', 'PENDING'][index % 3],
+            'processing_time': float(index),
+            'error_count': 1 if index % 3 == 1 else 0,
+            'data_size': 10,
+            'created_at': START + timedelta(hours=index),
+            'updated_at': START
+        })
+    await session.execute(insert(BaseStagedOutput.__table__), outputs)
+    await session.commit()
+
+    result = await session.execute(output_metrics_statement(PIPELINE_ID, 'sqlite', bucket='day'))
+    metrics = summarize_outputs(result.all())
+
+    assert metrics['total_outputs'] == 60
+    assert metrics['status_distribution'] == {'completed': 20, 'failed': 20, 'pending': 20}
+    assert metrics['component_breakdown']['analytics']['total'] == 30
+    assert metrics['average_processing_time'] == pytest.approx(29.5)
+    assert metrics['error_rate'] == pytest.approx(20 / 60)
+    assert [b['total'] for b in metrics['buckets']] == [24, 24, 12]
+
+
+def test_postgres_statements_compute_percentiles():
+    dialect = postgresql.dialect()
+    runs_sql = str(run_metrics_statement(PIPELINE_ID, 'postgresql', bucket='hour').compile(dialect=dialect))
+    outputs_sql = str(output_metrics_statement(PIPELINE_ID, 'postgresql').compile(dialect=dialect))
+
+    assert 'percentile_cont' in runs_sql and 'WITHIN GROUP' in runs_sql
+    assert 'FILTER (WHERE' in runs_sql
+    assert 'date_trunc' in runs_sql and 'GROUP BY' in runs_sql
+    assert 'percentile_cont' in outputs_sql and 'GROUP BY' in outputs_sql
@@ -0,0 +1,102 @@
+import json
+import math
+import random
+import statistics
+
+import pytest
+
+from core.monitoring.online_stats import EWMA, MetricSketch, P2Quantile, Welford
+
+
+def exact_quantile(values, q):
+    ordered = sorted(values)
+    rank = q * (len(ordered) - 1)
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def test_welford_matches_batch_statistics():
+    values = [random.gauss(100, 15) for _ in range(5000)]
+    stats = Welford()
+    for value in values:
+        stats.update(value)
+
+    assert stats.mean == pytest.approx(statistics.mean(values))
+    assert stats.std_dev == pytest.approx(statistics.stdev(values))
+    assert stats.minimum == min(values) and stats.maximum == max(values)
+
+    left, right = Welford(), Welford()
+    for value in values[:2000]:
+        left.update(value)
+    for value in values[2000:]:
+        right.update(value)
+    left.merge(right)
+    assert left.variance == pytest.approx(stats.variance)
+
+
+def test_p2_quantiles_track_exact_values():
+    random.seed(7)
+    values = [random.lognormvariate(0, 0.5) for _ in range(20000)]
+    for q in (0.5, 0.95, 0.99):
+        estimator = P2Quantile(q)
+        for value in values:
+            estimator.update(value)
+        assert estimator.value == pytest.approx(exact_quantile(values, q), rel=0.03)
+
+
+def test_p2_is_exact_while_warming_up():
+    estimator = P2Quantile(0.5)
+    for value in (50.0, 60.0, 55.0):
+        estimator.update(value)
+    assert estimator.value == 55.0
+
+
+def test_ewma_follows_level_shift():
+    ewma = EWMA(alpha=0.2)
+    for _ in range(50):
+        ewma.update(10.0)
+    for _ in range(50):
+        ewma.update(20.0)
+    assert ewma.mean == pytest.approx(20.0, abs=0.01)
+
+
+def test_sketch_scores_spikes_and_round_trips():
+    sketch = MetricSketch()
+    for value in [50.0, 52.0, 51.0, 49.0, 50.0, 51.0, 50.0, 52.0, 49.0, 50.0, 51.0, 50.0]:
+        sketch.update(value)
+
+    assert abs(sketch.score(50.5)) < 2
+    assert sketch.update(90.0) > 3
+
+    restored = MetricSketch.from_dict(json.loads(json.dumps(sketch.to_dict())))
+    assert restored.summary() == sketch.summary()
+
+
+def test_flat_series_scores_stay_finite():
+    sketch = MetricSketch()
+    for _ in range(50):
+        sketch.update(100.0)
+
+    assert sketch.score(100.0) == 0.0
+    spike = sketch.update(120.0)
+    assert math.isfinite(spike) and spike > 3
+    # The score is stored on the sketch, so it has to survive strict JSON
+    json.dumps(sketch.to_dict(), allow_nan=False)
+
+    zero = MetricSketch()
+    for _ in range(50):
+        zero.update(0.0)
+    assert math.isfinite(zero.score(-1.0)) and zero.score(-1.0) < 0
+
+
+def test_sketch_size_does_not_grow_with_history():
+    sketch = MetricSketch()
+    for i in range(20000):
+        sketch.update(float(i % 97))
+    size = len(json.dumps(sketch.to_dict()))
+
+    for i in range(40000):
+        sketch.update(float(i % 97))
+    assert sketch.moments.count == 60000
+    assert abs(len(json.dumps(sketch.to_dict())) - size) < 20
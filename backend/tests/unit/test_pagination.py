@@ -0,0 +1,210 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import CheckConstraint, Column, DateTime, Index, Integer, MetaData, String, Uuid, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.schema import CreateTable
+
+from db.models.data.pipeline import Pipeline, PipelineStep, QualityGate
+from db.repository.auth import PipelineRepository
+from db.repository.base import BaseRepository
+from db.repository.pagination import (
+    CountCache,
+    InvalidCursorError,
+    count_cache,
+    encode_cursor,
+    filter_fingerprint
+)
+
+Base = declarative_base()
+EPOCH = datetime(2025, 1, 1)
+
+
+class Item(Base):
+    __tablename__ = 'pagination_items'
+
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    created_at = Column(DateTime, nullable=False)
+    group = Column(String(10), nullable=False)
+    rank = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index('ix_pagination_items_keyset', 'created_at', 'id'),
+        Index('ix_pagination_items_group_keyset', 'group', 'created_at', 'id'),
+    )
+
+
+async def _session_with_rows(rows: int):
+    engine = create_async_engine('sqlite+aiosqlite://')
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        batch = []
+        for index in range(rows):
+            # Pairs share a timestamp so the id tiebreak is exercised
+            batch.append({
+                'id': uuid.uuid4(),
+                'created_at': EPOCH + timedelta(seconds=index // 2),
+                'group': 'even' if index % 2 == 0 else 'odd',
+                'rank': index
+            })
+            if len(batch) == 10000:
+                await connection.execute(insert(Item), batch)
+                batch = []
+        if batch:
+            await connection.execute(insert(Item), batch)
+    return engine, async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)()
+
+
+@pytest.fixture(autouse=True)
+def clear_count_cache():
+    count_cache.invalidate()
+    yield
+    count_cache.invalidate()
+
+
+@pytest.fixture
+async def repository():
+    engine, session = await _session_with_rows(250)
+    yield BaseRepository(session)
+    await session.close()
+    await engine.dispose()
+
+
+async def test_cursor_walk_visits_every_row_once(repository):
+    seen, cursor = [], None
+    while True:
+        page = await repository.list_all(Item, page_size=40, cursor=cursor)
+        seen.extend(item.rank for item in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert len(seen) == 250
+    assert len(set(seen)) == 250
+    assert page.total_count == 250
+    # Newest first on (created_at, id)
+    timestamps = [EPOCH + timedelta(seconds=rank // 2) for rank in seen]
+    assert timestamps == sorted(timestamps, reverse=True)
+
+
+async def test_filters_are_bound_to_the_cursor(repository):
+    first = await repository.list_all(Item, filters={'group': 'odd'}, page_size=100)
+    second = await repository.list_all(
+        Item, filters={'group': 'odd'}, page_size=100, cursor=first.next_cursor
+    )
+
+    assert {item.group for item in first.items + second.items} == {'odd'}
+    assert len(first.items) + len(second.items) == 125
+    assert second.next_cursor is None
+
+    with pytest.raises(InvalidCursorError):
+        await repository.list_all(Item, filters={'group': 'even'}, cursor=first.next_cursor)
+    with pytest.raises(InvalidCursorError):
+        await repository.list_all(Item, cursor='not-a-cursor')
+
+
+async def test_exact_counts_are_cached_per_filter(repository):
+    await repository.list_all(Item, filters={'group': 'odd'}, page_size=10)
+    hits = count_cache.hits
+    await repository.list_all(Item, filters={'group': 'odd'}, page_size=10)
+    assert count_cache.hits == hits + 1
+
+    page = await repository.list_all(Item, page_size=10, count_mode='none')
+    assert page.total_count is None
+
+    # Estimates fall back to the exact count off PostgreSQL
+    page = await repository.list_all(Item, page_size=10, count_mode='estimate')
+    assert page.total_count == 250 and not page.count_estimated
+
+    await repository.create(
+        {'created_at': EPOCH, 'group': 'odd', 'rank': -1}, Item
+    )
+    page = await repository.list_all(Item, filters={'group': 'odd'}, page_size=10)
+    assert page.total_count == 126
+
+
+def test_count_cache_expires_and_evicts():
+    now = [0.0]
+    cache = CountCache(ttl=5, max_entries=2, clock=lambda: now[0])
+    cache.set('t', 'a', 1)
+    cache.set('t', 'b', 2)
+    cache.set('t', 'c', 3)
+    assert cache.get('t', 'a') is None
+    assert cache.get('t', 'c') == 3
+
+    now[0] = 6
+    assert cache.get('t', 'b') is None
+
+
+async def test_deep_cursor_page_matches_offset_page():
+    page_size = 10
+    rows = 2000
+    engine, session = await _session_with_rows(rows)
+    repository = BaseRepository(session)
+    try:
+        deep_page = rows // page_size - 1
+        ordered = select(Item).order_by(Item.created_at.desc(), Item.id.desc())
+        anchor = (await session.execute(
+            ordered.offset((deep_page - 1) * page_size - 1).limit(1)
+        )).scalar_one()
+        fingerprint = filter_fingerprint(Item.__tablename__, None, 'created_at')
+        deep_cursor = encode_cursor([anchor.created_at, anchor.id], fingerprint)
+
+        deep = await repository.list_all(
+            Item, page_size=page_size, count_mode='none', cursor=deep_cursor
+        )
+        offset_rows = (await session.execute(
+            ordered.offset((deep_page - 1) * page_size).limit(page_size)
+        )).scalars().all()
+
+        assert [item.id for item in deep.items] == [item.id for item in offset_rows]
+        assert deep.next_cursor is not None
+    finally:
+        await session.close()
+        await engine.dispose()
+
+
+async def test_pipeline_listing_pages_dicts_on_an_async_session():
+    engine = create_async_engine('sqlite+aiosqlite://')
+    metadata = MetaData()
+    async with engine.begin() as connection:
+        # Plain DDL; the models' after_create hooks and CHECKs are PostgreSQL-only
+        for table in (Pipeline.__table__, PipelineStep.__table__, QualityGate.__table__):
+            copy = table.to_metadata(metadata)
+            for constraint in [c for c in copy.constraints if isinstance(c, CheckConstraint)]:
+                copy.constraints.discard(constraint)
+            await connection.execute(CreateTable(copy, include_foreign_key_constraints=[]))
+    session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)()
+    try:
+        session.add_all([
+            Pipeline(name=f'pipeline-{index}', updated_at=EPOCH + timedelta(minutes=index))
+            for index in range(5)
+        ])
+        await session.commit()
+
+        # The same call PipelineService.list_pipelines makes for the router
+        def list_page(cursor):
+            return lambda sync: PipelineRepository(sync).list_pipelines(
+                {}, page_size=3, cursor=cursor
+            )
+
+        first = await session.run_sync(list_page(None))
+        second = await session.run_sync(list_page(first.next_cursor))
+
+        names = [pipeline['name'] for pipeline in first.items + second.items]
+        assert names == [f'pipeline-{index}' for index in reversed(range(5))]
+        assert first.total_count == 5
+        assert second.next_cursor is None
+        assert first.items[0]['steps'] == [] and isinstance(first.items[0]['id'], str)
+        assert BaseRepository.to_dict(
+            (await session.execute(select(Pipeline).limit(1))).scalar_one()
+        )['name'].startswith('pipeline-')
+    finally:
+        await session.close()
+        await engine.dispose()
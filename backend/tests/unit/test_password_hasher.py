@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("passlib")
+pytest.importorskip("bcrypt")
+
+from core.services.auth.password_hasher import HashingLimitExceeded, PasswordHasher, crypt_context
+
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher(rounds=4, workers=2, max_pending=4, per_key_limit=1)
+    yield hasher
+    hasher.shutdown()
+
+
+@pytest.fixture
+def slow_hasher():
+    # Enough cost that jobs are still running when the limits are probed
+    hasher = PasswordHasher(rounds=10, workers=1, max_pending=4, per_key_limit=1)
+    yield hasher
+    hasher.shutdown()
+
+
+async def test_hash_and_verify_off_the_loop(hasher):
+    hashed = await hasher.hash('s3cret')
+    assert hashed.startswith('$2b$04$')
+    assert await hasher.verify('s3cret', hashed)
+    assert not await hasher.verify('wrong', hashed)
+    assert hasher.pending == 0
+    assert hasher.stats.to_dict()['verified'] == 2
+
+
+async def test_changed_cost_rehashes_on_verify(hasher):
+    old_hash = crypt_context(5).hash('s3cret')
+
+    valid, new_hash = await hasher.verify_and_update('s3cret', old_hash)
+    assert valid and new_hash.startswith('$2b$04$')
+    assert await hasher.verify_and_update('s3cret', new_hash) == (True, None)
+    # A wrong password never yields a replacement hash
+    assert await hasher.verify_and_update('wrong', old_hash) == (False, None)
+    assert hasher.stats.rehashed == 1
+
+
+async def test_per_key_and_pool_limits(slow_hasher):
+    hasher = slow_hasher
+    first = asyncio.create_task(hasher.hash('a', ['account:alice', 'ip:10.0.0.1']))
+    await asyncio.sleep(0)
+    with pytest.raises(HashingLimitExceeded):
+        await hasher.hash('b', ['ip:10.0.0.1'])
+    # Other accounts and addresses are unaffected until the pool is full
+    others = [asyncio.create_task(hasher.hash('c', [f"account:user{index}"])) for index in range(3)]
+    await asyncio.sleep(0)
+    assert hasher.pending == 4
+    with pytest.raises(HashingLimitExceeded):
+        await hasher.hash('d', ['account:user9'])
+
+    await asyncio.gather(first, *others)
+    assert hasher.pending == 0
+    assert hasher.stats.rejected == 2
+    await hasher.hash('e', ['ip:10.0.0.1'])
+
+
+async def test_cancelled_callers_keep_their_slot_until_work_ends(slow_hasher):
+    hasher = slow_hasher
+    task = asyncio.create_task(hasher.hash('a', ['account:alice']))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    with pytest.raises(HashingLimitExceeded):
+        await hasher.hash('b', ['account:alice'])
+
+    while hasher.pending:
+        await asyncio.sleep(0.01)
+    await hasher.hash('b', ['account:alice'])
+
+
+async def test_verification_leaves_the_loop_free(slow_hasher):
+    stored = crypt_context(10).hash('s3cret')
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    tick = asyncio.create_task(ticker())
+    try:
+        valid, _ = await slow_hasher.verify_and_update('s3cret', stored, ['account:alice'])
+    finally:
+        tick.cancel()
+
+    assert valid
+    # Other coroutines kept running while bcrypt worked on the pool
+    assert ticks > 1
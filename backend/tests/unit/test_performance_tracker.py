@@ -46,7 +46,7 @@ async def test_initialization(performance_tracker, mock_message_broker):
     assert performance_tracker.baseline_window == timedelta(hours=24)
     assert performance_tracker.anomaly_threshold == 2.0
     assert performance_tracker.min_samples == 100
-    assert performance_tracker.performance_history == {}
+    assert len(performance_tracker.performance_store) == 0
     assert performance_tracker.performance_baselines == {}
     
     # Verify message broker subscriptions
@@ -65,77 +65,27 @@ async def test_handle_metrics_update(performance_tracker, mock_message_broker, s
     
     await performance_tracker._handle_metrics_update(message)
     
-    # Verify metrics were stored
-    assert 'test_pipeline' in performance_tracker.performance_history
-    assert len(performance_tracker.performance_history['test_pipeline']) == 1
+    # Verify one series per numeric metric was stored
+    store = performance_tracker.performance_store
+    assert len(store.select(pipeline_id='test_pipeline')) == 5
     
     # Verify stored metrics
-    stored_metrics = performance_tracker.performance_history['test_pipeline'][0]
-    assert 'timestamp' in stored_metrics
-    assert stored_metrics['metrics'] == sample_metrics
+    cpu = store.query('system.cpu_percent', pipeline_id='test_pipeline')[0]
+    assert cpu.values.tolist() == [50.0]
+    assert performance_tracker._sample_count('test_pipeline') == 1
 
-@pytest.mark.asyncio
-async def test_cleanup_old_metrics(performance_tracker):
-    """Test cleanup of old metrics"""
-    pipeline_id = 'test_pipeline'
-    
-    # Add old metrics
-    old_time = datetime.now() - timedelta(hours=25)
-    performance_tracker.performance_history[pipeline_id] = [
-        {'timestamp': old_time, 'metrics': {'system': {'cpu_percent': 50.0}}},
-        {'timestamp': datetime.now(), 'metrics': {'system': {'cpu_percent': 60.0}}}
-    ]
-    
-    # Clean up old metrics
-    performance_tracker._cleanup_old_metrics(pipeline_id)
-    
-    # Verify only recent metrics remain
-    assert len(performance_tracker.performance_history[pipeline_id]) == 1
-    assert performance_tracker.performance_history[pipeline_id][0]['timestamp'] > old_time
-
-@pytest.mark.asyncio
-async def test_extract_metrics_data(performance_tracker):
-    """Test extraction of metrics data"""
-    history = [
-        {
-            'timestamp': datetime.now(),
-            'metrics': {
-                'system': {'cpu_percent': 50.0, 'memory_percent': 75.0},
-                'performance': {'response_time': 0.5}
-            }
-        },
-        {
-            'timestamp': datetime.now(),
-            'metrics': {
-                'system': {'cpu_percent': 60.0, 'memory_percent': 85.0},
-                'performance': {'response_time': 0.6}
-            }
-        }
-    ]
-    
-    metrics_data = performance_tracker._extract_metrics_data(history)
-    
-    # Verify extracted data structure
-    assert 'system' in metrics_data
-    assert 'performance' in metrics_data
-    assert len(metrics_data['system']['cpu_percent']) == 2
-    assert len(metrics_data['system']['memory_percent']) == 2
-    assert len(metrics_data['performance']['response_time']) == 2
+def _feed(tracker, pipeline_id, category, key, values):
+    for value in values:
+        tracker._update_stats(pipeline_id, category, key, value)
 
 @pytest.mark.asyncio
 async def test_calculate_performance_metrics(performance_tracker):
-    """Test calculation of performance metrics"""
-    metrics_data = {
-        'system': {
-            'cpu_percent': [50.0, 60.0, 55.0],
-            'memory_percent': [75.0, 85.0, 80.0]
-        },
-        'performance': {
-            'response_time': [0.5, 0.6, 0.55]
-        }
-    }
+    """Test calculation of performance metrics from online sketches"""
+    _feed(performance_tracker, 'test_pipeline', 'system', 'cpu_percent', [50.0, 60.0, 55.0])
+    _feed(performance_tracker, 'test_pipeline', 'system', 'memory_percent', [75.0, 85.0, 80.0])
+    _feed(performance_tracker, 'test_pipeline', 'performance', 'response_time', [0.5, 0.6, 0.55])
     
-    performance_metrics = performance_tracker._calculate_performance_metrics(metrics_data)
+    performance_metrics = performance_tracker._calculate_performance_metrics('test_pipeline')
     
     # Verify calculated metrics
     assert 'system' in performance_metrics
@@ -145,46 +95,38 @@ async def test_calculate_performance_metrics(performance_tracker):
     cpu_metrics = performance_metrics['system']['cpu_percent']
     assert cpu_metrics['mean'] == 55.0
     assert cpu_metrics['median'] == 55.0
+    assert cpu_metrics['std_dev'] == pytest.approx(5.0)
     assert cpu_metrics['min'] == 50.0
     assert cpu_metrics['max'] == 60.0
 
 @pytest.mark.asyncio
 async def test_detect_anomalies(performance_tracker):
     """Test anomaly detection"""
-    metrics_data = {
-        'system': {
-            'cpu_percent': [50.0, 60.0, 55.0, 90.0],  # 90.0 is an anomaly
-            'memory_percent': [75.0, 85.0, 80.0, 95.0]  # 95.0 is an anomaly
-        }
-    }
+    steady = [50.0, 52.0, 51.0, 49.0, 50.0, 51.0, 50.0, 52.0, 49.0, 50.0, 51.0, 50.0]
+    _feed(performance_tracker, 'test_pipeline', 'system', 'cpu_percent', steady + [90.0])
+    _feed(performance_tracker, 'test_pipeline', 'system', 'memory_percent', steady + [50.5])
     
-    performance_metrics = performance_tracker._calculate_performance_metrics(metrics_data)
-    anomalies = performance_tracker._detect_anomalies(metrics_data, performance_metrics)
+    anomalies = performance_tracker._detect_anomalies('test_pipeline')
     
-    # Verify anomalies were detected
-    assert 'system' in anomalies
-    assert len(anomalies['system']) > 0
+    # Only the spike is flagged
+    assert [a['metric'] for a in anomalies['system']] == ['cpu_percent']
     
     # Check anomaly details
     for anomaly in anomalies['system']:
-        assert 'metric' in anomaly
-        assert 'value' in anomaly
+        assert anomaly['value'] == 90.0
+        assert anomaly['severity'] == 'high'
         assert 'threshold' in anomaly
-        assert 'severity' in anomaly
+        assert 'score' in anomaly
 
 @pytest.mark.asyncio
 async def test_compare_with_baseline(performance_tracker):
     """Test baseline comparison"""
     pipeline_id = 'test_pipeline'
     
-    # Set up baseline
-    baseline_metrics = {
-        'system': {
-            'cpu_percent': {'mean': 50.0},
-            'memory_percent': {'mean': 75.0}
-        }
-    }
-    performance_tracker.performance_baselines[pipeline_id] = baseline_metrics
+    # Set up baseline sketches
+    _feed(performance_tracker, 'baseline', 'system', 'cpu_percent', [50.0])
+    _feed(performance_tracker, 'baseline', 'system', 'memory_percent', [75.0])
+    performance_tracker.performance_baselines[pipeline_id] = performance_tracker.metric_stats['baseline']
     
     # Current performance metrics
     current_metrics = {
@@ -212,9 +154,7 @@ async def test_handle_performance_analysis(performance_tracker, mock_message_bro
     """Test handling of performance analysis request"""
     # Set up test data
     pipeline_id = 'test_pipeline'
-    performance_tracker.performance_history[pipeline_id] = [
-        {'timestamp': datetime.now(), 'metrics': {'system': {'cpu_percent': 50.0}}}
-    ] * 150  # More than min_samples
+    _feed(performance_tracker, pipeline_id, 'system', 'cpu_percent', [50.0] * 150)  # More than min_samples
     
     message = ProcessingMessage(
         message_type=MessageType.MONITORING_PERFORMANCE_ANALYZE,
@@ -233,9 +173,7 @@ async def test_handle_baseline_update(performance_tracker, mock_message_broker):
     """Test handling of baseline update request"""
     # Set up test data
     pipeline_id = 'test_pipeline'
-    performance_tracker.performance_history[pipeline_id] = [
-        {'timestamp': datetime.now(), 'metrics': {'system': {'cpu_percent': 50.0}}}
-    ] * 150  # More than min_samples
+    _feed(performance_tracker, pipeline_id, 'system', 'cpu_percent', [50.0] * 150)  # More than min_samples
     
     message = ProcessingMessage(
         message_type=MessageType.MONITORING_BASELINE_UPDATE,
@@ -250,4 +188,41 @@ async def test_handle_baseline_update(performance_tracker, mock_message_broker):
     # Verify baseline update notification was published
     mock_message_broker.publish.assert_called_once()
     published_message = mock_message_broker.publish.call_args[0][0]
-    assert published_message.message_type == MessageType.MONITORING_BASELINE_UPDATE 
\ No newline at end of file
+    assert published_message.message_type == MessageType.MONITORING_BASELINE_UPDATE 
+    # The baseline is frozen and a new comparison period starts
+    assert performance_tracker.performance_baselines[pipeline_id]['system']['cpu_percent'].count == 150
+    assert performance_tracker._sample_count(pipeline_id) == 0
+
+@pytest.mark.asyncio
+async def test_baselines_persist_as_sketches(mock_message_broker, tmp_path):
+    """Baselines survive a restart without keeping raw samples"""
+    path = str(tmp_path / 'baselines.json')
+    tracker = PerformanceTracker(mock_message_broker, baseline_path=path)
+    _feed(tracker, 'test_pipeline', 'system', 'cpu_percent', [float(v) for v in range(200)])
+
+    await tracker._handle_baseline_update(ProcessingMessage(
+        message_type=MessageType.MONITORING_BASELINE_UPDATE,
+        content={'pipeline_id': 'test_pipeline'}
+    ))
+
+    restored = PerformanceTracker(mock_message_broker, baseline_path=path)
+    sketch = restored.performance_baselines['test_pipeline']['system']['cpu_percent']
+    assert sketch.count == 200
+    assert sketch.moments.mean == pytest.approx(99.5)
+    assert sketch.quantile(0.95) == pytest.approx(189.05, rel=0.05)
+
+@pytest.mark.asyncio
+async def test_pipeline_cleanup_drops_series_and_sketches(performance_tracker, sample_metrics):
+    for pipeline_id in ('done', 'running'):
+        await performance_tracker._handle_metrics_update(ProcessingMessage(
+            message_type=MessageType.MONITORING_METRICS_UPDATE,
+            content={'pipeline_id': pipeline_id, 'metrics': sample_metrics}
+        ))
+
+    await performance_tracker._handle_pipeline_cleanup(ProcessingMessage(
+        message_type=MessageType.PIPELINE_CLEANUP_REQUEST,
+        content={'pipeline_id': 'done'}
+    ))
+
+    assert performance_tracker.performance_store.label_values('pipeline_id') == {'running'}
+    assert set(performance_tracker.metric_stats) == {'running'}
@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import CheckConstraint, MetaData
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.schema import CreateTable
+
+from api.fastapi_app.dependencies.pagination import PaginationParams
+from api.fastapi_app.routers.pipeline import list_pipelines
+from core.control.status_index import pipeline_status_index
+from core.services.pipeline.pipeline_service import PipelineService
+from db.models.data.pipeline import Pipeline, PipelineStep, QualityGate
+
+EPOCH = datetime(2025, 1, 1)
+
+
+@pytest.fixture
+async def session():
+    engine = create_async_engine('sqlite+aiosqlite://')
+    metadata = MetaData()
+    async with engine.begin() as connection:
+        # Plain DDL; the models' after_create hooks and CHECKs are PostgreSQL-only
+        for table in (Pipeline.__table__, PipelineStep.__table__, QualityGate.__table__):
+            copy = table.to_metadata(metadata)
+            for constraint in [c for c in copy.constraints if isinstance(c, CheckConstraint)]:
+                copy.constraints.discard(constraint)
+            await connection.execute(CreateTable(copy, include_foreign_key_constraints=[]))
+    session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)()
+    yield session
+    await session.close()
+    await engine.dispose()
+    pipeline_status_index.clear()
+
+
+def _service():
+    # Listing only needs the orchestrator's live contexts, not its broker
+    service = PipelineService.__new__(PipelineService)
+    service.active_contexts = {}
+    return service
+
+
+async def test_list_pipelines_pages_and_attaches_runtime_status(session):
+    pipelines = [
+        Pipeline(name=f'pipeline-{index}', updated_at=EPOCH + timedelta(minutes=index))
+        for index in range(3)
+    ]
+    session.add_all(pipelines)
+    await session.commit()
+    running = str(pipelines[2].id)
+    pipeline_status_index.set(running, {'state': 'running', 'current_stage': 'quality'})
+
+    service = _service()
+    first = await list_pipelines(
+        pagination=PaginationParams(cursor=None, per_page=2, count='exact'),
+        filters=None, current_user={}, pipeline_service=service, db=session
+    )
+    second = await list_pipelines(
+        pagination=PaginationParams(cursor=first['next_cursor'], per_page=2, count='none'),
+        filters=None, current_user={}, pipeline_service=service, db=session
+    )
+
+    names = [pipeline['name'] for pipeline in first['pipelines'] + second['pipelines']]
+    assert names == ['pipeline-2', 'pipeline-1', 'pipeline-0']
+    assert first['total_count'] == 3 and second['next_cursor'] is None
+    newest = first['pipelines'][0]
+    assert newest['id'] == running
+    assert newest['runtime_status']['state'] == 'running'
+    assert 'runtime_status' not in first['pipelines'][1]
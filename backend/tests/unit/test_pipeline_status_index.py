@@ -0,0 +1,110 @@
+from types import SimpleNamespace
+
+from core.control.status_index import STATUS_FIELDS, PipelineStatusIndex, status_view, subscribed_events
+
+
+class RecordingBroker:
+    def __init__(self):
+        self.subscriptions = []
+
+    async def subscribe(self, module_identifier, message_patterns, callback):
+        self.subscriptions.append((module_identifier, message_patterns, callback))
+
+
+def test_cpm_notifications_track_the_pipeline():
+    index = PipelineStatusIndex()
+    index.set('p1', {'state': 'pending', 'current_stage': 'reception', 'progress': 0.0})
+
+    index.apply_notification('p1', 'stage_started', {'stage': 'quality', 'department': 'quality'})
+    index.apply_notification('p1', 'progress_update', {'stage': 'quality', 'overall_progress': 0.4})
+    index.apply_notification('p1', 'stage_error', {'stage': 'quality', 'error': 'bad rows'})
+    status = index.get('p1')
+    assert status['state'] == 'running' and status['current_stage'] == 'quality'
+    assert status['progress'] == 0.4
+    assert status['error_count'] == 1 and status['last_error'] == 'bad rows'
+
+    index.apply_notification('p1', 'stage_completed', {'stage': 'quality', 'next_stage': 'insight'})
+    index.apply_notification('p1', 'pipeline_completed', {'summary': {}})
+    status = index.get('p1')
+    assert status['state'] == 'completed' and status['last_completed_stage'] == 'quality'
+    assert status['completed_at'] is not None
+
+
+async def test_broker_events_update_and_clean_up():
+    index = PipelineStatusIndex()
+    broker = RecordingBroker()
+    await index.attach(broker)
+    await index.attach(broker)
+    assert len(broker.subscriptions) == 1
+    assert broker.subscriptions[0][1] == subscribed_events()
+    callback = broker.subscriptions[0][2]
+
+    def message(event_type, **content):
+        return SimpleNamespace(message_type=SimpleNamespace(value=event_type), content=content)
+
+    await callback(message('pipeline.start.complete', pipeline_id='p1', status='started'))
+    await callback(message('pipeline.stage.status.update', pipeline_id='p1', stage='analytics', status='started'))
+    assert index.get('p1')['state'] == 'running'
+    assert index.get('p1')['current_stage'] == 'analytics'
+
+    await callback(message(
+        'pipeline.stage.complete.notify', pipeline_id='p1', stage='analytics',
+        next_stage='report', progress={'overall': 0.8}
+    ))
+    await callback(message('pipeline.pause.complete', pipeline_id='p1'))
+    status = index.get('p1')
+    assert (status['state'], status['current_stage'], status['progress']) == ('paused', 'report', 0.8)
+
+    await callback(message('pipeline.cleanup.complete', pipeline_id='p1', status='success'))
+    assert 'p1' not in index
+    # Malformed messages are logged, never raised into the broker
+    await callback(SimpleNamespace(message_type='pipeline.start.complete', content=None))
+
+
+def test_get_many_returns_copies_of_known_pipelines_only():
+    index = PipelineStatusIndex(max_entries=3)
+    for number in range(4):
+        index.set(f"p{number}", {'state': 'running'})
+
+    # The least recently written entry makes room
+    assert len(index) == 3 and 'p0' not in index
+    statuses = index.get_many(['p1', 'p3', 'missing'])
+    assert set(statuses) == {'p1', 'p3'}
+    statuses['p1']['state'] = 'mutated'
+    assert index.get('p1')['state'] == 'running'
+
+
+
+async def test_late_events_do_not_revive_discarded_pipelines():
+    index = PipelineStatusIndex()
+    broker = RecordingBroker()
+    await index.attach(broker)
+    callback = broker.subscriptions[0][2]
+
+    def message(event_type, **content):
+        return SimpleNamespace(message_type=SimpleNamespace(value=event_type), content=content)
+
+    # Nothing but a start event (or set) opens an entry
+    await callback(message('pipeline.stage.status.update', pipeline_id='p1', stage='quality'))
+    await callback(message('pipeline.error.notify', pipeline_id='p1', error='late'))
+    index.apply_notification('p1', 'progress_update', {'overall_progress': 0.5})
+    assert 'p1' not in index
+
+    await callback(message('pipeline.start.complete', pipeline_id='p1'))
+    await callback(message('pipeline.cleanup.complete', pipeline_id='p1'))
+    await callback(message('pipeline.stage.error', pipeline_id='p1', error='after cleanup'))
+    await callback(message('pipeline.pause.complete', pipeline_id='p1'))
+    assert len(index) == 0
+
+
+def test_statuses_share_one_shape():
+    index = PipelineStatusIndex()
+    index.set('p1', {'state': 'running', 'progress': {'overall': 0.25}, 'extra': 'dropped'})
+    index.set('p2', {'state': 'pending'})
+    index.record_error('p2', 'bad rows')
+
+    statuses = index.get_many(['p1', 'p2'])
+    assert {tuple(status) for status in statuses.values()} == {STATUS_FIELDS}
+    assert statuses['p1']['progress'] == 0.25
+    assert statuses['p2']['error_count'] == 1 and statuses['p2']['last_error'] == 'bad rows'
+    assert status_view({'pipeline_id': 'p3'})['pending_decision'] is False
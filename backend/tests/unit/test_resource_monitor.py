@@ -151,7 +151,7 @@ async def test_handle_threshold_update(resource_monitor, mock_message_broker):
 @pytest.mark.asyncio
 async def test_collect_resource_metrics(resource_monitor):
     """Test resource metrics collection"""
-    with patch('psutil.cpu_percent') as mock_cpu_percent, \
+    with patch('core.services.monitoring.resource_monitor.get_system_sampler') as mock_sampler, \
          patch('psutil.cpu_count') as mock_cpu_count, \
          patch('psutil.cpu_freq') as mock_cpu_freq, \
          patch('psutil.cpu_times') as mock_cpu_times, \
@@ -160,7 +160,7 @@ async def test_collect_resource_metrics(resource_monitor):
          patch('psutil.net_io_counters') as mock_net_io:
         
         # Set up mock values
-        mock_cpu_percent.return_value = 75.0
+        mock_sampler.return_value.latest.return_value = Mock(cpu_percent=75.0)
         mock_cpu_count.return_value = 4
         mock_cpu_freq.return_value = Mock(current=2.5, min=1.0, max=3.0)
         mock_cpu_times.return_value = Mock(user=100.0, system=50.0, idle=200.0)
@@ -0,0 +1,128 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import CheckConstraint, MetaData, func, insert, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.schema import CreateTable
+
+from db.models.staging.base import BaseStagedOutput, ProcessingStatus
+from db.models.staging.processing import StagedAnalyticsOutput
+from db.repository.staging import StagingRepository, _subtype_key_columns
+
+
+@compiles(JSONB, 'sqlite')
+def _jsonb_on_sqlite(element, compiler, **kw):
+    return 'JSON'
+
+
+PIPELINE_ID = uuid.uuid4()
+NOW = datetime.utcnow()
+
+
+async def _seeded_session(rows: int):
+    engine = create_async_engine('sqlite+aiosqlite://')
+    metadata = MetaData()
+    tables = [BaseStagedOutput.__table__] + list({c.table for c in _subtype_key_columns()})
+    async with engine.begin() as connection:
+        # Plain DDL; the models' after_create hooks and CHECKs are PostgreSQL-only
+        for table in tables:
+            copy = table.to_metadata(metadata)
+            for constraint in [c for c in copy.constraints if isinstance(c, CheckConstraint)]:
+                copy.constraints.discard(constraint)
+            await connection.execute(CreateTable(copy, include_foreign_key_constraints=[]))
+
+        statuses = [ProcessingStatus.PENDING, ProcessingStatus.IN_PROGRESS,
+                    ProcessingStatus.FAILED, ProcessingStatus.COMPLETED]
+        batch, children = [], []
+        for index in range(rows):
+            # A leading hex letter keeps SQLite's NUMERIC affinity from coercing ids
+            output_id = uuid.UUID(int=(0xA << 124) | index)
+            batch.append({
+                'id': output_id,
+                'stage_key': f'stage-{index}',
+                'pipeline_id': PIPELINE_ID,
+                'component_type': 'ANALYTICS',
+                'status': statuses[index % 4],
+                'retry_count': index % 5,
+                'storage_path': f'/staging/{index}.parquet',
+                # Every other output has expired; the first half are old
+                'expires_at': NOW - timedelta(hours=1) if index % 2 == 0 else NOW + timedelta(hours=1),
+                'created_at': NOW - timedelta(days=2) if index < rows // 2 else NOW,
+                'updated_at': NOW
+            })
+            children.append({'base_id': output_id, 'model_type': 'regression'})
+            if len(batch) == 20000:
+                await connection.execute(insert(BaseStagedOutput.__table__), batch)
+                await connection.execute(insert(StagedAnalyticsOutput.__table__), children)
+                batch, children = [], []
+        if batch:
+            await connection.execute(insert(BaseStagedOutput.__table__), batch)
+            await connection.execute(insert(StagedAnalyticsOutput.__table__), children)
+    return engine, async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)()
+
+
+@pytest.fixture
+async def repository():
+    engine, session = await _seeded_session(2000)
+    yield StagingRepository(session)
+    await session.close()
+    await engine.dispose()
+
+
+async def _count(session, *conditions):
+    result = await session.execute(select(func.count()).select_from(BaseStagedOutput.__table__).where(*conditions))
+    return result.scalar_one()
+
+
+async def test_cleanup_cancels_only_expired_open_outputs(repository):
+    expired = await repository.cleanup_expired_outputs(batch_size=128)
+
+    # index % 2 == 0 and status pending (index % 4 == 0); in_progress never has an even index
+    assert len(expired) == 500
+    assert len(set(expired)) == 500
+    session = repository.db_session
+    assert await _count(session, BaseStagedOutput.last_error == 'expired') == 500
+    assert await _count(session, BaseStagedOutput.status == ProcessingStatus.CANCELLED) == 500
+
+    assert await repository.cleanup_expired_outputs() == []
+
+
+async def test_cleanup_respects_batch_cap(repository):
+    expired = await repository.cleanup_expired_outputs(batch_size=100, max_batches=2)
+    assert len(expired) == 200
+
+
+async def test_retry_failed_outputs_is_set_based(repository):
+    retried = await repository.retry_failed_outputs(PIPELINE_ID, max_retries=3, batch_size=64)
+
+    # Failed outputs are index % 4 == 2, retry_count = index % 5
+    expected = sum(1 for index in range(2000) if index % 4 == 2 and index % 5 < 3)
+    assert len(retried) == expected
+    session = repository.db_session
+    assert await _count(session, BaseStagedOutput.status == ProcessingStatus.FAILED) == 500 - expected
+    assert await _count(
+        session, BaseStagedOutput.id.in_(retried), BaseStagedOutput.retry_count == 0
+    ) == 0
+
+
+async def test_delete_expired_outputs_yields_batches_with_paths(repository):
+    cutoff = NOW - timedelta(days=1)
+    deleted = []
+    async for batch in repository.delete_expired_outputs(cutoff, batch_size=300):
+        assert len(batch) <= 300
+        deleted.extend(batch)
+
+    assert len(deleted) == 1000
+    assert all(path.startswith('/staging/') for _, path in deleted)
+    session = repository.db_session
+    assert await _count(session) == 1000
+    children = await session.execute(select(func.count()).select_from(StagedAnalyticsOutput.__table__))
+    assert children.scalar_one() == 1000
+
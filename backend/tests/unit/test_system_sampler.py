@@ -0,0 +1,73 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("psutil")
+
+from core.monitoring.system_sampler import SystemSampler
+
+
+@pytest.fixture
+def sampler():
+    sampler = SystemSampler(interval=0.05)
+    sampler.start()
+    yield sampler
+    sampler.stop()
+
+
+def test_background_thread_refreshes_snapshot(sampler):
+    """Snapshots are replaced by the sampler thread, not by readers"""
+    first = sampler.latest()
+    time.sleep(0.2)
+    second = sampler.latest()
+
+    assert sampler.running
+    assert second is not first
+    assert second.timestamp > first.timestamp
+    assert 0.0 <= second.cpu_percent <= 100.0
+    assert second.process.memory_rss > 0
+
+
+def test_reads_never_sample(sampler, monkeypatch):
+    """Readers get the current snapshot; only the thread calls psutil"""
+    sampler.stop()
+    calls = []
+    monkeypatch.setattr(sampler, '_sample', lambda: calls.append(1))
+
+    snapshot = sampler.latest()
+    assert all(sampler.latest() is snapshot for _ in range(1000))
+    assert calls == []
+
+
+def test_track_attributes_usage_per_label(sampler):
+    """Usage recorded under a label appears in later snapshots"""
+    def busy():
+        with sampler.track('pipeline-1:analytics'):
+            end = time.perf_counter() + 0.05
+            while time.perf_counter() < end:
+                pass
+
+    worker = threading.Thread(target=busy)
+    worker.start()
+    worker.join()
+    time.sleep(0.15)
+
+    usage = sampler.latest().tasks['pipeline-1:analytics']
+    assert usage.runs == 1
+    assert usage.active == 0
+    assert usage.cpu_seconds > 0
+    assert usage.wall_seconds >= 0.05
+
+
+def test_pipeline_labels_are_evicted(sampler):
+    """Cleanup drops a pipeline's labels, even one tracked while evicting"""
+    with sampler.track('p1:quality.start'):
+        pass
+    sampler._record('p1:quality.detect', runs=1)
+    sampler._record('p10:quality.start', runs=1)
+
+    with sampler.track('p1:insight.start'):
+        assert sampler.evict_pipeline('p1') == 3
+
+    assert set(sampler.usage()) == {'p10:quality.start'}
@@ -0,0 +1,111 @@
+import random
+
+import pytest
+
+from core.control.task_queue import TaskPriorityQueue
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def queue(clock):
+    return TaskPriorityQueue(aging_rate=0.1, clock=clock)
+
+
+def _drain(queue):
+    order = []
+    while queue:
+        order.append(queue.pop().task_id)
+    return order
+
+
+def test_pop_order_matches_priority_with_fifo_ties(queue):
+    queue.push('low', None, 1)
+    queue.push('high-a', None, 5)
+    queue.push('high-b', None, 5)
+    queue.push('mid', None, 3)
+
+    assert _drain(queue) == ['high-a', 'high-b', 'mid', 'low']
+
+
+def test_update_and_remove_by_id(queue):
+    for index in range(10):
+        queue.push(f't{index}', None, index)
+
+    assert queue.update_priority('t0', 100)
+    assert queue.remove('t9').task_id == 't9'
+    assert queue.remove('t9') is None
+    assert 't9' not in queue
+
+    assert _drain(queue) == ['t0', 't8', 't7', 't6', 't5', 't4', 't3', 't2', 't1']
+
+
+def test_aging_lets_old_tasks_overtake_without_rescoring(queue, clock):
+    queue.push('old', None, 1)
+    clock.now = 30  # 30s * 0.1 aging = +3 priority
+    queue.push('new', None, 3.5)
+
+    assert queue.effective_priority('old') == pytest.approx(4.0)
+    assert queue.pop().task_id == 'old'
+
+
+def test_moved_entry_keeps_its_age(clock):
+    source = TaskPriorityQueue(aging_rate=0.1, clock=clock)
+    target = TaskPriorityQueue(aging_rate=0.1, clock=clock)
+    source.push('moved', None, 1)
+    clock.now = 50
+    target.push('resident', None, 5)
+
+    target.push_entry(source.remove('moved'))
+    assert target.pop().task_id == 'moved'
+
+
+def test_admission_follows_backpressure_level(clock):
+    queue = TaskPriorityQueue(max_size=2, clock=clock)
+
+    assert queue.admits(0, 'low')
+    assert not queue.admits(0, 'medium')
+    assert not queue.admits(1, 'high')
+    assert queue.admits(2, 'high')
+
+    queue.push('a', None, 3)
+    queue.push('b', None, 3)
+    assert not queue.admits(3, 'low')
+
+
+def test_heap_stays_consistent_under_random_operations(clock):
+    rng = random.Random(0)
+    queue = TaskPriorityQueue(aging_rate=0.0, clock=clock)
+    expected = {}
+    for step in range(5000):
+        action = rng.random()
+        if action < 0.5 or not expected:
+            task_id = f't{step}'
+            priority = rng.randint(0, 100)
+            queue.push(task_id, None, priority)
+            expected[task_id] = priority
+        elif action < 0.7:
+            task_id = rng.choice(list(expected))
+            expected[task_id] = rng.randint(0, 100)
+            queue.update_priority(task_id, expected[task_id])
+        elif action < 0.85:
+            task_id = rng.choice(list(expected))
+            queue.remove(task_id)
+            del expected[task_id]
+        else:
+            entry = queue.pop()
+            assert entry.priority == max(expected.values())
+            del expected[entry.task_id]
+
+    assert len(queue) == len(expected)
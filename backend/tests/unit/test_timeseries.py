@@ -0,0 +1,101 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.monitoring.timeseries import TimeSeriesStore
+
+
+@pytest.fixture
+def store():
+    return TimeSeriesStore(raw_capacity=1000, rollups={1: 120, 60: 60, 3600: 24})
+
+
+def test_ring_keeps_only_latest_points(store):
+    """Raw storage is bounded by capacity and stays time-ordered"""
+    for second in range(2500):
+        store.record('cpu', float(second), {'host': 'a'}, timestamp=float(second))
+
+    series = store.query('cpu', host='a')[0]
+    assert len(series.values) == 1000
+    assert series.timestamps[0] == 1500.0
+    assert np.all(np.diff(series.timestamps) > 0)
+
+
+def test_range_query_across_wraparound(store):
+    for second in range(1500):
+        store.record('cpu', float(second), timestamp=float(second))
+
+    series = store.query('cpu', start=995.0, end=1005.0)[0]
+    assert series.values.tolist() == [float(v) for v in range(995, 1005)]
+
+
+def test_rollups_aggregate_min_max_sum_count(store):
+    for second in range(180):
+        store.record('latency', float(second % 60), timestamp=float(second))
+
+    minutes = store.query('latency', resolution=60)[0]
+    assert minutes.timestamps.tolist() == [0.0, 60.0, 120.0]
+    assert minutes.count.tolist() == [60, 60, 60]
+    assert minutes.minimum.tolist() == [0.0, 0.0, 0.0]
+    assert minutes.maximum.tolist() == [59.0, 59.0, 59.0]
+    assert minutes.values.tolist() == [29.5, 29.5, 29.5]
+
+
+def test_label_index_selects_series(store):
+    store.record('rows', 1, {'source_type': 'api', 'source_id': 'x'})
+    store.record('rows', 2, {'source_type': 'db', 'source_id': 'y'})
+    store.record('errors', 3, {'source_type': 'api', 'source_id': 'x'})
+
+    assert len(store.select(source_type='api')) == 2
+    assert len(store.select('rows', source_type='api')) == 1
+    assert store.select('rows', source_type='file') == []
+    assert store.drop(source_id='x') == 2
+    assert len(store) == 1
+
+
+def test_memory_is_bounded(store):
+    store.record('cpu', 0.0, timestamp=0.0)
+    for second in range(1, 200_000, 7):
+        store.record('cpu', float(second), timestamp=float(second))
+    size = store.nbytes
+    for second in range(200_000, 400_000, 7):
+        store.record('cpu', float(second), timestamp=float(second))
+
+    assert store.nbytes == size
+
+
+
+def test_full_store_evicts_least_recently_written():
+    """New series replace the stalest one instead of being refused"""
+    small = TimeSeriesStore(raw_capacity=10, rollups={}, max_series=2)
+    small.record('cpu', 1.0, {'pipeline_id': 'a'})
+    small.record('cpu', 1.0, {'pipeline_id': 'b'})
+    small.record('cpu', 2.0, {'pipeline_id': 'a'})
+    small.record('cpu', 1.0, {'pipeline_id': 'c'})
+
+    assert small.label_values('pipeline_id') == {'a', 'c'}
+    assert small.evicted == 1
+
+
+def test_drop_removes_empty_index_entries(store):
+    store.record('rows', 1, {'pipeline_id': 'p1'})
+    store.record('rows', 1, {'pipeline_id': 'p2'})
+
+    assert store.drop(pipeline_id='p1') == 1
+    assert ('pipeline_id', 'p1') not in store._by_label
+    store.drop(pipeline_id='p2')
+    assert store._by_name == {} and store._by_label == {}
+
+
+def test_range_query_matches_linear_scan():
+    """Binary-search range queries return exactly what a scan would"""
+    store = TimeSeriesStore(raw_capacity=1000, rollups={})
+    for second in range(1500):
+        store.record('cpu', float(second), timestamp=float(second))
+    series = store.series('cpu')
+    timestamps = store.query('cpu')[0].timestamps
+
+    for start, end in ((500.0, 560.0), (999.5, 1200.0), (1499.0, 2000.0), (0.0, 10.0)):
+        data = series.range(start, end)
+        expected = timestamps[(timestamps >= start) & (timestamps < end)]
+        assert data['timestamp'].tolist() == expected.tolist()
@@ -0,0 +1,107 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+pytest.importorskip("fastapi")
+pytest.importorskip("jose")
+pytest.importorskip("passlib")
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateTable
+
+from core.services.auth.principal_cache import principal_cache
+from core.services.auth.token_revocation import BloomFilter, TokenRevocationStore
+from db.models.auth.session import revoked_tokens
+
+
+@pytest.fixture
+async def sessions():
+    engine = create_async_engine('sqlite+aiosqlite://', poolclass=StaticPool)
+    async with engine.begin() as connection:
+        await connection.execute(CreateTable(revoked_tokens))
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+def _in(seconds):
+    return datetime.utcnow() + timedelta(seconds=seconds)
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(10000, error_rate=0.01)
+    added = [uuid.uuid4().hex for _ in range(10000)]
+    for jti in added:
+        bloom.add(jti)
+
+    assert all(jti in bloom for jti in added)
+    false_positives = sum(uuid.uuid4().hex in bloom for _ in range(20000))
+    assert false_positives / 20000 < 0.02
+
+
+async def test_revoke_then_refuse(sessions):
+    store = TokenRevocationStore(sessions)
+    principal_cache.set('jti-1', {'id': str(uuid.uuid4()), 'roles': [], 'permissions': []})
+
+    await store.revoke('jti-1', _in(60), user_id=str(uuid.uuid4()), reason='logout')
+    # Revoking twice is harmless
+    await store.revoke('jti-1', _in(60))
+
+    assert await store.is_revoked('jti-1')
+    assert not await store.is_revoked('jti-2')
+    assert principal_cache.get('jti-1') is None
+    assert store.stats.lookups == 0
+
+
+async def test_unrevoked_tokens_never_touch_the_database(sessions):
+    store = TokenRevocationStore(sessions, capacity=1000, error_rate=0.001)
+    for index in range(200):
+        await store.revoke(f"revoked-{index}", _in(60))
+
+    checks = 5000
+    for _ in range(checks):
+        assert not await store.is_revoked(uuid.uuid4().hex)
+
+    assert store.stats.bloom_negatives + store.stats.false_positives == checks
+    assert store.stats.lookups <= checks * 0.01
+
+
+async def test_revocations_reach_other_workers(sessions):
+    first = TokenRevocationStore(sessions)
+    second = TokenRevocationStore(sessions)
+    await second.load()
+
+    await first.revoke('shared', _in(60))
+    # Cached principal on the worker that did not see the logout
+    principal_cache.set('shared', {'id': str(uuid.uuid4()), 'roles': [], 'permissions': []})
+    assert not second.might_be_revoked('shared')
+    assert await second.sync() == 1
+    assert second.might_be_revoked('shared')
+    assert await second.is_revoked('shared')
+    assert principal_cache.get('shared') is None
+
+    # A fresh worker picks every active revocation up when it loads
+    third = TokenRevocationStore(sessions)
+    assert await third.is_revoked('shared')
+
+
+async def test_purge_drops_expired_rows_and_rebuilds(sessions):
+    store = TokenRevocationStore(sessions)
+    await store.revoke('expired', _in(60))
+    await store.revoke('active', _in(60))
+    async with sessions() as session:
+        await session.execute(
+            update(revoked_tokens).where(revoked_tokens.c.jti == 'expired').values(expires_at=_in(-1))
+        )
+        await session.commit()
+
+    assert await store.purge() == 1
+    assert not store.might_be_revoked('expired')
+    assert await store.is_revoked('active')
+    async with sessions() as session:
+        assert (await session.execute(select(func.count()).select_from(revoked_tokens))).scalar() == 1
+    assert store.stats.rebuilds == 2
@@ -0,0 +1,92 @@
+import pytest
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+
+from data.processing.advanced_analytics.modules.model_training import tuning_engine
+from data.processing.advanced_analytics.modules.model_training.tuning_engine import (
+    MatrixCache,
+    successive_halving_schedule,
+    run_successive_halving,
+    feature_drop_scores
+)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def small_pool():
+    tuning_engine.configure_cpu_budget(2)
+    yield
+    tuning_engine.shutdown_pool()
+
+
+@pytest.fixture
+def classification_data():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(600, 4)), columns=['a', 'b', 'c', 'd'])
+    y = pd.Series((X['a'] + 0.5 * X['b'] > 0).astype('int64'), name='target')
+    return X, y
+
+
+def test_schedule_shrinks_candidates_and_grows_resource():
+    """Each rung keeps ~1/eta of the candidates and the last uses all rows"""
+    schedule = successive_halving_schedule(108, max_resource=8000, min_resource=296, eta=3)
+
+    assert schedule[0] == (108, 296)
+    assert schedule[-1][1] == 8000
+    assert [c for c, _ in schedule] == sorted([c for c, _ in schedule], reverse=True)
+
+
+def test_matrix_cache_reuses_prepared_folds(tmp_path, classification_data):
+    """The same data maps to the same cached matrices and splits"""
+    X, y = classification_data
+    cache = MatrixCache(cache_dir=tmp_path)
+
+    first = cache.prepare(X, y, n_splits=3)
+    second = cache.prepare(X, y, n_splits=3)
+
+    assert first is second
+    assert len(first.folds) == 3
+    assert first.scoring == 'accuracy'
+
+
+
+def test_evicted_matrices_are_not_served_from_stale_maps(tmp_path, classification_data):
+    """Worker mappings of evicted files are released and rewrites remapped"""
+    X, y = classification_data
+    cache = MatrixCache(cache_dir=tmp_path, max_entries=1)
+
+    first = cache.prepare(X, y, n_splits=3)
+    tuning_engine._load(first.x_path)
+    assert any(path == first.x_path for path, _ in tuning_engine._WORKER_ARRAYS)
+
+    cache.prepare(X.iloc[:300], y.iloc[:300], n_splits=3)
+    assert not any(path == first.x_path for path, _ in tuning_engine._WORKER_ARRAYS)
+
+    again = cache.prepare(X, y, n_splits=3)
+    assert tuning_engine._load(again.x_path).shape == X.shape
+
+@pytest.mark.asyncio
+async def test_successive_halving_reports_time_to_best(classification_data):
+    """The search returns a fitted model and a monotone time-to-best curve"""
+    X, y = classification_data
+    grid = {'n_estimators': [5, 10, 20], 'max_depth': [1, 3, None]}
+
+    model, report = await run_successive_halving(
+        RandomForestClassifier(random_state=0), grid, X, y, eta=3, min_resource=60, n_splits=3
+    )
+
+    assert report.best_params in [dict(p) for p in tuning_engine.ParameterGrid(grid)]
+    assert len(report.rungs) >= 2
+    assert report.rungs[-1]['candidates'] < report.rungs[0]['candidates']
+    scores = [point['best_score'] for point in report.time_to_best]
+    assert scores == sorted(scores)
+    assert model.predict(X.to_numpy()).shape == (len(X),)
+
+
+def test_feature_drop_scores_flags_informative_feature(classification_data):
+    """Dropping the strongest feature costs the most score"""
+    X, y = classification_data
+    baseline, dropped = feature_drop_scores(RandomForestClassifier(n_estimators=20, random_state=0), X, y, n_splits=3)
+
+    impacts = {column: baseline - score for column, score in dropped.items()}
+    assert max(impacts, key=impacts.get) == 'a'
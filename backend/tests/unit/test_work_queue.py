@@ -0,0 +1,200 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+pytest.importorskip("psutil")
+
+from sqlalchemy import CheckConstraint, MetaData, select, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from core.control.work_queue import DurableWorkQueue
+from db.models.core.events import EventQueue
+from db.repository.work_queue import ItemResult, WorkQueueRepository
+
+
+@compiles(JSONB, 'sqlite')
+def _jsonb_on_sqlite(element, compiler, **kw):
+    return 'JSON'
+
+
+def _event_id(index: int) -> uuid.UUID:
+    # A leading hex letter keeps SQLite's NUMERIC affinity from coercing ids
+    return uuid.UUID(int=(0xA << 124) | index)
+
+
+@pytest.fixture
+async def sessions():
+    engine = create_async_engine('sqlite+aiosqlite://', poolclass=StaticPool)
+    copy = EventQueue.__table__.to_metadata(MetaData())
+    for constraint in [c for c in copy.constraints if isinstance(c, CheckConstraint)]:
+        copy.constraints.discard(constraint)
+    async with engine.begin() as connection:
+        # Plain DDL; the models' after_create hooks are PostgreSQL-only
+        await connection.execute(CreateTable(copy, include_foreign_key_constraints=[]))
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def _statuses(sessions):
+    async with sessions() as session:
+        rows = await session.execute(select(EventQueue.__table__.c.status, EventQueue.__table__.c.attempt_count))
+        return rows.all()
+
+
+async def test_claims_by_priority_then_schedule(sessions):
+    now = datetime.utcnow()
+    async with sessions() as session:
+        repository = WorkQueueRepository(session)
+        await repository.enqueue_many([
+            {'event_id': _event_id(0), 'priority': 1, 'scheduled_time': now - timedelta(seconds=5)},
+            {'event_id': _event_id(1), 'priority': 5, 'scheduled_time': now - timedelta(seconds=1)},
+            {'event_id': _event_id(2), 'priority': 5, 'scheduled_time': now - timedelta(seconds=3)},
+            {'event_id': _event_id(3), 'priority': 9, 'scheduled_time': now + timedelta(hours=1)},
+        ])
+
+        first = await repository.claim(2, visibility_timeout=30)
+        second = await repository.claim(10, visibility_timeout=30)
+
+    assert [item.event_id for item in first] == [_event_id(2), _event_id(1)]
+    # The future item is not due yet
+    assert [item.event_id for item in second] == [_event_id(0)]
+    assert all(item.attempt_count == 1 for item in first + second)
+
+
+async def test_failures_back_off_and_give_up(sessions):
+    async with sessions() as session:
+        repository = WorkQueueRepository(session)
+        await repository.enqueue_many([{'event_id': _event_id(0)}])
+
+        for attempt in range(1, 4):
+            [item] = await repository.claim(1, visibility_timeout=30)
+            assert item.attempt_count == attempt
+            await repository.acknowledge(
+                [ItemResult(item, 0.01, 1.5, error='boom')],
+                max_attempts=3, backoff=lambda attempt: 0
+            )
+
+        assert await repository.claim(1, visibility_timeout=30) == []
+        row = (await session.execute(select(EventQueue.__table__))).one()
+        assert row.status == 'failed'
+        assert row.error_log['attempt'] == 3
+        assert row.execution_time == pytest.approx(0.01)
+
+
+async def test_backoff_delays_visibility(sessions):
+    async with sessions() as session:
+        repository = WorkQueueRepository(session)
+        await repository.enqueue_many([{'event_id': _event_id(0)}])
+        [item] = await repository.claim(1, visibility_timeout=30)
+        await repository.acknowledge([ItemResult(item, 0.0, error='boom')], backoff=lambda attempt: 60)
+
+        assert await repository.claim(1, visibility_timeout=30) == []
+        row = (await session.execute(select(EventQueue.__table__))).one()
+        assert row.status == 'pending'
+        assert row.scheduled_time > datetime.utcnow() + timedelta(seconds=50)
+
+
+async def test_expired_leases_are_reclaimed_and_fenced(sessions):
+    async with sessions() as session:
+        repository = WorkQueueRepository(session)
+        await repository.enqueue_many([{'event_id': _event_id(0)}])
+        [stale] = await repository.claim(1, visibility_timeout=30)
+
+        # Simulate the worker dying past its lease
+        await session.execute(
+            update(EventQueue.__table__).values(lease_expires_at=datetime.utcnow() - timedelta(seconds=1))
+        )
+        await session.commit()
+        assert await repository.reclaim_expired() == 1
+
+        [fresh] = await repository.claim(1, visibility_timeout=30)
+        assert fresh.id == stale.id and fresh.attempt_count == 2
+
+        # The stale worker's late ack no longer matches the lease
+        await repository.acknowledge([ItemResult(stale, 1.0)])
+        assert await _statuses(sessions) == [('processing', 2)]
+
+        await repository.acknowledge([ItemResult(fresh, 0.5, 2.0)])
+        assert await _statuses(sessions) == [('completed', 2)]
+
+
+async def test_engine_processes_and_records_metrics(sessions):
+    seen = []
+
+    async def handler(item):
+        seen.append(item.event_id)
+        if item.event_id == _event_id(3):
+            raise RuntimeError('bad payload')
+
+    queue = DurableWorkQueue(sessions, handler, batch_size=4, backoff=lambda attempt: 3600)
+    await queue.enqueue({'event_id': _event_id(index)} for index in range(10))
+
+    while await queue.run_once():
+        pass
+
+    assert sorted(seen) == sorted(_event_id(index) for index in range(10))
+    assert queue.stats.completed == 9 and queue.stats.failed == 1
+    async with sessions() as session:
+        depth = await WorkQueueRepository(session).get_queue_depth()
+        timings = await session.execute(
+            select(EventQueue.__table__.c.execution_time, EventQueue.__table__.c.memory_usage)
+            .where(EventQueue.__table__.c.status == 'completed')
+        )
+    assert depth == {'completed': 9, 'pending': 1}
+    assert all(elapsed is not None and memory is not None for elapsed, memory in timings.all())
+
+
+def test_postgres_claim_skips_locked_rows():
+    dialect = postgresql.dialect()
+    captured = []
+
+    class Session:
+        async def execute(self, statement, *args):
+            captured.append(str(statement.compile(dialect=dialect)))
+            raise RuntimeError('stop')
+
+        async def rollback(self):
+            pass
+
+    repository = WorkQueueRepository.__new__(WorkQueueRepository)
+    repository._db_session = Session()
+    with pytest.raises(RuntimeError):
+        asyncio.run(repository.claim(50, visibility_timeout=30))
+
+    sql = captured[0]
+    assert 'FOR UPDATE SKIP LOCKED' in sql
+    assert 'ORDER BY event_queue.priority DESC, event_queue.scheduled_time' in sql
+    assert 'RETURNING' in sql
+
+
+
+async def test_slow_handlers_fail_inside_the_lease(sessions):
+    async def handler(item):
+        await asyncio.sleep(10)
+
+    with pytest.raises(ValueError):
+        DurableWorkQueue(sessions, handler, visibility_timeout=1.0, handler_timeout=1.0)
+
+    queue = DurableWorkQueue(sessions, handler, visibility_timeout=1.0, handler_timeout=0.05,
+                             backoff=lambda attempt: 3600)
+    assert DurableWorkQueue(sessions, handler, visibility_timeout=1.0).handler_timeout == 0.5
+    await queue.enqueue([{'event_id': _event_id(0)}])
+
+    assert await queue.run_once() == 1
+    assert queue.stats.failed == 1
+    assert await _statuses(sessions) == [('pending', 1)]
+
+
+def test_claim_index_matches_the_claim_order():
+    [index] = [i for i in EventQueue.__table__.indexes if i.name == 'ix_event_queue_claim']
+    sql = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+    assert '(priority DESC, scheduled_time)' in sql
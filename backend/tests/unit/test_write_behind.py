@@ -0,0 +1,187 @@
+import asyncio
+import uuid
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import CheckConstraint, MetaData, select, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateTable
+
+from db.models.data.pipeline import PipelineLog
+from db.models.staging.base import ProcessingStatus, StagingProcessingHistory
+from db.repository.write_behind import (
+    WriteBehindBuffer,
+    WriteBehindClosedError,
+    pipeline_log_row,
+    processing_history_row,
+    with_column_defaults
+)
+
+
+@compiles(JSONB, 'sqlite')
+def _jsonb_on_sqlite(element, compiler, **kw):
+    return 'JSON'
+
+
+PIPELINE_ID = uuid.uuid4()
+LOGS = PipelineLog.__table__
+
+
+@pytest.fixture
+async def sessions():
+    engine = create_async_engine('sqlite+aiosqlite://', poolclass=StaticPool)
+    metadata = MetaData()
+    async with engine.begin() as connection:
+        # Plain DDL; the models' after_create hooks and CHECKs are PostgreSQL-only
+        for table in (LOGS, StagingProcessingHistory.__table__):
+            copy = table.to_metadata(metadata)
+            for constraint in [c for c in copy.constraints if isinstance(c, CheckConstraint)]:
+                copy.constraints.discard(constraint)
+            await connection.execute(CreateTable(copy, include_foreign_key_constraints=[]))
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def _messages(sessions):
+    async with sessions() as session:
+        result = await session.execute(select(LOGS.c.message).order_by(text("rowid")))
+        return result.scalars().all()
+
+
+async def test_size_trigger_flushes_multi_row_batches_in_order(sessions):
+    buffer = WriteBehindBuffer(sessions, max_batch=100, max_pending=1000)
+    for index in range(250):
+        await buffer.append(LOGS, pipeline_log_row(PIPELINE_ID, f"step {index}", event_type='step'))
+
+    # Two size-triggered flushes, each a single INSERT
+    assert buffer.pending == 50
+    assert buffer.stats.statements == 2
+
+    await buffer.close()
+    assert await _messages(sessions) == [f"step {index}" for index in range(250)]
+    assert buffer.stats.written == 250
+
+    with pytest.raises(WriteBehindClosedError):
+        await buffer.append(LOGS, pipeline_log_row(PIPELINE_ID, 'late'))
+
+
+async def test_time_trigger_and_mixed_tables(sessions):
+    buffer = WriteBehindBuffer(sessions, max_batch=1000, flush_interval=0.05)
+    buffer.start()
+    await buffer.append(LOGS, pipeline_log_row(PIPELINE_ID, 'started', run_id=uuid.uuid4()))
+    await buffer.append(StagingProcessingHistory.__table__, processing_history_row(
+        uuid.uuid4(), 'status_changed', status=ProcessingStatus.COMPLETED, duration=1.5
+    ))
+
+    await asyncio.sleep(0.3)
+    assert buffer.pending == 0
+    async with sessions() as session:
+        history = (await session.execute(select(StagingProcessingHistory.__table__))).one()
+    assert history.history_status == ProcessingStatus.COMPLETED
+    assert history.history_created_at is not None
+    await buffer.close()
+
+
+async def test_backpressure_bounds_memory(sessions):
+    buffer = WriteBehindBuffer(sessions, max_batch=50, flush_interval=10, max_pending=200)
+    buffer.start()
+    high_water = 0
+    for index in range(2000):
+        await buffer.append(LOGS, pipeline_log_row(PIPELINE_ID, f"step {index}"))
+        high_water = max(high_water, buffer.pending)
+
+    assert high_water <= 200
+    assert buffer.stats.backpressure_waits > 0
+    await buffer.close()
+    assert len(await _messages(sessions)) == 2000
+
+
+async def test_rejected_rows_are_dropped_individually(sessions):
+    buffer = WriteBehindBuffer(sessions, max_batch=100)
+    await buffer.append(LOGS, pipeline_log_row(PIPELINE_ID, 'first'))
+    bad = pipeline_log_row(PIPELINE_ID, 'bad')
+    bad['message'] = None
+    await buffer.append(LOGS, bad)
+    await buffer.append(LOGS, pipeline_log_row(PIPELINE_ID, 'last'))
+
+    assert await buffer.flush() == 2
+    assert buffer.stats.dropped == 1
+    assert await _messages(sessions) == ['first', 'last']
+
+
+async def test_outage_keeps_rows_buffered_in_order(sessions):
+    healthy = [False]
+
+    class Unreachable:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def execute(self, *args, **kwargs):
+            raise OperationalError('INSERT', {}, Exception('connection refused'))
+
+        async def rollback(self):
+            pass
+
+    def factory():
+        return sessions() if healthy[0] else Unreachable()
+
+    buffer = WriteBehindBuffer(factory, max_batch=10)
+    for index in range(5):
+        await buffer.append(LOGS, pipeline_log_row(PIPELINE_ID, f"step {index}"))
+    with pytest.raises(OperationalError):
+        await buffer.flush()
+    assert buffer.pending == 5
+
+    await buffer.append(LOGS, pipeline_log_row(PIPELINE_ID, 'step 5'))
+    healthy[0] = True
+    await buffer.close()
+    assert await _messages(sessions) == [f"step {index}" for index in range(6)]
+
+
+def test_rows_share_one_key_shape():
+    first = with_column_defaults(LOGS, pipeline_log_row(PIPELINE_ID, 'a'))
+    second = with_column_defaults(LOGS, pipeline_log_row(PIPELINE_ID, 'b', context={'x': 1}))
+    assert first.keys() == second.keys()
+    assert first['id'] != second['id']
+    assert first['version'] == 1
+
+
+async def test_any_flush_failure_keeps_rows(sessions):
+    broken = [True]
+
+    def factory():
+        if broken[0]:
+            raise RuntimeError('pool exhausted')
+        return sessions()
+
+    buffer = WriteBehindBuffer(factory, max_batch=10)
+    for index in range(3):
+        await buffer.append(LOGS, pipeline_log_row(PIPELINE_ID, f"step {index}"))
+    with pytest.raises(RuntimeError):
+        await buffer.flush()
+    assert buffer.pending == 3
+
+    broken[0] = False
+    assert await buffer.flush() == 3
+    assert buffer.pending == 0
+    assert await _messages(sessions) == [f"step {index}" for index in range(3)]
+
+
+async def test_large_volumes_flush_in_batched_statements(sessions):
+    buffer = WriteBehindBuffer(sessions, max_batch=500)
+    for index in range(5000):
+        await buffer.append(LOGS, pipeline_log_row(PIPELINE_ID, f"buffered {index}"))
+    await buffer.close()
+
+    assert buffer.stats.written == 5000
+    assert buffer.stats.statements == 10